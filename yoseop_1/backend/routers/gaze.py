@@ -15,11 +15,12 @@
 작성일: 2025-08-12
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Form, UploadFile, File
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Form, Request, WebSocket, WebSocketDisconnect, Query
 from fastapi.security import HTTPAuthorizationCredentials
-from typing import Dict
-import uuid
-import shutil
+from typing import Dict, Optional
+from concurrent.futures import Future
+import asyncio
+import json
 from datetime import datetime
 import os
 import sys
@@ -29,22 +30,44 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.auth_service import AuthService, security
-from services.supabase_client import get_user_supabase_client
+from services.supabase_client import get_user_supabase_client, is_missing_column_error
+from backend.services.streaming_upload import MultipartFileStream, StreamingS3Uploader, StreamUploadError
 from schemas.gaze import (
     CalibrationStartRequest, CalibrationStartResponse, CalibrationStatusResponse,
     CalibrationResult, VideoAnalysisRequest, VideoAnalysisResponse, 
     GazeAnalysisResult, AnalysisStatusResponse, FrameFeedbackResponse,
-    GazeAnalysisTriggerRequest, GazeAnalysisTriggerResponse, ErrorResponse
+    GazeAnalysisTriggerRequest, GazeAnalysisTriggerResponse, ErrorResponse, TraceFormat
 )
 
-# 기존 gaze 모듈들 import (서비스 레이어로 이전 전까지 임시 사용)
+# 캘리브레이션 서비스 (세션별 잠금 + FaceMesh 풀로 세션 간 병렬 처리)
 try:
-    from test.gaze_calibration import calibration_manager
-    from test.gaze_analysis import gaze_analyzer, GazeAnalysisResult as GazeAnalyzerResultData
+    from services.calibration_service import calibration_manager
+    from services.gaze_core import decode_frame_message, read_frame_header, FrameMessageError
 except ImportError as e:
-    print(f"[WARNING] 기존 gaze 모듈 import 실패: {e}")
+    print(f"[WARNING] 캘리브레이션 서비스 import 실패: {e}")
     calibration_manager = None
+
+# 동영상 분석은 서비스 레이어의 전용 워커 풀에서 실행 (이벤트 루프 차단 방지)
+try:
+    from services.gaze_core import GazeAnalysisCancelled
+    from services.gaze_service import gaze_analyzer, GazeAnalysisResult as GazeAnalyzerResultData
+    from services.gaze_worker_pool import gaze_worker_pool, GazeQueueFullError
+    from services.gaze_task_registry import gaze_task_registry, derive_task_id, reusable_statuses
+except ImportError as e:
+    print(f"[WARNING] 시선 분석 서비스 import 실패: {e}")
     gaze_analyzer = None
+    gaze_worker_pool = None
+    gaze_task_registry = None
+
+# 면접 중 라이브 시선 추적 (GAZE_LIVE_ENABLED=false이면 None)
+try:
+    from services.live_gaze_service import (
+        live_gaze_manager, GAZE_LIVE_FPS, GAZE_LIVE_MIN_COVERAGE
+    )
+    from services.gaze_core import GazeConfig
+except ImportError as e:
+    print(f"[WARNING] 라이브 시선 추적 서비스 import 실패: {e}")
+    live_gaze_manager = None
 
 # 라우터 초기화
 router = APIRouter(prefix="/gaze", tags=["Gaze Analysis"])
@@ -53,55 +76,202 @@ auth_service = AuthService()
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# 분석 작업 상태 저장소 (실제 서비스에서는 Redis나 DB 사용 권장)
-analysis_tasks: Dict[str, Dict] = {}
+# 분석 작업 상태 저장소 (SQLite 저장, 진행 중 작업만 메모리 보관 - services/gaze_task_registry.py)
+analysis_tasks = gaze_task_registry
 BUCKET_NAME = 'betago-s3'
 
-# 임시 파일 저장 폴더
-TEMP_GAZE_FOLDER = "backend/uploads/temp_gaze"
+# 임시 업로드 S3 경로 (요청 본문을 S3 멀티파트 업로드로 바로 전송)
+TEMP_GAZE_PREFIX = "gaze-videos/temporary"
+
+# 분석 결과로 인정할 최소 분석 프레임 수
+MIN_ANALYZED_FRAMES = 30
+ANALYSIS_FRAME_SKIP = 10
+
+
+def _make_progress_updater(task_id: str):
+    """워커 스레드에서 호출되는 진행률 콜백 생성 (진행 중 작업의 메모리 상태만 갱신)"""
+    def update(progress: float, message: str) -> None:
+        analysis_tasks.report_progress(task_id, round(min(max(progress, 0.0), 1.0), 3), message)
+    return update
+
+
+async def _lookup_cached_result(s3_key: str, calibration_points: list, initial_face_size: Optional[float]):
+    """
+    시선 결과 캐시 조회 (S3 ETag 조회가 있으므로 스레드에서 실행)
+    
+    Returns:
+        (캐시 키, 사용할 캐시 결과): 분석 프레임이 부족한 결과는 돌려주지 않고 워커 풀에서 실패로 처리되게 함
+    """
+    cache_key, cached = await asyncio.to_thread(
+        gaze_worker_pool.lookup_cached, BUCKET_NAME, s3_key, calibration_points,
+        initial_face_size, ANALYSIS_FRAME_SKIP
+    )
+    if cached is not None and cached.analyzed_frames < MIN_ANALYZED_FRAMES:
+        cached = None
+    return cache_key, cached
+
+
+def _submit_analysis(task_id: str, s3_key: str, calibration_points: list,
+                     initial_face_size: Optional[float], cache_key: Optional[str] = None) -> Future:
+    """
+    분석 작업을 워커 풀 대기열에 추가
+    
+    같은 cache_key의 분석이 진행 중이면 워커 풀이 그 결과를 함께 기다리게 합니다.
+    대기열이 가득 차면 작업 기록을 지우고 429를 반환합니다.
+    """
+    try:
+        return gaze_worker_pool.submit(
+            task_id,
+            BUCKET_NAME,
+            s3_key,
+            calibration_points,
+            initial_face_size,
+            frame_skip=ANALYSIS_FRAME_SKIP,
+            progress_callback=_make_progress_updater(task_id),
+            cache_key=cache_key
+        )
+    except GazeQueueFullError as e:
+        analysis_tasks.delete(task_id)
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+def _to_result_schema(result: "GazeAnalyzerResultData", analysis_duration: float) -> GazeAnalysisResult:
+    """서비스 레이어 분석 결과를 API 응답 스키마로 변환"""
+    return GazeAnalysisResult(
+        gaze_score=result.gaze_score,
+        total_frames=result.total_frames,
+        analyzed_frames=result.analyzed_frames,
+        in_range_frames=result.in_range_frames,
+        in_range_ratio=result.in_range_ratio,
+        jitter_score=result.jitter_score,
+        compliance_score=result.compliance_score,
+        stability_rating=result.stability_rating,
+        feedback=result.feedback,
+        gaze_points=result.gaze_points,
+        analysis_duration=analysis_duration,
+        allowed_range=result.allowed_range,
+        calibration_points=result.calibration_points,
+        trace=result.trace,
+        heatmap=result.heatmap
+    )
+
+
+def _apply_trace_format(result: Optional[GazeAnalysisResult], trace_format: TraceFormat) -> Optional[GazeAnalysisResult]:
+    """요청한 궤적 형식에 필요한 필드만 남김 (기본 points는 기존 응답과 같은 크기)"""
+    if result is None or trace_format == 'all':
+        return result
+    if trace_format == 'points':
+        return result.model_copy(update={'trace': None, 'heatmap': None})
+    if trace_format == 'compact':
+        return result.model_copy(update={'gaze_points': [], 'heatmap': None})
+    return result.model_copy(update={'gaze_points': [], 'trace': None})
+
+
+async def _save_session_gaze_result(result_obj: GazeAnalysisResult, s3_key: str, user_id: int,
+                                    session_id: str) -> None:
+    """세션 기반 시선 분석 결과를 Supabase gaze_analysis 테이블에 저장 (s3_key 기반, 실패해도 예외 없음)"""
+    try:
+        # Supabase 클라이언트 가져오기 (인증 없이 서비스 계정 사용)
+        supabase_client = get_user_supabase_client("")  # 빈 토큰으로 서비스 계정 사용
+        
+        # GazeAnalysisResult 객체를 딕셔너리로 변환
+        data_to_insert = result_obj.model_dump()
+        
+        # DB에 없는 필드들을 저장 전에 제거
+        fields_to_remove = [
+            'allowed_range', 'analysis_duration', 'total_frames', 
+            'analyzed_frames', 'in_range_frames', 'in_range_ratio', 'feedback'
+        ]
+        for field in fields_to_remove:
+            if field in data_to_insert:
+                del data_to_insert[field]
+        
+        # 추가 필드들 설정
+        data_to_insert['s3_key'] = s3_key  # S3 키를 저장하여 나중에 interview_id와 연결
+        data_to_insert['user_id'] = user_id  # analysis_tasks에서 user_id 가져오기
+        data_to_insert['session_id'] = session_id # session_id를 DB에 직접 저장
+        data_to_insert['created_at'] = datetime.now().isoformat()  # 생성 시간
+        data_to_insert['interview_id'] = None  # 나중에 _process_gaze_data_after_evaluation에서 업데이트
+        
+        # 압축 궤적/히트맵은 gaze_trace, gaze_heatmap 컬럼에 저장 (scripts/database/gaze_analysis_compact_trace.sql)
+        data_to_insert['gaze_trace'] = data_to_insert.pop('trace', None)
+        data_to_insert['gaze_heatmap'] = data_to_insert.pop('heatmap', None)
+        
+        # Supabase에 저장 (동기 클라이언트이므로 스레드에서 실행)
+        try:
+            insert_result = await asyncio.to_thread(
+                supabase_client.table('gaze_analysis').insert(data_to_insert).execute
+            )
+        except Exception as column_error:
+            # 컬럼이 아직 없는 DB에서만 압축 필드 없이 재시도 (시간 초과 등은 이미 저장되었을 수 있어 재삽입하지 않음)
+            if not is_missing_column_error(column_error):
+                raise
+            logger.warning(f"⚠️ [DB_SAVE] 압축 궤적 포함 저장 실패, 압축 필드 없이 재시도: {column_error}")
+            data_to_insert.pop('gaze_trace', None)
+            data_to_insert.pop('gaze_heatmap', None)
+            insert_result = await asyncio.to_thread(
+                supabase_client.table('gaze_analysis').insert(data_to_insert).execute
+            )
+        
+        if insert_result.data:
+            logger.info(f"✅ [DB_SAVE] gaze_analysis 레코드 초기 저장 완료 (s3_key 기반): {insert_result.data[0].get('gaze_id', 'unknown')}")
+        else:
+            logger.error(f"❌ [DB_SAVE] gaze_analysis 레코드 초기 저장 실패: {getattr(insert_result, 'error', 'Unknown error')}")
+            
+    except Exception as db_save_error:
+        logger.error(f"❌ [DB_SAVE] gaze_analysis DB 저장 중 오류 발생: {db_save_error}", exc_info=True)
+        # DB 저장 실패 시에도 분석 작업은 완료로 처리 (폴링 상태)
+
+
+def _mark_cancelled(task_id: str) -> None:
+    analysis_tasks.update(task_id, {
+        'status': 'cancelled',
+        'message': '시선 분석이 취소되었습니다.',
+        'cancelled_at': datetime.now()
+    })
 
 
 # === 임시 업로드 엔드포인트 ===
 
 @router.post("/upload/temporary/{session_id}", tags=["Upload"])
-async def upload_temporary_gaze_video(session_id: str, file: UploadFile = File(...)):
+async def upload_temporary_gaze_video(session_id: str, request: Request):
     """
-    시선 추적 영상을 임시 폴더에 session_id를 파일명으로 하여 저장합니다.
+    시선 추적 영상을 session_id를 파일명으로 하여 S3 임시 경로에 저장합니다.
     
-    이 API는 빠른 응답을 위해 로컬 임시 폴더에만 저장하며,
-    실제 Supabase 업로드와 분석은 나중에 백그라운드에서 처리됩니다.
+    multipart/form-data의 file 필드를 받는 대로 S3 멀티파트 업로드로 보내므로
+    로컬 디스크를 쓰지 않고, 큰 파일도 이벤트 루프를 막지 않습니다 (services/streaming_upload.py).
+    첫 바이트로 동영상 형식을 확인하고, 응답에 SHA-256 체크섬을 포함합니다.
+    실제 분석은 나중에 백그라운드에서 처리됩니다.
     """
     try:
-        # 임시 폴더 생성
-        os.makedirs(TEMP_GAZE_FOLDER, exist_ok=True)
+        stream = await MultipartFileStream(request).open()
         
         # 파일 확장자 추출 (webm 우선 지원)
-        if not file.filename or not file.filename.lower().endswith(('.webm', '.mp4')):
+        if not stream.filename or not stream.filename.lower().endswith(('.webm', '.mp4')):
             raise HTTPException(status_code=400, detail="지원되지 않는 파일 형식입니다. webm 또는 mp4 파일만 업로드 가능합니다.")
         
-        # 파일 크기 제한 (2GB) - 현재 테스트를 위해 주석 처리
-        # if file.size and file.size > 2 * 1024 * 1024 * 1024:
-        #     raise HTTPException(status_code=413, detail="파일 크기가 너무 큽니다. 2GB 이하의 파일만 업로드 가능합니다.")
-        
-        # 파일 확장자 결정
-        file_extension = file.filename.split('.')[-1].lower()
-        file_path = os.path.join(TEMP_GAZE_FOLDER, f"{session_id}.{file_extension}")
+        # 파일 확장자 결정 (기존 파일이 있으면 덮어쓰기)
+        file_extension = stream.filename.split('.')[-1].lower()
+        s3_key = f"{TEMP_GAZE_PREFIX}/{session_id}.{file_extension}"
         
-        # 기존 파일이 있으면 덮어쓰기
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        result = await StreamingS3Uploader(bucket=BUCKET_NAME).upload(stream, s3_key, stream.content_type,
+                                                                      extension=f".{file_extension}")
         
-        print(f"✅ 임시 파일 저장 완료: {file_path} (크기: {file.size} bytes)")
+        print(f"✅ 임시 파일 업로드 완료: s3://{BUCKET_NAME}/{s3_key} (크기: {result.size} bytes, 파트 {result.parts}개)")
         
         return {
             "message": "시선 추적 영상이 임시 저장되었습니다.",
             "session_id": session_id,
-            "file_path": file_path,
-            "file_size": file.size
+            "s3_key": s3_key,
+            "file_size": result.size,
+            "sha256": result.sha256,
+            "etag": result.etag
         }
         
     except HTTPException:
         raise
+    except StreamUploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         print(f"❌ 임시 파일 저장 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"파일 임시 저장 실패: {str(e)}")
@@ -186,7 +356,8 @@ async def process_calibration_frame(session_id: str, frame_data: str = Form(...)
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid base64 frame data")
 
-        result = calibration_manager.process_frame(session_id, frame)
+        # MediaPipe 추론은 스레드에서 실행 (이벤트 루프와 다른 세션을 막지 않음)
+        result = await asyncio.to_thread(calibration_manager.process_frame, session_id, frame)
         if result is None:
             raise HTTPException(status_code=404, detail="Calibration session not found")
             
@@ -198,6 +369,90 @@ async def process_calibration_frame(session_id: str, frame_data: str = Form(...)
         raise HTTPException(status_code=500, detail=f"프레임 처리 실패: {str(e)}")
 
 
+@router.websocket("/calibration/ws/{session_id}")
+async def calibration_frame_stream(websocket: WebSocket, session_id: str):
+    """
+    캘리브레이션 프레임 스트리밍 (WebSocket)
+    
+    /calibration/frame은 프레임마다 HTTP 요청 + base64 폼 필드를 사용하므로
+    요청 오버헤드와 base64 디코딩이 프레임률을 제한합니다. 이 채널은 연결 하나로
+    바이너리 프레임([4바이트 big-endian 경과 ms][JPEG/WebP])을 받습니다.
+    
+    - 서버 → 처리한 프레임마다 {"type": "frame", "seq": 경과 ms, "dropped": 누적 버린 수, ...process_frame 결과}
+    - 추론이 밀리면 처리 전 프레임은 최신 프레임으로 교체하고(dropped 증가), 경과 ms가 이전 이하인 프레임도 버림
+      (캘리브레이션은 서버 시간 기준으로 단계가 진행되므로 늦게 도착한 프레임은 의미가 없음)
+    - 캘리브레이션이 완료되면 결과를 보낸 뒤 연결 종료
+    """
+    await websocket.accept()
+    if not calibration_manager:
+        await websocket.close(code=1013, reason="캘리브레이션 서비스를 사용할 수 없습니다")
+        return
+    if calibration_manager.get_session_status(session_id) is None:
+        await websocket.close(code=1008, reason="Calibration session not found")
+        return
+    
+    # 수신 태스크는 최신 프레임 하나만 보관, 처리 루프는 추론이 끝날 때마다 그 프레임을 가져감
+    pending = {'data': None, 'dropped': 0, 'closed': False}
+    frame_ready = asyncio.Event()
+    
+    async def receive_frames():
+        try:
+            while True:
+                message = await websocket.receive()
+                if message['type'] == 'websocket.disconnect':
+                    break
+                data = message.get('bytes')
+                if data is None:
+                    continue
+                if pending['data'] is not None:
+                    pending['dropped'] += 1
+                pending['data'] = data
+                frame_ready.set()
+        finally:
+            pending['closed'] = True
+            frame_ready.set()
+    
+    def decode_and_process(data: bytes) -> Optional[Dict]:
+        _, frame = decode_frame_message(data)
+        return calibration_manager.process_frame(session_id, frame)
+    
+    receiver = asyncio.create_task(receive_frames())
+    last_seq = -1
+    try:
+        while True:
+            await frame_ready.wait()
+            frame_ready.clear()
+            data, pending['data'] = pending['data'], None
+            if data is None:
+                if pending['closed']:
+                    break
+                continue
+            
+            try:
+                seq = read_frame_header(data)
+                if seq <= last_seq:
+                    pending['dropped'] += 1
+                    continue
+                # 이미지 디코딩과 MediaPipe 추론은 스레드에서 실행 (이벤트 루프와 다른 세션을 막지 않음)
+                result = await asyncio.to_thread(decode_and_process, data)
+            except FrameMessageError as e:
+                await websocket.send_json({'type': 'error', 'message': str(e)})
+                continue
+            last_seq = seq
+            
+            if result is None:
+                await websocket.close(code=1008, reason="Calibration session not found")
+                break
+            await websocket.send_json({'type': 'frame', 'seq': seq, 'dropped': pending['dropped'], **result})
+            if result.get('status') == 'completed':
+                await websocket.close()
+                break
+    except WebSocketDisconnect:
+        logger.info(f"🔌 [CALIBRATION_WS] 연결 종료: {session_id}")
+    finally:
+        receiver.cancel()
+
+
 @router.get("/calibration/result/{session_id}", response_model=CalibrationResult)
 async def get_calibration_result(session_id: str):
     """
@@ -253,7 +508,7 @@ async def analyze_gaze(
     분석은 백그라운드에서 진행되며, 상태 조회 API로 진행 상황을 확인할 수 있습니다.
     """
     try:
-        if not gaze_analyzer or not calibration_manager:
+        if not gaze_worker_pool or not calibration_manager:
             raise HTTPException(status_code=503, detail="시선 분석 서비스를 사용할 수 없습니다")
             
         # video_url 형식 검증
@@ -285,30 +540,60 @@ async def analyze_gaze(
         
         s3_key = db_result.data[0]['s3_key']
 
+        # 결과 캐시 키(ETag + 분석기 지문)가 작업 ID에 들어가므로 먼저 조회
+        cache_key, cached = await _lookup_cached_result(s3_key, calibration_points, initial_face_size)
+
+        # 같은 입력 + 같은 영상 버전이면 같은 작업 ID → 진행 중이거나 완료된 작업이 있으면 그대로 반환
+        task_id = derive_task_id(
+            'analyze', current_user.user_id, s3_key, calibration_points, initial_face_size, ANALYSIS_FRAME_SKIP,
+            revision=cache_key
+        )
+        existing = analysis_tasks.get(task_id)
+        if existing and existing['status'] in reusable_statuses(cache_key):
+            return VideoAnalysisResponse(
+                task_id=task_id,
+                status=existing['status'],
+                message="이미 요청된 시선 분석 작업입니다."
+            )
+
+        # 같은 영상 + 캘리브레이션의 분석 결과가 캐시에 있으면 바로 완료 처리
+        if cached is not None:
+            analysis_tasks.create(task_id, {
+                'status': 'completed',
+                'progress': 1.0,
+                'message': '이전에 분석한 결과를 사용했습니다.',
+                'started_at': datetime.now(),
+                'completed_at': datetime.now(),
+                'result': _to_result_schema(cached, 0.001)
+            })
+            return VideoAnalysisResponse(
+                task_id=task_id,
+                status="completed",
+                message="캐시된 시선 분석 결과를 사용했습니다."
+            )
+
         # 분석 작업 생성
-        task_id = str(uuid.uuid4())
-        analysis_tasks[task_id] = {
-            'task_id': task_id,
-            'status': 'processing',
+        analysis_tasks.create(task_id, {
+            'status': 'queued',
             'progress': 0.0,
             'message': '분석 작업을 대기열에 추가했습니다.',
             'started_at': datetime.now()
-        }
+        })
+        future = _submit_analysis(task_id, s3_key, calibration_points, initial_face_size, cache_key)
 
-        # 백그라운드 분석 시작
+        # 워커 풀의 결과를 기다렸다가 상태를 갱신 (대기만 하므로 이벤트 루프를 막지 않음)
         background_tasks.add_task(
             run_video_analysis,
             task_id,
+            future,
             BUCKET_NAME,
-            s3_key,
-            calibration_points,
-            initial_face_size
+            s3_key
         )
 
         return VideoAnalysisResponse(
             task_id=task_id,
-            status="processing",
-            message="동영상 시선 분석이 시작되었습니다."
+            status="queued",
+            message="동영상 시선 분석이 대기열에 추가되었습니다."
         )
 
     except HTTPException:
@@ -337,7 +622,7 @@ async def trigger_gaze_analysis(
         print(f"   - Calibration Session: {request.calibration_data.session_id}")
         print(f"   - Media ID: {request.media_id}")
         
-        if not gaze_analyzer:
+        if not gaze_worker_pool:
             raise HTTPException(status_code=503, detail="시선 분석 서비스를 사용할 수 없습니다")
         
         # S3 키 형식 검증 (session_id 기반으로 수정)
@@ -360,36 +645,108 @@ async def trigger_gaze_analysis(
         print(f"🎯 [GAZE_TRIGGER] Calibration points: {len(calibration_points)}개")
         print(f"🎯 [GAZE_TRIGGER] Initial face size: {initial_face_size}")
         
+        # 결과 캐시 키(ETag + 분석기 지문)가 작업 ID에 들어가므로 먼저 조회
+        cache_key, cached = await _lookup_cached_result(request.s3_key, calibration_points, initial_face_size)
+
+        # 같은 입력 + 같은 영상 버전이면 같은 작업 ID → 트리거가 중복되어도 분석/DB 저장을 반복하지 않음
+        # (임시 업로드처럼 같은 S3 키에 다시 올린 영상은 ETag가 달라 새 작업)
+        task_id = derive_task_id(
+            'trigger', current_user.user_id, request.s3_key, calibration_points, initial_face_size,
+            ANALYSIS_FRAME_SKIP, session_id=request.session_id, revision=cache_key
+        )
+        existing = analysis_tasks.get(task_id)
+        if existing and existing['status'] in reusable_statuses(cache_key):
+            print(f"🔁 [GAZE_TRIGGER] 이미 요청된 분석 작업 반환: {task_id} ({existing['status']})")
+            return GazeAnalysisTriggerResponse(
+                task_id=task_id,
+                status="completed" if existing['status'] == 'completed' else "started",
+                message="이미 요청된 시선 분석 작업입니다"
+            )
+        
+        # 면접 중 라이브 시선 추적이 녹화 구간을 충분히 덮었으면 사후 S3 분석 생략
+        live_session = live_gaze_manager.take_covering_result(
+            request.session_id, current_user.user_id, MIN_ANALYZED_FRAMES
+        ) if live_gaze_manager else None
+        if live_session is not None:
+            result_obj = _to_result_schema(
+                live_session.result, max(live_session.updated_at - live_session.started_at, 0.001)
+            )
+            analysis_tasks.create(task_id, {
+                'status': 'completed',
+                'progress': 1.0,
+                'message': '면접 중 실시간 시선 추적 결과를 사용했습니다.',
+                'started_at': datetime.fromtimestamp(live_session.started_at),
+                'completed_at': datetime.now(),
+                'session_id': request.session_id,
+                'user_id': current_user.user_id,
+                's3_key': request.s3_key,
+                'temp_media_id': request.media_id,
+                'result': result_obj
+            })
+            background_tasks.add_task(
+                _save_session_gaze_result, result_obj, request.s3_key, current_user.user_id, request.session_id
+            )
+            print(f"⚡ [GAZE_TRIGGER] 라이브 결과 사용 (커버리지 {live_session.coverage:.0%}) - S3 분석 생략: {task_id}")
+            
+            return GazeAnalysisTriggerResponse(
+                task_id=task_id,
+                status="completed",
+                message="실시간 시선 추적 결과로 분석이 완료되었습니다"
+            )
+        
+        # 같은 영상 + 캘리브레이션의 분석 결과가 캐시에 있으면 S3 분석 없이 완료 처리
+        if cached is not None:
+            result_obj = _to_result_schema(cached, 0.001)
+            analysis_tasks.create(task_id, {
+                'status': 'completed',
+                'progress': 1.0,
+                'message': '이전에 분석한 결과를 사용했습니다.',
+                'started_at': datetime.now(),
+                'completed_at': datetime.now(),
+                'session_id': request.session_id,
+                'user_id': current_user.user_id,
+                's3_key': request.s3_key,
+                'temp_media_id': request.media_id,
+                'result': result_obj
+            })
+            background_tasks.add_task(
+                _save_session_gaze_result, result_obj, request.s3_key, current_user.user_id, request.session_id
+            )
+            print(f"💾 [GAZE_TRIGGER] 캐시된 분석 결과 사용 - S3 분석 생략: {task_id}")
+            
+            return GazeAnalysisTriggerResponse(
+                task_id=task_id,
+                status="completed",
+                message="캐시된 시선 분석 결과로 분석이 완료되었습니다"
+            )
+        
         # 분석 작업 생성 (session_id 기반으로 변경)
-        task_id = str(uuid.uuid4())
-        analysis_tasks[task_id] = {
-            'task_id': task_id,
-            'status': 'started',
+        analysis_tasks.create(task_id, {
+            'status': 'queued',
             'progress': 0.0,
             'message': 'S3 업로드 완료 - 분석 대기열에 추가됨',
             'started_at': datetime.now(),
             'session_id': request.session_id,  # session_id 저장
             'user_id': current_user.user_id,
             's3_key': request.s3_key,
-            'temp_media_id': request.media_id,  # 임시 media_id 저장
-            'calibration_data': request.calibration_data  # 캘리브레이션 데이터 보관
-        }
+            'temp_media_id': request.media_id  # 임시 media_id 저장
+        })
         
         print(f"📋 [GAZE_TRIGGER] Task 생성 완료: {task_id} (session_id: {request.session_id})")
+        future = _submit_analysis(task_id, request.s3_key, calibration_points, initial_face_size, cache_key)
         
-        # 백그라운드 분석 시작 (interview_id 제거)
+        # 워커 풀 결과 대기 후 DB 저장 (interview_id 제거)
         background_tasks.add_task(
             run_s3_video_analysis_with_session,
             task_id,
+            future,
             BUCKET_NAME,
             request.s3_key,
-            calibration_points,
-            initial_face_size,
             current_user.user_id,
             request.session_id  # interview_id 대신 session_id 전달
         )
         
-        print(f"⚡ [GAZE_TRIGGER] 백그라운드 분석 시작: {task_id}")
+        print(f"⚡ [GAZE_TRIGGER] 분석 대기열 추가: {task_id}")
         
         return GazeAnalysisTriggerResponse(
             task_id=task_id,
@@ -405,18 +762,28 @@ async def trigger_gaze_analysis(
 
 
 @router.get("/analyze/status/{task_id}", response_model=AnalysisStatusResponse)
-async def get_analysis_status(task_id: str):
+async def get_analysis_status(
+    task_id: str,
+    trace_format: TraceFormat = Query('points', description="결과 시선 궤적 형식 (points/compact/heatmap/all)")
+):
     """
     시선 분석 진행 상태 조회
     
     분석 진행률, 현재 단계, 결과 등을 조회합니다.
+    trace_format=compact이면 다운샘플 포인트 대신 전체 해상도 압축 궤적을, heatmap이면 히트맵만 돌려줍니다.
     """
     try:
-        if task_id not in analysis_tasks:
+        task = analysis_tasks.get(task_id)
+        if task is None:
             raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다.")
         
-        task = analysis_tasks[task_id]
-        return AnalysisStatusResponse(**task)
+        if task['status'] == 'queued' and gaze_worker_pool:
+            position = gaze_worker_pool.queue_position(task_id)
+            if position:
+                task['message'] = f"분석 대기 중입니다. (대기 순번 {position})"
+        response = AnalysisStatusResponse(**task)
+        response.result = _apply_trace_format(response.result, trace_format)
+        return response
         
     except HTTPException:
         raise
@@ -424,40 +791,143 @@ async def get_analysis_status(task_id: str):
         raise HTTPException(status_code=500, detail=f"상태 조회 실패: {str(e)}")
 
 
+@router.post("/analyze/cancel/{task_id}")
+async def cancel_analysis(task_id: str):
+    """
+    시선 분석 작업 취소
+    
+    대기 중인 작업은 즉시, 실행 중인 작업은 다음 샘플 프레임에서 중단됩니다.
+    """
+    task = analysis_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다.")
+    
+    if task['status'] not in ('queued', 'processing'):
+        raise HTTPException(status_code=400, detail="이미 종료된 작업은 취소할 수 없습니다.")
+    
+    if gaze_worker_pool:
+        gaze_worker_pool.cancel(task_id)
+    _mark_cancelled(task_id)
+    return {"message": "분석 작업 취소를 요청했습니다.", "task_id": task_id}
+
+
+# === 라이브 시선 추적 엔드포인트 ===
+
+@router.websocket("/live/{session_id}")
+async def live_gaze_tracking(websocket: WebSocket, session_id: str, token: str = Query(...)):
+    """
+    면접 중 실시간 시선 추적 (WebSocket)
+    
+    프로토콜:
+    1. 클라이언트 → {"type": "start", "calibration_data": {"calibration_points": [...], "initial_face_size": ...}}
+    2. 서버 → {"type": "ready", "fps": 권장 전송 빈도, "frame_size": [너비, 높이]}
+    3. 클라이언트 → 바이너리 프레임 ([4바이트 경과 ms][JPEG/WebP]) 반복
+       서버 → 일정 간격으로 {"type": "progress", ...}
+    4. 클라이언트 → {"type": "stop", "duration_ms": 녹화 길이}
+    5. 서버 → {"type": "result", "covered": 사후 분석 생략 여부, "coverage": ..., "gaze_score": ...} 후 종료
+    
+    브라우저 WebSocket은 헤더를 지정할 수 없으므로 인증 토큰은 쿼리 파라미터로 받습니다.
+    """
+    await websocket.accept()
+    if not live_gaze_manager:
+        await websocket.close(code=1013, reason="라이브 시선 추적을 사용할 수 없습니다")
+        return
+    
+    try:
+        current_user = await asyncio.to_thread(
+            auth_service.get_current_user, HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+    except HTTPException:
+        await websocket.close(code=1008, reason="인증에 실패했습니다")
+        return
+    
+    try:
+        start_message = await websocket.receive_json()
+        calibration_data = start_message.get('calibration_data') or {}
+        if start_message.get('type') != 'start':
+            raise ValueError("첫 메시지는 start여야 합니다.")
+        live_gaze_manager.start_session(
+            session_id, current_user.user_id,
+            calibration_data.get('calibration_points') or [],
+            calibration_data.get('initial_face_size')
+        )
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        await websocket.close(code=1003, reason=str(e)[:120])
+        return
+    
+    await websocket.send_json({
+        'type': 'ready',
+        'fps': GAZE_LIVE_FPS,
+        'frame_size': list(GazeConfig.STREAM_DECODE_SIZE)
+    })
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+            
+            if message.get('bytes') is not None:
+                try:
+                    elapsed_ms, frame = decode_frame_message(message['bytes'])
+                except FrameMessageError as e:
+                    await websocket.send_json({'type': 'error', 'message': str(e)})
+                    continue
+                # MediaPipe 추론은 스레드에서 실행 (프레임은 도착 순서대로 하나씩 처리)
+                outcome = await asyncio.to_thread(live_gaze_manager.process_frame, session_id, elapsed_ms, frame)
+                if outcome is None:
+                    break
+                if outcome['received'] % 10 == 0:
+                    await websocket.send_json({'type': 'progress', **outcome})
+                continue
+            
+            try:
+                control = json.loads(message.get('text') or '{}')
+            except ValueError:
+                await websocket.send_json({'type': 'error', 'message': '제어 메시지 형식이 올바르지 않습니다.'})
+                continue
+            if control.get('type') == 'stop':
+                session = await asyncio.to_thread(
+                    live_gaze_manager.finish_session, session_id, control.get('duration_ms')
+                )
+                await websocket.send_json({
+                    'type': 'result',
+                    'covered': bool(session and session.result and session.coverage >= GAZE_LIVE_MIN_COVERAGE
+                                    and session.result.analyzed_frames >= MIN_ANALYZED_FRAMES),
+                    'coverage': round(session.coverage, 3) if session else 0.0,
+                    'analyzed_frames': session.stats.count if session else 0,
+                    'gaze_score': session.result.gaze_score if session and session.result else None,
+                    'error': session.error if session else "라이브 세션을 찾을 수 없습니다."
+                })
+                await websocket.close()
+                break
+    except WebSocketDisconnect:
+        # 연결이 끊겨도 세션은 유지 (재연결 시 이어서 누적, 종료되지 않으면 사후 S3 분석 사용)
+        logger.info(f"🔌 [LIVE_GAZE] 연결 종료: {session_id}")
+
+
 # === 백그라운드 분석 작업 ===
 
 async def run_video_analysis(
     task_id: str, 
+    future: Future,
     bucket: str, 
-    key: str, 
-    calibration_points: list, 
-    initial_face_size: float
+    key: str
 ):
     """
-    백그라운드에서 동영상 시선 분석 실행
+    워커 풀에서 실행 중인 동영상 시선 분석 완료 대기
     
-    S3에서 동영상을 다운로드하고 MediaPipe로 시선을 추적하여
-    집중도와 안정성 점수를 계산합니다.
+    S3 다운로드와 MediaPipe 시선 추적은 워커 스레드에서 진행되며(진행률은 콜백으로 갱신),
+    여기서는 결과를 기다렸다가 집중도와 안정성 점수를 작업 상태에 저장합니다.
     """
     try:
-        print(f"🚀 [ANALYSIS] Task ID: {task_id} - 분석 시작")
+        print(f"🚀 [ANALYSIS] Task ID: {task_id} - 분석 대기열 등록")
         print(f"   - S3 Path: s3://{bucket}/{key}")
         start_time = datetime.now()
-        
-        analysis_tasks[task_id]['progress'] = 0.1
-        analysis_tasks[task_id]['message'] = "분석 엔진 초기화 중..."
-
-        if not gaze_analyzer:
-            raise ValueError("시선 분석 엔진을 사용할 수 없습니다")
 
-        # 시선 분석 실행
-        result: GazeAnalyzerResultData = gaze_analyzer.analyze_video(
-            bucket=bucket,
-            key=key,
-            calibration_points=calibration_points,
-            initial_face_size=initial_face_size,
-            frame_skip=10
-        )
+        result: GazeAnalyzerResultData = await asyncio.wrap_future(future)
         
         end_time = datetime.now()
         analysis_duration = (end_time - start_time).total_seconds()
@@ -465,7 +935,6 @@ async def run_video_analysis(
         print(f"✅ [ANALYSIS] Task ID: {task_id} - 분석 완료 ({analysis_duration:.2f}초)")
 
         # 최소 데이터 검증
-        MIN_ANALYZED_FRAMES = 30
         if result.analyzed_frames < MIN_ANALYZED_FRAMES:
             print(f"⚠️ [ANALYSIS] 데이터 부족: 분석된 프레임 {result.analyzed_frames}개 < 최소 기준 {MIN_ANALYZED_FRAMES}개")
             raise ValueError(
@@ -474,34 +943,24 @@ async def run_video_analysis(
             )
         
         # 결과 저장
-        analysis_tasks[task_id].update({
+        analysis_tasks.update(task_id, {
             'status': 'completed',
             'progress': 1.0,
             'message': '분석이 성공적으로 완료되었습니다.',
             'completed_at': end_time,
-            'result': GazeAnalysisResult(
-                gaze_score=result.gaze_score,
-                total_frames=result.total_frames,
-                analyzed_frames=result.analyzed_frames,
-                in_range_frames=result.in_range_frames,
-                in_range_ratio=result.in_range_ratio,
-                jitter_score=result.jitter_score,
-                compliance_score=result.compliance_score,
-                stability_rating=result.stability_rating,
-                feedback=result.feedback,
-                gaze_points=result.gaze_points,
-                analysis_duration=analysis_duration,
-                allowed_range=result.allowed_range,
-                calibration_points=result.calibration_points
-            )
+            'result': _to_result_schema(result, analysis_duration)
         })
 
+    except (GazeAnalysisCancelled, asyncio.CancelledError):
+        print(f"🛑 [ANALYSIS] Task ID: {task_id} - 분석 취소")
+        _mark_cancelled(task_id)
+
     except Exception as e:
         import traceback
         print(f"❌ [ANALYSIS] Task ID: {task_id} - 분석 실패")
         traceback.print_exc()
         
-        analysis_tasks[task_id].update({
+        analysis_tasks.update(task_id, {
             'status': 'failed',
             'error': str(e),
             'failed_at': datetime.now()
@@ -510,10 +969,9 @@ async def run_video_analysis(
 
 async def run_s3_video_analysis(
     task_id: str, 
+    future: Future,
     bucket: str, 
     s3_key: str, 
-    calibration_points: list, 
-    initial_face_size: float,
     user_id: int,
     interview_id: int
 ):
@@ -527,25 +985,9 @@ async def run_s3_video_analysis(
         print(f"   - S3 Path: s3://{bucket}/{s3_key}")
         print(f"   - User: {user_id}, Interview: {interview_id}")
         start_time = datetime.now()
-        
-        analysis_tasks[task_id]['progress'] = 0.1
-        analysis_tasks[task_id]['status'] = 'processing'
-        analysis_tasks[task_id]['message'] = "시선 분석 엔진 초기화 중..."
 
-        if not gaze_analyzer:
-            raise ValueError("시선 분석 엔진을 사용할 수 없습니다")
-
-        # 시선 분석 실행 (S3 키 직접 사용)
-        analysis_tasks[task_id]['progress'] = 0.3
-        analysis_tasks[task_id]['message'] = "S3에서 비디오 다운로드 중..."
-        
-        result: GazeAnalyzerResultData = gaze_analyzer.analyze_video(
-            bucket=bucket,
-            key=s3_key,
-            calibration_points=calibration_points,
-            initial_face_size=initial_face_size,
-            frame_skip=10
-        )
+        # 시선 분석은 워커 풀에서 실행 (S3 키 직접 사용, 진행률은 콜백으로 갱신)
+        result: GazeAnalyzerResultData = await asyncio.wrap_future(future)
         
         end_time = datetime.now()
         analysis_duration = (end_time - start_time).total_seconds()
@@ -553,7 +995,6 @@ async def run_s3_video_analysis(
         print(f"✅ [S3_ANALYSIS] Task ID: {task_id} - 분석 완료 ({analysis_duration:.2f}초)")
 
         # 최소 데이터 검증
-        MIN_ANALYZED_FRAMES = 30
         if result.analyzed_frames < MIN_ANALYZED_FRAMES:
             print(f"⚠️ [S3_ANALYSIS] 데이터 부족: 분석된 프레임 {result.analyzed_frames}개 < 최소 기준 {MIN_ANALYZED_FRAMES}개")
             raise ValueError(
@@ -562,37 +1003,27 @@ async def run_s3_video_analysis(
             )
         
         # 결과 저장
-        analysis_tasks[task_id].update({
+        analysis_tasks.update(task_id, {
             'status': 'completed',
             'progress': 1.0,
             'message': '시선 분석이 성공적으로 완료되었습니다.',
             'completed_at': end_time,
-            'result': GazeAnalysisResult(
-                gaze_score=result.gaze_score,
-                total_frames=result.total_frames,
-                analyzed_frames=result.analyzed_frames,
-                in_range_frames=result.in_range_frames,
-                in_range_ratio=result.in_range_ratio,
-                jitter_score=result.jitter_score,
-                compliance_score=result.compliance_score,
-                stability_rating=result.stability_rating,
-                feedback=result.feedback,
-                gaze_points=result.gaze_points,
-                analysis_duration=analysis_duration,
-                allowed_range=result.allowed_range,
-                calibration_points=result.calibration_points
-            )
+            'result': _to_result_schema(result, analysis_duration)
         })
         
         print(f"📊 [S3_ANALYSIS] 결과 저장 완료: 점수={result.gaze_score}")
 
+    except (GazeAnalysisCancelled, asyncio.CancelledError):
+        print(f"🛑 [S3_ANALYSIS] Task ID: {task_id} - 분석 취소")
+        _mark_cancelled(task_id)
+
     except Exception as e:
         import traceback
         print(f"❌ [S3_ANALYSIS] Task ID: {task_id} - 분석 실패")
         print(f"   - Error: {str(e)}")
         traceback.print_exc()
         
-        analysis_tasks[task_id].update({
+        analysis_tasks.update(task_id, {
             'status': 'failed',
             'error': str(e),
             'message': f'시선 분석 실패: {str(e)}',
@@ -602,10 +1033,9 @@ async def run_s3_video_analysis(
 
 async def run_s3_video_analysis_with_session(
     task_id: str, 
+    future: Future,
     bucket: str, 
     s3_key: str, 
-    calibration_points: list, 
-    initial_face_size: float,
     user_id: int,
     session_id: str
 ):
@@ -620,25 +1050,9 @@ async def run_s3_video_analysis_with_session(
         print(f"   - S3 Path: s3://{bucket}/{s3_key}")
         print(f"   - User: {user_id}, Session: {session_id}")
         start_time = datetime.now()
-        
-        analysis_tasks[task_id]['progress'] = 0.1
-        analysis_tasks[task_id]['status'] = 'processing'
-        analysis_tasks[task_id]['message'] = "시선 분석 엔진 초기화 중..."
 
-        if not gaze_analyzer:
-            raise ValueError("시선 분석 엔진을 사용할 수 없습니다")
-
-        # 시선 분석 실행 (S3 키 직접 사용)
-        analysis_tasks[task_id]['progress'] = 0.3
-        analysis_tasks[task_id]['message'] = "S3에서 비디오 다운로드 중..."
-        
-        result: GazeAnalyzerResultData = gaze_analyzer.analyze_video(
-            bucket=bucket,
-            key=s3_key,
-            calibration_points=calibration_points,
-            initial_face_size=initial_face_size,
-            frame_skip=10
-        )
+        # 시선 분석은 워커 풀에서 실행 (S3 키 직접 사용, 진행률은 콜백으로 갱신)
+        result: GazeAnalyzerResultData = await asyncio.wrap_future(future)
         
         end_time = datetime.now()
         analysis_duration = (end_time - start_time).total_seconds()
@@ -646,7 +1060,6 @@ async def run_s3_video_analysis_with_session(
         print(f"✅ [SESSION_ANALYSIS] Task ID: {task_id} - 분석 완료 ({analysis_duration:.2f}초)")
 
         # 최소 데이터 검증
-        MIN_ANALYZED_FRAMES = 30
         if result.analyzed_frames < MIN_ANALYZED_FRAMES:
             print(f"⚠️ [SESSION_ANALYSIS] 데이터 부족: 분석된 프레임 {result.analyzed_frames}개 < 최소 기준 {MIN_ANALYZED_FRAMES}개")
             raise ValueError(
@@ -655,62 +1068,13 @@ async def run_s3_video_analysis_with_session(
             )
         
         # === 12단계: GazeAnalysisResult 객체 생성 ===
-        gaze_analysis_result_obj = GazeAnalysisResult(
-            gaze_score=result.gaze_score,
-            total_frames=result.total_frames,
-            analyzed_frames=result.analyzed_frames,
-            in_range_frames=result.in_range_frames,
-            in_range_ratio=result.in_range_ratio,
-            jitter_score=result.jitter_score,
-            compliance_score=result.compliance_score,
-            stability_rating=result.stability_rating,
-            feedback=result.feedback,
-            gaze_points=result.gaze_points,
-            analysis_duration=analysis_duration,
-            allowed_range=result.allowed_range,
-            calibration_points=result.calibration_points
-        )
+        gaze_analysis_result_obj = _to_result_schema(result, analysis_duration)
 
         # === 13단계: 분석 결과를 Supabase gaze_analysis 테이블에 저장 (s3_key 기반) ===
-        try:
-            from dataclasses import asdict
-            
-            # Supabase 클라이언트 가져오기 (인증 없이 서비스 계정 사용)
-            supabase_client = get_user_supabase_client("")  # 빈 토큰으로 서비스 계정 사용
-            
-            # GazeAnalysisResult 객체를 딕셔너리로 변환
-            data_to_insert = gaze_analysis_result_obj.model_dump()
-            
-            # DB에 없는 필드들을 저장 전에 제거
-            fields_to_remove = [
-                'allowed_range', 'analysis_duration', 'total_frames', 
-                'analyzed_frames', 'in_range_frames', 'in_range_ratio', 'feedback'
-            ]
-            for field in fields_to_remove:
-                if field in data_to_insert:
-                    del data_to_insert[field]
-            
-            # 추가 필드들 설정
-            data_to_insert['s3_key'] = s3_key  # S3 키를 저장하여 나중에 interview_id와 연결
-            data_to_insert['user_id'] = user_id  # analysis_tasks에서 user_id 가져오기
-            data_to_insert['session_id'] = session_id # session_id를 DB에 직접 저장
-            data_to_insert['created_at'] = datetime.now().isoformat()  # 생성 시간
-            data_to_insert['interview_id'] = None  # 나중에 _process_gaze_data_after_evaluation에서 업데이트
-            
-            # Supabase에 저장
-            insert_result = supabase_client.table('gaze_analysis').insert(data_to_insert).execute()
-            
-            if insert_result.data:
-                logger.info(f"✅ [DB_SAVE] gaze_analysis 레코드 초기 저장 완료 (s3_key 기반): {insert_result.data[0].get('gaze_id', 'unknown')}")
-            else:
-                logger.error(f"❌ [DB_SAVE] gaze_analysis 레코드 초기 저장 실패: {getattr(insert_result, 'error', 'Unknown error')}")
-                
-        except Exception as db_save_error:
-            logger.error(f"❌ [DB_SAVE] gaze_analysis DB 저장 중 오류 발생: {db_save_error}", exc_info=True)
-            # DB 저장 실패 시에도 분석 작업은 완료로 처리 (폴링 상태)
+        await _save_session_gaze_result(gaze_analysis_result_obj, s3_key, user_id, session_id)
 
         # === 14단계: analysis_tasks 업데이트 ===
-        analysis_tasks[task_id].update({
+        analysis_tasks.update(task_id, {
             'status': 'completed',
             'progress': 1.0,
             'message': '시선 분석이 성공적으로 완료되었습니다.',
@@ -723,13 +1087,17 @@ async def run_s3_video_analysis_with_session(
         print(f"   - interview_id 연결은 면접 완료 후 지연 처리됩니다.")
         print(f"   - Supabase DB 저장도 완료되었습니다.")
 
+    except (GazeAnalysisCancelled, asyncio.CancelledError):
+        print(f"🛑 [SESSION_ANALYSIS] Task ID: {task_id} - 분석 취소")
+        _mark_cancelled(task_id)
+
     except Exception as e:
         import traceback
         print(f"❌ [SESSION_ANALYSIS] Task ID: {task_id} - 분석 실패")
         print(f"   - Error: {str(e)}")
         traceback.print_exc()
         
-        analysis_tasks[task_id].update({
+        analysis_tasks.update(task_id, {
             'status': 'failed',
             'error': str(e),
             'message': f'시선 분석 실패: {str(e)}',
@@ -744,11 +1112,16 @@ async def list_analysis_tasks():
     """
     진행 중인 분석 작업 목록 조회 (디버깅용)
     """
+    counts = analysis_tasks.counts()
     return {
-        "active_tasks": len([t for t in analysis_tasks.values() if t['status'] == 'processing']),
-        "completed_tasks": len([t for t in analysis_tasks.values() if t['status'] == 'completed']),
-        "failed_tasks": len([t for t in analysis_tasks.values() if t['status'] == 'failed']),
-        "tasks": list(analysis_tasks.keys())[-10:]  # 최근 10개만 표시
+        "queued_tasks": counts.get('queued', 0),
+        "active_tasks": counts.get('processing', 0),
+        "completed_tasks": counts.get('completed', 0),
+        "failed_tasks": counts.get('failed', 0),
+        "cancelled_tasks": counts.get('cancelled', 0),
+        "worker_pool": gaze_worker_pool.stats() if gaze_worker_pool else None,
+        "live_sessions": live_gaze_manager.stats() if live_gaze_manager else None,
+        "tasks": analysis_tasks.recent_ids(10)  # 최근 10개만 표시
     }
 
 
@@ -757,13 +1130,14 @@ async def delete_analysis_task(task_id: str):
     """
     완료된 분석 작업 삭제
     """
-    if task_id not in analysis_tasks:
+    task = analysis_tasks.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다.")
     
-    if analysis_tasks[task_id]['status'] == 'processing':
+    if task['status'] in ('queued', 'processing'):
         raise HTTPException(status_code=400, detail="진행 중인 작업은 삭제할 수 없습니다.")
     
-    del analysis_tasks[task_id]
+    analysis_tasks.delete(task_id)
     return {"message": "분석 작업이 삭제되었습니다.", "task_id": task_id}
 
 
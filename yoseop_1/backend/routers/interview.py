@@ -1,14 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Request, Query
-from fastapi.responses import StreamingResponse, HTMLResponse
+from fastapi.responses import StreamingResponse, HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 import logging
-from typing import List, Union
-import boto3
+from typing import List, Literal, Union
 from botocore.exceptions import ClientError
 from backend.services.supabase_client import supabase_client
 from backend.schemas.user import UserResponse
 from schemas.interview import InterviewHistoryResponse, InterviewSettings, AnswerSubmission, AICompetitionAnswerSubmission, CompetitionTurnSubmission, InterviewResponse, TTSRequest, STTResponse, MemoUpdateRequest
-from backend.schemas.gaze import GazeAnalysisResponse
+from backend.schemas.gaze import GazeAnalysisResponse, TraceFormat
+from backend.services.gaze_trace import encode_trace, build_heatmap
+from backend.services.s3_client import get_s3_client, generate_presigned_get_url, S3_BUCKET_NAME, S3_PRESIGNED_URL_EXPIRES_SEC
+from backend.services.s3_chunk_cache import get_s3_chunk_cache
+from services.media_service import media_service, OPTIMIZED_SUFFIX
 from services.interview_service import InterviewService
 from services.interview_service_temp import InterviewServiceTemp
 from backend.services.auth_service import AuthService
@@ -17,6 +21,7 @@ from fastapi.responses import HTMLResponse
 import io
 import time
 import os
+import asyncio
 import tempfile
 import aiohttp
 from dotenv import load_dotenv
@@ -29,6 +34,11 @@ interview_service_temp = InterviewServiceTemp()
 
 # AuthService 인스턴스 생성
 auth_service = AuthService()
+# 토큰이 없어도 통과 (영상 프록시 재생은 인증 없이 <video src>로 접근)
+optional_security = HTTPBearer(auto_error=False)
+
+# 결과 페이지 영상 재생 방식 (presigned: 브라우저가 S3에서 직접 재생 / proxy: API가 바이트를 중계)
+VIDEO_PLAYBACK_MODE = os.getenv('VIDEO_PLAYBACK_MODE', 'presigned')
 
 # 의존성 주입
 def get_interview_service():
@@ -434,7 +444,7 @@ async def get_interview_results(
     
     try:
         media_res = supabase_client.client.from_("media_files") \
-            .select("s3_key, file_name, file_size, duration, created_at") \
+            .select("*") \
             .eq("interview_id", interview_id) \
             .eq("file_type", "video") \
             .order("created_at", desc=True) \
@@ -449,7 +459,10 @@ async def get_interview_results(
                 "file_name": video_file.get("file_name"),
                 "file_size": video_file.get("file_size"),
                 "duration": video_file.get("duration"),
-                "created_at": video_file.get("created_at")
+                "created_at": video_file.get("created_at"),
+                "video_codec": video_file.get("video_codec"),
+                # 업로드 후처리에서 만든 포스터 썸네일 (S3 직접 접근 URL)
+                "poster_url": generate_presigned_get_url(video_file["poster_s3_key"]) if video_file.get("poster_s3_key") else None
             }
             interview_logger.info(f"✅ 면접 {interview_id}의 영상 파일 발견: {video_file.get('file_name')}")
         else:
@@ -474,7 +487,9 @@ async def get_interview_results(
         "video_url": video_url,
         "download_url": download_url,
         "download_optimized_url": download_optimized_url,
-        "video_metadata": video_metadata
+        "video_metadata": video_metadata,
+        # presigned면 프론트엔드가 /stream?mode=url로 S3 직접 재생 URL을 받아 사용
+        "video_playback_mode": VIDEO_PLAYBACK_MODE if video_url else None
     }
     
     return result
@@ -483,9 +498,15 @@ async def get_interview_results(
 @interview_router.get("/{interview_id}/gaze-analysis", response_model=GazeAnalysisResponse, summary="[신규] 특정 면접의 시선 분석 결과 조회")
 async def get_gaze_analysis_for_interview(
     interview_id: int,
+    trace_format: TraceFormat = Query('points', description="시선 궤적 형식 (points/compact/heatmap/all)"),
     current_user: UserResponse = Depends(auth_service.get_current_user)
 ):
-    """특정 면접에 대한 시선 분석(비언어적 피드백) 결과를 조회합니다."""
+    """
+    특정 면접에 대한 시선 분석(비언어적 피드백) 결과를 조회합니다.
+
+    trace_format=compact/heatmap이면 gaze_points 대신 압축 궤적(gaze_trace) / 히트맵(gaze_heatmap)을 돌려줍니다.
+    압축 필드가 없는 이전 레코드는 저장된 gaze_points로 만들어 돌려줍니다.
+    """
     try:
         interview_logger.info(f"📈 시선 분석 결과 요청: interview_id={interview_id}")
         
@@ -517,6 +538,20 @@ async def get_gaze_analysis_for_interview(
 
         analysis_data = gaze_res.data[0]
         
+        gaze_points = analysis_data.get("gaze_points")
+        gaze_trace = analysis_data.get("gaze_trace")
+        gaze_heatmap = analysis_data.get("gaze_heatmap")
+        if trace_format != 'points' and gaze_points and (gaze_trace is None or gaze_heatmap is None):
+            pairs = [(p['x'], p['y']) if isinstance(p, dict) else (p[0], p[1]) for p in gaze_points]
+            gaze_trace = gaze_trace or encode_trace(pairs)
+            gaze_heatmap = gaze_heatmap or build_heatmap(pairs)
+        if trace_format in ('compact', 'heatmap'):
+            gaze_points = None
+        if trace_format not in ('compact', 'all'):
+            gaze_trace = None
+        if trace_format not in ('heatmap', 'all'):
+            gaze_heatmap = None
+        
         # 프론트엔드가 기대하는 GazeAnalysisResponse 모델로 변환
         return GazeAnalysisResponse(
             gaze_id=analysis_data.get("gaze_id"),
@@ -527,9 +562,11 @@ async def get_gaze_analysis_for_interview(
             compliance_score=analysis_data.get("compliance_score", 0),
             stability_rating=analysis_data.get("stability_rating", "N/A"),
             created_at=analysis_data.get("created_at"),
-            gaze_points=analysis_data.get("gaze_points"),
+            gaze_points=gaze_points,
             calibration_points=analysis_data.get("calibration_points"),
             video_metadata=analysis_data.get("video_metadata"),
+            gaze_trace=gaze_trace,
+            gaze_heatmap=gaze_heatmap,
         )
 
     except HTTPException:
@@ -540,17 +577,25 @@ async def get_gaze_analysis_for_interview(
 
 
 @interview_router.get("/video/{interview_id}/stream")
-async def stream_interview_video(interview_id: int, request: Request):
+async def stream_interview_video(
+    interview_id: int,
+    request: Request,
+    mode: Literal['proxy', 'redirect', 'url'] = Query('proxy', description="재생 방식 (proxy: API 중계 / redirect: Presigned URL로 307 리다이렉트 / url: Presigned URL JSON)"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+):
     """
     면접 영상 스트리밍 엔드포인트 (Range 헤더 지원 - 비디오 탐색 기능).
-    이 엔드포인트는 인증된 사용자에게만 노출되는 결과 페이지를 통해 접근되므로,
+    proxy 모드는 인증된 사용자에게만 노출되는 결과 페이지를 통해 접근되므로,
     엔드포인트 자체의 인증은 생략하여 비디오 플레이어 호환성을 높입니다.
+
+    redirect / url 모드는 로그인한 영상 소유자에게만 짧은 만료 시간의 Presigned URL을 발급합니다.
+    브라우저가 S3에서 직접 Range 요청으로 재생하므로 API가 영상 바이트를 중계하지 않습니다.
     """
     try:
         # 1. DB에서 영상 정보 조회
-        interview_logger.info(f"📹 스트리밍 요청 수신: interview_id={interview_id}")
+        interview_logger.info(f"📹 스트리밍 요청 수신: interview_id={interview_id}, mode={mode}")
         media_res = supabase_client.client.from_("media_files") \
-            .select("s3_key, file_name, file_size") \
+            .select("*") \
             .eq("interview_id", interview_id) \
             .eq("file_type", "video") \
             .order("created_at", desc=True) \
@@ -564,15 +609,46 @@ async def stream_interview_video(interview_id: int, request: Request):
         video_file = media_res.data[0]
         s3_key = video_file["s3_key"]
         file_size = video_file.get("file_size")
+        # 업로드 후처리가 끝난 영상은 탐색용으로 다시 묶은 파일 재생 (mp4 faststart / webm 앞쪽 Cues)
+        if video_file.get("optimized_s3_key"):
+            s3_key = video_file["optimized_s3_key"]
+            file_size = video_file.get("optimized_file_size") or file_size
         interview_logger.info(f"✅ DB 조회 성공. S3 Key: {s3_key}, File Size: {file_size}")
 
-        # 2. S3 클라이언트 설정
-        aws_access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-        s3_client = boto3.client('s3', aws_access_key_id=aws_access_key, aws_secret_access_key=aws_secret_key, region_name='ap-northeast-2')
-        bucket_name = 'betago-s3'
-
-        # 3. Range 헤더 처리
+        # 2. Presigned URL 재생 (권한 확인 후 URL만 발급)
+        if mode != 'proxy':
+            if credentials is None:
+                raise HTTPException(status_code=401, detail="인증이 필요합니다.")
+            current_user = auth_service.get_current_user(credentials)
+            if str(video_file.get("user_id")) != str(current_user.user_id):
+                raise HTTPException(status_code=403, detail="해당 면접에 접근할 권한이 없습니다.")
+
+            content_type = 'video/mp4' if s3_key.lower().endswith('.mp4') else 'video/webm'
+            playback_url = generate_presigned_get_url(s3_key, content_type=content_type)
+            interview_logger.info(f"🔗 Presigned 재생 URL 발급: interview_id={interview_id}, mode={mode}")
+            # URL이 만료되면 재발급해야 하므로 응답 자체는 캐시하지 않음
+            no_store = {"Cache-Control": "no-store"}
+            if mode == 'redirect':
+                return RedirectResponse(playback_url, status_code=307, headers=no_store)
+            return JSONResponse({
+                "url": playback_url,
+                "expires_in": S3_PRESIGNED_URL_EXPIRES_SEC,
+                "content_type": content_type,
+                "file_size": file_size
+            }, headers=no_store)
+
+        # 3. 공용 S3 클라이언트 (연결 재사용)
+        s3_client = get_s3_client()
+        bucket_name = S3_BUCKET_NAME
+
+        # 청크 캐시 사용 시 실제 객체 크기 / ETag 기준으로 Range 응답을 캐시된 청크로 조립
+        chunk_cache = get_s3_chunk_cache()
+        object_meta = None
+        if chunk_cache is not None:
+            object_meta = await asyncio.to_thread(chunk_cache.head, s3_key)
+            file_size = object_meta.size
+
+        # 4. Range 헤더 처리
         range_header = request.headers.get('range')
         if range_header and file_size:
             interview_logger.info(f"📊 Range 요청: {range_header}, 파일 크기: {file_size}")
@@ -621,13 +697,18 @@ async def stream_interview_video(interview_id: int, request: Request):
                 end = file_size - 1
                 content_length = file_size
             
-            # S3에서 Range로 객체 가져오기
-            s3_object = s3_client.get_object(
-                Bucket=bucket_name, 
-                Key=s3_key,
-                Range=f'bytes={start}-{end}'
-            )
-            streaming_content = s3_object['Body']
+            # S3에서 Range로 객체 가져오기 (청크 캐시가 있으면 캐시된 청크로 조립)
+            if object_meta is not None:
+                streaming_content = chunk_cache.iter_range(object_meta, start, end)
+                media_type = object_meta.content_type
+            else:
+                s3_object = s3_client.get_object(
+                    Bucket=bucket_name, 
+                    Key=s3_key,
+                    Range=f'bytes={start}-{end}'
+                )
+                streaming_content = s3_object['Body']
+                media_type = s3_object.get('ContentType', 'video/webm')
             
             # Range 응답 헤더 설정 (RFC 7233 준수)
             response_headers = {
@@ -645,14 +726,19 @@ async def stream_interview_video(interview_id: int, request: Request):
             return StreamingResponse(
                 streaming_content, 
                 status_code=206,  # Partial Content
-                media_type=s3_object.get('ContentType', 'video/webm'), 
+                media_type=media_type, 
                 headers=response_headers
             )
         else:
             # Range 헤더가 없는 경우 전체 파일 스트리밍
             interview_logger.info("📊 전체 파일 스트리밍")
-            s3_object = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-            streaming_content = s3_object['Body']
+            if object_meta is not None:
+                streaming_content = chunk_cache.iter_range(object_meta, 0, object_meta.size - 1)
+                media_type = object_meta.content_type
+            else:
+                s3_object = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
+                streaming_content = s3_object['Body']
+                media_type = s3_object.get('ContentType', 'video/webm')
 
             response_headers = {
                 "Accept-Ranges": "bytes",
@@ -668,14 +754,14 @@ async def stream_interview_video(interview_id: int, request: Request):
             interview_logger.info(f"✅ 전체 스트리밍 시작: {s3_key} (파일 크기: {file_size})")
             return StreamingResponse(
                 streaming_content, 
-                media_type=s3_object.get('ContentType', 'video/webm'), 
+                media_type=media_type, 
                 headers=response_headers
             )
 
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code")
         interview_logger.error(f"S3 스트리밍 오류 (interview_id: {interview_id}): {error_code}")
-        if error_code == 'NoSuchKey':
+        if error_code in ('NoSuchKey', '404'):
             raise HTTPException(status_code=404, detail=f"S3에 해당 파일이 없습니다: {s3_key}")
         else:
             raise HTTPException(status_code=500, detail=f"S3 처리 오류: {error_code}")
@@ -692,13 +778,14 @@ async def download_interview_video(interview_id: int, optimize: bool = False):
     """
     면접 영상 다운로드 엔드포인트.
     스트리밍과 달리 Range 헤더를 무시하고 전체 파일을 다운로드합니다.
-    optimize=true 시 시간 탐색에 최적화된 파일로 변환하여 제공합니다.
+    optimize=true 시 업로드 후처리에서 만든 시간 탐색 최적화 파일을 제공합니다
+    (요청마다 FFmpeg를 실행하지 않고 S3 객체를 그대로 스트리밍, 후처리 전이면 원본 제공).
     """
     try:
         # 1. DB에서 영상 정보 조회
         interview_logger.info(f"📥 다운로드 요청 수신: interview_id={interview_id}, optimize={optimize}")
         media_res = supabase_client.client.from_("media_files") \
-            .select("s3_key, file_name, file_size") \
+            .select("*") \
             .eq("interview_id", interview_id) \
             .eq("file_type", "video") \
             .order("created_at", desc=True) \
@@ -711,95 +798,37 @@ async def download_interview_video(interview_id: int, optimize: bool = False):
 
         video_file = media_res.data[0]
         s3_key = video_file["s3_key"]
-        file_name = video_file.get("file_name", f"interview_{interview_id}_video.webm")
-        file_size = video_file.get("file_size")
+        file_name = video_file.get("file_name") or f"interview_{interview_id}_video.webm"
         interview_logger.info(f"✅ 다운로드 DB 조회 성공. S3 Key: {s3_key}, File Name: {file_name}")
 
-        # 2. S3 클라이언트 설정
-        aws_access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-        s3_client = boto3.client('s3', aws_access_key_id=aws_access_key, aws_secret_access_key=aws_secret_key, region_name='ap-northeast-2')
-        bucket_name = 'betago-s3'
+        # 2. 공용 S3 클라이언트 (연결 재사용)
+        s3_client = get_s3_client()
+        bucket_name = S3_BUCKET_NAME
 
-        # 3. S3에서 전체 파일 가져오기
-        s3_object = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-        
+        # 3. 최적화 파일 선택 (후처리 컬럼이 없는 DB는 파생 객체 키 규칙으로 확인)
+        optimized_file_name = file_name
         if optimize:
-            # FFmpeg 최적화 적용
-            interview_logger.info("🔧 FFmpeg 최적화 적용 중...")
-            from utils.video_optimizer import VideoOptimizer
-            
-            if not VideoOptimizer.is_ffmpeg_available():
-                interview_logger.warning("FFmpeg를 찾을 수 없어 원본 파일로 제공합니다")
-                streaming_content = s3_object['Body']
-                optimized_file_name = file_name
+            optimized_key = video_file.get("optimized_s3_key") or media_service.derived_key(s3_key, OPTIMIZED_SUFFIX)
+            if video_file.get("optimized_s3_key") or await asyncio.to_thread(media_service.check_file_exists, optimized_key):
+                s3_key = optimized_key
+                base, ext = os.path.splitext(file_name)
+                optimized_file_name = f"{base}_optimized{ext}"
             else:
-                import tempfile
-                
-                # 최적화된 파일을 위한 임시 파일 생성
-                file_extension = file_name.split('.')[-1] if '.' in file_name else 'webm'
-                optimized_file_name = file_name.replace(f'.{file_extension}', f'_optimized.{file_extension}')
-                
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as temp_output:
-                    temp_output_path = temp_output.name
-                
-                try:
-                    # FFmpeg로 최적화 수행
-                    optimization_success = VideoOptimizer.optimize_for_seeking(
-                        s3_object['Body'], 
-                        temp_output_path, 
-                        file_extension
-                    )
-                    
-                    if optimization_success and os.path.exists(temp_output_path):
-                        interview_logger.info("✅ FFmpeg 최적화 완료")
-                        
-                        # 최적화된 파일을 메모리로 읽어서 스트림으로 변환
-                        import io
-                        optimized_data = io.BytesIO()
-                        with open(temp_output_path, 'rb') as f:
-                            optimized_data.write(f.read())
-                        optimized_data.seek(0)
-                        
-                        streaming_content = optimized_data
-                        
-                        # 최적화된 파일 크기 업데이트
-                        file_size = os.path.getsize(temp_output_path)
-                    else:
-                        interview_logger.warning("FFmpeg 최적화 실패, 원본 파일로 제공합니다")
-                        # S3 객체를 다시 가져와야 함 (스트림이 이미 읽혔으므로)
-                        s3_object = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-                        streaming_content = s3_object['Body']
-                        optimized_file_name = file_name
-                        
-                except Exception as e:
-                    interview_logger.error(f"최적화 중 오류: {e}")
-                    # S3 객체를 다시 가져와야 함
-                    s3_object = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-                    streaming_content = s3_object['Body']
-                    optimized_file_name = file_name
-                finally:
-                    # 임시 파일 정리
-                    if os.path.exists(temp_output_path):
-                        try:
-                            os.unlink(temp_output_path)
-                        except Exception as cleanup_error:
-                            interview_logger.warning(f"임시 파일 정리 실패: {cleanup_error}")
-        else:
-            # 원본 파일 그대로 제공
-            streaming_content = s3_object['Body']
-            optimized_file_name = file_name
+                interview_logger.info("ℹ️ 후처리된 파일이 없어 원본 파일로 제공합니다")
+
+        # 4. S3 객체 스트리밍
+        s3_object = await asyncio.to_thread(s3_client.get_object, Bucket=bucket_name, Key=s3_key)
+        streaming_content = s3_object['Body'].iter_chunks(1024 * 1024)
 
-        # 4. 다운로드용 응답 헤더 설정
+        # 5. 다운로드용 응답 헤더 설정
         response_headers = {
             "Content-Disposition": f'attachment; filename="{optimized_file_name}"',
+            "Content-Length": str(s3_object['ContentLength']),
             "Cache-Control": "no-cache",
             "Content-Description": "File Transfer"
         }
-        if file_size:
-            response_headers["Content-Length"] = str(file_size)
 
-        interview_logger.info(f"✅ 다운로드 시작: {optimized_file_name}")
+        interview_logger.info(f"✅ 다운로드 시작: {optimized_file_name} ({s3_key})")
         return StreamingResponse(
             streaming_content, 
             media_type="application/octet-stream",  # 다운로드 강제
@@ -7,6 +7,7 @@ S3 미디어 파일 관리 라우터
 
 주요 기능:
 - S3 Presigned URL 기반 업로드
+- 서버 경유 스트리밍 업로드 (S3 멀티파트, 로컬 디스크 미사용)
 - 동영상/오디오 재생 URL 생성
 - 업로드 완료 처리
 - 파일 목록 및 통계 조회
@@ -17,8 +18,9 @@ S3 미디어 파일 관리 라우터
 
 import os
 import sys
-import boto3
-from fastapi import APIRouter, HTTPException, Depends, Request
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Request, BackgroundTasks
+from pydantic import ValidationError
 from fastapi.security import HTTPAuthorizationCredentials
 from typing import List, Optional
 
@@ -26,10 +28,17 @@ from typing import List, Optional
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
 
 from services.auth_service import AuthService, security
-from services.supabase_client import get_supabase_client, get_user_supabase_client
+from services.supabase_client import get_supabase_client, get_user_supabase_client, is_missing_column_error
+from backend.services.s3_client import get_s3_client, S3_BUCKET_NAME
+from services.media_service import media_service, OPTIMIZED_SUFFIX, POSTER_SUFFIX
+from services.media_pagination import count_media, list_media_page, decode_cursor
+from backend.services.streaming_upload import MultipartFileStream, StreamingS3Uploader, StreamUploadError
+from services.media_stats import (
+    get_user_media_stats, to_stats_response_fields, insert_media_record, mark_upload_completed
+)
 from schemas.media import (
     UploadRequest, TestUploadRequest, GazeUploadRequest, UploadResponse, PlayResponse,
-    UploadCompleteRequest, UploadCompleteResponse, MediaFileInfo,
+    UploadCompleteRequest, UploadCompleteResponse, StreamUploadResponse, MediaFileInfo,
     MediaListResponse, MediaStatsResponse, ErrorResponse
 )
 import uuid
@@ -44,14 +53,10 @@ print(f"[DEBUG] AWS_ACCESS_KEY_ID: {os.getenv('AWS_ACCESS_KEY_ID', 'NOT SET')[:1
 print(f"[DEBUG] AWS_SECRET_ACCESS_KEY: {'SET' if os.getenv('AWS_SECRET_ACCESS_KEY') else 'NOT SET'}")
 print(f"[DEBUG] AWS_REGION: {os.getenv('AWS_REGION', 'ap-northeast-2')}")
 
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_REGION', 'ap-northeast-2')
-)
+# 프로세스 공용 클라이언트 (연결 풀 공유)
+s3_client = get_s3_client()
 
-BUCKET_NAME = 'betago-s3'
+BUCKET_NAME = S3_BUCKET_NAME
 
 
 @router.post("/upload-url", response_model=UploadResponse)
@@ -83,7 +88,7 @@ async def get_upload_url(
         # DB에 미디어 파일 레코드 생성
         supabase = get_supabase_client()
         try:
-            result = supabase.table('media_files').insert({
+            result = insert_media_record(supabase, {
                 'user_id': current_user.user_id,
                 'interview_id': request.interview_id,
                 'file_name': request.file_name,
@@ -92,7 +97,7 @@ async def get_upload_url(
                 's3_url': f"https://{BUCKET_NAME}.s3.ap-northeast-2.amazonaws.com/{s3_key}",
                 'file_size': request.file_size,
                 'duration': request.duration
-            }).execute()
+            })
             
             if not result.data:
                 raise HTTPException(status_code=500, detail="DB 레코드 생성 실패")
@@ -112,6 +117,73 @@ async def get_upload_url(
         raise HTTPException(status_code=500, detail=f"업로드 URL 생성 실패: {str(e)}")
 
 
+@router.post("/upload", response_model=StreamUploadResponse)
+async def upload_media_stream(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    interview_id: int,
+    file_type: str = "video",
+    current_user=Depends(auth_service.get_current_user)
+):
+    """
+    서버 경유 스트리밍 업로드
+    
+    브라우저가 S3에 직접 올릴 수 없을 때 사용합니다. multipart/form-data의 file 필드를
+    읽는 대로 S3 멀티파트 업로드로 보내므로 파일 전체를 메모리나 임시 파일에 두지 않습니다.
+    첫 바이트로 형식을 확인하고, 업로드가 끝난 뒤 완료 상태로 DB 레코드를 만듭니다.
+    """
+    try:
+        stream = await MultipartFileStream(request).open()
+        try:
+            upload_request = UploadRequest(interview_id=interview_id, file_name=stream.filename or '',
+                                           file_type=file_type)
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=f"잘못된 업로드 요청: {e.errors()[0]['msg']}")
+        
+        extension = os.path.splitext(upload_request.file_name)[1].lower()
+        if extension not in media_service.allowed_extensions:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식: {extension}")
+        
+        s3_key = f"interviews/{current_user.user_id}/{upload_request.interview_id}/{upload_request.file_name}"
+        result = await StreamingS3Uploader(s3_client, BUCKET_NAME).upload(
+            stream, s3_key, stream.content_type, extension=extension
+        )
+        
+        # 업로드가 끝난 뒤 삽입하므로 upload_status는 기본값(completed)
+        supabase = get_supabase_client()
+        record = await asyncio.to_thread(lambda: supabase.table('media_files').insert({
+            'user_id': current_user.user_id,
+            'interview_id': upload_request.interview_id,
+            'file_name': upload_request.file_name,
+            'file_type': upload_request.file_type,
+            's3_key': s3_key,
+            's3_url': f"https://{BUCKET_NAME}.s3.ap-northeast-2.amazonaws.com/{s3_key}",
+            'file_size': result.size
+        }).execute())
+        if not record.data:
+            raise HTTPException(status_code=500, detail="DB 레코드 생성 실패")
+        media_id = record.data[0]['media_id']
+        
+        if upload_request.file_type == 'video':
+            background_tasks.add_task(media_service.process_uploaded_video, media_id, s3_key, supabase)
+        
+        return StreamUploadResponse(
+            media_id=media_id,
+            s3_key=s3_key,
+            file_size=result.size,
+            sha256=result.sha256,
+            etag=result.etag,
+            parts=result.parts
+        )
+        
+    except HTTPException:
+        raise
+    except StreamUploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스트리밍 업로드 실패: {str(e)}")
+
+
 @router.post("/test/upload-url", response_model=UploadResponse)
 async def get_test_upload_url(
     request: TestUploadRequest, 
@@ -163,7 +235,7 @@ async def get_test_upload_url(
             }
             print(f"[DEBUG] DB 삽입할 데이터: {insert_data}")
             
-            result = supabase.table('media_files').insert(insert_data).execute()
+            result = insert_media_record(supabase, insert_data)
             print(f"[DEBUG] DB 삽입 결과: {result}")
             print(f"[DEBUG] 삽입된 데이터: {result.data}")
             
@@ -314,6 +386,7 @@ async def get_play_url(
 @router.patch("/complete/{media_id}", response_model=UploadCompleteResponse)
 async def complete_upload(
     media_id: str, 
+    background_tasks: BackgroundTasks,
     request: Optional[UploadCompleteRequest] = None,
     file_size: Optional[int] = None, 
     duration: Optional[int] = None,
@@ -325,6 +398,7 @@ async def complete_upload(
     
     S3 업로드 완료 후 DB에서 파일 정보를 업데이트합니다.
     실제 파일 크기와 재생 시간을 기록합니다.
+    동영상은 응답 후 백그라운드에서 1회 후처리합니다 (재생용 재구성, 재생 시간 / 코덱 조회, 포스터 썸네일).
     """
     print(f"[DEBUG] 완료 API 호출: media_id={media_id}, file_size={file_size}, user_id={current_user.user_id}")
     
@@ -377,7 +451,13 @@ async def complete_upload(
         else:
             print(f"[DEBUG] 업데이트 필요 없음 - 이미 최신 상태")
             result = check_result  # 기존 레코드를 결과로 사용
+
+        # 통계(media_user_stats)는 트리거가 pending → completed로 옮김
+        mark_upload_completed(supabase, media_id, current_user.user_id)
             
+        if existing_record.get('file_type') == 'video' and existing_record.get('s3_key'):
+            background_tasks.add_task(media_service.process_uploaded_video, media_id, existing_record['s3_key'], supabase)
+
         print(f"[✅] 완료 API 성공: media_id={media_id}")
         return UploadCompleteResponse(
             message='업로드 완료', 
@@ -396,6 +476,7 @@ async def get_media_list(
     page: int = 1,
     page_size: int = 20,
     file_type: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_user=Depends(auth_service.get_current_user),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -404,28 +485,31 @@ async def get_media_list(
     
     사용자의 미디어 파일 목록을 페이지네이션으로 조회합니다.
     파일 타입별 필터링을 지원합니다.
+
+    다음 페이지는 응답의 next_cursor를 cursor로 넘기면 (created_at, media_id) 키셋으로 조회합니다.
+    cursor 없이 page만 지정하면 기존처럼 offset으로 조회합니다.
+    전체 개수는 행 없이 개수만 조회합니다 (services/media_pagination.py).
     """
+    page = max(page, 1)
+    page_size = max(page_size, 1)
+    if cursor:
+        try:
+            decode_cursor(cursor, file_type)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     try:
         user_token = credentials.credentials
         supabase = get_user_supabase_client(user_token)
         
-        # 쿼리 빌더 생성
-        query = supabase.table('media_files').select('*').eq('user_id', current_user.user_id)
-        
-        # 파일 타입 필터링
-        if file_type:
-            query = query.eq('file_type', file_type)
-        
-        # 전체 개수 조회
-        count_result = query.execute()
-        total_count = len(count_result.data) if count_result.data else 0
-        
-        # 페이지네이션 적용
-        offset = (page - 1) * page_size
-        result = query.order('created_at', desc=True).range(offset, offset + page_size - 1).execute()
+        # 전체 개수 / 페이지 동시 조회
+        total_count, (rows, next_cursor) = await asyncio.gather(
+            asyncio.to_thread(count_media, supabase, current_user.user_id, file_type),
+            asyncio.to_thread(list_media_page, supabase, current_user.user_id, page_size,
+                              file_type, cursor, (page - 1) * page_size)
+        )
         
         media_files = []
-        for item in result.data if result.data else []:
+        for item in rows:
             media_files.append(MediaFileInfo(
                 media_id=item['media_id'],
                 file_name=item['file_name'],
@@ -444,7 +528,9 @@ async def get_media_list(
             total_count=total_count,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
         )
         
     except Exception as e:
@@ -460,47 +546,14 @@ async def get_media_stats(
     미디어 파일 통계 조회
     
     사용자의 미디어 파일 사용 통계를 제공합니다.
+    업로드 / 완료 / 삭제 시 트리거가 갱신하는 사용자별 통계 1행만 조회하므로 파일 수와 무관합니다
+    (services/media_stats.py).
     """
     try:
-        user_token = credentials.credentials
-        supabase = get_user_supabase_client(user_token)
-        
-        result = supabase.table('media_files').select('*').eq('user_id', current_user.user_id).execute()
-        
-        if not result.data:
-            return MediaStatsResponse(
-                total_files=0,
-                total_size_mb=0.0,
-                video_count=0,
-                audio_count=0,
-                avg_file_size_mb=0.0,
-                latest_upload=None
-            )
-        
-        files = result.data
-        total_files = len(files)
-        video_count = len([f for f in files if f['file_type'] == 'video'])
-        audio_count = len([f for f in files if f['file_type'] == 'audio'])
-        
-        # 파일 크기 계산 (None 값 제외)
-        file_sizes = [f['file_size'] for f in files if f.get('file_size')]
-        total_size_mb = sum(file_sizes) / (1024 * 1024) if file_sizes else 0.0
-        avg_file_size_mb = total_size_mb / len(file_sizes) if file_sizes else 0.0
-        
-        # 최근 업로드 시간
-        latest_upload = None
-        if files:
-            latest_file = max(files, key=lambda f: f['created_at'])
-            latest_upload = latest_file['created_at']
-        
-        return MediaStatsResponse(
-            total_files=total_files,
-            total_size_mb=round(total_size_mb, 2),
-            video_count=video_count,
-            audio_count=audio_count,
-            avg_file_size_mb=round(avg_file_size_mb, 2),
-            latest_upload=latest_upload
-        )
+        # 통계 테이블은 anon 키 접근을 막아 두었으므로 서비스 키로 본인 행만 조회
+        supabase = get_supabase_client()
+        stats = await asyncio.to_thread(get_user_media_stats, supabase, current_user.user_id)
+        return MediaStatsResponse(**to_stats_response_fields(stats))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
@@ -515,29 +568,44 @@ async def delete_media_file(
     """
     미디어 파일 삭제
     
-    S3에서 파일을 삭제하고 DB 레코드도 제거합니다.
+    S3에서 원본과 후처리 파생 객체(재생용 영상, 포스터)를 삭제하고 DB 레코드도 제거합니다.
     """
     try:
         user_token = credentials.credentials
         supabase = get_user_supabase_client(user_token)
         
-        # 파일 정보 조회
-        result = supabase.table('media_files').select('s3_key').eq('media_id', media_id).eq('user_id', current_user.user_id).execute()
+        # 파일 정보 조회 (파생 객체 키 컬럼이 없는 DB면 원본 키만 조회)
+        query = supabase.table('media_files').select('s3_key, optimized_s3_key, poster_s3_key')
+        try:
+            result = query.eq('media_id', media_id).eq('user_id', current_user.user_id).execute()
+        except Exception as e:
+            if not is_missing_column_error(e):
+                raise
+            result = supabase.table('media_files').select('s3_key').eq('media_id', media_id).eq('user_id', current_user.user_id).execute()
         
         if not result.data:
             raise HTTPException(status_code=404, detail="미디어 파일을 찾을 수 없습니다")
         
-        s3_key = result.data[0]['s3_key']
+        record = result.data[0]
+        s3_key = record['s3_key']
+        # 키가 기록되지 않았어도 후처리가 파생 객체를 올렸을 수 있으므로 규칙대로 만든 키도 삭제
+        # (S3는 없는 키 삭제도 성공으로 처리)
+        s3_keys = [
+            s3_key,
+            record.get('optimized_s3_key') or media_service.derived_key(s3_key, OPTIMIZED_SUFFIX),
+            record.get('poster_s3_key') or media_service.derived_key(s3_key, POSTER_SUFFIX),
+        ]
         
         # S3에서 파일 삭제
-        try:
-            s3_client.delete_object(Bucket=BUCKET_NAME, Key=s3_key)
-            print(f"[DEBUG] S3 파일 삭제 완료: {s3_key}")
-        except Exception as e:
-            print(f"[WARNING] S3 파일 삭제 실패: {e}")
-            # S3 삭제 실패해도 DB 레코드는 삭제
-        
-        # DB 레코드 삭제
+        for key in dict.fromkeys(s3_keys):
+            try:
+                s3_client.delete_object(Bucket=BUCKET_NAME, Key=key)
+                print(f"[DEBUG] S3 파일 삭제 완료: {key}")
+            except Exception as e:
+                print(f"[WARNING] S3 파일 삭제 실패: {key} - {e}")
+                # S3 삭제 실패해도 DB 레코드는 삭제
+        
+        # DB 레코드 삭제 (사용자 통계는 트리거가 같은 트랜잭션에서 차감)
         supabase.table('media_files').delete().eq('media_id', media_id).eq('user_id', current_user.user_id).execute()
         
         return {"message": "미디어 파일이 삭제되었습니다", "media_id": media_id}
@@ -16,7 +16,7 @@
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Literal
 from datetime import datetime
 from uuid import UUID
 
@@ -180,6 +180,8 @@ class GazeAnalysisResult(BaseModel):
     analysis_duration: float = Field(..., description="분석 소요 시간 (초)", gt=0)
     allowed_range: Dict[str, float] = Field(..., description="허용 시선 범위")
     calibration_points: List[Tuple[float, float]] = Field(..., description="캘리브레이션 기준 좌표")
+    trace: Optional[Dict[str, Any]] = Field(None, description="전체 해상도 시선 궤적 압축본 (trace_format=compact/all)")
+    heatmap: Optional[Dict[str, Any]] = Field(None, description="저해상도 시선 히트맵 (trace_format=heatmap/all)")
     
     class Config:
         schema_extra = {
@@ -211,6 +213,14 @@ class GazeAnalysisResult(BaseModel):
         }
 
 
+# 시선 궤적 응답 형식 (services/gaze_trace.py)
+# - points: 다운샘플된 gaze_points만 (기본값, 기존 응답과 동일)
+# - compact: 전체 해상도 압축 궤적(trace)만, gaze_points는 빈 리스트
+# - heatmap: 저해상도 히트맵(heatmap)만, gaze_points는 빈 리스트
+# - all: 모두
+TraceFormat = Literal['points', 'compact', 'heatmap', 'all']
+
+
 class AnalysisStatusResponse(BaseModel):
     """분석 상태 조회 응답 스키마"""
     task_id: str = Field(..., description="작업 ID")
@@ -378,6 +388,8 @@ class GazeAnalysisResponse(BaseModel):
     gaze_points: Optional[Any] = None
     calibration_points: Optional[Any] = None
     video_metadata: Optional[Dict[str, Any]] = None
+    gaze_trace: Optional[Dict[str, Any]] = None
+    gaze_heatmap: Optional[Dict[str, Any]] = None
 
     class Config:
         orm_mode = True
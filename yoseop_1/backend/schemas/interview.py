@@ -17,6 +17,7 @@ class InterviewSettings(BaseModel):
     user_resume_id: Optional[int] = None
     use_interviewer_service: Optional[bool] = False
     calibration_data: Optional[Dict] = None
+    incremental_evaluation: Optional[bool] = False  # 면접 진행 중 답변 단위 선평가 (opt-in)
 
 class QuestionRequest(BaseModel):
     """질문 요청 모델"""
@@ -114,6 +114,16 @@ class UploadCompleteResponse(BaseModel):
         }
 
 
+class StreamUploadResponse(BaseModel):
+    """서버 경유 스트리밍 업로드 응답 스키마"""
+    media_id: str = Field(..., description="미디어 파일 ID")
+    s3_key: str = Field(..., description="S3 키")
+    file_size: int = Field(..., description="업로드된 파일 크기 (바이트)")
+    sha256: str = Field(..., description="파일 SHA-256 체크섬 (hex)")
+    etag: str = Field(..., description="S3 ETag")
+    parts: int = Field(..., description="S3 멀티파트 파트 수 (단일 PUT이면 1)")
+
+
 class MediaFileInfo(BaseModel):
     """미디어 파일 정보 스키마"""
     media_id: str = Field(..., description="미디어 파일 ID")
@@ -138,6 +148,8 @@ class MediaListResponse(BaseModel):
     page: int = Field(1, description="현재 페이지")
     page_size: int = Field(20, description="페이지 크기")
     total_pages: int = Field(..., description="전체 페이지 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
 
 
 class MediaStatsResponse(BaseModel):
@@ -148,6 +160,9 @@ class MediaStatsResponse(BaseModel):
     audio_count: int = Field(..., description="오디오 파일 수")
     avg_file_size_mb: float = Field(..., description="평균 파일 크기 (MB)")
     latest_upload: Optional[datetime] = Field(None, description="최근 업로드 시간")
+    pending_count: int = Field(0, description="업로드 진행 중(미완료) 파일 수")
+    completed_count: int = Field(0, description="업로드 완료 파일 수")
+    total_bytes: int = Field(0, description="전체 파일 크기 (bytes)")
     
     class Config:
         json_encoders = {
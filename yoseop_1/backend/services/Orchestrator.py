@@ -36,18 +36,21 @@ class AgentMessage:
 
 class Orchestrator:
     def __init__(self, session_id: str, session_state: Dict[str, Any], 
-                 question_generator=None, ai_candidate_model=None):
+                 question_generator=None, ai_candidate_model=None, qa_listener=None):
         """
         Orchestrator: 모든 면접 비즈니스 로직 담당
         - 플로우 제어
         - 에이전트 조율
         - 메시지 처리
         - 상태 업데이트
+
+        qa_listener: qa_history에 답변이 확정될 때마다 호출되는 콜백 (예: 증분 평가)
         """
         self.session_id = session_id
         self.session_state = session_state  # InterviewService의 session_state 참조
         self.question_generator = question_generator
         self.ai_candidate_model = ai_candidate_model
+        self.qa_listener = qa_listener
         
         # TTS는 프론트엔드에서 처리하므로 이력 추적 불필요
 
@@ -147,6 +150,7 @@ class Orchestrator:
                 "answer": content
             }
             self.session_state['qa_history'].append(qa_entry)
+            self._notify_qa_completed(qa_entry)
             print(f"[DEBUG] QA 저장: answerer={from_agent}, question='{question_text[:50]}...', answer='{content[:30]}...'")
             
             # 개별 답변 완료 체크 (사용자와 AI 모두 답변했는지)
@@ -178,6 +182,7 @@ class Orchestrator:
                 "answer": content
             }
             self.session_state['qa_history'].append(qa_entry)
+            self._notify_qa_completed(qa_entry)
             print(f"[DEBUG] QA 저장 (async): answerer={from_agent}, question='{question_text[:50]}...', answer='{content[:30]}...'")
 
             # 두 답변이 모두 완료되면 턴 증가 및 꼬리 질문 상태 업데이트
@@ -197,6 +202,15 @@ class Orchestrator:
                 if current_answers >= 2:
                     self._handle_turn_completion_for_common_question()
 
+    def _notify_qa_completed(self, qa_entry: Dict[str, Any]) -> None:
+        """확정된 QA를 리스너에 전달 (리스너 오류가 면접 진행을 막지 않도록 격리)"""
+        if not self.qa_listener:
+            return
+        try:
+            self.qa_listener(qa_entry)
+        except Exception as e:
+            print(f"[WARNING] QA 리스너 호출 실패: {e}")
+
     def _handle_turn_completion_for_common_question(self):
         """공통 질문 완료 시 처리"""
         # 🆕 꼬리 질문 카운트 증가 (수정된 로직)
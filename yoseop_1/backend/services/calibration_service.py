@@ -28,7 +28,7 @@ import uuid
 import logging
 
 # 새로운 모듈 import
-from .gaze_core import GazeCoreProcessor, GazeConfig
+from .gaze_core import GazeCoreProcessor, GazeConfig, FaceMeshPool
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -114,7 +114,8 @@ class GazeCalibrationManager(GazeCoreProcessor):
     
     실제 면접 서비스 적용 가이드:
     - 동시 처리: 서버당 50-100개 세션 동시 관리 가능
-    - 성능 최적화: MediaPipe 인스턴스 공유로 메모리 절약
+    - 성능 최적화: FaceMesh 인스턴스 풀로 세션 간 추론을 병렬 처리
+      (전역 잠금은 세션 딕셔너리 조회에만 사용, 세션 상태는 세션별 잠금으로 보호)
     - 사용자 경험: 직관적인 가이드 메시지 제공
     - 품질 보장: 불충분한 데이터 자동 감지 및 재수집
     """
@@ -131,7 +132,11 @@ class GazeCalibrationManager(GazeCoreProcessor):
         
         # 세션 관리
         self.sessions: Dict[str, CalibrationSession] = {}
-        self.lock = Lock()  # 스레드 안전성 보장
+        self.lock = Lock()  # 세션 딕셔너리 보호 (조회/추가/삭제 동안만 보유)
+        self._session_locks: Dict[str, Lock] = {}  # 세션 상태 보호 (같은 세션의 프레임은 순서대로 처리)
+        
+        # 프레임 추론용 FaceMesh 풀 (부모 클래스에서 만든 인스턴스를 첫 번째 인스턴스로 사용)
+        self.face_mesh_pool = FaceMeshPool(initial=self.face_mesh)
         
         # 캘리브레이션 설정
         self.calibration_phases = ['top_left', 'top_right', 'bottom_left', 'bottom_right']
@@ -181,10 +186,16 @@ class GazeCalibrationManager(GazeCoreProcessor):
                 initial_face_size=None
             )
             self.sessions[session_id] = session
+            self._session_locks[session_id] = Lock()
         
         logger.info(f"📝 [SESSION] 새 캘리브레이션 세션 생성: {session_id}")
         return session_id
     
+    def _get_session(self, session_id: str) -> Tuple[Optional[CalibrationSession], Optional[Lock]]:
+        """세션과 세션별 잠금 조회 (전역 잠금은 딕셔너리 조회 동안만 보유)"""
+        with self.lock:
+            return self.sessions.get(session_id), self._session_locks.get(session_id)
+    
     def start_calibration(self, session_id: str) -> bool:
         """
         캘리브레이션 시작
@@ -202,12 +213,12 @@ class GazeCalibrationManager(GazeCoreProcessor):
         - 존재하지 않는 세션 ID
         - 이미 진행 중인 캘리브레이션
         """
-        with self.lock:
-            if session_id not in self.sessions:
-                logger.warning(f"⚠️ [SESSION] 존재하지 않는 세션: {session_id}")
-                return False
-                
-            session = self.sessions[session_id]
+        session, session_lock = self._get_session(session_id)
+        if session is None:
+            logger.warning(f"⚠️ [SESSION] 존재하지 않는 세션: {session_id}")
+            return False
+        
+        with session_lock:
             if session.current_phase != 'ready':
                 logger.warning(f"⚠️ [SESSION] 잘못된 상태에서 시작 시도: {session.current_phase}")
                 return False
@@ -254,11 +265,11 @@ class GazeCalibrationManager(GazeCoreProcessor):
         - 사용자 가이드 제공
         - 자동 단계 진행 감지
         """
-        with self.lock:
-            if session_id not in self.sessions:
-                return None
-                
-            session = self.sessions[session_id]
+        session, session_lock = self._get_session(session_id)
+        if session is None:
+            return None
+        
+        with session_lock:
             current_time = time.time()
             elapsed_time = current_time - session.phase_start_time if session.phase_start_time > 0 else 0
             
@@ -442,12 +453,13 @@ class GazeCalibrationManager(GazeCoreProcessor):
         - 처리 속도: 30FPS 실시간 처리 지원
         - 메모리 효율: 프레임 버퍼링 최소화
         - 네트워크 효율: 필요한 정보만 전송
+        - 동시성: 추론은 세션별 잠금 + FaceMesh 풀에서 수행되어 다른 세션을 막지 않음
         """
-        with self.lock:
-            if session_id not in self.sessions:
-                return None
-                
-            session = self.sessions[session_id]
+        session, session_lock = self._get_session(session_id)
+        if session is None:
+            return None
+        
+        with session_lock:
             current_time = time.time()
             elapsed = current_time - session.phase_start_time
             
@@ -463,7 +475,8 @@ class GazeCalibrationManager(GazeCoreProcessor):
             # === 프레임 분석 ===
             h, w, _ = frame.shape
             rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.face_mesh.process(rgb_frame)
+            with self.face_mesh_pool.checkout(session_id) as face_mesh:
+                results = face_mesh.process(rgb_frame)
             
             # 분석 결과 변수 초기화
             eye_detected = False
@@ -473,11 +486,8 @@ class GazeCalibrationManager(GazeCoreProcessor):
             
             if results.multi_face_landmarks:
                 for face_landmarks in results.multi_face_landmarks:
-                    # 시선 포인트 계산 (부모 클래스 메서드 사용)
-                    gaze_point = self.get_gaze_point_3d(face_landmarks.landmark, w, h)
-                    
-                    # 얼굴 크기 측정 (부모 클래스 메서드 사용)
-                    current_face_size = self._estimate_face_size(face_landmarks.landmark, w, h)
+                    # 시선 포인트와 얼굴 크기 계산 (부모 클래스 메서드, 랜드마크 1회 추출)
+                    gaze_point, current_face_size = self.measure_landmarks(face_landmarks.landmark, w, h)
                     
                     if gaze_point:
                         eye_detected = True
@@ -687,11 +697,11 @@ class GazeCalibrationManager(GazeCoreProcessor):
         - completed_at: 완료 시간
         - initial_face_size: 기준 얼굴 크기 (동적 스케일링용)
         """
-        with self.lock:
-            if session_id not in self.sessions:
-                return None
-                
-            session = self.sessions[session_id]
+        session, session_lock = self._get_session(session_id)
+        if session is None:
+            return None
+        
+        with session_lock:
             if session.current_phase != 'completed':
                 return None
             
@@ -783,6 +793,7 @@ class GazeCalibrationManager(GazeCoreProcessor):
             # 만료된 세션 삭제
             for session_id in expired_sessions:
                 del self.sessions[session_id]
+                self._session_locks.pop(session_id, None)
         
         if expired_sessions:
             logger.info(f"🧹 [CLEANUP] 오래된 세션 정리: {len(expired_sessions)}개 삭제")
@@ -0,0 +1,452 @@
+"""
+시선 분석 일괄 재분석 (백필)
+
+점수 계산 방식을 바꾼 뒤 과거 녹화 영상을 다시 채점하려면 API로 한 건씩 재분석을 요청하는 방법밖에 없었습니다.
+이 모듈은 media_files에 저장된 녹화 영상을 조건별로 나열해 프로세스 풀에서 다시 분석하고,
+결과를 gaze_analysis에 묶음 단위로 저장합니다. CLI는 scripts/gaze_backfill.py입니다.
+
+- 대상: media_files (file_type='video') + 같은 s3_key의 최신 gaze_analysis 레코드 (캘리브레이션 포인트 출처)
+  목록 조회에서는 gaze_id / 캘리브레이션 등 필요한 컬럼만 50개 키씩 읽고, 전체 레코드는 저장 직전에 읽음
+  캘리브레이션이 없는 영상은 재분석할 수 없으므로 no_calibration으로 기록하고 건너뜀
+- 분석: spawn 프로세스 풀, 워커마다 GazeAnalyzer 1개 (워커 안의 구간 병렬 분석은 끔 → 코어 수만큼만 프로세스 사용)
+- S3 읽기 제한: 작업 제출 전에 요청 수 / 바이트 토큰 버킷 (media_files.file_size 기준)
+- 저장: 결과를 batch_size개씩 모아 upsert (gaze_id 기준). 저장이 끝난 작업만 체크포인트에 기록
+  저장에 실패한 묶음은 failed로 기록하고 계속 진행 (다시 실행하면 재시도)
+- 체크포인트: JSONL 추가 기록. 다시 실행하면 완료된 영상은 건너뛰고 실패한 영상만 재시도
+- 로컬 실행: LocalS3Client(폴더) + ManifestRecordingSource(JSONL) + JsonlResultSink로 네트워크 없이 실행 가능
+"""
+
+import os
+import json
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .gaze_core import GazeConfig
+from .gaze_service import GAZE_ANALYZER_VERSION
+
+logger = logging.getLogger(__name__)
+
+# 재분석 결과로 덮어쓰는 gaze_analysis 컬럼
+RESULT_FIELDS = ('gaze_score', 'jitter_score', 'compliance_score', 'stability_rating', 'gaze_points')
+COMPACT_FIELDS = ('gaze_trace', 'gaze_heatmap')
+# 다시 실행할 때 건너뛰는 체크포인트 상태 (failed는 재시도)
+FINISHED_STATUSES = ('updated', 'no_calibration')
+# 대상 조회 시 gaze_analysis에서 읽는 컬럼 (gaze_points 등 큰 컬럼은 저장 직전에 gaze_id로 다시 읽음)
+GAZE_ROW_FIELDS = 'gaze_id, s3_key, calibration_points, created_at'
+# in_ 필터 1회에 넣는 키 수 (PostgREST GET URL 길이 제한)
+IN_FILTER_CHUNK = 50
+
+
+@dataclass
+class BackfillJob:
+    """재분석 대상 녹화 영상 1개"""
+    media_id: str
+    s3_key: str
+    user_id: Optional[int] = None
+    interview_id: Optional[int] = None
+    created_at: Optional[str] = None
+    file_size: Optional[int] = None
+    calibration_points: List[Tuple[float, float]] = field(default_factory=list)
+    initial_face_size: Optional[float] = None
+    gaze_row: Optional[Dict[str, Any]] = None   # 기존 gaze_analysis 레코드 (GAZE_ROW_FIELDS 컬럼만)
+
+
+@dataclass
+class BackfillStats:
+    """진행 상황 / 처리량"""
+    started_at: float = field(default_factory=time.time)
+    submitted: int = 0
+    updated: int = 0
+    failed: int = 0
+    no_calibration: int = 0
+    already_done: int = 0
+    bytes_read: int = 0
+    analysis_seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = max(time.time() - self.started_at, 1e-6)
+        finished = self.updated + self.failed
+        return {
+            'elapsed_sec': round(elapsed, 1),
+            'submitted': self.submitted,
+            'updated': self.updated,
+            'failed': self.failed,
+            'no_calibration': self.no_calibration,
+            'already_done': self.already_done,
+            'recordings_per_min': round(finished / elapsed * 60, 2),
+            'mb_per_sec': round(self.bytes_read / elapsed / 1024 / 1024, 2),
+            'avg_analysis_sec': round(self.analysis_seconds / finished, 2) if finished else None,
+        }
+
+
+class RateLimiter:
+    """
+    토큰 버킷 (rate 단위/초, rate <= 0이면 제한 없음)
+
+    요청량이 버킷보다 커도 막히지 않도록 토큰을 빌려 쓰고, 빚을 갚을 만큼 기다립니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """amount만큼 사용 (필요하면 대기). Returns: 대기한 시간(초)"""
+        if self.rate <= 0 or amount <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self.rate
+        time.sleep(delay)
+        return delay
+
+
+class BackfillCheckpoint:
+    """영상별 처리 상태를 JSONL로 추가 기록 (중단 후 이어서 실행)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: set = set()
+        if os.path.exists(path):
+            latest: Dict[str, str] = {}
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 중단 중에 잘린 마지막 줄
+                    latest[entry['media_id']] = entry['status']
+            self.done = {media_id for media_id, status in latest.items() if status in FINISHED_STATUSES}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def record(self, media_id: str, status: str, **info: Any) -> None:
+        entry = dict(media_id=media_id, status=status, at=time.time(), analyzer_version=GAZE_ANALYZER_VERSION, **info)
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        if status in FINISHED_STATUSES:
+            self.done.add(media_id)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# === 대상 영상 목록 ===
+
+def _matches(job: BackfillJob, since: Optional[str], until: Optional[str],
+             user_ids: Optional[Sequence[int]], interview_ids: Optional[Sequence[int]]) -> bool:
+    if since and (job.created_at or '') < since:
+        return False
+    if until and (job.created_at or '') >= until:
+        return False
+    if user_ids and job.user_id not in user_ids:
+        return False
+    if interview_ids and job.interview_id not in interview_ids:
+        return False
+    return True
+
+
+class SupabaseRecordingSource:
+    """media_files + gaze_analysis에서 재분석 대상 조회 (생성 시각 순, page_size개씩)"""
+
+    def __init__(self, client, page_size: int = 500):
+        self.client = client
+        self.page_size = page_size
+
+    def _latest_gaze_rows(self, s3_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        latest: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(s3_keys), IN_FILTER_CHUNK):
+            rows = self.client.table('gaze_analysis').select(GAZE_ROW_FIELDS) \
+                .in_('s3_key', s3_keys[start:start + IN_FILTER_CHUNK]) \
+                .order('created_at', desc=True) \
+                .execute().data or []
+            for row in rows:
+                latest.setdefault(row['s3_key'], row)
+        return latest
+
+    def iter_jobs(self, since: Optional[str] = None, until: Optional[str] = None,
+                  user_ids: Optional[Sequence[int]] = None,
+                  interview_ids: Optional[Sequence[int]] = None) -> Iterator[BackfillJob]:
+        offset = 0
+        while True:
+            query = self.client.table('media_files') \
+                .select('media_id, user_id, interview_id, s3_key, file_size, created_at') \
+                .eq('file_type', 'video')
+            if since:
+                query = query.gte('created_at', since)
+            if until:
+                query = query.lt('created_at', until)
+            if user_ids:
+                query = query.in_('user_id', list(user_ids))
+            if interview_ids:
+                query = query.in_('interview_id', list(interview_ids))
+            rows = query.order('created_at').order('media_id') \
+                .range(offset, offset + self.page_size - 1).execute().data or []
+            if not rows:
+                return
+
+            gaze_rows = self._latest_gaze_rows([row['s3_key'] for row in rows if row.get('s3_key')])
+            for row in rows:
+                if not row.get('s3_key'):
+                    continue
+                gaze_row = gaze_rows.get(row['s3_key'])
+                yield BackfillJob(
+                    media_id=str(row['media_id']),
+                    s3_key=row['s3_key'],
+                    user_id=row.get('user_id'),
+                    interview_id=row.get('interview_id'),
+                    created_at=row.get('created_at'),
+                    file_size=row.get('file_size'),
+                    calibration_points=[tuple(p) for p in (gaze_row or {}).get('calibration_points') or []],
+                    gaze_row=gaze_row,
+                )
+            if len(rows) < self.page_size:
+                return
+            offset += self.page_size
+
+
+class ManifestRecordingSource:
+    """
+    JSONL 목록에서 재분석 대상 조회 (로컬 실행 / 검증용)
+
+    줄마다 BackfillJob 필드 (media_id, s3_key, calibration_points 필수)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def iter_jobs(self, since: Optional[str] = None, until: Optional[str] = None,
+                  user_ids: Optional[Sequence[int]] = None,
+                  interview_ids: Optional[Sequence[int]] = None) -> Iterator[BackfillJob]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                data['media_id'] = str(data['media_id'])
+                data['calibration_points'] = [tuple(p) for p in data.get('calibration_points') or []]
+                job = BackfillJob(**data)
+                if _matches(job, since, until, user_ids, interview_ids):
+                    yield job
+
+
+# === 결과 저장 ===
+
+def _result_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {name: result[name] for name in RESULT_FIELDS}
+    fields['gaze_trace'] = result.get('trace')
+    fields['gaze_heatmap'] = result.get('heatmap')
+    return fields
+
+
+class SupabaseResultSink:
+    """
+    gaze_analysis 레코드를 묶음 단위로 upsert (gaze_id 기준)
+
+    upsert는 전체 컬럼이 필요하므로 저장 직전에 묶음의 gaze_id로 기존 레코드를 읽어 결과 필드를 덮어씁니다.
+    flush가 실패해도 묶음은 비워지므로 호출하는 쪽에서 실패로 기록하고 계속 진행할 수 있습니다.
+    """
+
+    def __init__(self, client, batch_size: int = 50):
+        self.client = client
+        self.batch_size = batch_size
+        self._results: Dict[Any, Dict[str, Any]] = {}   # gaze_id → 결과 필드
+        self._compact_columns = True
+
+    @property
+    def pending(self) -> int:
+        return len(self._results)
+
+    def add(self, job: BackfillJob, result: Dict[str, Any]) -> None:
+        if not job.gaze_row or 'gaze_id' not in job.gaze_row:
+            raise ValueError(f"gaze_analysis 레코드가 없는 영상: {job.media_id}")
+        self._results[job.gaze_row['gaze_id']] = _result_fields(result)
+
+    def _load_rows(self, results: Dict[Any, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        gaze_ids = list(results)
+        rows = []
+        for start in range(0, len(gaze_ids), IN_FILTER_CHUNK):
+            rows.extend(self.client.table('gaze_analysis').select('*')
+                        .in_('gaze_id', gaze_ids[start:start + IN_FILTER_CHUNK]).execute().data or [])
+        missing = set(gaze_ids) - {row['gaze_id'] for row in rows}
+        if missing:
+            raise ValueError(f"gaze_analysis 레코드가 삭제됨: gaze_id={sorted(missing, key=str)}")
+        return [dict(row, **results[row['gaze_id']]) for row in rows]
+
+    def flush(self) -> None:
+        if not self._results:
+            return
+        results, self._results = self._results, {}
+        rows = self._load_rows(results)
+        if not self._compact_columns:
+            rows = [{k: v for k, v in row.items() if k not in COMPACT_FIELDS} for row in rows]
+        try:
+            self.client.table('gaze_analysis').upsert(rows, on_conflict='gaze_id').execute()
+        except Exception as e:
+            from .supabase_client import is_missing_column_error
+            if not self._compact_columns or not is_missing_column_error(e):
+                raise
+            # 압축 궤적 컬럼이 없는 DB: 이후 묶음부터는 압축 필드 없이 저장
+            logger.warning(f"⚠️ [BACKFILL] 압축 궤적 포함 저장 실패, 압축 필드 없이 재시도: {e}")
+            self._compact_columns = False
+            rows = [{k: v for k, v in row.items() if k not in COMPACT_FIELDS} for row in rows]
+            self.client.table('gaze_analysis').upsert(rows, on_conflict='gaze_id').execute()
+        logger.info(f"💾 [BACKFILL] gaze_analysis {len(rows)}건 저장")
+
+
+class JsonlResultSink:
+    """재분석 결과를 JSONL 파일에 묶음 단위로 기록 (로컬 실행 / DB 반영 전 검토용)"""
+
+    def __init__(self, path: str, batch_size: int = 50):
+        self.path = path
+        self.batch_size = batch_size
+        self._lines: List[str] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._lines)
+
+    def add(self, job: BackfillJob, result: Dict[str, Any]) -> None:
+        entry = {
+            'media_id': job.media_id, 's3_key': job.s3_key,
+            'gaze_id': (job.gaze_row or {}).get('gaze_id'),
+            'analyzer_version': GAZE_ANALYZER_VERSION,
+            **_result_fields(result),
+        }
+        self._lines.append(json.dumps(entry, ensure_ascii=False))
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+# === 워커 프로세스 ===
+
+_worker_analyzer = None
+
+
+def _init_backfill_worker(local_root: Optional[str]) -> None:
+    global _worker_analyzer
+    from .gaze_service import GazeAnalyzer
+    from .local_s3 import LocalS3Client
+
+    # 프로세스 풀 자체가 영상 단위로 병렬이므로 영상 안의 구간 병렬 분석은 끔
+    GazeConfig.PARALLEL_MAX_WORKERS = 1
+    _worker_analyzer = GazeAnalyzer()
+    if local_root:
+        _worker_analyzer.s3_client = LocalS3Client(local_root)
+
+
+def _analyze_in_worker(bucket: str, s3_key: str, calibration_points: List[Tuple[float, float]],
+                       initial_face_size: Optional[float], frame_skip: Optional[int]) -> Dict[str, Any]:
+    start = time.time()
+    result = _worker_analyzer.analyze_video_from_s3(bucket, s3_key, calibration_points, initial_face_size,
+                                                    frame_skip=frame_skip)
+    return {'result': asdict(result), 'seconds': time.time() - start}
+
+
+# === 실행 ===
+
+def run_backfill(jobs: Iterable[BackfillJob], sink, checkpoint: BackfillCheckpoint, bucket: str,
+                 workers: int = 2, frame_skip: Optional[int] = None, local_root: Optional[str] = None,
+                 max_requests_per_sec: float = 0.0, max_bytes_per_sec: float = 0.0,
+                 report_interval: float = 30.0) -> BackfillStats:
+    """
+    대상 영상을 프로세스 풀에서 재분석하고 결과를 sink에 묶음 단위로 저장
+
+    sink는 add(job, result) / flush() / pending / batch_size를 제공해야 합니다.
+    flush()는 실패해도 묶음을 비워야 합니다 (실패한 묶음의 영상은 failed로 기록하고 계속 진행).
+    """
+    stats = BackfillStats()
+    request_limiter = RateLimiter(max_requests_per_sec)
+    byte_limiter = RateLimiter(max_bytes_per_sec)
+    max_in_flight = max(1, workers) * 2
+    pending: Dict[Future, BackfillJob] = {}
+    unflushed: List[BackfillJob] = []
+    last_report = time.time()
+
+    def flush_sink() -> None:
+        try:
+            sink.flush()
+        except Exception as e:
+            stats.failed += len(unflushed)
+            for failed in unflushed:
+                checkpoint.record(failed.media_id, 'failed', s3_key=failed.s3_key, error=f"저장 실패: {e}")
+            logger.error(f"❌ [BACKFILL] 결과 {len(unflushed)}건 저장 실패: {e}")
+        else:
+            stats.updated += len(unflushed)
+            for flushed in unflushed:
+                checkpoint.record(flushed.media_id, 'updated', s3_key=flushed.s3_key)
+        unflushed.clear()
+
+    def collect(done_futures) -> None:
+        nonlocal last_report
+        for future in done_futures:
+            job = pending.pop(future)
+            try:
+                output = future.result()
+            except Exception as e:
+                stats.failed += 1
+                checkpoint.record(job.media_id, 'failed', s3_key=job.s3_key, error=str(e))
+                logger.warning(f"⚠️ [BACKFILL] 재분석 실패: {job.s3_key} - {e}")
+                continue
+            stats.bytes_read += job.file_size or 0
+            stats.analysis_seconds += output['seconds']
+            try:
+                sink.add(job, output['result'])
+            except Exception as e:
+                stats.failed += 1
+                checkpoint.record(job.media_id, 'failed', s3_key=job.s3_key, error=str(e))
+                logger.warning(f"⚠️ [BACKFILL] 결과 저장 준비 실패: {job.s3_key} - {e}")
+                continue
+            unflushed.append(job)
+            if sink.pending >= sink.batch_size:
+                flush_sink()
+
+        if time.time() - last_report >= report_interval:
+            last_report = time.time()
+            logger.info(f"📊 [BACKFILL] 진행 상황: {stats.summary()}")
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max(1, workers), mp_context=context,
+                             initializer=_init_backfill_worker, initargs=(local_root,)) as pool:
+        for job in jobs:
+            if job.media_id in checkpoint.done:
+                stats.already_done += 1
+                continue
+            if len(job.calibration_points) != 4:
+                stats.no_calibration += 1
+                checkpoint.record(job.media_id, 'no_calibration', s3_key=job.s3_key)
+                continue
+
+            while len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            request_limiter.acquire()
+            byte_limiter.acquire(job.file_size or 0)
+            future = pool.submit(_analyze_in_worker, bucket, job.s3_key, job.calibration_points,
+                                 job.initial_face_size, frame_skip)
+            pending[future] = job
+            stats.submitted += 1
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    flush_sink()
+    logger.info(f"✅ [BACKFILL] 재분석 완료: {stats.summary()}")
+    return stats
@@ -16,16 +16,31 @@
 용도: 베타고 면접 플랫폼 시선 분석 시스템
 """
 
+import os
 import cv2
 import mediapipe as mp
 import numpy as np
-from typing import Tuple, Optional, List
+import struct
+import threading
+import subprocess
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Tuple, Optional, List, Iterator, Callable
 import logging
 
+from .gaze_stats import GazeStatsAccumulator
+
 # 로깅 설정 (실제 서비스에서는 중앙 로거 사용 권장)
 logger = logging.getLogger(__name__)
 
 
+class GazeAnalysisCancelled(Exception):
+    """분석 취소 요청으로 동영상 분석이 중단된 경우"""
+    pass
+
+
 class GazeCoreProcessor:
     """
     시선 분석의 핵심 로직을 담당하는 기반 클래스
@@ -64,12 +79,7 @@ class GazeCoreProcessor:
         
         # MediaPipe 솔루션 초기화
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            refine_landmarks=True,          # 아이리스 추적을 위해 필수
-            max_num_faces=1,                # 면접: 한 사람만 추적
-            min_detection_confidence=0.5,   # 50% 신뢰도로 얼굴 검출
-            min_tracking_confidence=0.5     # 50% 신뢰도로 추적 지속
-        )
+        self.face_mesh = self.create_face_mesh()
         
         # 아이리스 랜드마크 인덱스 (MediaPipe FaceMesh 468포인트 기준)
         # 참고: https://github.com/google/mediapipe/blob/master/docs/solutions/face_mesh.md
@@ -80,8 +90,21 @@ class GazeCoreProcessor:
         # 실제 면접에서 사용자가 앞뒤로 움직일 때 거리 변화 감지용
         self.face_boundary_indices = [10, 152, 234, 454]  # 이마, 턱, 좌측, 우측
         
+        # 프레임마다 필요한 14개 랜드마크만 한 번에 꺼내기 위한 인덱스 (아이리스 10개 + 얼굴 경계 4개)
+        self._tracked_indices = tuple(self.left_iris_indices + self.right_iris_indices + self.face_boundary_indices)
+        
         logger.info("✅ [GAZE_CORE] MediaPipe FaceMesh 초기화 완료")
     
+    @staticmethod
+    def create_face_mesh():
+        """시선 분석 공통 설정의 FaceMesh 인스턴스 생성 (FaceMeshPool에서도 사용)"""
+        return mp.solutions.face_mesh.FaceMesh(
+            refine_landmarks=True,          # 아이리스 추적을 위해 필수
+            max_num_faces=1,                # 면접: 한 사람만 추적
+            min_detection_confidence=0.5,   # 50% 신뢰도로 얼굴 검출
+            min_tracking_confidence=0.5     # 50% 신뢰도로 추적 지속
+        )
+    
     def get_gaze_point_3d(self, landmarks, w: int, h: int) -> Optional[Tuple[float, float]]:
         """
         MediaPipe 랜드마크로부터 3D 시선 포인트를 계산
@@ -111,33 +134,7 @@ class GazeCoreProcessor:
         - 반환값이 None이면 해당 프레임은 분석에서 제외
         """
         try:
-            # 좌측 아이리스 중심점 계산
-            left_iris_points = np.array([
-                (landmarks[i].x * w, landmarks[i].y * h, landmarks[i].z) 
-                for i in self.left_iris_indices
-            ])
-            left_center = np.mean(left_iris_points, axis=0)
-            
-            # 우측 아이리스 중심점 계산  
-            right_iris_points = np.array([
-                (landmarks[i].x * w, landmarks[i].y * h, landmarks[i].z)
-                for i in self.right_iris_indices
-            ])
-            right_center = np.mean(right_iris_points, axis=0)
-            
-            # 양쪽 아이리스의 평균으로 최종 시선 포인트 계산
-            avg_gaze = (left_center + right_center) / 2
-            
-            # 유효성 검증: NaN, 무한대, 0값 체크
-            if (np.any(np.isnan(avg_gaze)) or 
-                np.any(np.isinf(avg_gaze)) or 
-                np.allclose(avg_gaze, 0)):
-                logger.warning("⚠️ [GAZE_CORE] 유효하지 않은 시선 포인트 감지됨")
-                return None
-            
-            # x, y 좌표만 반환 (z는 깊이 정보로 여기서는 사용하지 않음)
-            return (float(avg_gaze[0]), float(avg_gaze[1]))
-            
+            return self.gaze_point_from_array(self.extract_landmark_array(landmarks, w, h))
         except Exception as e:
             logger.error(f"❌ [GAZE_CORE] 시선 포인트 계산 실패: {e}")
             return None
@@ -176,32 +173,115 @@ class GazeCoreProcessor:
         - 상대적 비율(scale_factor)로만 사용 권장
         """
         try:
-            # 얼굴 경계 포인트들의 픽셀 좌표 계산
-            face_points = [
-                (landmarks[self.face_boundary_indices[0]].x * w, landmarks[self.face_boundary_indices[0]].y * h),  # 이마 (10)
-                (landmarks[self.face_boundary_indices[1]].x * w, landmarks[self.face_boundary_indices[1]].y * h),  # 턱 (152)
-                (landmarks[self.face_boundary_indices[2]].x * w, landmarks[self.face_boundary_indices[2]].y * h),  # 좌측 (234)
-                (landmarks[self.face_boundary_indices[3]].x * w, landmarks[self.face_boundary_indices[3]].y * h),  # 우측 (454)
-            ]
-            
-            # 바운딩 박스 계산
-            x_coords = [p[0] for p in face_points]
-            y_coords = [p[1] for p in face_points]
-            
-            width = max(x_coords) - min(x_coords)   # 얼굴 너비
-            height = max(y_coords) - min(y_coords)  # 얼굴 높이
-            
-            # 너비와 높이 중 큰 값을 얼굴 크기로 사용
-            face_size = max(width, height)
-            
-            logger.debug(f"📏 [GAZE_CORE] 얼굴 크기 측정: {face_size:.1f}px (W:{width:.1f}, H:{height:.1f})")
-            return face_size
-            
+            return self.face_size_from_array(self.extract_landmark_array(landmarks, w, h))
         except Exception as e:
             logger.error(f"❌ [GAZE_CORE] 얼굴 크기 측정 실패: {e}")
             return 0.0
     
-    def validate_gaze_data(self, gaze_points: list, min_points: int = 10) -> bool:
+    def extract_landmark_array(self, landmarks, w: int, h: int) -> np.ndarray:
+        """
+        시선/얼굴 크기 계산에 필요한 랜드마크만 (14, 3) 픽셀 좌표 배열로 추출
+        
+        행 순서: 좌측 아이리스 5개, 우측 아이리스 5개, 얼굴 경계 4개 (이마, 턱, 좌측, 우측)
+        프레임당 배열 하나만 만들고, 이후 계산은 모두 이 배열에 대한 numpy 연산으로 처리합니다.
+        """
+        coords = np.fromiter(
+            (value for i in self._tracked_indices
+             for value in (landmarks[i].x, landmarks[i].y, landmarks[i].z)),
+            dtype=np.float64, count=len(self._tracked_indices) * 3
+        ).reshape(-1, 3)
+        coords *= (w, h, 1.0)
+        return coords
+    
+    @staticmethod
+    def gaze_point_from_array(points: np.ndarray) -> Optional[Tuple[float, float]]:
+        """extract_landmark_array 결과로 시선 포인트 계산 (get_gaze_point_3d와 동일한 값)"""
+        # 눈별 아이리스 중심 (2, 3) → 양쪽 평균
+        avg_gaze = points[:10].reshape(2, 5, 3).mean(axis=1).mean(axis=0)
+        
+        # 유효성 검증: NaN, 무한대, 0값 체크
+        if not np.all(np.isfinite(avg_gaze)) or np.allclose(avg_gaze, 0):
+            logger.warning("⚠️ [GAZE_CORE] 유효하지 않은 시선 포인트 감지됨")
+            return None
+        
+        # x, y 좌표만 반환 (z는 깊이 정보로 여기서는 사용하지 않음)
+        return (float(avg_gaze[0]), float(avg_gaze[1]))
+    
+    @staticmethod
+    def face_size_from_array(points: np.ndarray) -> float:
+        """extract_landmark_array 결과로 얼굴 크기 계산 (_estimate_face_size와 동일한 값)"""
+        width, height = np.ptp(points[10:14, :2], axis=0)
+        face_size = float(max(width, height))
+        logger.debug(f"📏 [GAZE_CORE] 얼굴 크기 측정: {face_size:.1f}px (W:{width:.1f}, H:{height:.1f})")
+        return face_size
+    
+    def measure_landmarks(self, landmarks, w: int, h: int) -> Tuple[Optional[Tuple[float, float]], float]:
+        """
+        한 프레임의 (시선 포인트, 얼굴 크기)를 랜드마크 1회 추출로 계산
+        
+        Returns:
+            Tuple: (시선 포인트 또는 None, 얼굴 크기 또는 0.0)
+        """
+        try:
+            points = self.extract_landmark_array(landmarks, w, h)
+        except Exception as e:
+            logger.error(f"❌ [GAZE_CORE] 랜드마크 추출 실패: {e}")
+            return None, 0.0
+        return self.gaze_point_from_array(points), self.face_size_from_array(points)
+    
+    def locate_face(self, face_mesh, frame: np.ndarray,
+                    roi_tracker: Optional["FaceRoiTracker"] = None) -> Optional[np.ndarray]:
+        """
+        프레임에서 FaceMesh를 실행해 전체 프레임 픽셀 좌표의 (14, 3) 랜드마크 배열을 반환
+        
+        roi_tracker가 있으면 직전 얼굴 주변 크롭에서만 추론하고, 크롭에서 얼굴을 놓치면
+        같은 프레임을 전체 해상도로 다시 검출합니다. 크롭 좌표는 원점 이동으로 전체 프레임 좌표로 되돌리므로
+        gaze_point_from_array / face_size_from_array 결과는 전체 프레임 기준 값입니다.
+        
+        FaceMesh 추적 모드는 직전 입력의 랜드마크 위치를 이어서 쓰므로, 크롭은 roi_tracker의 크롭 전용 FaceMesh로,
+        전체 프레임은 face_mesh로 추론해 한 인스턴스에 좌표계가 다른 이미지가 섞이지 않게 합니다.
+        크롭 영역이 바뀐 프레임은 새 크롭을 한 번 먼저 넣어(결과 버림) 이전 영역 좌표의 추적 상태를 갱신합니다.
+        
+        Returns:
+            np.ndarray | None: extract_landmark_array와 같은 형식의 배열 (얼굴 미검출 시 None)
+        """
+        frame_h, frame_w = frame.shape[:2]
+        if roi_tracker is None:
+            return self._infer_landmark_array(face_mesh, frame, (0, 0), frame_w)
+        
+        image, origin = roi_tracker.crop(frame)
+        if image is frame:
+            points = self._infer_landmark_array(face_mesh, frame, (0, 0), frame_w)
+        else:
+            crop_face_mesh = roi_tracker.crop_face_mesh()
+            if roi_tracker.take_roi_change():
+                crop_face_mesh.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+            points = self._infer_landmark_array(crop_face_mesh, image, origin, frame_w)
+            if points is None:
+                points = self._infer_landmark_array(face_mesh, frame, (0, 0), frame_w)
+        roi_tracker.update(points, frame_w, frame_h)
+        return points
+    
+    def _infer_landmark_array(self, face_mesh, image: np.ndarray, origin: Tuple[int, int],
+                              frame_width: int) -> Optional[np.ndarray]:
+        """image(전체 프레임 또는 크롭)에서 FaceMesh 추론 후 랜드마크를 전체 프레임 좌표로 변환"""
+        h, w = image.shape[:2]
+        results = face_mesh.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        if not results.multi_face_landmarks:
+            return None
+        try:
+            points = self.extract_landmark_array(results.multi_face_landmarks[0].landmark, w, h)
+        except Exception as e:
+            logger.error(f"❌ [GAZE_CORE] 랜드마크 추출 실패: {e}")
+            return None
+        if origin != (0, 0):
+            points[:, 0] += origin[0]
+            points[:, 1] += origin[1]
+        if w != frame_width:
+            points[:, 2] *= w / frame_width  # z는 입력 이미지 너비 기준 정규화 값
+        return points
+    
+    def validate_gaze_data(self, gaze_points, min_points: int = 10) -> bool:
         """
         시선 데이터의 유효성을 검증
         
@@ -230,18 +310,125 @@ class GazeCoreProcessor:
             return True  # 포인트가 적으면 분산 계산 불가
         
         # 시선 포인트 분산도 체크
-        arr = np.array(gaze_points)
-        std_x = np.std(arr[:, 0])
-        std_y = np.std(arr[:, 1])
+        arr = np.asarray(gaze_points)
+        return self.validate_gaze_spread(len(gaze_points), np.std(arr[:, 0]), np.std(arr[:, 1]), min_points)
+    
+    def validate_gaze_spread(self, count: int, std_x: float, std_y: float, min_points: int = 10) -> bool:
+        """포인트 수와 x/y 표준편차만으로 하는 validate_gaze_data 검증 (GazeStatsAccumulator 결과용)"""
+        if count < min_points:
+            logger.warning(f"⚠️ [GAZE_CORE] 시선 데이터 부족: {count} < {min_points}")
+            return False
+        
+        if count < 3:
+            return True  # 포인트가 적으면 분산 계산 불가
         
         # 분산이 너무 작으면 (모든 포인트가 한 곳에 집중) 의심스러운 데이터
         if std_x < 1.0 and std_y < 1.0:
             logger.warning("⚠️ [GAZE_CORE] 시선 데이터 분산도 너무 낮음 (한 점에 집중)")
             return False
         
-        logger.info(f"✅ [GAZE_CORE] 시선 데이터 유효성 검증 통과: {len(gaze_points)}개 포인트")
+        logger.info(f"✅ [GAZE_CORE] 시선 데이터 유효성 검증 통과: {count}개 포인트")
         return True
     
+    def track_video_segment(self, video_path: str, frame_skip: int, start_frame: int = 0,
+                            end_frame: Optional[int] = None,
+                            progress_callback: Optional[Callable[[int], None]] = None,
+                            cancel_event: Optional[threading.Event] = None,
+                            accumulator: Optional[GazeStatsAccumulator] = None) -> GazeStatsAccumulator:
+        """
+        동영상의 한 구간에서 샘플링된 프레임마다 시선 포인트와 얼굴 크기를 추출
+        
+        전체 동영상 순차 분석과 구간 병렬 분석이 같은 코드 경로를 사용하도록 분리한 메서드입니다.
+        start_frame이 frame_skip의 배수이면 전체 순차 분석과 동일한 프레임이 샘플링됩니다.
+        
+        Args:
+            video_path: 로컬 동영상 경로
+            frame_skip: 프레임 스킵 간격
+            start_frame: 구간 시작 (이 프레임 수만큼 건너뛴 뒤부터 분석)
+            end_frame: 구간 끝 (1부터 센 프레임 번호, 포함). None이면 끝까지
+            progress_callback: 샘플 프레임마다 현재 프레임 번호로 호출 (선택적)
+            cancel_event: 설정되면 다음 샘플 프레임에서 GazeAnalysisCancelled 발생 (선택적)
+            accumulator: 유효한 프레임의 (시선 포인트, 얼굴 크기)를 누적할 대상 (없으면 새로 생성)
+            
+        Returns:
+            GazeStatsAccumulator: 이 구간의 시선 통계
+        """
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise Exception(f"동영상을 열 수 없습니다: {video_path}")
+        
+        def frames_in_segment():
+            for frame_number, frame in iter_sampled_frames(cap, frame_skip, start_frame=start_frame):
+                if end_frame is not None and frame_number > end_frame:
+                    return
+                yield frame_number, frame
+        
+        try:
+            return self.track_frames(frames_in_segment(), progress_callback, cancel_event, accumulator)
+        finally:
+            cap.release()
+    
+    def track_frames(self, frames: Iterator[Tuple[int, np.ndarray]],
+                     progress_callback: Optional[Callable[[int], None]] = None,
+                     cancel_event: Optional[threading.Event] = None,
+                     accumulator: Optional[GazeStatsAccumulator] = None,
+                     sampler: Optional["MotionAdaptiveSampler"] = None) -> GazeStatsAccumulator:
+        """
+        (프레임 번호, BGR 프레임) 이터레이터의 모든 프레임에서 시선 포인트와 얼굴 크기를 추출
+        
+        OpenCV 디코딩(track_video_segment)과 FFmpeg 파이프 디코딩(FFmpegFrameReader)이 공유하는 추적 루프입니다.
+        포인트를 목록으로 모으지 않고 유효한 프레임마다 accumulator에 바로 반영합니다.
+        
+        sampler가 있으면 프레임은 후보 프레임으로 취급하고 움직임이 있는 프레임에서만 FaceMesh를 실행합니다.
+        건너뛴 프레임은 누적하지 않으므로 통계와 분석 프레임 수(count)는 실제로 분석한 프레임만 반영합니다.
+        
+        Returns:
+            GazeStatsAccumulator: 누적된 시선 통계 (accumulator를 넘겼으면 같은 객체)
+        """
+        if accumulator is None:
+            accumulator = GazeStatsAccumulator()
+        roi_tracker = FaceRoiTracker(face_mesh_factory=self.create_face_mesh) if GazeConfig.ROI_TRACKING_ENABLED else None
+        last_sample = None
+        try:
+            for frame_number, frame in frames:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise GazeAnalysisCancelled("시선 분석이 취소되었습니다.")
+                if progress_callback:
+                    progress_callback(frame_number)
+                
+                if sampler is not None and not sampler.should_analyze(frame):
+                    continue
+                last_sample = None
+                
+                # MediaPipe 얼굴 분석 (가능하면 직전 얼굴 주변 크롭에서만 추론)
+                points = self.locate_face(self.face_mesh, frame, roi_tracker)
+                
+                if points is not None:
+                    gaze_point = self.gaze_point_from_array(points)
+                    current_face_size = self.face_size_from_array(points)
+                    
+                    if gaze_point and current_face_size > 0:
+                        accumulator.update(gaze_point, current_face_size)
+                        last_sample = (gaze_point, current_face_size)
+                
+                if sampler is not None:
+                    sampler.set_focus(*(last_sample or (None, 0.0)))
+        finally:
+            # 중간에 멈춘 경우 제너레이터를 바로 닫아 디코더(FFmpeg 프로세스 등)를 정리
+            close = getattr(frames, 'close', None)
+            if close:
+                close()
+            if roi_tracker is not None:
+                roi_tracker.close()
+        
+        if roi_tracker is not None:
+            logger.info(f"✂️ [GAZE_CORE] 얼굴 ROI 추적: 크롭 {roi_tracker.cropped}회, 전체 프레임 {roi_tracker.full}회, "
+                        f"추적 실패 후 재검출 {roi_tracker.lost}회, 영역 변경 재추적 {roi_tracker.reprimes}회")
+        if sampler is not None:
+            logger.info(f"🎯 [GAZE_CORE] 적응형 샘플링: 후보 {sampler.candidates}프레임 중 "
+                        f"{sampler.analyzed}프레임 FaceMesh 분석")
+        return accumulator
+    
     def __del__(self):
         """
         소멸자: MediaPipe 리소스 정리
@@ -277,6 +464,49 @@ class GazeConfig:
         'high_performance': 20   # 고속 처리 (긴 면접, 다중 처리)
     }
     
+    # 프레임 스킵이 이 값 이상이면 grab() 반복 대신 프레임 위치 탐색(seek) 사용
+    # (키프레임 간격보다 스킵이 길 때만 이득, 0이면 비활성화)
+    SEEK_FRAME_SKIP_THRESHOLD = 60
+    # OpenCV 프레임 위치 탐색이 프레임 단위로 정확하지 않은 코덱 (브라우저 녹화 webm 등) → 항상 grab()으로 진행
+    SEEK_UNSAFE_CODECS = ('VP80', 'VP90', 'AV01')
+    
+    # === 구간 병렬 분석 ===
+    # 이 길이 이상의 동영상은 시간 구간으로 나눠 프로세스 풀에서 분석 (워커당 FaceMesh 1개)
+    PARALLEL_MIN_DURATION_SEC = 120
+    PARALLEL_MIN_SEGMENT_SEC = 30   # 구간이 너무 짧으면 구간 시작 시 얼굴 재검출 비용이 커짐
+    PARALLEL_MAX_WORKERS = int(os.getenv('GAZE_PARALLEL_WORKERS', str(os.cpu_count() or 1)))
+    
+    # === FFmpeg 파이프 디코딩 ===
+    # FFmpeg 1개 프로세스가 분석 해상도/분석 fps로 줄인 raw 프레임을 파이프로 전달 (중간 mp4 없음)
+    # 해상도와 기준 fps는 기존 webm→mp4 트랜스코딩 설정(640x480, 15fps)과 같아 점수 기준이 유지됩니다.
+    STREAM_DECODE_ENABLED = os.getenv('GAZE_STREAM_DECODE', 'true').lower() == 'true'
+    STREAM_FROM_S3 = os.getenv('GAZE_STREAM_FROM_S3', 'true').lower() == 'true'  # webm은 다운로드 없이 S3 본문을 바로 입력
+    STREAM_DECODE_SIZE = (640, 480)
+    STREAM_BASE_FPS = 15            # 샘플링 fps = STREAM_BASE_FPS / frame_skip
+    
+    # === 움직임 적응형 샘플링 (FFmpeg 파이프 경로) ===
+    # 고정 간격 대신 더 촘촘한 후보 프레임마다 축소 밝기 차이로 움직임을 재고, 움직임이 있을 때만 FaceMesh 실행
+    # 건너뛴 후보 프레임은 통계에 넣지 않으므로 분석 프레임 수가 고정 샘플링보다 적어짐 (기본 꺼짐)
+    ADAPTIVE_SAMPLING_ENABLED = os.getenv('GAZE_ADAPTIVE_SAMPLING', 'false').lower() == 'true'
+    ADAPTIVE_CANDIDATE_RATIO = 3        # 후보 fps = 고정 샘플링 fps × 3 (최대 STREAM_BASE_FPS)
+    ADAPTIVE_BUDGET_RATIO = 0.67        # 분당 FaceMesh 호출 예산 = 고정 샘플링 호출 수 × 0.67
+    ADAPTIVE_BUDGET_PER_MIN = float(os.getenv('GAZE_ADAPTIVE_BUDGET_PER_MIN', '0'))  # 0이면 위 비율로 계산
+    ADAPTIVE_MOTION_THRESHOLD = float(os.getenv('GAZE_ADAPTIVE_MOTION_THRESHOLD', '2.0'))  # 평균 밝기 차이 (0~255)
+    ADAPTIVE_MAX_INTERVAL_SEC = 2.0     # 정지 구간에서도 이 간격마다 한 번은 측정
+    ADAPTIVE_BURST_SEC = 5.0            # 움직임이 몰릴 때 앞당겨 쓸 수 있는 예산 (초 단위)
+    ADAPTIVE_PROBE_SIZE = (64, 48)      # 전체 화면 움직임 측정용 축소 크기
+    
+    # === 얼굴 ROI 추적 ===
+    # 직전 프레임 얼굴 주변(여백 포함)만 잘라 FaceMesh에 넣음 (HD 원본 디코딩 경로에서 효과가 큼, 기본 꺼짐)
+    # 크롭은 전용 FaceMesh로 추론하고 영역이 바뀌면 새로 만들어 추적 상태를 초기화
+    ROI_TRACKING_ENABLED = os.getenv('GAZE_ROI_TRACKING', 'false').lower() == 'true'
+    ROI_PADDING = 0.5           # 얼굴 크기 대비 각 방향 여백 (크롭 한 변 = 얼굴 크기 × 2)
+    ROI_MAX_AREA_RATIO = 0.5    # 크롭이 프레임 면적의 이 비율보다 크면 전체 프레임 사용 (이득 없음)
+    
+    # === 실시간 프레임 처리 (캘리브레이션) ===
+    # 동시에 추론할 수 있는 FaceMesh 인스턴스 수 (인스턴스당 메모리 약 100-200MB)
+    FACE_MESH_POOL_SIZE = int(os.getenv('GAZE_FACEMESH_POOL_SIZE', str(os.cpu_count() or 1)))
+    
     # === 점수 계산 가중치 ===
     # 실제 면접 데이터로 검증된 값 (추후 A/B 테스트로 최적화 가능)
     SCORE_WEIGHTS = {
@@ -304,6 +534,19 @@ class GazeConfig:
         """프레임 스킵 설정 반환"""
         return cls.FRAME_SKIP_CONFIGS.get(mode, cls.FRAME_SKIP_CONFIGS['balanced'])
     
+    @classmethod
+    def adaptive_sampling_plan(cls, frame_skip: int) -> Tuple[float, float]:
+        """
+        frame_skip에 대응하는 적응형 샘플링 설정 반환
+        
+        Returns:
+            Tuple[float, float]: (후보 프레임 fps, 분당 FaceMesh 호출 예산)
+        """
+        fixed_fps = cls.STREAM_BASE_FPS / max(1, frame_skip)
+        candidate_fps = min(float(cls.STREAM_BASE_FPS), fixed_fps * cls.ADAPTIVE_CANDIDATE_RATIO)
+        budget = cls.ADAPTIVE_BUDGET_PER_MIN or fixed_fps * 60 * cls.ADAPTIVE_BUDGET_RATIO
+        return candidate_fps, budget
+    
     @classmethod
     def validate_config(cls) -> bool:
         """설정값 유효성 검증"""
@@ -317,6 +560,562 @@ class GazeConfig:
         return True
 
 
+def gaze_in_range_mask(points: np.ndarray, allowed_range: dict) -> np.ndarray:
+    """(N, 2) 시선 포인트 배열 중 허용 범위(경계 포함) 안에 있는 포인트의 불리언 마스크"""
+    x, y = points[:, 0], points[:, 1]
+    return ((allowed_range['left_bound'] <= x) & (x <= allowed_range['right_bound']) &
+            (allowed_range['top_bound'] <= y) & (y <= allowed_range['bottom_bound']))
+
+
+class FaceRoiTracker:
+    """
+    얼굴 ROI(관심 영역) 추적기
+    
+    직전에 검출한 랜드마크(아이리스 + 얼굴 경계)의 바운딩 박스에 여백을 더한 정사각형 영역을 다음 프레임의
+    FaceMesh 입력으로 사용합니다. 얼굴이 크롭 안쪽 여백을 벗어나거나 크기가 크게 바뀔 때만 영역을 다시 잡아
+    크롭 위치가 프레임마다 흔들리지 않게 합니다 (MediaPipe 내부 추적 모드 유지).
+    얼굴을 놓치면 영역을 해제해 전체 프레임 검출로 돌아갑니다.
+    
+    크롭은 전체 프레임과 좌표계가 다르므로 크롭 전용 FaceMesh(crop_face_mesh) 1개로 추론합니다.
+    영역이 바뀌면 FaceMesh를 다시 만들지 않고(모델 재로딩 + 검출 모드 비용) 새 크롭을 한 번 더 넣어
+    추적 상태를 새 영역 좌표로 다시 잡습니다 (take_roi_change, 영역 변경당 추론 1회 추가).
+    """
+    
+    def __init__(self, padding: Optional[float] = None, max_area_ratio: Optional[float] = None,
+                 face_mesh_factory: Optional[Callable[[], object]] = None):
+        self.padding = GazeConfig.ROI_PADDING if padding is None else padding
+        self.max_area_ratio = GazeConfig.ROI_MAX_AREA_RATIO if max_area_ratio is None else max_area_ratio
+        self.face_mesh_factory = face_mesh_factory
+        self.roi: Optional[Tuple[int, int, int, int]] = None  # (x0, y0, x1, y1)
+        self.cropped = 0
+        self.full = 0
+        self.lost = 0
+        self.reprimes = 0
+        self._face_mesh = None
+        self._face_mesh_roi: Optional[Tuple[int, int, int, int]] = None
+    
+    def crop_face_mesh(self):
+        """크롭 전용 FaceMesh (최초 호출 시 생성, 이후 재사용)"""
+        if self._face_mesh is None:
+            factory = self.face_mesh_factory or GazeCoreProcessor.create_face_mesh
+            self._face_mesh = factory()
+        return self._face_mesh
+    
+    def take_roi_change(self) -> bool:
+        """크롭 FaceMesh가 마지막으로 본 영역과 현재 영역이 다르면 True (현재 영역을 본 것으로 기록)"""
+        if self._face_mesh_roi == self.roi:
+            return False
+        if self._face_mesh_roi is not None:
+            self.reprimes += 1
+        self._face_mesh_roi = self.roi
+        return True
+    
+    def close(self) -> None:
+        if self._face_mesh is not None:
+            self._face_mesh.close()
+            self._face_mesh = None
+    
+    def crop(self, frame: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """FaceMesh에 넣을 이미지와 그 원점 반환 (ROI가 없으면 전체 프레임과 (0, 0))"""
+        if self.roi is None:
+            self.full += 1
+            return frame, (0, 0)
+        self.cropped += 1
+        x0, y0, x1, y1 = self.roi
+        return frame[y0:y1, x0:x1], (x0, y0)
+    
+    def update(self, points: Optional[np.ndarray], frame_w: int, frame_h: int) -> None:
+        """이번 프레임의 전체 프레임 좌표 랜드마크 배열(없으면 None)로 다음 프레임 ROI 갱신"""
+        if points is None:
+            if self.roi is not None:
+                self.lost += 1
+            self.roi = None
+            return
+        
+        (bx0, by0), (bx1, by1) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+        face = max(bx1 - bx0, by1 - by0)
+        if face <= 0:
+            self.roi = None
+            return
+        
+        # 얼굴이 현재 크롭 안쪽(각 변 10% 여백)에 있고 크기 비율이 유지되면 크롭을 그대로 사용
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            side = min(x1 - x0, y1 - y0)
+            margin = side * 0.1
+            if (bx0 >= x0 + margin and by0 >= y0 + margin and bx1 <= x1 - margin and by1 <= y1 - margin and
+                    0.35 <= face / side <= 0.65):
+                return
+        
+        side = face * (1 + 2 * self.padding)
+        if side * side > self.max_area_ratio * frame_w * frame_h:
+            self.roi = None
+            return
+        cx, cy = (bx0 + bx1) / 2, (by0 + by1) / 2
+        x0 = int(max(0, min(cx - side / 2, frame_w - side)))
+        y0 = int(max(0, min(cy - side / 2, frame_h - side)))
+        self.roi = (x0, y0, int(min(frame_w, x0 + side)), int(min(frame_h, y0 + side)))
+
+
+class MotionAdaptiveSampler:
+    """
+    움직임 적응형 프레임 샘플러
+    
+    후보 프레임마다 저비용 움직임 지표를 계산해 FaceMesh를 실행할 프레임을 고릅니다.
+    - 움직임 지표: 마지막으로 분석한 프레임 대비 평균 밝기 차이 (0~255)
+      전체 화면은 ADAPTIVE_PROBE_SIZE로 축소해 비교하고, 직전 측정의 눈 주변 영역은 1/4 축소로 따로 비교해
+      머리가 고정된 채 눈동자만 움직이는 경우도 감지합니다 (둘 중 큰 값 사용).
+    - 예산: 분당 budget_per_min회를 토큰 버킷으로 제한 (움직임이 몰리면 ADAPTIVE_BURST_SEC만큼 앞당겨 사용)
+    - 정지 구간에서도 max_interval_sec마다 한 번은 분석 (이때도 예산을 차감해 장기 평균이 예산을 넘지 않음)
+    
+    후보 프레임 하나당 흑백 변환 + 축소 1회 비용으로, FaceMesh 추론보다 수백 배 저렴합니다.
+    """
+    
+    def __init__(self, candidate_fps: float, budget_per_min: float,
+                 motion_threshold: Optional[float] = None, max_interval_sec: Optional[float] = None):
+        self.candidate_fps = candidate_fps
+        self.budget_per_min = budget_per_min
+        self.motion_threshold = (GazeConfig.ADAPTIVE_MOTION_THRESHOLD
+                                 if motion_threshold is None else motion_threshold)
+        if max_interval_sec is None:
+            max_interval_sec = GazeConfig.ADAPTIVE_MAX_INTERVAL_SEC
+        self.max_interval = max(1, int(round(max_interval_sec * candidate_fps)))
+        
+        self.token_rate = budget_per_min / 60.0 / candidate_fps
+        self.max_tokens = max(1.0, budget_per_min / 60.0 * GazeConfig.ADAPTIVE_BURST_SEC)
+        self.tokens = 1.0
+        
+        self.candidates = 0
+        self.analyzed = 0
+        self._since_last = 0
+        self._reference_gray: Optional[np.ndarray] = None
+        self._reference_probe: Optional[np.ndarray] = None
+        self._eye_box: Optional[Tuple[int, int, int, int]] = None
+    
+    def set_focus(self, gaze_point: Optional[Tuple[float, float]], face_size: float) -> None:
+        """직전 측정의 시선 포인트(양 눈 중심)와 얼굴 크기로 눈 주변 비교 영역 설정"""
+        if gaze_point is None or face_size <= 0:
+            self._eye_box = None
+            return
+        half_w, half_h = face_size * 0.35, face_size * 0.12
+        x, y = gaze_point
+        self._eye_box = (int(x - half_w), int(y - half_h), int(x + half_w), int(y + half_h))
+    
+    def _eye_motion(self, gray: np.ndarray) -> float:
+        if self._eye_box is None:
+            return 0.0
+        h, w = gray.shape
+        x0, y0, x1, y1 = self._eye_box
+        x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, w), min(y1, h)
+        if x1 - x0 < 8 or y1 - y0 < 8:
+            return 0.0
+        size = ((x1 - x0) // 4, (y1 - y0) // 4)
+        current = cv2.resize(gray[y0:y1, x0:x1], size, interpolation=cv2.INTER_AREA)
+        reference = cv2.resize(self._reference_gray[y0:y1, x0:x1], size, interpolation=cv2.INTER_AREA)
+        return float(cv2.absdiff(current, reference).mean())
+    
+    def should_analyze(self, frame: np.ndarray) -> bool:
+        """후보 프레임(BGR)에서 FaceMesh를 실행할지 결정"""
+        self.candidates += 1
+        self._since_last += 1
+        self.tokens = min(self.tokens + self.token_rate, self.max_tokens)
+        
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        probe = cv2.resize(gray, GazeConfig.ADAPTIVE_PROBE_SIZE, interpolation=cv2.INTER_AREA)
+        
+        if self._reference_gray is None or self._reference_gray.shape != gray.shape:
+            analyze = True
+        elif self._since_last >= self.max_interval:
+            analyze = True
+        elif self.tokens < 1.0:
+            analyze = False
+        else:
+            motion = float(cv2.absdiff(probe, self._reference_probe).mean())
+            if motion < self.motion_threshold:
+                motion = max(motion, self._eye_motion(gray))
+            analyze = motion >= self.motion_threshold
+        
+        if analyze:
+            self.tokens -= 1.0
+            self.analyzed += 1
+            self._since_last = 0
+            self._reference_gray = gray
+            self._reference_probe = probe
+        return analyze
+
+
+# 바이너리 프레임 메시지 헤더 (WebSocket 캘리브레이션 / 라이브 시선 추적 공통)
+# [4바이트 big-endian uint32: 클라이언트 기준 경과 ms][JPEG/WebP 이미지 바이트]
+FRAME_HEADER = struct.Struct('>I')
+
+
+class FrameMessageError(ValueError):
+    """바이너리 프레임 메시지를 해석할 수 없는 경우"""
+    pass
+
+
+def read_frame_header(data: bytes) -> int:
+    """바이너리 프레임 메시지의 경과 ms만 읽음 (이미지 디코딩 전 순서 확인용)"""
+    if len(data) <= FRAME_HEADER.size:
+        raise FrameMessageError("프레임 데이터가 비어 있습니다.")
+    return FRAME_HEADER.unpack_from(data)[0]
+
+
+def decode_frame_message(data: bytes) -> Tuple[int, np.ndarray]:
+    """
+    바이너리 프레임 메시지를 (경과 ms, BGR 프레임)으로 해석
+    
+    base64 문자열 대신 이미지 바이트를 그대로 받으므로 복사 없이 cv2.imdecode에 넘깁니다.
+    """
+    elapsed_ms = read_frame_header(data)
+    frame = cv2.imdecode(np.frombuffer(data, np.uint8, offset=FRAME_HEADER.size), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise FrameMessageError("프레임 이미지를 디코딩할 수 없습니다.")
+    return elapsed_ms, frame
+
+
+def seek_is_frame_accurate(cap: "cv2.VideoCapture") -> bool:
+    """코덱(FOURCC)으로 CAP_PROP_POS_FRAMES 탐색을 믿을 수 있는지 판단 (코덱을 모르면 False)"""
+    code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    if code <= 0:
+        return False
+    fourcc = ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).upper()
+    return fourcc not in GazeConfig.SEEK_UNSAFE_CODECS
+
+
+def iter_sampled_frames(cap: "cv2.VideoCapture", frame_skip: int, seek_threshold: Optional[int] = None,
+                        start_frame: int = 0) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    프레임 스킵 간격에 맞춰 분석 대상 프레임만 디코딩하여 반환하는 제너레이터
+    
+    cap.read()는 매 프레임을 디코딩 + BGR 변환까지 수행하므로, 건너뛸 프레임은
+    cap.grab()으로 패킷만 넘기고 분석 대상 프레임에서만 cap.retrieve()를 호출합니다.
+    스킵 간격이 seek_threshold 이상이면 프레임 위치 탐색으로 구간을 통째로 건너뜁니다
+    (탐색이 프레임 단위로 정확하지 않은 VP8/VP9/AV1 등은 제외).
+    
+    start_frame은 탐색이 정확한 코덱(seek_is_frame_accurate)이면 CAP_PROP_POS_FRAMES로 이동합니다.
+    OpenCV FFmpeg 백엔드는 start_frame 직전 키프레임으로 탐색한 뒤 그 프레임까지 디코딩하므로,
+    구간 시작에 도착하는 비용은 키프레임 간격 이내입니다. VP8 webm처럼 키프레임 간격이 길고
+    타임스탬프가 고르지 않은 동영상은 탐색이 다른 프레임에 도착할 수 있어 처음부터 grab()으로 디코딩합니다
+    (이 경우 구간 시작까지의 디코딩이 구간 길이에 비례하므로 collect_gaze_stats는 구간을 나누지 않음).
+    
+    샘플링 규칙은 기존 루프와 동일합니다: 1부터 센 frame_count가 frame_skip의 배수인 프레임.
+    
+    Args:
+        cap: 열린 cv2.VideoCapture
+        frame_skip: 프레임 스킵 간격 (1이면 모든 프레임)
+        seek_threshold: seek 사용 임계값 (None이면 GazeConfig 값, 0이면 비활성화)
+        start_frame: 이 프레임 수만큼 건너뛴 위치부터 시작 (frame_skip 배수일 때 샘플링이 전체 순차 분석과 일치)
+        
+    Yields:
+        Tuple[int, np.ndarray]: (1부터 센 프레임 번호, BGR 프레임)
+    """
+    frame_skip = max(1, int(frame_skip))
+    if seek_threshold is None:
+        seek_threshold = GazeConfig.SEEK_FRAME_SKIP_THRESHOLD
+    
+    # 프레임 수 메타데이터가 신뢰할 수 있을 때만 seek 사용 (webm은 메타데이터가 부정확한 경우가 많음)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    seek_accurate = total_frames > 0 and seek_is_frame_accurate(cap)
+    use_seek = bool(seek_threshold) and frame_skip >= seek_threshold and seek_accurate
+    
+    # 구간 시작 위치로 이동 (탐색이 부정확한 코덱은 디코딩 후 버려서 프레임 번호를 순차 분석과 맞춤)
+    start_frame = max(0, int(start_frame))
+    frame_count = 0
+    if start_frame and seek_accurate:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        frame_count = start_frame
+    else:
+        for _ in range(start_frame):
+            if not cap.grab():
+                return
+            frame_count += 1
+    
+    while True:
+        if use_seek:
+            target = frame_count + frame_skip
+            if target > total_frames:
+                return
+            cap.set(cv2.CAP_PROP_POS_FRAMES, target - 1)
+            if not cap.grab():
+                return
+            frame_count = target
+        else:
+            # 건너뛸 프레임은 디코딩 결과를 꺼내지 않음
+            for _ in range(frame_skip):
+                if not cap.grab():
+                    return
+                frame_count += 1
+        
+        ret, frame = cap.retrieve()
+        if not ret or frame is None:
+            continue
+        yield frame_count, frame
+
+
+class FaceMeshPool:
+    """
+    FaceMesh 인스턴스 풀 (스레드 안전)
+    
+    FaceMesh.process()는 인스턴스 하나를 동시에 여러 스레드가 쓸 수 없으므로,
+    호출마다 쉬고 있는 인스턴스를 빌려 쓰고 반납합니다. 인스턴스는 필요할 때 max_size까지만 만듭니다.
+    
+    직전에 같은 key(세션)를 처리한 인스턴스를 우선 배정하여 추적 모드의 연속성을 유지하고,
+    모든 인스턴스가 사용 중이면 반납될 때까지 기다립니다.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None, initial=None):
+        self.max_size = max(1, max_size or GazeConfig.FACE_MESH_POOL_SIZE)
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[Optional[str], object]] = []  # (마지막 key, FaceMesh), 오래 쉰 순서
+        self._created = 0
+        if initial is not None:
+            self._idle.append((None, initial))
+            self._created = 1
+    
+    @contextmanager
+    def checkout(self, key: Optional[str] = None):
+        face_mesh = self._acquire(key)
+        try:
+            yield face_mesh
+        finally:
+            with self._cond:
+                self._idle.append((key, face_mesh))
+                self._cond.notify()
+    
+    def _acquire(self, key: Optional[str]):
+        with self._cond:
+            while True:
+                for i, (last_key, face_mesh) in enumerate(self._idle):
+                    if key is not None and last_key == key:
+                        del self._idle[i]
+                        return face_mesh
+                if self._created < self.max_size:
+                    self._created += 1
+                    break
+                if self._idle:
+                    return self._idle.pop(0)[1]
+                self._cond.wait()
+        
+        # 모델 로딩은 느리므로 잠금 밖에서 생성
+        try:
+            return GazeCoreProcessor.create_face_mesh()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+    
+    def stats(self) -> dict:
+        with self._cond:
+            return {'max_size': self.max_size, 'created': self._created, 'idle': len(self._idle)}
+
+
+def probe_video_duration(source: str) -> Optional[float]:
+    """ffprobe로 동영상 길이(초) 조회. 알 수 없으면 None (MediaRecorder webm은 길이 정보가 없는 경우가 많음)"""
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', source],
+            capture_output=True, text=True, timeout=30
+        )
+        duration = float(result.stdout.strip())
+        return duration if duration > 0 else None
+    except (subprocess.SubprocessError, FileNotFoundError, ValueError):
+        return None
+
+
+class FFmpegFrameReader:
+    """
+    FFmpeg rawvideo 파이프 프레임 리더
+    
+    FFmpeg 프로세스 1개가 디코딩 → fps 필터(샘플링) → 축소 → BGR 변환까지 수행하고,
+    분석할 프레임만 고정 크기 raw 바이트로 stdout 파이프에 씁니다.
+    OpenCV로 전체 해상도를 디코딩하거나 중간 파일을 만들지 않습니다.
+    
+    입력은 로컬 파일 경로 또는 스트리밍 본문(input_stream, 예: S3 get_object Body)입니다.
+    스트리밍 본문은 별도 스레드가 FFmpeg stdin으로 복사하며 bytes_fed에 누적 바이트 수를 기록합니다.
+    
+    Yields:
+        Tuple[int, np.ndarray]: (1부터 센 출력 프레임 번호, BGR 프레임)
+    """
+    
+    FEED_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, source: Optional[str], sample_fps: float,
+                 size: Tuple[int, int] = None, start_sec: Optional[float] = None,
+                 duration_sec: Optional[float] = None, input_stream=None):
+        self.width, self.height = size or GazeConfig.STREAM_DECODE_SIZE
+        self.input_stream = input_stream
+        self.bytes_fed = 0
+        self.frames_read = 0
+        self._feed_error: Optional[Exception] = None
+        
+        command = ['ffmpeg', '-hide_banner', '-v', 'error']
+        if input_stream is None:
+            command.append('-nostdin')
+        if start_sec:
+            command += ['-ss', f'{start_sec:.3f}']
+        if duration_sec:
+            command += ['-t', f'{duration_sec:.3f}']
+        command += [
+            '-i', 'pipe:0' if input_stream is not None else source,
+            '-an', '-sn',
+            '-vf', f'fps={sample_fps:.6f},scale={self.width}:{self.height}',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+            'pipe:1'
+        ]
+        self.command = command
+    
+    def _feed(self, stdin) -> None:
+        try:
+            while True:
+                chunk = self.input_stream.read(self.FEED_CHUNK_SIZE)
+                if not chunk:
+                    break
+                stdin.write(chunk)
+                self.bytes_fed += len(chunk)
+        except BrokenPipeError:
+            pass  # FFmpeg가 먼저 종료됨 (취소 등)
+        except Exception as e:
+            self._feed_error = e
+        finally:
+            try:
+                stdin.close()
+            except OSError:
+                pass
+    
+    def __iter__(self) -> Iterator[Tuple[int, np.ndarray]]:
+        frame_bytes = self.width * self.height * 3
+        stderr_file = tempfile.TemporaryFile()
+        process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE if self.input_stream is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            bufsize=frame_bytes * 4
+        )
+        feeder = None
+        if self.input_stream is not None:
+            feeder = threading.Thread(target=self._feed, args=(process.stdin,),
+                                      name="ffmpeg-feed", daemon=True)
+            feeder.start()
+        
+        completed = False
+        try:
+            index = 0
+            while True:
+                buffer = process.stdout.read(frame_bytes)
+                if len(buffer) < frame_bytes:
+                    break  # EOF (마지막 불완전 프레임은 버림)
+                index += 1
+                self.frames_read = index
+                yield index, np.frombuffer(buffer, np.uint8).reshape(self.height, self.width, 3)
+            completed = True
+        finally:
+            if not completed and process.poll() is None:
+                process.kill()  # 중간에 멈춘 경우 (취소/오류)
+            process.stdout.close()
+            returncode = process.wait()
+            if feeder is not None:
+                feeder.join(timeout=5)
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace')
+            stderr_file.close()
+        
+        if self._feed_error is not None:
+            raise Exception(f"동영상 스트림 읽기 실패: {self._feed_error}")
+        if returncode != 0:
+            raise Exception(f"FFmpeg 디코딩 실패 (코드: {returncode}): {stderr[:500]}")
+
+
+def split_time_segments(duration: float, sample_fps: float,
+                        workers: int) -> List[Tuple[float, Optional[float]]]:
+    """
+    동영상 길이를 샘플 간격(1 / sample_fps) 배수 경계의 시간 구간으로 분할 (FFmpeg 파이프 병렬 분석용)
+    
+    Returns:
+        List[Tuple[float, Optional[float]]]: [(시작 초, 구간 길이 초), ...] (마지막 구간 길이는 None = 끝까지)
+    """
+    total_samples = int(duration * sample_fps)
+    min_samples = max(1, int(GazeConfig.PARALLEL_MIN_SEGMENT_SEC * sample_fps))
+    count = max(1, min(workers, total_samples // min_samples))
+    segment_samples = -(-total_samples // count)  # 올림 나눗셈
+    
+    segments = []
+    for i in range(count):
+        start = i * segment_samples / sample_fps
+        segments.append((start, segment_samples / sample_fps))
+    segments[-1] = (segments[-1][0], None)
+    return segments
+
+
+# === 구간 병렬 분석용 프로세스 풀 ===
+# 워커 프로세스마다 GazeCoreProcessor(FaceMesh) 1개를 초기화 시점에 만들어 재사용합니다.
+_worker_processor: Optional[GazeCoreProcessor] = None
+_segment_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_segment_worker():
+    global _worker_processor
+    _worker_processor = GazeCoreProcessor()
+
+
+def track_segment_in_worker(video_path: str, frame_skip: int, start_frame: int, end_frame: int,
+                            accumulator: GazeStatsAccumulator) -> GazeStatsAccumulator:
+    return _worker_processor.track_video_segment(video_path, frame_skip, start_frame, end_frame,
+                                                 accumulator=accumulator)
+
+
+def track_stream_segment_in_worker(video_path: str, sample_fps: float, start_sec: float,
+                                   duration_sec: Optional[float], accumulator: GazeStatsAccumulator,
+                                   sampler_budget: Optional[float] = None) -> GazeStatsAccumulator:
+    reader = FFmpegFrameReader(video_path, sample_fps, start_sec=start_sec, duration_sec=duration_sec)
+    sampler = MotionAdaptiveSampler(sample_fps, sampler_budget) if sampler_budget else None
+    return _worker_processor.track_frames(iter(reader), accumulator=accumulator, sampler=sampler)
+
+
+def get_segment_pool() -> ProcessPoolExecutor:
+    """구간 병렬 분석용 프로세스 풀 (최초 호출 시 생성, 이후 재사용)"""
+    global _segment_pool
+    if _segment_pool is None:
+        # MediaPipe 내부 스레드와 fork가 충돌하지 않도록 spawn 사용
+        _segment_pool = ProcessPoolExecutor(
+            max_workers=max(1, GazeConfig.PARALLEL_MAX_WORKERS),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_segment_worker
+        )
+        logger.info(f"🚀 [GAZE_CORE] 구간 분석 프로세스 풀 생성: {GazeConfig.PARALLEL_MAX_WORKERS}개 워커")
+    return _segment_pool
+
+
+def split_frame_segments(total_frames: int, fps: float, frame_skip: int,
+                         workers: int) -> List[Tuple[int, Optional[int]]]:
+    """
+    전체 프레임을 frame_skip 배수 경계의 구간으로 분할
+    
+    경계를 frame_skip 배수로 맞추면 각 구간의 샘플 프레임이 순차 분석과 정확히 일치합니다.
+    
+    Returns:
+        List[Tuple[int, Optional[int]]]: [(start_frame, end_frame), ...]
+            start는 건너뛸 프레임 수, end는 포함 프레임 번호 (마지막 구간은 None = 끝까지)
+    """
+    min_frames = max(frame_skip, int(GazeConfig.PARALLEL_MIN_SEGMENT_SEC * fps))
+    count = max(1, min(workers, total_frames // min_frames))
+    segment_len = -(-total_frames // count)                        # 올림 나눗셈
+    segment_len = -(-segment_len // frame_skip) * frame_skip       # frame_skip 배수로 올림
+    
+    segments = []
+    start = 0
+    while start < total_frames:
+        end = min(start + segment_len, total_frames)
+        segments.append((start, end))
+        start = end
+    
+    # 메타데이터 프레임 수가 실제보다 적을 수 있으므로 마지막 구간은 끝까지 읽음
+    segments[-1] = (segments[-1][0], None)
+    return segments
+
+
 # 설정값 유효성 검증 (모듈 로딩 시 자동 실행)
 if __name__ == "__main__":
     GazeConfig.validate_config()
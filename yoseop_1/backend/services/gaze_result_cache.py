@@ -0,0 +1,177 @@
+"""
+시선 분석 결과 캐시
+
+같은 녹화 영상이 재시도, /gaze/analyze 재호출, 트리거 중복 요청 등으로 여러 번 분석되면
+매번 S3에서 전체 파일을 받아 다시 디코딩하게 됩니다. 이 모듈은 분석 결과를 로컬 디스크에 저장해
+같은 입력의 분석을 즉시 돌려줍니다.
+
+캐시 키 = sha256(버킷/S3 키, ETag, 캘리브레이션 해시, frame_skip, 분석기 버전)
+- ETag는 head_object로 조회합니다 (본문은 내려받지 않음). 같은 S3 키에 영상을 다시 올리면 ETag가 바뀌어 자동으로 무효화
+- 캘리브레이션 해시는 4개 포인트와 초기 얼굴 크기를 소수 셋째 자리로 반올림해 계산 (직렬화 오차 무시)
+- 분석기 버전은 GAZE_ANALYZER_VERSION과 결과에 영향을 주는 GazeConfig 값의 지문
+  (샘플링/ROI/점수 설정을 바꾸면 이전 결과는 사용되지 않음)
+
+같은 키의 동시 요청 합치기는 GazeAnalysisWorkerPool이 캐시 키 단위로 처리합니다.
+
+환경변수:
+- GAZE_RESULT_CACHE_ENABLED: 결과 캐시 사용 여부 (기본 true)
+- GAZE_RESULT_CACHE_DIR: 캐시 파일 폴더 (기본 backend/uploads/gaze_cache)
+- GAZE_RESULT_CACHE_TTL_SEC: 캐시 보관 시간 (기본 30일)
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from dataclasses import asdict
+from threading import Lock, get_ident
+from typing import Any, Dict, List, Optional, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from .gaze_core import GazeConfig
+from .gaze_service import GazeAnalysisResult, GAZE_ANALYZER_VERSION
+
+logger = logging.getLogger(__name__)
+
+GAZE_RESULT_CACHE_ENABLED = os.getenv('GAZE_RESULT_CACHE_ENABLED', 'true').lower() == 'true'
+GAZE_RESULT_CACHE_DIR = os.getenv('GAZE_RESULT_CACHE_DIR', 'backend/uploads/gaze_cache')
+GAZE_RESULT_CACHE_TTL_SEC = float(os.getenv('GAZE_RESULT_CACHE_TTL_SEC', str(30 * 24 * 3600)))
+
+
+def analyzer_fingerprint() -> str:
+    """분석기 버전 + 결과에 영향을 주는 GazeConfig 값의 지문"""
+    config = {
+        'version': GAZE_ANALYZER_VERSION,
+        'mediapipe': GazeConfig.MEDIAPIPE_CONFIG,
+        'stream': [GazeConfig.STREAM_DECODE_ENABLED, GazeConfig.STREAM_DECODE_SIZE, GazeConfig.STREAM_BASE_FPS],
+        'adaptive': [
+            GazeConfig.ADAPTIVE_SAMPLING_ENABLED, GazeConfig.ADAPTIVE_CANDIDATE_RATIO,
+            GazeConfig.ADAPTIVE_BUDGET_RATIO, GazeConfig.ADAPTIVE_BUDGET_PER_MIN,
+            GazeConfig.ADAPTIVE_MOTION_THRESHOLD, GazeConfig.ADAPTIVE_MAX_INTERVAL_SEC,
+            GazeConfig.ADAPTIVE_BURST_SEC, GazeConfig.ADAPTIVE_PROBE_SIZE,
+        ],
+        'roi': [GazeConfig.ROI_TRACKING_ENABLED, GazeConfig.ROI_PADDING, GazeConfig.ROI_MAX_AREA_RATIO],
+        'score': [GazeConfig.SCORE_WEIGHTS, GazeConfig.JITTER_THRESHOLDS],
+    }
+    encoded = json.dumps(config, sort_keys=True, default=list).encode()
+    return f"v{GAZE_ANALYZER_VERSION}-{hashlib.sha256(encoded).hexdigest()[:12]}"
+
+
+def calibration_hash(calibration_points: List[Tuple[float, float]], initial_face_size: Optional[float]) -> str:
+    """캘리브레이션 포인트 + 초기 얼굴 크기 해시 (소수 셋째 자리 반올림)"""
+    points = [[round(float(x), 3), round(float(y), 3)] for x, y in calibration_points]
+    face_size = round(float(initial_face_size), 3) if initial_face_size else None
+    return hashlib.sha256(json.dumps([points, face_size]).encode()).hexdigest()
+
+
+class DiskCacheBackend:
+    """
+    키별 JSON 파일 저장소 (<폴더>/<키 앞 2자리>/<키>.json)
+
+    임시 파일에 쓴 뒤 os.replace로 교체하므로 여러 프로세스가 같은 폴더를 써도 깨진 파일을 읽지 않습니다.
+    get/set/delete만 맞추면 Redis 등 다른 저장소로 바꿀 수 있습니다.
+    """
+
+    def __init__(self, directory: str = GAZE_RESULT_CACHE_DIR, ttl_sec: float = GAZE_RESULT_CACHE_TTL_SEC):
+        self.directory = directory
+        self.ttl_sec = ttl_sec
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ [GAZE_CACHE] 캐시 파일 읽기 실패, 삭제: {path} - {e}")
+            self.delete(key)
+            return None
+
+        if time.time() - entry.get('created_at', 0) > self.ttl_sec:
+            self.delete(key)
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': time.time(), 'value': value}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+class GazeResultCache:
+    """시선 분석 결과 캐시 (키 계산 + 결과 직렬화)"""
+
+    def __init__(self, backend: DiskCacheBackend):
+        self.backend = backend
+        self.fingerprint = analyzer_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def make_key(self, s3_client, bucket: str, key: str, calibration_points: List[Tuple[float, float]],
+                 initial_face_size: Optional[float], frame_skip: Optional[int]) -> Optional[str]:
+        """
+        캐시 키 계산 (워커 스레드에서 호출, head_object 1회)
+
+        ETag를 조회할 수 없으면 None을 반환하고, 호출 측은 캐시 없이 분석합니다.
+        """
+        try:
+            etag = s3_client.head_object(Bucket=bucket, Key=key)['ETag'].strip('"')
+        except (BotoCoreError, ClientError, KeyError) as e:
+            logger.warning(f"⚠️ [GAZE_CACHE] ETag 조회 실패, 캐시 생략: s3://{bucket}/{key} - {e}")
+            return None
+
+        material = json.dumps([
+            bucket, key, etag, calibration_hash(calibration_points, initial_face_size), frame_skip, self.fingerprint
+        ])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[GazeAnalysisResult]:
+        value = self.backend.get(cache_key)
+        result = None
+        if value is not None:
+            try:
+                value['gaze_points'] = [tuple(p) for p in value['gaze_points']]
+                value['calibration_points'] = [tuple(p) for p in value['calibration_points']]
+                result = GazeAnalysisResult(**value)
+            except (KeyError, TypeError) as e:
+                logger.warning(f"⚠️ [GAZE_CACHE] 캐시 항목 형식 오류, 삭제: {cache_key} - {e}")
+                self.backend.delete(cache_key)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(self, cache_key: str, result: GazeAnalysisResult) -> None:
+        """결과 저장 (실패해도 분석 결과에는 영향 없음)"""
+        try:
+            self.backend.set(cache_key, asdict(result))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ [GAZE_CACHE] 캐시 저장 실패: {cache_key} - {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'fingerprint': self.fingerprint}
+
+
+# 싱글톤 인스턴스 (GAZE_RESULT_CACHE_ENABLED=false이면 None)
+gaze_result_cache = GazeResultCache(DiskCacheBackend()) if GAZE_RESULT_CACHE_ENABLED else None
@@ -21,22 +21,33 @@ GazeCoreProcessor를 상속받아 공통 로직을 재사용하고,
 import cv2
 import numpy as np
 import os
-import boto3
 from botocore.exceptions import ClientError
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Callable
+from concurrent.futures import wait, FIRST_COMPLETED
+import threading
 import time
 import logging
 import subprocess
 import shutil
 
 # 새로운 모듈 import
-from .gaze_core import GazeCoreProcessor, GazeConfig
+from .gaze_core import (
+    GazeCoreProcessor, GazeConfig, GazeAnalysisCancelled, FFmpegFrameReader, MotionAdaptiveSampler,
+    get_segment_pool, split_frame_segments, split_time_segments, probe_video_duration, seek_is_frame_accurate,
+    track_segment_in_worker, track_stream_segment_in_worker, gaze_in_range_mask
+)
+from .gaze_stats import GazeStatsAccumulator
+from .gaze_trace import encode_trace, build_heatmap
 from .secure_file_manager import SecureFileManager, FileValidator
+from .s3_client import get_s3_client
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 추적/점수 계산 방식이나 결과 필드를 바꾸면 올림 (이전 버전으로 계산한 시선 결과 캐시를 무효화)
+GAZE_ANALYZER_VERSION = 5
+
 
 @dataclass
 class GazeAnalysisResult:
@@ -59,6 +70,8 @@ class GazeAnalysisResult:
     - gaze_points: 시선 궤적 포인트 리스트 [(x, y), ...]
     - allowed_range: 캘리브레이션 기반 허용 시선 범위 좌표
     - calibration_points: 4개 캘리브레이션 포인트 [(x, y), ...]
+    - trace: 전체 해상도 시선 궤적 압축본 (gaze_trace.encode_trace)
+    - heatmap: 저해상도 시선 히트맵 (gaze_trace.build_heatmap)
     """
     gaze_score: int
     total_frames: int
@@ -72,6 +85,8 @@ class GazeAnalysisResult:
     gaze_points: List[Tuple[float, float]]
     allowed_range: Dict[str, float]
     calibration_points: List[Tuple[float, float]]
+    trace: Optional[Dict[str, Any]] = None
+    heatmap: Optional[Dict[str, Any]] = None
 
 
 class GazeAnalyzer(GazeCoreProcessor):
@@ -110,6 +125,9 @@ class GazeAnalyzer(GazeCoreProcessor):
         # S3 클라이언트 초기화
         self._initialize_s3_client()
         
+        # FFmpeg 파이프 디코딩 가능 여부 (최초 분석 시 1회 확인)
+        self._ffmpeg_pipe_checked: Optional[bool] = None
+        
         logger.info("🚀 [GAZE_ANALYZER] 동영상 시선 분석기 초기화 완료")
     
     def _initialize_s3_client(self):
@@ -127,12 +145,8 @@ class GazeAnalyzer(GazeCoreProcessor):
         - 키 로테이션 정기 실행
         """
         try:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                region_name=os.getenv('AWS_REGION', 'ap-northeast-2')
-            )
+            # 프로세스 공용 클라이언트 (워커 풀 스레드들이 연결 풀을 함께 사용)
+            self.s3_client = get_s3_client()
             logger.info("✅ [GAZE_ANALYZER] S3 클라이언트 초기화 성공")
             
         except Exception as e:
@@ -403,7 +417,7 @@ class GazeAnalyzer(GazeCoreProcessor):
             logger.error(f"❌ [DOWNLOAD] 동영상 다운로드 실패: {e}")
             raise Exception(f"동영상 다운로드 중 오류 발생: {str(e)}")
     
-    def calculate_jitter_score(self, gaze_points: List[Tuple[float, float]]) -> int:
+    def calculate_jitter_score(self, gaze_points) -> int:
         """
         시선 흔들림 점수 계산 (0-100점, 높을수록 안정적)
         
@@ -413,7 +427,7 @@ class GazeAnalyzer(GazeCoreProcessor):
         3. 임계값 기반으로 0-100점 스케일링
         
         Args:
-            gaze_points: 시선 포인트 리스트 [(x, y), ...]
+            gaze_points: 시선 포인트 리스트 [(x, y), ...] 또는 (N, 2) 배열
             
         Returns:
             int: 흔들림 점수 (0-100점)
@@ -431,14 +445,16 @@ class GazeAnalyzer(GazeCoreProcessor):
             logger.warning("⚠️ [JITTER] 시선 데이터 부족으로 기본 점수 반환")
             return 50  # 데이터 부족 시 중간 점수
         
-        # 시선 포인트를 numpy 배열로 변환
-        arr = np.array(gaze_points)
+        # 시선 포인트를 numpy 배열로 변환 (이미 배열이면 복사 없이 사용)
+        arr = np.asarray(gaze_points, dtype=np.float64)
         
         # x, y 좌표별 표준편차 계산
         jitter_x = np.std(arr[:, 0])
         jitter_y = np.std(arr[:, 1])
-        jitter = (jitter_x + jitter_y) / 2
-        
+        return self.jitter_to_score((jitter_x + jitter_y) / 2)
+    
+    def jitter_to_score(self, jitter: float) -> int:
+        """x, y 표준편차 평균(jitter)을 흔들림 점수(0-100점)로 변환"""
         # 점수 계산 (임계값 기반 스케일링)
         max_jitter = GazeConfig.JITTER_THRESHOLDS['poor']     # 50.0
         min_jitter = GazeConfig.JITTER_THRESHOLDS['excellent'] # 0.5
@@ -456,8 +472,7 @@ class GazeAnalyzer(GazeCoreProcessor):
         logger.debug(f"📊 [JITTER] 흔들림 계산: jitter={jitter:.2f}, score={score}")
         return score
     
-    def calculate_gaze_compliance_score(self, gaze_points: List[Tuple[float, float]], 
-                                       allowed_range: Dict[str, float]) -> int:
+    def calculate_gaze_compliance_score(self, gaze_points, allowed_range: Dict[str, float]) -> int:
         """
         시선 범위 준수 점수 계산 (0-100점)
         
@@ -465,7 +480,7 @@ class GazeAnalyzer(GazeCoreProcessor):
         이는 면접자의 집중도와 아이컨택 능력을 평가하는 핵심 지표입니다.
         
         Args:
-            gaze_points: 시선 포인트 리스트
+            gaze_points: 시선 포인트 리스트 또는 (N, 2) 배열
             allowed_range: 허용 시선 범위 {'left_bound', 'right_bound', 'top_bound', 'bottom_bound'}
             
         Returns:
@@ -481,16 +496,13 @@ class GazeAnalyzer(GazeCoreProcessor):
         - 50-69점: "개선 가능"
         - 50점 미만: "집중력 향상 필요"
         """
-        if not gaze_points or not all(allowed_range.values()) or len(gaze_points) < 10:
+        if len(gaze_points) < 10 or not all(allowed_range.values()):
             logger.warning("⚠️ [COMPLIANCE] 유효하지 않은 데이터로 기본 점수 반환")
             return 50
         
         # 허용 범위 내 포인트 수 계산
-        in_range_count = 0
-        for x, y in gaze_points:
-            if (allowed_range['left_bound'] <= x <= allowed_range['right_bound'] and
-                allowed_range['top_bound'] <= y <= allowed_range['bottom_bound']):
-                in_range_count += 1
+        arr = np.asarray(gaze_points, dtype=np.float64)
+        in_range_count = int(np.count_nonzero(gaze_in_range_mask(arr, allowed_range)))
         
         # 준수율 계산 (0.0 ~ 1.0)
         compliance_ratio = in_range_count / len(gaze_points)
@@ -666,12 +678,102 @@ class GazeAnalyzer(GazeCoreProcessor):
                    f"거울을 보면서 아이컨택 연습을 하거나, 모의 면접을 통해 자연스러운 시선 처리를 익혀보세요. "
                    f"규칙적인 연습으로 충분히 개선할 수 있습니다.")
     
+    def collect_gaze_stats(self, video_path: str, frame_skip: int, total_frames: int, fps: float,
+                           accumulator: GazeStatsAccumulator,
+                           progress_callback: Optional[Callable[[float], None]] = None,
+                           cancel_event: Optional[threading.Event] = None) -> GazeStatsAccumulator:
+        """
+        동영상 전체의 (시선 포인트, 얼굴 크기) 샘플을 프레임 순서대로 accumulator에 누적
+        
+        동영상이 GazeConfig.PARALLEL_MIN_DURATION_SEC 이상이고 프레임 수 메타데이터가 유효하며
+        프레임 위치 탐색이 정확한 코덱(트랜스코딩된 mp4 등)이면 frame_skip 배수 경계의 시간 구간으로 나눠
+        프로세스 풀(워커당 FaceMesh 1개)에서 분석하고, 구간별 누적 결과를 시간 순서대로 합칩니다.
+        각 구간은 시작 직전 키프레임부터 디코딩하므로 전체 디코딩 양은 순차 분석과 거의 같습니다.
+        
+        트랜스코딩하지 못한 VP8/VP9 webm은 구간 시작까지 처음부터 디코딩해야 해서(iter_sampled_frames)
+        구간을 나누면 디코딩이 구간 수에 비례해 늘어나므로 순차 분석합니다.
+        긴 webm의 병렬 분석은 FFmpeg 파이프 경로(collect_stream_stats, -ss 탐색)가 담당합니다.
+        
+        참고: FaceMesh는 추적 모드라 각 구간의 첫 프레임에서만 얼굴을 새로 검출합니다.
+        샘플 프레임은 순차 분석과 동일하며, 점수 차이는 구간 경계의 추적 초기화 수준입니다.
+        
+        Args:
+            video_path: 로컬 동영상 경로
+            frame_skip: 프레임 스킵 간격
+            total_frames: 메타데이터상 총 프레임 수 (0 이하면 순차 분석)
+            fps: 프레임레이트
+            accumulator: 시선 통계 누적기
+            progress_callback: 추적 진행률(0.0 ~ 1.0)을 받는 콜백 (선택적)
+            cancel_event: 설정되면 분석을 중단하고 GazeAnalysisCancelled 발생 (선택적)
+            
+        Returns:
+            GazeStatsAccumulator: 샘플이 반영된 accumulator
+        """
+        workers = GazeConfig.PARALLEL_MAX_WORKERS
+        duration = total_frames / fps if total_frames > 0 and fps > 0 else 0
+        
+        def on_frame(frame_number: int) -> None:
+            if progress_callback and total_frames > 0:
+                progress_callback(min(frame_number / total_frames, 1.0))
+        
+        if (workers <= 1 or duration < GazeConfig.PARALLEL_MIN_DURATION_SEC
+                or not self._segment_seek_supported(video_path)):
+            return self.track_video_segment(video_path, frame_skip, progress_callback=on_frame,
+                                            cancel_event=cancel_event, accumulator=accumulator)
+        
+        segments = split_frame_segments(total_frames, fps, frame_skip, workers)
+        if len(segments) <= 1:
+            return self.track_video_segment(video_path, frame_skip, progress_callback=on_frame,
+                                            cancel_event=cancel_event, accumulator=accumulator)
+        
+        logger.info(f"⚡ [ANALYZE] 구간 병렬 분석: {len(segments)}개 구간, {duration:.1f}초")
+        pool = get_segment_pool()
+        futures = [
+            pool.submit(track_segment_in_worker, video_path, frame_skip, start, end, accumulator.spawn())
+            for start, end in segments
+        ]
+        return self._gather_segment_results(futures, accumulator, progress_callback, cancel_event)
+    
+    @staticmethod
+    def _segment_seek_supported(video_path: str) -> bool:
+        """구간 시작 위치로 바로 탐색할 수 있는 동영상인지 (코덱 기준)"""
+        cap = cv2.VideoCapture(video_path)
+        try:
+            supported = cap.isOpened() and seek_is_frame_accurate(cap)
+        finally:
+            cap.release()
+        if not supported:
+            logger.info("ℹ️ [ANALYZE] 프레임 탐색이 부정확한 코덱이라 구간 병렬 분석 없이 순차 분석합니다")
+        return supported
+    
+    @staticmethod
+    def _gather_segment_results(futures: list, accumulator: GazeStatsAccumulator,
+                                progress_callback: Optional[Callable[[float], None]],
+                                cancel_event: Optional[threading.Event]) -> GazeStatsAccumulator:
+        """구간별 누적 결과를 제출 순서(= 시간 순서)대로 accumulator에 합침"""
+        # 구간 완료 단위로 진행률을 보고하고, 취소 요청은 1초 간격으로 확인
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            if cancel_event is not None and cancel_event.is_set():
+                for future in pending:
+                    future.cancel()
+                raise GazeAnalysisCancelled("시선 분석이 취소되었습니다.")
+            if progress_callback:
+                progress_callback((len(futures) - len(pending)) / len(futures))
+        
+        for future in futures:  # 제출 순서 = 시간 순서
+            accumulator.merge(future.result())
+        return accumulator
+    
     def analyze_video_from_s3(self,
                      bucket: str,
                      key: str,
                      calibration_points: List[Tuple[float, float]],
                      initial_face_size: Optional[float] = None,
-                     frame_skip: int = None) -> GazeAnalysisResult:
+                     frame_skip: int = None,
+                     progress_callback: Optional[Callable[[float, str], None]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> GazeAnalysisResult:
         """
         S3 동영상의 종합적인 시선 안정성 분석
         
@@ -692,12 +794,15 @@ class GazeAnalyzer(GazeCoreProcessor):
             calibration_points: 4포인트 캘리브레이션 데이터
             initial_face_size: 캘리브레이션 시 얼굴 크기 (선택적)
             frame_skip: 프레임 스킵 간격 (성능 튜닝용, 기본값: 10)
+            progress_callback: (진행률 0.0 ~ 1.0, 상태 메시지)를 받는 콜백 (선택적)
+            cancel_event: 설정되면 다음 샘플 프레임에서 분석 중단 (선택적)
             
         Returns:
             GazeAnalysisResult: 종합 분석 결과
             
         Raises:
             FileNotFoundError: S3 파일이 없는 경우
+            GazeAnalysisCancelled: cancel_event로 분석이 취소된 경우
             Exception: 분석 실패 시
             
         실제 면접 서비스 성능 고려사항:
@@ -718,10 +823,195 @@ class GazeAnalyzer(GazeCoreProcessor):
         logger.info(f"🎬 [ANALYZE] 동영상 분석 시작: s3://{bucket}/{key}")
         analysis_start_time = time.time()
         
+        def report(progress: float, message: str) -> None:
+            if progress_callback:
+                progress_callback(progress, message)
+        
+        try:
+            # === 허용 시선 범위 계산 (프레임마다 범위 내 여부를 바로 판정하기 위해 먼저 계산) ===
+            logger.info(f"🎯 [ANALYZE] Calibration points: {calibration_points}")
+            original_allowed_range = self.calculate_allowed_gaze_range(calibration_points)
+            logger.info(f"🎯 [ANALYZE] Calculated allowed range: {original_allowed_range}")
+            stats = GazeStatsAccumulator(original_allowed_range, initial_face_size)
+            
+            # === 1~5단계: 다운로드/디코딩/프레임별 시선 추적 및 통계 누적 ===
+            if GazeConfig.STREAM_DECODE_ENABLED and self._ffmpeg_pipe_available():
+                total_frames = self._collect_stats_ffmpeg_pipe(bucket, key, frame_skip, stats, report, cancel_event)
+            else:
+                total_frames = self._collect_stats_opencv(bucket, key, frame_skip, stats, report, cancel_event)
+            
+            # === 6~11단계: 점수 계산 및 결과 정리 ===
+            return self.score_gaze_stats(stats, total_frames, calibration_points, analysis_start_time, report)
+            
+        except GazeAnalysisCancelled:
+            logger.info(f"🛑 [ANALYZE] 분석 취소: s3://{bucket}/{key}")
+            raise
+        except Exception as e:
+            logger.error(f"❌ [ANALYZE] 분석 실패: {e}")
+            raise
+    
+    def _ffmpeg_pipe_available(self) -> bool:
+        """FFmpeg 파이프 디코딩 사용 가능 여부 (트랜스코딩과 달리 libx264 불필요)"""
+        if self._ffmpeg_pipe_checked is None:
+            self._ffmpeg_pipe_checked = shutil.which('ffmpeg') is not None
+            if not self._ffmpeg_pipe_checked:
+                logger.warning("⚠️ [FFMPEG] FFmpeg가 없어 OpenCV 디코딩 경로를 사용합니다")
+        return self._ffmpeg_pipe_checked
+    
+    def _collect_stats_ffmpeg_pipe(self, bucket: str, key: str, frame_skip: int, stats: GazeStatsAccumulator,
+                                   report: Callable[[float, str], None],
+                                   cancel_event: Optional[threading.Event]) -> int:
+        """
+        FFmpeg rawvideo 파이프 디코딩 경로
+        
+        FFmpeg 1개 프로세스가 샘플링 fps(STREAM_BASE_FPS / frame_skip)와 분석 해상도로 줄인 프레임만 출력하므로
+        중간 mp4 파일과 전체 해상도 디코딩이 없습니다. 샘플링 간격과 해상도는 기존 트랜스코딩 경로
+        (640x480, 15fps에서 frame_skip 간격)와 같습니다.
+        
+        - webm + GAZE_STREAM_FROM_S3: 다운로드 없이 S3 본문을 FFmpeg stdin으로 바로 전달 (순차 분석)
+        - 그 외: 임시 파일로 다운로드 후 파일 입력 (길이를 알면 긴 동영상은 시간 구간 병렬 분석)
+        
+        GAZE_ADAPTIVE_SAMPLING이 켜져 있으면 더 촘촘한 후보 fps로 디코딩하고
+        MotionAdaptiveSampler가 움직임이 있는 프레임만 골라 FaceMesh를 실행합니다 (분당 호출 예산 이내).
+        
+        Returns:
+            int: 기준 fps 환산 총 프레임 수 (시선 통계는 stats에 누적)
+        """
+        sample_fps = GazeConfig.STREAM_BASE_FPS / max(1, frame_skip)
+        sampler_budget = None
+        if GazeConfig.ADAPTIVE_SAMPLING_ENABLED:
+            sample_fps, sampler_budget = GazeConfig.adaptive_sampling_plan(frame_skip)
+            logger.info(f"🎯 [ANALYZE] 적응형 샘플링: 후보 {sample_fps:.2f}fps, 분당 최대 {sampler_budget:.0f}회 분석")
+        
+        def on_ratio(ratio: float) -> None:
+            report(0.3 + 0.6 * min(max(ratio, 0.0), 1.0), "프레임별 시선 추적 중...")
+        
+        if GazeConfig.STREAM_FROM_S3 and key.lower().endswith('.webm'):
+            report(0.1, "S3 동영상 스트림 연결 중...")
+            body, content_length = self._open_s3_stream(bucket, key)
+            try:
+                reader = FFmpegFrameReader(None, sample_fps, input_stream=body)
+                logger.info(f"🎞️ [ANALYZE] FFmpeg 파이프 디코딩 (S3 스트리밍): {sample_fps:.2f}fps, "
+                            f"{GazeConfig.STREAM_DECODE_SIZE[0]}x{GazeConfig.STREAM_DECODE_SIZE[1]}")
+                report(0.3, "프레임별 시선 추적 중...")
+                # 길이 정보가 없는 스트림이므로 입력 바이트 기준으로 진행률 계산
+                self.track_frames(
+                    iter(reader),
+                    progress_callback=lambda _: on_ratio(reader.bytes_fed / content_length) if content_length else None,
+                    cancel_event=cancel_event,
+                    accumulator=stats,
+                    sampler=MotionAdaptiveSampler(sample_fps, sampler_budget) if sampler_budget else None
+                )
+            finally:
+                body.close()
+            return self._pipe_total_frames(reader, sample_fps)
+        
+        with SecureFileManager.secure_temp_file(os.path.splitext(key)[1] or '.webm') as video_path:
+            report(0.1, "S3에서 비디오 다운로드 중...")
+            self.download_video_from_s3(bucket, key, video_path)
+            
+            validation = FileValidator.validate_video_file(video_path)
+            if not validation['valid']:
+                raise Exception(f"동영상 파일 검증 실패: {', '.join(validation['errors'])}")
+            
+            duration = probe_video_duration(video_path)
+            logger.info(f"🎞️ [ANALYZE] FFmpeg 파이프 디코딩 (파일): {sample_fps:.2f}fps, "
+                        f"길이 {duration if duration else '알 수 없음'}초")
+            report(0.3, "프레임별 시선 추적 중...")
+            self.collect_stream_stats(video_path, sample_fps, duration, stats,
+                                      progress_callback=on_ratio, cancel_event=cancel_event,
+                                      sampler_budget=sampler_budget)
+            
+            if duration:
+                total_frames = int(round(duration * GazeConfig.STREAM_BASE_FPS))
+            else:
+                total_frames = int(round(stats.count * GazeConfig.STREAM_BASE_FPS / sample_fps))
+            return max(total_frames, 1)
+    
+    def _open_s3_stream(self, bucket: str, key: str):
+        """S3 객체 본문 스트림 열기 (크기 검증 포함). Returns: (StreamingBody, ContentLength)"""
+        try:
+            response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'NoSuchKey':
+                raise FileNotFoundError(f"S3에서 파일을 찾을 수 없습니다: s3://{bucket}/{key}")
+            raise Exception(f"S3 다운로드 오류 ({error_code}): {e}")
+        
+        content_length = response.get('ContentLength') or 0
+        size_mb = content_length / (1024 * 1024)
+        if content_length and (size_mb > FileValidator.MAX_FILE_SIZE_MB or
+                               content_length < FileValidator.MIN_FILE_SIZE_KB * 1024):
+            response['Body'].close()
+            raise Exception(f"동영상 파일 검증 실패: 허용되지 않는 파일 크기 {size_mb:.1f}MB")
+        return response['Body'], content_length
+    
+    def collect_stream_stats(self, video_path: str, sample_fps: float, duration: Optional[float],
+                             accumulator: GazeStatsAccumulator,
+                             progress_callback: Optional[Callable[[float], None]] = None,
+                             cancel_event: Optional[threading.Event] = None,
+                             sampler_budget: Optional[float] = None) -> GazeStatsAccumulator:
+        """
+        FFmpeg 파이프로 로컬 동영상의 (시선 포인트, 얼굴 크기) 샘플을 accumulator에 누적
+        
+        collect_gaze_stats의 FFmpeg 버전입니다. 길이가 GazeConfig.PARALLEL_MIN_DURATION_SEC 이상이면
+        샘플 간격 배수 경계의 시간 구간으로 나눠 프로세스 풀에서 분석하고 순서대로 합칩니다.
+        (구간 경계에서는 FFmpeg 정확 탐색으로 인해 경계 프레임 1개 수준의 차이가 있을 수 있습니다.)
+        
+        sampler_budget(분당 FaceMesh 호출 수)이 있으면 sample_fps를 후보 fps로 보고 적응형 샘플링을 사용합니다.
+        구간 병렬 분석에서는 구간마다 샘플러를 새로 만들며 예산도 구간별로 적용됩니다.
+        """
+        workers = GazeConfig.PARALLEL_MAX_WORKERS
+        expected = duration * sample_fps if duration else 0
+        
+        def on_frame(index: int) -> None:
+            if progress_callback and expected > 0:
+                progress_callback(index / expected)
+        
+        def make_sampler() -> Optional[MotionAdaptiveSampler]:
+            return MotionAdaptiveSampler(sample_fps, sampler_budget) if sampler_budget else None
+        
+        if workers <= 1 or not duration or duration < GazeConfig.PARALLEL_MIN_DURATION_SEC:
+            reader = FFmpegFrameReader(video_path, sample_fps)
+            return self.track_frames(iter(reader), progress_callback=on_frame, cancel_event=cancel_event,
+                                     accumulator=accumulator, sampler=make_sampler())
+        
+        segments = split_time_segments(duration, sample_fps, workers)
+        if len(segments) <= 1:
+            reader = FFmpegFrameReader(video_path, sample_fps)
+            return self.track_frames(iter(reader), progress_callback=on_frame, cancel_event=cancel_event,
+                                     accumulator=accumulator, sampler=make_sampler())
+        
+        logger.info(f"⚡ [ANALYZE] 구간 병렬 분석 (FFmpeg): {len(segments)}개 구간, {duration:.1f}초")
+        pool = get_segment_pool()
+        futures = [
+            pool.submit(track_stream_segment_in_worker, video_path, sample_fps, start, length,
+                        accumulator.spawn(), sampler_budget)
+            for start, length in segments
+        ]
+        return self._gather_segment_results(futures, accumulator, progress_callback, cancel_event)
+    
+    @staticmethod
+    def _pipe_total_frames(reader: FFmpegFrameReader, sample_fps: float) -> int:
+        """스트리밍 입력은 길이를 모르므로 출력 프레임 수를 기준 fps 프레임 수로 환산"""
+        return max(int(round(reader.frames_read * GazeConfig.STREAM_BASE_FPS / sample_fps)), 1)
+    
+    def _collect_stats_opencv(self, bucket: str, key: str, frame_skip: int, stats: GazeStatsAccumulator,
+                              report: Callable[[float, str], None],
+                              cancel_event: Optional[threading.Event]) -> int:
+        """
+        기존 디코딩 경로: S3 다운로드 → (가능하면) webm→mp4 트랜스코딩 → OpenCV 디코딩
+        
+        FFmpeg 파이프 디코딩을 쓸 수 없을 때(FFmpeg 미설치, GAZE_STREAM_DECODE=false) 사용합니다.
+        
+        Returns:
+            int: 총 프레임 수 (시선 통계는 stats에 누적)
+        """
         # 안전한 임시 파일 관리 (webm 파일)
         with SecureFileManager.secure_temp_file('.webm') as video_path:
             try:
                 # === 1단계: S3에서 동영상 다운로드 ===
+                report(0.1, "S3에서 비디오 다운로드 중...")
                 self.download_video_from_s3(bucket, key, video_path)
                 
                 # 파일 유효성 검증
@@ -730,6 +1020,7 @@ class GazeAnalyzer(GazeCoreProcessor):
                     raise Exception(f"동영상 파일 검증 실패: {', '.join(validation['errors'])}")
                 
                 # === 2단계: FFmpeg 트랜스코딩 (ValidationError 근본 해결) ===
+                report(0.2, "동영상 변환 중...")
                 # 메타데이터 검증 및 FFmpeg 가용성 확인
                 metadata_valid = self._validate_video_metadata(video_path)
                 ffmpeg_available = self._check_ffmpeg_availability()
@@ -775,12 +1066,6 @@ class GazeAnalyzer(GazeCoreProcessor):
                 else:
                     logger.info("📁 [ANALYZE] 원본 WebM 파일 사용 (메타데이터 보정 적용 예정)")
                 
-                # === 3단계: 허용 시선 범위 계산 ===
-                logger.info(f"🎯 [ANALYZE] Calibration points: {calibration_points}")
-                original_allowed_range = self.calculate_allowed_gaze_range(calibration_points)
-                current_allowed_range = original_allowed_range.copy()
-                logger.info(f"🎯 [ANALYZE] Calculated allowed range: {original_allowed_range}")
-                
                 # === 4단계: 동영상 프레임 분석 (최종 결정된 파일 사용) ===
                 cap = cv2.VideoCapture(final_video_path)
                 if not cap.isOpened():
@@ -807,117 +1092,18 @@ class GazeAnalyzer(GazeCoreProcessor):
 
                 # duration = total_frames / fps if fps > 0 else 0
                 
-                # 분석 변수 초기화
-                gaze_points = []
-                analyzed_count = 0
-                frame_count = 0
-                face_sizes = []  # 동적 스케일링용
-                
-                # === 4단계: 프레임별 시선 추적 ===
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                    
-                    frame_count += 1
-                    
-                    # 프레임 스킵 적용 (성능 최적화)
-                    if frame_count % frame_skip != 0:
-                        continue
-                    
-                    h, w, _ = frame.shape
-                    
-                    # MediaPipe 얼굴 분석
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    results = self.face_mesh.process(rgb_frame)
-                    
-                    if results.multi_face_landmarks:
-                        for face_landmarks in results.multi_face_landmarks:
-                            # 시선 포인트 계산 (부모 클래스 메서드 사용)
-                            gaze_point = self.get_gaze_point_3d(face_landmarks.landmark, w, h)
-                            
-                            # 얼굴 크기 측정 (부모 클래스 메서드 사용)
-                            current_face_size = self._estimate_face_size(face_landmarks.landmark, w, h)
-                            
-                            if gaze_point and current_face_size > 0:
-                                gaze_points.append(gaze_point)
-                                face_sizes.append(current_face_size)
-                                analyzed_count += 1
-                                
-                                # === 5단계: 동적 스케일링 적용 ===
-                                if initial_face_size and initial_face_size > 0:
-                                    current_allowed_range = self.apply_dynamic_scaling(
-                                        original_allowed_range, initial_face_size, current_face_size
-                                    )
-                
                 cap.release()
                 
-                # === 6단계: 분석 결과 검증 ===
-                if not self.validate_gaze_data(gaze_points):
-                    raise Exception("충분한 시선 데이터를 수집하지 못했습니다. 얼굴이 명확히 보이는 동영상으로 다시 시도해주세요.")
-                
-                # === 7단계: 점수 계산 ===
-                jitter_score = self.calculate_jitter_score(gaze_points)
-                compliance_score = self.calculate_gaze_compliance_score(gaze_points, current_allowed_range)
-                
-                # 최종 종합 점수 (가중 평균)
-                weights = GazeConfig.SCORE_WEIGHTS
-                final_score = int((jitter_score * weights['jitter']) + 
-                                (compliance_score * weights['compliance']))
-                
-                # 범위 내 프레임 통계
-                in_range_count = sum(1 for x, y in gaze_points 
-                                   if (current_allowed_range['left_bound'] <= x <= current_allowed_range['right_bound'] and
-                                       current_allowed_range['top_bound'] <= y <= current_allowed_range['bottom_bound']))
-                in_range_ratio = in_range_count / analyzed_count if analyzed_count > 0 else 0
-                
-                # === 8단계: 안정성 등급 결정 ===
-                if final_score >= 85:
-                    stability_rating = "우수"
-                elif final_score >= 70:
-                    stability_rating = "양호"
-                elif final_score >= 50:
-                    stability_rating = "보통"
-                else:
-                    stability_rating = "개선 필요"
-                
-                # === 9단계: AI 피드백 생성 ===
-                feedback = self.generate_feedback(final_score, jitter_score, compliance_score, stability_rating)
-                
-                # === 10단계: 결과 정리 ===
-                analysis_duration = time.time() - analysis_start_time
-                
-                # 시각화용 시선 포인트 샘플링 (프론트엔드 성능 고려)
-                max_points = 50
-                if len(gaze_points) > max_points:
-                    step = len(gaze_points) // max_points
-                    sampled_points = gaze_points[::step]
-                else:
-                    sampled_points = gaze_points
-                
-                logger.info(f"✅ [ANALYZE] 분석 완료: 점수={final_score}, 소요시간={analysis_duration:.1f}초")
-                logger.info(f"🎯 [ANALYZE] Final allowed range in result: {current_allowed_range}")
-                
-                # === 11단계: 분석 완료 ===
-                
-                return GazeAnalysisResult(
-                    gaze_score=final_score,
-                    total_frames=corrected_total_frames,
-                    analyzed_frames=analyzed_count,
-                    in_range_frames=in_range_count,
-                    in_range_ratio=in_range_ratio,
-                    jitter_score=jitter_score,
-                    compliance_score=compliance_score,
-                    stability_rating=stability_rating,
-                    feedback=feedback,
-                    gaze_points=sampled_points,
-                    allowed_range=current_allowed_range,
-                    calibration_points=calibration_points
+                # === 4단계: 프레임별 시선 추적 (긴 동영상은 구간 병렬 분석) ===
+                report(0.3, "프레임별 시선 추적 중...")
+                self.collect_gaze_stats(
+                    final_video_path, frame_skip, raw_total_frames, corrected_fps, stats,
+                    progress_callback=lambda ratio: report(0.3 + 0.6 * ratio, "프레임별 시선 추적 중..."),
+                    cancel_event=cancel_event
                 )
                 
-            except Exception as e:
-                logger.error(f"❌ [ANALYZE] 분석 실패: {e}")
-                raise
+                return corrected_total_frames
+                
             finally:
                 # 트랜스코딩된 임시 파일 정리
                 if 'transcoded_success' in locals() and transcoded_success and 'mp4_path' in locals():
@@ -927,7 +1113,87 @@ class GazeAnalyzer(GazeCoreProcessor):
                             logger.debug(f"🗑️ [CLEANUP] 트랜스코딩된 임시 파일 정리: {mp4_path}")
                     except Exception as cleanup_error:
                         logger.warning(f"⚠️ [CLEANUP] 임시 파일 정리 실패: {cleanup_error}")
-
+    
+    def score_gaze_stats(self, stats: GazeStatsAccumulator, corrected_total_frames: int,
+                         calibration_points: List[Tuple[float, float]], analysis_start_time: float,
+                         report: Callable[[float, str], None]) -> GazeAnalysisResult:
+        """
+        누적된 시선 통계로 점수/등급/피드백 계산 (점수는 O(1), 궤적/히트맵 인코딩만 포인트 수에 비례)
+        
+        디코딩 경로와 무관한 공통 단계로, 라이브 시선 추적(live_gaze_service)도 같은 메서드로 결과를 만듭니다.
+        """
+        # 실제로 FaceMesh 분석에서 시선을 얻은 프레임 수 (적응형 샘플링이 건너뛴 프레임은 포함하지 않음)
+        analyzed_count = stats.count
+        std_x, std_y = stats.x.std, stats.y.std
+        current_allowed_range = stats.current_allowed_range()
+        
+        # === 6단계: 분석 결과 검증 ===
+        if not self.validate_gaze_spread(analyzed_count, std_x, std_y):
+            raise Exception("충분한 시선 데이터를 수집하지 못했습니다. 얼굴이 명확히 보이는 동영상으로 다시 시도해주세요.")
+        
+        # === 7단계: 점수 계산 ===
+        report(0.95, "시선 점수 계산 중...")
+        jitter_score = self.jitter_to_score((std_x + std_y) / 2)
+        if all(stats.allowed_range.values()):
+            compliance_score = int(stats.in_range_ratio * 100)
+        else:
+            logger.warning("⚠️ [COMPLIANCE] 유효하지 않은 데이터로 기본 점수 반환")
+            compliance_score = 50
+        
+        # 최종 종합 점수 (가중 평균)
+        weights = GazeConfig.SCORE_WEIGHTS
+        final_score = int((jitter_score * weights['jitter']) + 
+                        (compliance_score * weights['compliance']))
+        
+        # 범위 내 프레임 통계 (모든 포인트를 마지막 얼굴 크기로 스케일링한 범위 기준)
+        in_range_count = stats.in_range_count
+        in_range_ratio = stats.in_range_ratio
+        
+        # === 8단계: 안정성 등급 결정 ===
+        if final_score >= 85:
+            stability_rating = "우수"
+        elif final_score >= 70:
+            stability_rating = "양호"
+        elif final_score >= 50:
+            stability_rating = "보통"
+        else:
+            stability_rating = "개선 필요"
+        
+        # === 9단계: AI 피드백 생성 ===
+        feedback = self.generate_feedback(final_score, jitter_score, compliance_score, stability_rating)
+        
+        # === 10단계: 결과 정리 ===
+        analysis_duration = time.time() - analysis_start_time
+        
+        # 시각화용 시선 포인트 샘플링 (누적 중 고정 간격으로 다운샘플링된 포인트)
+        sampled_points = stats.sampled_points()
+        # 전체 궤적은 압축본과 히트맵으로만 전달 (gaze_points는 기존 클라이언트용 다운샘플 유지)
+        trace_points = stats.trace_points()
+        trace = encode_trace(trace_points)
+        heatmap = build_heatmap(trace_points, current_allowed_range)
+        
+        logger.info(f"✅ [ANALYZE] 분석 완료: 점수={final_score}, 소요시간={analysis_duration:.1f}초")
+        logger.info(f"🎯 [ANALYZE] Final allowed range in result: {current_allowed_range}")
+        
+        # === 11단계: 분석 완료 ===
+        
+        return GazeAnalysisResult(
+            gaze_score=final_score,
+            total_frames=corrected_total_frames,
+            analyzed_frames=analyzed_count,
+            in_range_frames=in_range_count,
+            in_range_ratio=in_range_ratio,
+            jitter_score=jitter_score,
+            compliance_score=compliance_score,
+            stability_rating=stability_rating,
+            feedback=feedback,
+            gaze_points=sampled_points,
+            allowed_range=current_allowed_range,
+            calibration_points=calibration_points,
+            trace=trace,
+            heatmap=heatmap
+        )
+    
 
 # 싱글톤 인스턴스 생성 (기존 API 호환성 유지)
 # 실제 면접 서비스에서는 인스턴스 풀링 또는 의존성 주입 고려
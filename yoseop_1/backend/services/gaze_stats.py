@@ -0,0 +1,207 @@
+"""
+시선 통계 온라인 누적기
+
+동영상 분석은 모든 시선 포인트를 파이썬 리스트로 모아 두었다가 마지막에 표준편차, 범위 내 비율,
+시각화용 샘플(gaze_points[::step])을 여러 번 훑어 계산했습니다. 이 모듈의 누적기는 평균/분산과
+다운샘플링을 프레임마다 O(1)로 갱신하고, 포인트별 값은 float 배열에만 보관합니다.
+
+메모리는 분석한 포인트 수에 비례합니다 (포인트당 24바이트: 전체 궤적 16 + 범위 판정용 배율 8).
+frame_skip=10으로 30fps 영상 1시간을 분석해도 1만여 포인트, 약 260KB입니다.
+
+- RunningMeanVar: Welford 평균/분산 (np.mean / np.var와 부동소수점 오차 범위에서 동일)
+- GazeStatsAccumulator: x/y 흔들림, 얼굴 크기, 범위 내 프레임 수(포인트별 필요 배율의 정렬 배열),
+  고정 간격 다운샘플링, 압축 궤적/히트맵(gaze_trace)용 전체 궤적
+- 구간 병렬 분석 결과는 merge()로 시간 순서대로 합침 (Chan 병렬 분산 공식)
+"""
+
+import math
+import heapq
+from array import array
+from bisect import bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+
+
+class RunningMeanVar:
+    """Welford 온라인 평균/분산 (모집단 분산, ddof=0)"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningMeanVar") -> None:
+        """다른 누적기의 값을 합침 (Chan et al. 병렬 분산 공식)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class GazeStatsAccumulator:
+    """
+    동영상 분석 점수 계산에 필요한 시선 통계를 프레임 단위로 누적
+
+    범위 내 판정은 배치 계산과 같이 모든 포인트를 마지막 프레임의 얼굴 크기로 스케일링한 허용 범위와 비교합니다
+    (GazeAnalyzer.apply_dynamic_scaling). 마지막 얼굴 크기는 끝나기 전에 알 수 없으므로 포인트마다
+    범위 안에 들어오는 데 필요한 최소 배율 s_min = max(2|x-cx|/W, 2|y-cy|/H)을 정렬된 배열에 넣어 두고
+    (삽입 위치는 이진 탐색), 결과를 낼 때 s_min <= last_face_size / initial_face_size인 포인트 수를
+    이진 탐색 한 번으로 셉니다 (실시간 세션은 매 프레임 비율을 읽으므로 조회가 O(log N)이어야 함).
+    initial_face_size가 없으면 원본 범위와 바로 비교합니다.
+
+    시각화용 샘플은 고정 간격 다운샘플링으로 유지합니다. 버퍼가 가득 차면 하나 건너 하나를 버리고
+    간격을 두 배로 늘리므로 최대 2 * max_points개만 보관합니다.
+    포인트 수가 2 * max_points 이하이면 기존 gaze_points[::step] 결과와 정확히 같습니다.
+    """
+
+    def __init__(self, allowed_range: Optional[Dict[str, float]] = None,
+                 initial_face_size: Optional[float] = None, max_points: int = 50):
+        self.allowed_range = allowed_range
+        self.initial_face_size = initial_face_size if initial_face_size and initial_face_size > 0 else None
+        self.max_points = max_points
+
+        self.x = RunningMeanVar()
+        self.y = RunningMeanVar()
+        self.face_size = RunningMeanVar()
+        self.last_face_size = 0.0
+        self._fixed_in_range = 0              # initial_face_size가 없을 때 (원본 범위 기준)
+        self._scales = array('d')             # 포인트별 필요 최소 배율, 오름차순 (initial_face_size가 있을 때)
+
+        self._buffer: List[Tuple[float, float]] = []
+        self._stride = 1
+        self._trace_x = array('d')
+        self._trace_y = array('d')
+
+        if allowed_range:
+            self._center_x = (allowed_range['left_bound'] + allowed_range['right_bound']) / 2
+            self._center_y = (allowed_range['top_bound'] + allowed_range['bottom_bound']) / 2
+            self._width = allowed_range['right_bound'] - allowed_range['left_bound']
+            self._height = allowed_range['bottom_bound'] - allowed_range['top_bound']
+
+    @property
+    def count(self) -> int:
+        return self.x.count
+
+    def spawn(self) -> "GazeStatsAccumulator":
+        """같은 설정의 빈 누적기 (구간 병렬 분석 워커용)"""
+        return GazeStatsAccumulator(self.allowed_range, self.initial_face_size, self.max_points)
+
+    @staticmethod
+    def _needed_scale(offset: float, size: float) -> float:
+        if size > 0:
+            return 2 * offset / size
+        return 0.0 if offset == 0 else math.inf
+
+    def _record_in_range(self, x: float, y: float) -> None:
+        if self.initial_face_size is None:
+            bounds = self.allowed_range
+            if (bounds['left_bound'] <= x <= bounds['right_bound'] and
+                    bounds['top_bound'] <= y <= bounds['bottom_bound']):
+                self._fixed_in_range += 1
+            return
+        insort(self._scales, max(self._needed_scale(abs(x - self._center_x), self._width),
+                                 self._needed_scale(abs(y - self._center_y), self._height)))
+
+    @property
+    def in_range_count(self) -> int:
+        """마지막 얼굴 크기로 스케일링한 허용 범위 안의 포인트 수"""
+        if not self.allowed_range:
+            return 0
+        if self.initial_face_size is None:
+            return self._fixed_in_range
+        # 마지막 얼굴 크기가 유효하지 않으면 apply_dynamic_scaling처럼 원본 범위 (배율 1)
+        scale = self.last_face_size / self.initial_face_size if self.last_face_size > 0 else 1.0
+        return bisect_right(self._scales, scale)
+
+    def update(self, gaze_point: Tuple[float, float], face_size: float) -> None:
+        """샘플 프레임 1개 반영"""
+        x, y = gaze_point
+        index = self.x.count
+        self.x.update(x)
+        self.y.update(y)
+        self.face_size.update(face_size)
+        self.last_face_size = face_size
+
+        if self.allowed_range:
+            self._record_in_range(x, y)
+
+        self._trace_x.append(x)
+        self._trace_y.append(y)
+
+        if index % self._stride == 0:
+            self._buffer.append(gaze_point)
+            if len(self._buffer) > 2 * self.max_points:
+                self._buffer = self._buffer[::2]
+                self._stride *= 2
+
+    def merge(self, other: "GazeStatsAccumulator") -> None:
+        """시간상 뒤에 오는 구간의 누적 결과를 합침"""
+        if other.count == 0:
+            return
+        self.x.merge(other.x)
+        self.y.merge(other.y)
+        self.face_size.merge(other.face_size)
+        self.last_face_size = other.last_face_size
+        self._fixed_in_range += other._fixed_in_range
+        self._scales = array('d', heapq.merge(self._scales, other._scales))
+        self._trace_x.extend(other._trace_x)
+        self._trace_y.extend(other._trace_y)
+
+        # 간격이 다른 버퍼는 큰 간격에 맞춰 솎아낸 뒤 이어 붙임 (구간 경계에서는 근사적으로 균등)
+        stride = max(self._stride, other._stride)
+        merged = self._buffer[::stride // self._stride] + other._buffer[::stride // other._stride]
+        while len(merged) > 2 * self.max_points:
+            merged = merged[::2]
+            stride *= 2
+        self._buffer = merged
+        self._stride = stride
+
+    @property
+    def in_range_ratio(self) -> float:
+        return self.in_range_count / self.count if self.count else 0.0
+
+    def current_allowed_range(self) -> Optional[Dict[str, float]]:
+        """마지막 프레임의 얼굴 크기로 스케일링한 허용 범위 (결과 표시용)"""
+        if not self.allowed_range or self.initial_face_size is None or self.last_face_size <= 0:
+            return self.allowed_range
+        scale_factor = self.last_face_size / self.initial_face_size
+        new_width = self._width * scale_factor
+        new_height = self._height * scale_factor
+        return {
+            'left_bound': self._center_x - new_width / 2,
+            'right_bound': self._center_x + new_width / 2,
+            'top_bound': self._center_y - new_height / 2,
+            'bottom_bound': self._center_y + new_height / 2
+        }
+
+    def sampled_points(self) -> List[Tuple[float, float]]:
+        """시각화용 시선 포인트 (최대 약 2 * max_points개, 시간 순서)"""
+        if len(self._buffer) > self.max_points:
+            step = len(self._buffer) // self.max_points
+            return self._buffer[::step]
+        return list(self._buffer)
+
+    def trace_points(self) -> List[Tuple[float, float]]:
+        """전체 시선 궤적 (분석한 모든 샘플 프레임, 시간 순서)"""
+        return list(zip(self._trace_x, self._trace_y))
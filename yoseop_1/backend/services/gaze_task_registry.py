@@ -0,0 +1,282 @@
+"""
+시선 분석 작업 저장소
+
+라우터의 analysis_tasks 딕셔너리는 줄어들지 않고 서버를 재시작하면 사라져서,
+배포 중에 /gaze/analyze/status/{task_id}를 폴링하던 클라이언트가 결과를 잃었습니다.
+이 모듈은 작업 상태를 로컬 SQLite에 저장하고 메모리에는 진행 중인 작업만 둡니다.
+
+- 진행 중(queued/processing) 작업: 메모리에서 관리 (진행률 갱신은 DB에 쓰지 않고, 상태가 바뀔 때만 저장)
+- 종료된 작업: DB에만 보관, 조회 시 읽음 → 부하가 계속되어도 메모리 사용량 일정
+- 보관 한도: GAZE_TASK_TTL_SEC이 지난 작업과 GAZE_TASK_MAX_ROWS를 넘는 오래된 작업은 삭제
+- 작업 ID는 입력(사용자, S3 키, 캘리브레이션, frame_skip)과 영상 버전(결과 캐시 키: ETag + 분석기 지문)에서 만들어
+  같은 요청을 반복해도 같은 작업을 가리킴. 같은 S3 키에 영상을 다시 올리거나 분석기 버전이 바뀌면 새 작업
+- 결과는 필요한 필드만 압축된 JSON으로 저장 (시선 포인트는 소수 첫째 자리, 평탄화된 배열)
+- 재시작 시 DB에 남아 있던 진행 중 작업은 실패로 표시 (워커 풀 작업은 재시작에서 살아남지 않음)
+
+환경변수:
+- GAZE_TASK_DB_PATH: SQLite 파일 경로 (기본 backend/uploads/gaze_tasks.db)
+- GAZE_TASK_TTL_SEC: 작업 보관 시간 (기본 7일)
+- GAZE_TASK_MAX_ROWS: 보관할 최대 작업 수 (기본 5000)
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from .gaze_result_cache import calibration_hash
+
+logger = logging.getLogger(__name__)
+
+GAZE_TASK_DB_PATH = os.getenv('GAZE_TASK_DB_PATH', 'backend/uploads/gaze_tasks.db')
+GAZE_TASK_TTL_SEC = float(os.getenv('GAZE_TASK_TTL_SEC', str(7 * 24 * 3600)))
+GAZE_TASK_MAX_ROWS = int(os.getenv('GAZE_TASK_MAX_ROWS', '5000'))
+
+ACTIVE_STATUSES = ('queued', 'processing')
+
+# 저장하는 작업 필드 (분석 원본 객체, 캘리브레이션 요청 원문 등은 상태 조회에 쓰이지 않아 저장하지 않음)
+PERSISTED_FIELDS = (
+    'task_id', 'status', 'progress', 'message', 'error', 'result',
+    'started_at', 'completed_at', 'failed_at', 'cancelled_at',
+    'session_id', 'user_id', 's3_key', 'temp_media_id',
+)
+DATETIME_FIELDS = ('started_at', 'completed_at', 'failed_at', 'cancelled_at')
+
+# 작업 ID 네임스페이스 (uuid5)
+TASK_ID_NAMESPACE = uuid.UUID('6f1c2b6e-3f0a-5d7e-9a43-2b8f4c1d7e55')
+
+
+def derive_task_id(kind: str, user_id: Any, s3_key: str, calibration_points: List[Tuple[float, float]],
+                   initial_face_size: Optional[float], frame_skip: Optional[int], session_id: str = "",
+                   revision: Optional[str] = None) -> str:
+    """
+    입력이 같으면 같은 작업 ID (uuid5)
+
+    revision은 영상 버전(결과 캐시 키)으로, 같은 S3 키라도 ETag나 분석기 지문이 다르면 다른 작업이 됩니다.
+    """
+    material = json.dumps([
+        kind, str(user_id), session_id, s3_key, calibration_hash(calibration_points, initial_face_size), frame_skip,
+        revision
+    ])
+    return str(uuid.uuid5(TASK_ID_NAMESPACE, material))
+
+
+def reusable_statuses(revision: Optional[str]) -> Tuple[str, ...]:
+    """
+    같은 작업 ID로 다시 요청했을 때 그대로 돌려줄 작업 상태
+
+    영상 버전(revision)을 알 수 없으면(결과 캐시 비활성화, ETag 조회 실패) 완료된 작업이
+    지금 S3 키의 영상을 분석한 결과인지 알 수 없으므로 진행 중인 작업만 재사용합니다.
+    """
+    return ACTIVE_STATUSES + ('completed',) if revision else ACTIVE_STATUSES
+
+
+def _compact_result(result: Any) -> Optional[Dict[str, Any]]:
+    """API 결과 스키마(또는 딕셔너리) → 저장용 딕셔너리 (시선 포인트는 평탄화 + 반올림)"""
+    if result is None:
+        return None
+    data = result.model_dump() if hasattr(result, 'model_dump') else dict(result)
+    data['gaze_points'] = [round(float(v), 1) for point in data.get('gaze_points') or [] for v in point]
+    data['calibration_points'] = [[round(float(x), 2), round(float(y), 2)]
+                                  for x, y in data.get('calibration_points') or []]
+    data['in_range_ratio'] = round(float(data.get('in_range_ratio', 0.0)), 4)
+    data['analysis_duration'] = round(float(data.get('analysis_duration', 0.0)), 3)
+    return data
+
+
+def _expand_result(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if data is None:
+        return None
+    flat = data.get('gaze_points') or []
+    data['gaze_points'] = [(flat[i], flat[i + 1]) for i in range(0, len(flat) - 1, 2)]
+    data['calibration_points'] = [tuple(p) for p in data.get('calibration_points') or []]
+    return data
+
+
+def _encode_task(task: Dict[str, Any]) -> str:
+    data = {}
+    for name in PERSISTED_FIELDS:
+        value = task.get(name)
+        if value is None:
+            continue
+        if name == 'result':
+            value = _compact_result(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[name] = value
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def _decode_task(raw: str) -> Dict[str, Any]:
+    task = json.loads(raw)
+    for name in DATETIME_FIELDS:
+        if isinstance(task.get(name), str):
+            task[name] = datetime.fromisoformat(task[name])
+    task['result'] = _expand_result(task.get('result'))
+    return task
+
+
+class GazeTaskRegistry:
+    """SQLite 기반 시선 분석 작업 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: str = GAZE_TASK_DB_PATH, ttl_sec: float = GAZE_TASK_TTL_SEC,
+                 max_rows: int = GAZE_TASK_MAX_ROWS):
+        self.db_path = db_path
+        self.ttl_sec = ttl_sec
+        self.max_rows = max(1, max_rows)
+        self._lock = Lock()
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._writes = 0
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS gaze_tasks ("
+            "task_id TEXT PRIMARY KEY, status TEXT NOT NULL, updated_at REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_gaze_tasks_updated ON gaze_tasks(updated_at)")
+        self._conn.commit()
+        self._fail_interrupted()
+        self._prune()
+
+    def _fail_interrupted(self) -> None:
+        """재시작 전 진행 중이던 작업을 실패로 표시 (클라이언트가 무한히 폴링하지 않도록)"""
+        rows = self._conn.execute(
+            f"SELECT data FROM gaze_tasks WHERE status IN ({','.join('?' * len(ACTIVE_STATUSES))})",
+            ACTIVE_STATUSES
+        ).fetchall()
+        for (raw,) in rows:
+            task = _decode_task(raw)
+            task.update({
+                'status': 'failed',
+                'error': '서버 재시작으로 분석이 중단되었습니다.',
+                'message': '서버 재시작으로 분석이 중단되었습니다. 다시 요청해주세요.',
+                'failed_at': datetime.now()
+            })
+            self._write(task)
+        self._conn.commit()
+        if rows:
+            logger.info(f"🔁 [GAZE_TASKS] 재시작 전 진행 중이던 작업 {len(rows)}개를 실패로 표시")
+
+    def _write(self, task: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO gaze_tasks (task_id, status, updated_at, data) VALUES (?, ?, ?, ?)",
+            (task['task_id'], task['status'], time.time(), _encode_task(task))
+        )
+
+    def _prune(self) -> None:
+        """TTL이 지난 작업과 한도를 넘는 오래된 작업 삭제"""
+        expired = self._conn.execute(
+            "DELETE FROM gaze_tasks WHERE updated_at < ?", (time.time() - self.ttl_sec,)
+        ).rowcount
+        overflow = self._conn.execute(
+            "DELETE FROM gaze_tasks WHERE task_id IN ("
+            "SELECT task_id FROM gaze_tasks ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,)
+        ).rowcount
+        self._conn.commit()
+        if expired or overflow:
+            logger.info(f"🧹 [GAZE_TASKS] 작업 정리: 만료 {expired}개, 한도 초과 {overflow}개")
+
+    def _persist(self, task: Dict[str, Any]) -> None:
+        """잠금을 잡은 상태에서 호출. 종료된 작업은 메모리에서 내림"""
+        self._write(task)
+        self._conn.commit()
+        if task['status'] in ACTIVE_STATUSES:
+            self._active[task['task_id']] = task
+        else:
+            self._active.pop(task['task_id'], None)
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._prune()
+
+    def create(self, task_id: str, task: Dict[str, Any]) -> None:
+        """작업 생성 (같은 ID가 있으면 덮어씀)"""
+        task = dict(task, task_id=task_id)
+        with self._lock:
+            self._persist(task)
+
+    def update(self, task_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        작업 필드 갱신 후 저장
+
+        Returns:
+            갱신된 작업 (없으면 None)
+        """
+        with self._lock:
+            task = self._active.get(task_id)
+            if task is None:
+                row = self._conn.execute("SELECT data FROM gaze_tasks WHERE task_id = ?", (task_id,)).fetchone()
+                if row is None:
+                    return None
+                task = _decode_task(row[0])
+            task.update(fields)
+            self._persist(task)
+            return dict(task)
+
+    def report_progress(self, task_id: str, progress: float, message: str) -> None:
+        """
+        진행 중 작업의 진행률 갱신 (워커 스레드에서 호출)
+
+        메모리 상태만 바꾸고, 대기 중이던 작업이 처음 실행될 때(processing 전환)만 저장합니다.
+        이미 종료(취소 포함)된 작업은 무시합니다.
+        """
+        with self._lock:
+            task = self._active.get(task_id)
+            if task is None or task['status'] not in ACTIVE_STATUSES:
+                return
+            started = task['status'] != 'processing'
+            task.update({'status': 'processing', 'progress': progress, 'message': message})
+            if started:
+                self._persist(task)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            task = self._active.get(task_id)
+            if task is not None:
+                return dict(task)
+            row = self._conn.execute("SELECT data FROM gaze_tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return _decode_task(row[0]) if row else None
+
+    def __contains__(self, task_id: str) -> bool:
+        with self._lock:
+            if task_id in self._active:
+                return True
+            return self._conn.execute(
+                "SELECT 1 FROM gaze_tasks WHERE task_id = ?", (task_id,)
+            ).fetchone() is not None
+
+    def delete(self, task_id: str) -> None:
+        with self._lock:
+            self._active.pop(task_id, None)
+            self._conn.execute("DELETE FROM gaze_tasks WHERE task_id = ?", (task_id,))
+            self._conn.commit()
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM gaze_tasks GROUP BY status").fetchall()
+        return dict(rows)
+
+    def recent_ids(self, limit: int = 10) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id FROM gaze_tasks ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [task_id for (task_id,) in reversed(rows)]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤 인스턴스
+gaze_task_registry = GazeTaskRegistry()
@@ -0,0 +1,158 @@
+"""
+시선 궤적 / 히트맵 압축 인코딩
+
+분석 결과의 gaze_points는 [x, y] 실수 JSON 배열이라 크기 때문에 50개 안팎으로 다운샘플링해 저장했고,
+결과 페이지에서 세부 움직임이 사라지고 기록 화면에서는 JSON 파싱 비용도 컸습니다.
+이 모듈은 전체 해상도 궤적과 저해상도 히트맵을 작은 문자열로 인코딩/디코딩합니다.
+
+궤적 (encode_trace / decode_trace):
+- 좌표를 1/scale 픽셀 단위 정수로 양자화 (기본 0.5px, MediaPipe 아이리스 흔들림보다 작음)
+- 열 단위 배치: x 전체, y 전체 순서로 직전 값과의 차이(delta)를 저장 → 값이 작고 반복되어 압축이 잘 됨
+- delta는 지그재그 부호화(0, -1, 1, -2, ... → 0, 1, 2, 3, ...) 후 바이트 자리별 열로 분리
+  (하위 바이트 전체, 상위 바이트 전체 순서: 상위 바이트는 대부분 0이라 zlib이 거의 지움) → zlib → base64
+- 한 값이 2바이트를 넘으면 4바이트 열 사용 (bytes 필드)
+- 양자화된 절대값에서 차이를 구하므로 디코딩 시 오차가 누적되지 않음 (최대 오차 0.5/scale px)
+- 크기: 1.5fps(frame_skip 10) 샘플링 기준 10분 분량 전체 궤적이 약 2KB로, 기존 50포인트 JSON(약 2KB)과 비슷하거나 작음
+
+히트맵 (build_heatmap / decode_heatmap):
+- 포인트 범위(+ 허용 범위)를 cols x rows 격자로 나눠 칸별 포인트 수를 센 뒤 최대값 기준 0~255로 정규화
+- uint8 행 우선 배열 → zlib → base64
+
+numpy 없이 표준 라이브러리만 사용하므로 라우터나 스크립트에서도 가볍게 import할 수 있습니다.
+"""
+
+import zlib
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+TRACE_FORMAT = 'zigzag-delta-planes-zlib-b64'
+TRACE_SCALE = 2                # 1/2 픽셀 단위 양자화
+HEATMAP_FORMAT = 'uint8-zlib-b64'
+HEATMAP_GRID = (32, 24)        # (cols, rows), 분석 해상도 640x480 기준 20px 칸
+HEATMAP_MARGIN = 0.05          # 범위 여백 (프론트엔드 시각화와 같은 5%)
+
+
+def _pack(raw: bytes) -> str:
+    return base64.b64encode(zlib.compress(raw, 9)).decode('ascii')
+
+
+def _unpack(data: str) -> bytes:
+    return zlib.decompress(base64.b64decode(data))
+
+
+def _zigzag_deltas(values: Sequence[int]) -> List[int]:
+    previous = 0
+    out = []
+    for value in values:
+        delta = value - previous
+        out.append((delta << 1) ^ (delta >> 63))
+        previous = value
+    return out
+
+
+def encode_trace(points: Sequence[Tuple[float, float]], scale: int = TRACE_SCALE) -> Dict[str, Any]:
+    """
+    시선 포인트 목록 → 압축 궤적
+
+    Returns:
+        {'format', 'scale', 'bytes', 'count', 'data'} (JSON 직렬화 가능)
+    """
+    xs = [int(round(x * scale)) for x, _ in points]
+    ys = [int(round(y * scale)) for _, y in points]
+    codes = _zigzag_deltas(xs) + _zigzag_deltas(ys)
+    width = 2 if not codes or max(codes) < 1 << 16 else 4
+    raw = b''.join(bytes((code >> (8 * k)) & 0xFF for code in codes) for k in range(width))
+    return {
+        'format': TRACE_FORMAT,
+        'scale': scale,
+        'bytes': width,
+        'count': len(xs),
+        'data': _pack(raw),
+    }
+
+
+def decode_trace(trace: Dict[str, Any]) -> List[Tuple[float, float]]:
+    """압축 궤적 → [(x, y), ...]"""
+    if trace.get('format') != TRACE_FORMAT:
+        raise ValueError(f"지원하지 않는 궤적 형식: {trace.get('format')}")
+    count, scale, width = trace['count'], trace['scale'], trace['bytes']
+    raw = _unpack(trace['data'])
+    total = 2 * count
+    if len(raw) != total * width:
+        raise ValueError(f"궤적 길이 불일치: {len(raw)} != {total * width}")
+
+    codes = [0] * total
+    for k in range(width):
+        plane = raw[k * total:(k + 1) * total]
+        for i, byte in enumerate(plane):
+            codes[i] |= byte << (8 * k)
+
+    columns = []
+    for start in (0, count):
+        value = 0
+        column = []
+        for code in codes[start:start + count]:
+            value += (code >> 1) ^ -(code & 1)
+            column.append(value / scale)
+        columns.append(column)
+    return list(zip(columns[0], columns[1]))
+
+
+def heatmap_bounds(points: Sequence[Tuple[float, float]],
+                   allowed_range: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """히트맵 범위: 포인트와 허용 범위를 모두 포함하고 5% 여백"""
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    if allowed_range and all(allowed_range.get(k) is not None
+                             for k in ('left_bound', 'right_bound', 'top_bound', 'bottom_bound')):
+        xs += [allowed_range['left_bound'], allowed_range['right_bound']]
+        ys += [allowed_range['top_bound'], allowed_range['bottom_bound']]
+    left, right, top, bottom = min(xs), max(xs), min(ys), max(ys)
+    margin_x = max(right - left, 1.0) * HEATMAP_MARGIN
+    margin_y = max(bottom - top, 1.0) * HEATMAP_MARGIN
+    return {'left': left - margin_x, 'top': top - margin_y, 'right': right + margin_x, 'bottom': bottom + margin_y}
+
+
+def build_heatmap(points: Sequence[Tuple[float, float]], allowed_range: Optional[Dict[str, float]] = None,
+                  grid: Tuple[int, int] = HEATMAP_GRID) -> Optional[Dict[str, Any]]:
+    """
+    시선 포인트 → 저해상도 히트맵 (포인트가 없으면 None)
+
+    Returns:
+        {'format', 'cols', 'rows', 'bounds', 'total', 'max_count', 'data'}
+    """
+    if not points:
+        return None
+    cols, rows = grid
+    bounds = heatmap_bounds(points, allowed_range)
+    cell_w = (bounds['right'] - bounds['left']) / cols
+    cell_h = (bounds['bottom'] - bounds['top']) / rows
+
+    counts = [0] * (cols * rows)
+    for x, y in points:
+        col = min(max(int((x - bounds['left']) / cell_w), 0), cols - 1)
+        row = min(max(int((y - bounds['top']) / cell_h), 0), rows - 1)
+        counts[row * cols + col] += 1
+
+    max_count = max(counts)
+    levels = bytes(round(count * 255 / max_count) for count in counts)
+    return {
+        'format': HEATMAP_FORMAT,
+        'cols': cols,
+        'rows': rows,
+        'bounds': {k: round(v, 2) for k, v in bounds.items()},
+        'total': len(points),
+        'max_count': max_count,
+        'data': _pack(levels),
+    }
+
+
+def decode_heatmap(heatmap: Dict[str, Any]) -> List[List[int]]:
+    """히트맵 → rows x cols 강도 (0~255) 2차원 리스트"""
+    if heatmap.get('format') != HEATMAP_FORMAT:
+        raise ValueError(f"지원하지 않는 히트맵 형식: {heatmap.get('format')}")
+    cols, rows = heatmap['cols'], heatmap['rows']
+    levels = _unpack(heatmap['data'])
+    if len(levels) != cols * rows:
+        raise ValueError(f"히트맵 크기 불일치: {len(levels)} != {cols * rows}")
+    return [list(levels[r * cols:(r + 1) * cols]) for r in range(rows)]
@@ -0,0 +1,249 @@
+"""
+시선 분석 작업 워커 풀
+
+동영상 시선 분석(analyze_video_from_s3)은 수십 초 이상 걸리는 동기 작업이므로
+FastAPI 백그라운드 작업에서 직접 호출하면 분석하는 동안 이벤트 루프 전체가 멈춥니다.
+이 모듈은 분석을 전용 스레드 풀에서 실행하고 대기열, 수용 한도, 취소, 진행률을 관리합니다.
+
+- 워커 스레드마다 GazeAnalyzer(FaceMesh) 1개를 만들어 재사용 (FaceMesh는 스레드 간 공유 불가)
+- 실행 중 + 대기 중 분석 수가 한도에 도달하면 GazeQueueFullError로 즉시 거절
+- 대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 샘플 프레임에서 중단
+- 결과 캐시 키(gaze_result_cache)가 같은 작업은 분석 1개를 함께 기다림 (마지막 대기자가 취소해야 분석 중단)
+
+환경변수:
+- GAZE_ANALYSIS_WORKERS: 동시에 실행할 분석 수 (기본 2)
+- GAZE_ANALYSIS_MAX_QUEUE: 실행 대기 가능한 분석 수 (기본 8)
+"""
+
+import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from .gaze_core import GazeAnalysisCancelled
+from .gaze_service import GazeAnalyzer, GazeAnalysisResult, gaze_analyzer
+from .gaze_result_cache import gaze_result_cache
+
+logger = logging.getLogger(__name__)
+
+GAZE_ANALYSIS_WORKERS = int(os.getenv("GAZE_ANALYSIS_WORKERS", "2"))
+GAZE_ANALYSIS_MAX_QUEUE = int(os.getenv("GAZE_ANALYSIS_MAX_QUEUE", "8"))
+
+
+class GazeQueueFullError(Exception):
+    """분석 대기열이 가득 차 새 작업을 받을 수 없는 경우"""
+    pass
+
+
+@dataclass
+class _SharedAnalysis:
+    """실제로 실행되는 분석 1개와 이를 기다리는 작업들 (작업 ID → 진행률 콜백)"""
+    future: Future
+    cancel_event: threading.Event
+    waiters: Dict[str, Optional[Callable[[float, str], None]]] = field(default_factory=dict)
+
+    def report(self, progress: float, message: str) -> None:
+        for callback in list(self.waiters.values()):
+            if callback:
+                callback(progress, message)
+
+
+class GazeAnalysisWorkerPool:
+    """동영상 시선 분석 전용 워커 풀"""
+
+    def __init__(self, max_workers: int = GAZE_ANALYSIS_WORKERS, max_queue: int = GAZE_ANALYSIS_MAX_QUEUE):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gaze-analysis")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # 작업 ID → (작업별 Future, 분석 키) / 분석 키(캐시 키 또는 작업 ID) → 실행 중인 분석
+        self._jobs: Dict[str, Tuple[Future, str]] = {}
+        self._analyses: Dict[str, _SharedAnalysis] = {}
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _get_analyzer(self) -> GazeAnalyzer:
+        """워커 스레드별 GazeAnalyzer (최초 작업 시 생성)"""
+        analyzer = getattr(self._local, 'analyzer', None)
+        if analyzer is None:
+            analyzer = GazeAnalyzer()
+            self._local.analyzer = analyzer
+        return analyzer
+
+    def lookup_cached(self, bucket: str, key: str, calibration_points: list,
+                      initial_face_size: Optional[float] = None,
+                      frame_skip: Optional[int] = None) -> Tuple[Optional[str], Optional[GazeAnalysisResult]]:
+        """
+        결과 캐시 조회 (head_object를 호출하므로 스레드에서 실행)
+
+        Returns:
+            (캐시 키, 캐시된 결과): 캐시를 쓸 수 없으면 (None, None), 캐시에 없으면 (키, None)
+        """
+        if gaze_result_cache is None:
+            return None, None
+        cache_key = gaze_result_cache.make_key(
+            gaze_analyzer.s3_client, bucket, key, calibration_points, initial_face_size, frame_skip
+        )
+        if cache_key is None:
+            return None, None
+        result = gaze_result_cache.get(cache_key)
+        if result is not None:
+            logger.info(f"💾 [GAZE_POOL] 캐시된 분석 결과 사용: s3://{bucket}/{key}")
+        return cache_key, result
+
+    def _run(self, analysis: _SharedAnalysis, cache_key: Optional[str],
+             analysis_kwargs: Dict[str, Any]) -> GazeAnalysisResult:
+        if analysis.cancel_event.is_set():
+            raise GazeAnalysisCancelled("시선 분석이 취소되었습니다.")
+        # 대기하는 동안 다른 프로세스가 같은 결과를 저장했을 수 있음
+        if cache_key and gaze_result_cache is not None:
+            cached = gaze_result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        analysis.report(0.05, "시선 분석 엔진 초기화 중...")
+        result = self._get_analyzer().analyze_video_from_s3(
+            progress_callback=analysis.report, cancel_event=analysis.cancel_event, **analysis_kwargs
+        )
+        if cache_key and gaze_result_cache is not None:
+            gaze_result_cache.put(cache_key, result)
+        return result
+
+    def submit(self, task_id: str, bucket: str, key: str, calibration_points: list,
+               initial_face_size: Optional[float] = None, frame_skip: Optional[int] = None,
+               progress_callback: Optional[Callable[[float, str], None]] = None,
+               cache_key: Optional[str] = None) -> Future:
+        """
+        분석 작업을 대기열에 추가
+
+        cache_key(lookup_cached 결과)가 같은 분석이 이미 대기/실행 중이면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+        progress_callback은 워커 스레드에서 호출되므로 빠르게 반환해야 합니다.
+
+        Raises:
+            GazeQueueFullError: 실행 중 + 대기 중 분석 수가 수용 한도에 도달한 경우
+        """
+        analysis_kwargs = {
+            'bucket': bucket,
+            'key': key,
+            'calibration_points': calibration_points,
+            'initial_face_size': initial_face_size,
+            'frame_skip': frame_skip,
+        }
+        analysis_key = cache_key or f"task:{task_id}"
+        job_future: Future = Future()
+
+        with self._lock:
+            if task_id in self._jobs:
+                return self._jobs[task_id][0]
+            analysis = self._analyses.get(analysis_key)
+            coalesced = analysis is not None
+            if analysis is None:
+                if len(self._analyses) >= self.capacity:
+                    raise GazeQueueFullError(
+                        f"시선 분석 대기열이 가득 찼습니다. (최대 {self.capacity}개) 잠시 후 다시 시도해주세요."
+                    )
+                analysis = _SharedAnalysis(future=Future(), cancel_event=threading.Event())
+                analysis.future = self._executor.submit(self._run, analysis, cache_key, analysis_kwargs)
+                self._analyses[analysis_key] = analysis
+            analysis.waiters[task_id] = progress_callback
+            self._jobs[task_id] = (job_future, analysis_key)
+
+        # 콜백은 잠금 밖에서 등록 (이미 끝난 Future면 바로 호출되므로)
+        if not coalesced:
+            analysis.future.add_done_callback(lambda _: self._finish_analysis(analysis_key, analysis))
+        analysis.future.add_done_callback(lambda done: self._resolve(task_id, job_future, done))
+        if coalesced:
+            logger.info(f"🔗 [GAZE_POOL] 같은 영상 분석에 합류: {task_id} (대기 작업 {len(analysis.waiters)}개)")
+        else:
+            logger.info(f"📥 [GAZE_POOL] 분석 작업 추가: {task_id} (활성 {len(self._analyses)}/{self.capacity})")
+        return job_future
+
+    def _resolve(self, task_id: str, job_future: Future, done: Future) -> None:
+        """공유 분석 결과를 작업별 Future로 전달 (이미 취소된 작업은 무시)"""
+        with self._lock:
+            # 취소 후 같은 작업 ID로 다시 제출된 작업이면 그대로 둠
+            job = self._jobs.get(task_id)
+            if job is not None and job[0] is job_future:
+                del self._jobs[task_id]
+        try:
+            if done.cancelled():
+                job_future.cancel()
+            elif done.exception() is not None:
+                job_future.set_exception(done.exception())
+            else:
+                job_future.set_result(done.result())
+        except InvalidStateError:
+            pass
+
+    def _finish_analysis(self, analysis_key: str, analysis: _SharedAnalysis) -> None:
+        with self._lock:
+            if self._analyses.get(analysis_key) is analysis:
+                del self._analyses[analysis_key]
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        작업 취소 요청. 풀에 없는 작업(이미 끝났거나 모르는 ID)이면 False
+
+        같은 분석을 기다리는 다른 작업이 남아 있으면 이 작업만 빠지고 분석은 계속됩니다.
+        마지막 대기자가 취소하면 분석을 바로 목록에서 빼므로, 중단 중인 분석이 끝나기 전에
+        같은 키로 다시 제출한 작업은 새 분석으로 실행됩니다.
+        """
+        with self._lock:
+            job = self._jobs.pop(task_id, None)
+            if job is None:
+                return False
+            job_future, analysis_key = job
+            analysis = self._analyses.get(analysis_key)
+            stop_analysis = False
+            if analysis is not None:
+                analysis.waiters.pop(task_id, None)
+                stop_analysis = not analysis.waiters
+                if stop_analysis:
+                    del self._analyses[analysis_key]
+
+        job_future.cancel()
+        if analysis is not None and stop_analysis:
+            analysis.cancel_event.set()
+            analysis.future.cancel()  # 아직 대기 중이면 즉시 취소, 실행 중이면 cancel_event로 중단
+        logger.info(f"🛑 [GAZE_POOL] 분석 취소 요청: {task_id}")
+        return True
+
+    def queue_position(self, task_id: str) -> Optional[int]:
+        """대기 중인 작업의 순번 (1부터, 같은 분석을 기다리는 작업은 같은 순번). 실행 중이거나 풀에 없으면 None"""
+        with self._lock:
+            job = self._jobs.get(task_id)
+            waiting = [analysis_key for analysis_key, analysis in self._analyses.items()
+                       if not analysis.future.running() and not analysis.future.done()]
+        if job is None or job[1] not in waiting:
+            return None
+        return waiting.index(job[1]) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            futures = [analysis.future for analysis in self._analyses.values()]
+            jobs = len(self._jobs)
+        running = sum(1 for future in futures if future.running())
+        return {
+            'workers': self.max_workers,
+            'running': running,
+            'queued': len(futures) - running,
+            'coalesced': max(jobs - len(futures), 0),
+            'capacity': self.capacity,
+            'cache': gaze_result_cache.stats() if gaze_result_cache else None,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            analyses = list(self._analyses.values())
+        for analysis in analyses:
+            analysis.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 싱글톤 인스턴스 (스레드는 첫 작업 제출 시 생성됨)
+gaze_worker_pool = GazeAnalysisWorkerPool()
@@ -6,6 +6,7 @@ import uuid
 import time
 import boto3
 import os
+import threading
 from llm.interviewer.question_generator import QuestionGenerator
 from llm.candidate.model import AICandidateModel, CandidatePersona
 from llm.shared.models import AnswerRequest, QuestionType, LLMProvider
@@ -16,6 +17,7 @@ from backend.services.Orchestrator import Orchestrator
 from backend.services.supabase_client import get_supabase_client
 from backend.services.existing_tables_service import existing_tables_service
 from backend.services.gaze_service import gaze_analyzer
+from llm.feedback.incremental_eval import IncrementalEvaluator, is_incremental_evaluation_enabled
 class InterviewService:
     def __init__(self):
         # 세션 상태 관리 (Orchestrator의 state를 여기로 이관)
@@ -23,6 +25,11 @@ class InterviewService:
         self.active_orchestrators: Dict[str, Orchestrator] = {}
         self.question_generator = QuestionGenerator()
         self.ai_candidate_model = AICandidateModel()
+        # 증분 평가기 (opt-in 세션이 처음 생길 때 생성)
+        self.incremental_evaluator: Optional[IncrementalEvaluator] = None
+        # 최종 평가와 증분 평가가 함께 쓰는 평가 서비스 (처음 필요할 때 생성)
+        self._evaluation_service = None
+        self._evaluation_service_lock = threading.Lock()
         
         # 에이전트 핸들러는 Orchestrator로 이관됨
         
@@ -32,6 +39,14 @@ class InterviewService:
             "당근마켓": "daangn", "토스": "toss"
         }
 
+    def get_evaluation_service(self):
+        """면접 평가 서비스 (증분 평가 워커 스레드에서도 호출되므로 잠금 후 1회 생성)"""
+        with self._evaluation_service_lock:
+            if self._evaluation_service is None:
+                from llm.feedback.api_service import InterviewEvaluationService
+                self._evaluation_service = InterviewEvaluationService()
+            return self._evaluation_service
+
     def get_company_id(self, company_name: str) -> str:
         return self.company_name_map.get(company_name, company_name.lower())
 
@@ -235,12 +250,22 @@ class InterviewService:
             session_state = self.create_session_state(session_id, initial_settings)
             interview_logger.info(f"DEBUG: start_ai_competition - create_session_state 호출 완료 (session_id: {session_id}, keys: {session_state.keys()})")
             
+            # 증분 평가 (opt-in): 답변이 확정될 때마다 백그라운드에서 개별 평가 진행
+            qa_listener = None
+            if is_incremental_evaluation_enabled(settings):
+                if self.incremental_evaluator is None:
+                    self.incremental_evaluator = IncrementalEvaluator(service_factory=self.get_evaluation_service)
+                evaluator = self.incremental_evaluator
+                qa_listener = lambda qa_entry: evaluator.submit(session_state, qa_entry)
+                interview_logger.info(f"⚡ 증분 평가 활성화: {session_id}")
+            
             # Orchestrator 생성 - 에이전트들도 전달
             orchestrator = Orchestrator(
                 session_id=session_id, 
                 session_state=session_state,
                 question_generator=self.question_generator,
-                ai_candidate_model=self.ai_candidate_model
+                ai_candidate_model=self.ai_candidate_model,
+                qa_listener=qa_listener
             )
             self.active_orchestrators[session_id] = orchestrator
             interview_logger.info(f"DEBUG: start_ai_competition - Orchestrator 활성화 완료 (session_id: {session_id}). 현재 active_orchestrators 키: {self.active_orchestrators.keys()}")
@@ -289,7 +314,6 @@ class InterviewService:
         """면접 완료 시 세션의 QA 히스토리를 기반으로 피드백 평가/계획을 백그라운드에서 실행"""
         try:
             from llm.feedback.api_models import QuestionAnswerPair
-            from llm.feedback.api_service import InterviewEvaluationService
             import os
             import glob
             interview_logger.info(f"피드백 트리거 시작: {session_id}")
@@ -334,7 +358,7 @@ class InterviewService:
                     ))
                 return pairs
 
-            evaluation_service = InterviewEvaluationService()
+            evaluation_service = self.get_evaluation_service()
             shared_interview_id = None
 
             # 통합 평가 (사용자와 AI 지원자를 하나의 interview 세션에 저장)
@@ -344,6 +368,13 @@ class InterviewService:
                 user_pairs = build_pairs(user_qas) if user_qas else []
                 ai_pairs = build_pairs(ai_qas) if ai_qas else []
                 
+                # 증분 평가 결과 수집 (남은 작업이 있으면 완료될 때까지 대기)
+                precomputed_user, precomputed_ai = None, None
+                if self.incremental_evaluator and session_state.get(IncrementalEvaluator.STATE_KEY):
+                    precomputed_user, precomputed_ai = await self.incremental_evaluator.collect(session_state)
+                    ready = sum(1 for r in precomputed_user + precomputed_ai if r)
+                    interview_logger.info(f"⚡ 증분 평가 결과 수집: {ready}/{len(user_pairs) + len(ai_pairs)}개 완료")
+                
                 # 새로운 통합 평가 메서드 호출
                 combined_eval = evaluation_service.evaluate_combined_interview(
                     user_id=user_id,
@@ -353,7 +384,9 @@ class InterviewService:
                     user_resume_id=user_resume_id,
                     posting_id=posting_id,
                     company_id=company_id,
-                    position_id=position_id
+                    position_id=position_id,
+                    precomputed_user_results=precomputed_user,
+                    precomputed_ai_results=precomputed_ai
                 )
                 
                 if combined_eval and combined_eval.get('success'):
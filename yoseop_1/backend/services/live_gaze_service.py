@@ -0,0 +1,244 @@
+"""
+면접 중 실시간 시선 추적 (라이브 모드)
+
+면접이 끝난 뒤 S3에서 녹화 영상을 다시 내려받아 전체를 디코딩하는 대신,
+브라우저가 면접 중에 축소한 웹캠 프레임을 낮은 빈도로 WebSocket으로 보내면
+서버가 바로 GazeCoreProcessor로 시선을 추적하고 GazeStatsAccumulator에 누적합니다.
+면접이 끝나면 누적 통계로 GazeAnalyzer와 같은 결과(GazeAnalysisResult)를 만들고,
+라이브 데이터가 녹화 구간을 충분히 덮으면 사후 S3 분석을 생략합니다.
+
+프레임 메시지 형식 (바이너리, gaze_core.decode_frame_message):
+    [4바이트 big-endian uint32: 녹화 시작 후 경과 ms][JPEG/WebP 이미지 바이트]
+
+커버리지:
+    연속한 두 프레임 간격이 GAZE_LIVE_MAX_GAP_SEC 이하이면 그 사이 구간을 추적된 것으로 보고,
+    추적된 시간 / 녹화 길이를 커버리지로 사용합니다. (네트워크 끊김, 탭 전환 구간은 제외됨)
+
+환경변수:
+- GAZE_LIVE_ENABLED: 라이브 모드 사용 여부 (기본 true)
+- GAZE_LIVE_FPS: 브라우저에 안내하는 전송 빈도 (기본 GAZE_STREAM_BASE_FPS / 분석 frame_skip = 1.5)
+- GAZE_LIVE_MAX_GAP_SEC: 커버리지로 인정하는 최대 프레임 간격 (기본 2.0)
+- GAZE_LIVE_MIN_COVERAGE: 사후 분석을 생략하는 최소 커버리지 (기본 0.9)
+- GAZE_LIVE_SESSION_TTL_SEC: 라이브 세션 보관 시간 (기본 3600)
+"""
+
+import os
+import time
+import logging
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, Any
+
+import cv2
+import numpy as np
+
+from .gaze_core import GazeCoreProcessor, GazeConfig, FaceMeshPool
+from .gaze_stats import GazeStatsAccumulator
+from .gaze_service import gaze_analyzer, GazeAnalysisResult
+
+logger = logging.getLogger(__name__)
+
+GAZE_LIVE_ENABLED = os.getenv('GAZE_LIVE_ENABLED', 'true').lower() == 'true'
+GAZE_LIVE_FPS = float(os.getenv('GAZE_LIVE_FPS', str(GazeConfig.STREAM_BASE_FPS / 10)))
+GAZE_LIVE_MAX_GAP_SEC = float(os.getenv('GAZE_LIVE_MAX_GAP_SEC', '2.0'))
+GAZE_LIVE_MIN_COVERAGE = float(os.getenv('GAZE_LIVE_MIN_COVERAGE', '0.9'))
+GAZE_LIVE_SESSION_TTL_SEC = float(os.getenv('GAZE_LIVE_SESSION_TTL_SEC', '3600'))
+
+
+@dataclass
+class LiveGazeSession:
+    """면접 세션 1개의 라이브 시선 추적 상태"""
+    session_id: str
+    user_id: Any
+    calibration_points: List[Tuple[float, float]]
+    initial_face_size: Optional[float]
+    stats: GazeStatsAccumulator
+    started_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    frames_received: int = 0
+    frames_dropped: int = 0
+    last_elapsed_ms: Optional[int] = None
+    covered_ms: int = 0
+    duration_ms: Optional[int] = None
+    finished: bool = False
+    result: Optional[GazeAnalysisResult] = None
+    error: Optional[str] = None
+    lock: Lock = field(default_factory=Lock)
+
+    @property
+    def coverage(self) -> float:
+        """녹화 길이 대비 추적된 시간 비율 (종료 전에는 0)"""
+        if not self.duration_ms:
+            return 0.0
+        return min(self.covered_ms / self.duration_ms, 1.0)
+
+
+class LiveGazeManager(GazeCoreProcessor):
+    """
+    라이브 시선 추적 세션 관리자
+
+    GazeCalibrationManager와 같은 방식으로 세션 딕셔너리는 전역 잠금, 세션 상태는 세션별 잠금으로 보호하고
+    추론은 FaceMesh 풀에서 세션 ID로 인스턴스를 빌려 실행합니다(같은 세션은 가능하면 같은 인스턴스 → 추적 모드 유지).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sessions: Dict[str, LiveGazeSession] = {}
+        self.lock = Lock()
+        self.face_mesh_pool = FaceMeshPool(initial=self.face_mesh)
+
+    def _cleanup_expired(self) -> None:
+        now = time.time()
+        with self.lock:
+            expired = [sid for sid, s in self.sessions.items() if now - s.updated_at > GAZE_LIVE_SESSION_TTL_SEC]
+            for sid in expired:
+                del self.sessions[sid]
+        if expired:
+            logger.info(f"🧹 [LIVE_GAZE] 만료된 라이브 세션 {len(expired)}개 정리")
+
+    def start_session(self, session_id: str, user_id: Any, calibration_points: List[Tuple[float, float]],
+                      initial_face_size: Optional[float] = None) -> LiveGazeSession:
+        """
+        라이브 세션 시작 (같은 사용자가 재연결하면 진행 중인 세션을 이어서 사용)
+
+        Raises:
+            ValueError: 캘리브레이션 포인트가 4개가 아니거나 다른 사용자의 세션인 경우
+        """
+        self._cleanup_expired()
+        allowed_range = gaze_analyzer.calculate_allowed_gaze_range(calibration_points)
+
+        with self.lock:
+            session = self.sessions.get(session_id)
+            if session is not None and session.user_id != user_id:
+                raise ValueError("다른 사용자의 면접 세션입니다.")
+            if session is not None and not session.finished:
+                logger.info(f"🔁 [LIVE_GAZE] 라이브 세션 재연결: {session_id} ({session.stats.count}개 샘플 유지)")
+                return session
+
+            session = LiveGazeSession(
+                session_id=session_id,
+                user_id=user_id,
+                calibration_points=[tuple(p) for p in calibration_points],
+                initial_face_size=initial_face_size,
+                stats=GazeStatsAccumulator(allowed_range, initial_face_size)
+            )
+            self.sessions[session_id] = session
+
+        logger.info(f"🎥 [LIVE_GAZE] 라이브 세션 시작: {session_id}")
+        return session
+
+    def get_session(self, session_id: str) -> Optional[LiveGazeSession]:
+        with self.lock:
+            return self.sessions.get(session_id)
+
+    def process_frame(self, session_id: str, elapsed_ms: int, frame: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        라이브 프레임 1개 처리 (스레드에서 호출)
+
+        경과 시간이 이전 프레임보다 이르면(재전송, 순서 뒤바뀜) 버리고 dropped로 응답합니다.
+
+        Returns:
+            Dict | None: 처리 결과 (세션이 없거나 이미 종료되었으면 None)
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            return None
+
+        with session.lock:
+            if session.finished:
+                return None
+            session.frames_received += 1
+            session.updated_at = time.time()
+
+            if session.last_elapsed_ms is not None and elapsed_ms <= session.last_elapsed_ms:
+                session.frames_dropped += 1
+                return {'status': 'dropped', 'received': session.frames_received, 'frames': session.stats.count}
+
+            if session.last_elapsed_ms is not None:
+                gap = elapsed_ms - session.last_elapsed_ms
+                if gap <= GAZE_LIVE_MAX_GAP_SEC * 1000:
+                    session.covered_ms += gap
+            session.last_elapsed_ms = elapsed_ms
+
+            h, w, _ = frame.shape
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            with self.face_mesh_pool.checkout(session_id) as face_mesh:
+                results = face_mesh.process(rgb_frame)
+
+            eye_detected = False
+            if results.multi_face_landmarks:
+                gaze_point, face_size = self.measure_landmarks(results.multi_face_landmarks[0].landmark, w, h)
+                if gaze_point and face_size > 0:
+                    session.stats.update(gaze_point, face_size)
+                    eye_detected = True
+
+            return {
+                'status': 'processed',
+                'received': session.frames_received,
+                'eye_detected': eye_detected,
+                'frames': session.stats.count,
+                'in_range_ratio': round(session.stats.in_range_ratio, 3)
+            }
+
+    def finish_session(self, session_id: str, duration_ms: Optional[int]) -> Optional[LiveGazeSession]:
+        """
+        라이브 세션 종료 및 결과 계산 (스레드에서 호출)
+
+        duration_ms는 브라우저가 측정한 녹화 길이입니다. 없으면 마지막 프레임의 경과 시간을 사용합니다.
+        데이터가 부족하면 result 없이 error만 기록하고, 사후 S3 분석으로 넘어가게 합니다.
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            return None
+
+        with session.lock:
+            if session.finished:
+                return session
+            session.finished = True
+            session.updated_at = time.time()
+            # 녹화 길이는 마지막 프레임 시점보다 짧을 수 없음 (커버리지 과대 계산 방지)
+            session.duration_ms = max(int(duration_ms or 0), session.last_elapsed_ms or 0)
+
+            total_frames = max(int(session.duration_ms / 1000 * GazeConfig.STREAM_BASE_FPS), 1)
+            try:
+                session.result = gaze_analyzer.score_gaze_stats(
+                    session.stats, total_frames, session.calibration_points,
+                    session.started_at, lambda progress, message: None
+                )
+            except Exception as e:
+                session.error = str(e)
+                logger.warning(f"⚠️ [LIVE_GAZE] 라이브 결과 계산 실패: {session_id} - {e}")
+
+        logger.info(f"🏁 [LIVE_GAZE] 라이브 세션 종료: {session_id} "
+                    f"(샘플 {session.stats.count}개, 커버리지 {session.coverage:.0%}, "
+                    f"버린 프레임 {session.frames_dropped}개)")
+        return session
+
+    def take_covering_result(self, session_id: str, user_id: Any,
+                             min_frames: int = 0) -> Optional[LiveGazeSession]:
+        """
+        녹화 구간을 충분히 덮는 종료된 라이브 세션을 꺼냄 (사후 분석 생략 여부 판단용)
+
+        조건: 같은 사용자, 종료됨, 결과 있음, 분석 프레임 min_frames 이상, 커버리지 GAZE_LIVE_MIN_COVERAGE 이상.
+        조건을 만족하면 세션을 목록에서 제거하고 반환합니다.
+        """
+        with self.lock:
+            session = self.sessions.get(session_id)
+            if (session is None or session.user_id != user_id or not session.finished or
+                    session.result is None or session.result.analyzed_frames < min_frames or
+                    session.coverage < GAZE_LIVE_MIN_COVERAGE):
+                return None
+            del self.sessions[session_id]
+        return session
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            sessions = list(self.sessions.values())
+        return {
+            'active': sum(1 for s in sessions if not s.finished),
+            'finished': sum(1 for s in sessions if s.finished),
+        }
+
+
+# 싱글톤 인스턴스
+live_gaze_manager = LiveGazeManager() if GAZE_LIVE_ENABLED else None
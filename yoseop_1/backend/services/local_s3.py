@@ -0,0 +1,203 @@
+"""
+로컬 폴더 기반 S3 대용 클라이언트
+
+백필, 스트리밍 캐시 등 S3를 읽는 코드를 네트워크 없이 실행/검증하기 위한 boto3 S3 클라이언트 대용입니다.
+버킷 이름은 무시하고 root 폴더 아래의 상대 경로를 객체 키로 사용합니다.
+
+지원 메서드 (boto3와 같은 인자/반환 형식, 이 프로젝트에서 쓰는 부분만):
+- head_object: ETag(파일 내용 MD5), ContentLength, LastModified, ContentType
+- get_object: Range 헤더(bytes=a-b, bytes=a-, bytes=-n) 지원, Body는 read()/iter_chunks()/close() 제공
+- download_file / upload_file / put_object / delete_object
+- 멀티파트 업로드: create_multipart_upload / upload_part (ContentMD5 검증) / complete_multipart_upload /
+  abort_multipart_upload (파트는 root/.multipart/{UploadId}/ 아래에 보관)
+
+없는 키는 boto3와 같이 ClientError(404 / NoSuchKey)를 발생시킵니다.
+"""
+
+import os
+import uuid
+import base64
+import hashlib
+import mimetypes
+import shutil
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+
+class LocalStreamingBody:
+    """botocore StreamingBody 대용 (파일 일부 구간만 읽음)"""
+
+    def __init__(self, path: str, start: int, length: int):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = length
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        if self._remaining <= 0:
+            return b''
+        size = self._remaining if amt is None or amt < 0 else min(amt, self._remaining)
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def iter_chunks(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        while True:
+            data = self.read(chunk_size)
+            if not data:
+                return
+            yield data
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LocalS3Client:
+    """root 폴더를 S3 버킷처럼 제공하는 클라이언트"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self._etags: Dict[str, Tuple[float, int, str]] = {}
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ClientError({'Error': {'Code': '400', 'Message': f'Invalid key: {key}'}}, 'GetObject')
+        return path
+
+    def _existing_path(self, key: str, operation: str) -> str:
+        path = self._path(key)
+        if not os.path.isfile(path):
+            raise ClientError({'Error': {'Code': '404' if operation == 'HeadObject' else 'NoSuchKey',
+                                         'Message': 'Not Found'}}, operation)
+        return path
+
+    def _etag(self, path: str) -> str:
+        """파일 MD5 (수정 시각/크기가 같으면 다시 계산하지 않음)"""
+        stat = os.stat(path)
+        cached = self._etags.get(path)
+        if cached and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2]
+        md5 = hashlib.md5()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                md5.update(block)
+        etag = f'"{md5.hexdigest()}"'
+        self._etags[path] = (stat.st_mtime, stat.st_size, etag)
+        return etag
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        path = self._existing_path(Key, 'HeadObject')
+        stat = os.stat(path)
+        return {
+            'ETag': self._etag(path),
+            'ContentLength': stat.st_size,
+            'LastModified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            'ContentType': mimetypes.guess_type(Key)[0] or 'binary/octet-stream',
+        }
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        path = self._existing_path(Key, 'GetObject')
+        size = os.path.getsize(path)
+        start, end = 0, size - 1
+        response: Dict[str, Any] = {}
+        if Range:
+            spec = Range.replace('bytes=', '', 1)
+            first, _, last = spec.partition('-')
+            if first == '':
+                start, end = max(size - int(last), 0), size - 1
+            else:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            if start >= size or start > end:
+                raise ClientError({'Error': {'Code': 'InvalidRange', 'Message': 'Range Not Satisfiable'}},
+                                  'GetObject')
+            response['ContentRange'] = f"bytes {start}-{end}/{size}"
+        length = end - start + 1
+        response.update({
+            'Body': LocalStreamingBody(path, start, length),
+            'ContentLength': length,
+            'ETag': self._etag(path),
+            'ContentType': mimetypes.guess_type(Key)[0] or 'binary/octet-stream',
+        })
+        return response
+
+    def download_file(self, Bucket: str, Key: str, Filename: str, **kwargs) -> None:
+        shutil.copyfile(self._existing_path(Key, 'HeadObject'), Filename)
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, **kwargs) -> None:
+        path = self._path(Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(Filename, path)
+
+    def put_object(self, Bucket: str, Key: str, Body: Any = b'', **kwargs) -> Dict[str, Any]:
+        path = self._path(Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            if isinstance(Body, (bytes, bytearray)):
+                f.write(Body)
+            else:
+                shutil.copyfileobj(Body, f)
+        return {'ETag': self._etag(path)}
+
+    def _upload_dir(self, upload_id: str, operation: str) -> str:
+        path = os.path.join(self.root, '.multipart', upload_id)
+        if not os.path.isdir(path):
+            raise ClientError({'Error': {'Code': 'NoSuchUpload', 'Message': 'Upload not found'}}, operation)
+        return path
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        self._path(Key)
+        upload_id = uuid.uuid4().hex
+        os.makedirs(os.path.join(self.root, '.multipart', upload_id))
+        return {'Bucket': Bucket, 'Key': Key, 'UploadId': upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: Any,
+                    ContentMD5: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        directory = self._upload_dir(UploadId, 'UploadPart')
+        data = bytes(Body) if isinstance(Body, (bytes, bytearray, memoryview)) else Body.read()
+        digest = hashlib.md5(data).digest()
+        if ContentMD5 is not None and base64.b64decode(ContentMD5) != digest:
+            raise ClientError({'Error': {'Code': 'BadDigest', 'Message': 'Content-MD5 mismatch'}}, 'UploadPart')
+        # 파일 이름에 파트 MD5를 넣어 완료 시 다시 해시하지 않음 (같은 번호를 다시 올리면 교체)
+        for name in os.listdir(directory):
+            if name.startswith(f'{PartNumber:05d}-'):
+                os.remove(os.path.join(directory, name))
+        with open(os.path.join(directory, f'{PartNumber:05d}-{digest.hex()}'), 'wb') as f:
+            f.write(data)
+        return {'ETag': f'"{digest.hex()}"'}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict[str, Any],
+                                  **kwargs) -> Dict[str, Any]:
+        directory = self._upload_dir(UploadId, 'CompleteMultipartUpload')
+        parts = MultipartUpload['Parts']
+        if [part['PartNumber'] for part in parts] != sorted(part['PartNumber'] for part in parts):
+            raise ClientError({'Error': {'Code': 'InvalidPartOrder', 'Message': 'Parts not in order'}},
+                              'CompleteMultipartUpload')
+        path = self._path(Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        part_paths = [os.path.join(directory, f"{part['PartNumber']:05d}-{part['ETag'].strip(chr(34))}")
+                      for part in parts]
+        if not all(os.path.isfile(part_path) for part_path in part_paths):
+            raise ClientError({'Error': {'Code': 'InvalidPart', 'Message': 'Part not found or ETag mismatch'}},
+                              'CompleteMultipartUpload')
+        with open(path, 'wb') as out:
+            for part_path in part_paths:
+                with open(part_path, 'rb') as f:
+                    shutil.copyfileobj(f, out, 1024 * 1024)
+        digests = b''.join(bytes.fromhex(part['ETag'].strip('"')) for part in parts)
+        shutil.rmtree(directory, ignore_errors=True)
+        # S3 멀티파트 ETag 형식 (파트 MD5들의 MD5-파트 수)
+        return {'Bucket': Bucket, 'Key': Key, 'ETag': f'"{hashlib.md5(digests).hexdigest()}-{len(parts)}"'}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> Dict[str, Any]:
+        shutil.rmtree(self._upload_dir(UploadId, 'AbortMultipartUpload'), ignore_errors=True)
+        return {}
+
+    def delete_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        try:
+            os.remove(self._path(Key))
+        except FileNotFoundError:
+            pass
+        return {}
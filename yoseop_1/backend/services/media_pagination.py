@@ -0,0 +1,85 @@
+"""
+미디어 목록 페이지네이션 (정확한 개수 + 키셋 커서)
+
+/media/list는 전체 개수를 구하려고 사용자의 모든 레코드를 내려받아 len()을 세고, 페이지는 offset으로 다시 조회했습니다.
+라이브러리가 커질수록 요청마다 비용이 늘고, 뒤쪽 페이지일수록 offset 건너뛰기가 느려집니다.
+
+- 개수: select(count='exact', head=True)로 행 없이 개수만 조회
+- 페이지: (created_at, media_id) 내림차순 키셋. 다음 페이지는 마지막 행보다 뒤에 있는 행만 조회하므로 깊이와 무관
+  created_at이 같은 행은 media_id로 순서를 정해 중복/누락 없음
+- 커서: 마지막 행의 (created_at, media_id) + 필터(file_type)를 base64url로 인코딩한 불투명 문자열
+  필터가 다른 요청에 커서를 쓰면 ValueError
+
+권장 인덱스: create index on media_files (user_id, created_at desc, media_id desc);
+"""
+
+import json
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+
+LIST_COLUMNS = 'media_id, file_name, file_type, file_size, duration, created_at, updated_at, s3_url'
+
+
+def encode_cursor(created_at: str, media_id: str, file_type: Optional[str] = None) -> str:
+    """마지막 행 → 불투명 커서"""
+    raw = json.dumps({'c': created_at, 'i': str(media_id), 'f': file_type}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, file_type: Optional[str] = None) -> Tuple[str, str]:
+    """커서 → (created_at, media_id). 형식이 잘못됐거나 필터가 다르면 ValueError"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        created_at, media_id, cursor_type = data['c'], data['i'], data.get('f')
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {e}")
+    if cursor_type != file_type:
+        raise ValueError("커서의 필터와 요청 필터가 다릅니다")
+    return created_at, media_id
+
+
+def keyset_filter(created_at: str, media_id: str) -> str:
+    """(created_at, media_id) < (커서) 조건의 PostgREST or 필터 (값은 큰따옴표로 감싸 ':' '+' 등을 그대로 전달)"""
+    return f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",media_id.lt."{media_id}")'
+
+
+def count_media(client, user_id: Any, file_type: Optional[str] = None) -> int:
+    """조건에 맞는 파일 수 (행은 내려받지 않음)"""
+    query = client.table('media_files').select('media_id', count='exact', head=True).eq('user_id', user_id)
+    if file_type:
+        query = query.eq('file_type', file_type)
+    return query.execute().count or 0
+
+
+def list_media_page(client, user_id: Any, page_size: int, file_type: Optional[str] = None,
+                    cursor: Optional[str] = None, offset: int = 0) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    최신순 한 페이지 조회
+
+    Args:
+        cursor: 이전 페이지의 next_cursor (있으면 offset 무시)
+        offset: 커서 없이 특정 페이지로 바로 이동할 때 (기존 page 파라미터 호환)
+
+    Returns:
+        (행 목록, 다음 페이지 커서 또는 None)
+    """
+    query = client.table('media_files').select(LIST_COLUMNS).eq('user_id', user_id)
+    if file_type:
+        query = query.eq('file_type', file_type)
+    if cursor:
+        query = query.or_(keyset_filter(*decode_cursor(cursor, file_type)))
+    query = query.order('created_at', desc=True).order('media_id', desc=True)
+    # 다음 페이지 유무를 알기 위해 1행 더 조회
+    if cursor or not offset:
+        query = query.limit(page_size + 1)
+    else:
+        query = query.range(offset, offset + page_size)
+    rows = query.execute().data or []
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(last['created_at'], last['media_id'], file_type)
+    return rows, next_cursor
@@ -16,7 +16,6 @@
 """
 
 import os
-import boto3
 import uuid
 import tempfile
 from datetime import datetime, timedelta
@@ -25,24 +24,27 @@ from contextlib import contextmanager
 import logging
 
 from models.media import MediaFile, UploadStatus, MediaFileType
+from backend.services.s3_client import get_s3_client, S3_BUCKET_NAME
+from utils.video_optimizer import VideoOptimizer
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 업로드 후처리로 만드는 파생 객체 (원본 키 옆에 저장)
+OPTIMIZED_SUFFIX = '.optimized'
+POSTER_SUFFIX = '.poster.jpg'
+# 후처리 결과 컬럼 (DB에 없으면 duration만 저장)
+PROCESSED_FIELDS = ('video_codec', 'audio_codec', 'optimized_s3_key', 'optimized_file_size', 'poster_s3_key')
+
 
 class MediaService:
     """미디어 파일 관리 서비스"""
     
     def __init__(self):
         """서비스 초기화"""
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            region_name=os.getenv('AWS_REGION', 'ap-northeast-2')
-        )
+        self.s3_client = get_s3_client()
         
-        self.bucket_name = 'betago-s3'
+        self.bucket_name = S3_BUCKET_NAME
         self.max_file_size_mb = 100
         self.allowed_extensions = {'.mp4', '.webm', '.avi', '.mov', '.wav', '.mp3'}
         
@@ -350,6 +352,145 @@ class MediaService:
         
         return deleted_count
 
+    @staticmethod
+    def derived_key(s3_key: str, suffix: str) -> str:
+        """
+        파생 객체 키 (interviews/1/video.webm → interviews/1/video.optimized.webm / video.poster.jpg)
+        """
+        base, ext = os.path.splitext(s3_key)
+        if suffix == OPTIMIZED_SUFFIX:
+            return f"{base}{OPTIMIZED_SUFFIX}{ext}"
+        return f"{base}{suffix}"
+
+    def process_uploaded_video(self, media_id: str, s3_key: str, supabase=None) -> Dict[str, Any]:
+        """
+        업로드 후처리 (업로드당 1회, complete_upload에서 백그라운드로 실행)
+
+        1. 원본을 임시 파일로 내려받아 재생용으로 다시 묶음 (mp4: faststart / webm: 재생 시간 + 앞쪽 Cues)
+        2. ffprobe로 재생 시간 / 코덱 조회
+        3. 포스터 썸네일(JPEG) 생성
+        4. 파생 객체를 원본 옆에 업로드 (source-etag 메타데이터로 원본 버전 기록)
+        5. media_files에 재생 시간 / 코덱 / 파생 객체 키 저장
+
+        같은 원본(ETag)으로 이미 만든 파생 객체가 있으면 FFmpeg 작업은 건너뛰고, 파생 객체의 메타데이터로
+        DB 필드만 다시 저장합니다 (첫 실행의 DB 저장이 실패했어도 재실행으로 복구).
+        다운로드 / 재생은 파생 객체를 그대로 스트리밍하므로 요청마다 FFmpeg를 실행하지 않습니다.
+
+        Returns:
+            Dict: 처리 결과 (status: processed / skipped / failed)
+        """
+        ext = os.path.splitext(s3_key)[1].lstrip('.').lower() or 'webm'
+        optimized_key = self.derived_key(s3_key, OPTIMIZED_SUFFIX)
+        poster_key = self.derived_key(s3_key, POSTER_SUFFIX)
+
+        try:
+            source_etag = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)['ETag'].strip('"')
+            fields = self._existing_processed_fields(optimized_key, poster_key, source_etag)
+            if fields is not None:
+                if supabase is not None:
+                    self._save_processed_fields(supabase, media_id, fields)
+                logger.info(f"⏭️ [MEDIA_SERVICE] 이미 후처리된 영상: {s3_key}")
+                return {'status': 'skipped', **fields}
+
+            if not VideoOptimizer.is_ffmpeg_available():
+                logger.warning(f"⚠️ [MEDIA_SERVICE] FFmpeg 없음, 후처리 생략: {s3_key}")
+                return {'status': 'failed', 'error': 'ffmpeg not available'}
+
+            with self.secure_temp_file(f'.{ext}') as source_path, \
+                    self.secure_temp_file(f'.{ext}') as optimized_path, \
+                    self.secure_temp_file('.jpg') as poster_path:
+                if not self.download_from_s3(s3_key, source_path):
+                    return {'status': 'failed', 'error': 'download failed'}
+
+                if not VideoOptimizer._run_ffmpeg_optimization(source_path, optimized_path, ext):
+                    return {'status': 'failed', 'error': 'remux failed'}
+
+                probe = VideoOptimizer.probe_media(optimized_path) or {}
+                duration = probe.get('duration')
+                metadata = {'source-etag': source_etag}
+                # 재실행 시 FFmpeg 없이 DB 필드를 복구할 수 있도록 재생용 영상에 코덱 / 재생 시간 기록
+                video_metadata = dict(metadata, **{
+                    name: str(value) for name, value in (
+                        ('video-codec', probe.get('video_codec')),
+                        ('audio-codec', probe.get('audio_codec')),
+                        ('duration', int(round(duration)) if duration else None),
+                    ) if value
+                })
+                content_type = 'video/mp4' if ext == 'mp4' else 'video/webm'
+                self.s3_client.upload_file(optimized_path, self.bucket_name, optimized_key,
+                                           ExtraArgs={'ContentType': content_type, 'Metadata': video_metadata})
+                fields: Dict[str, Any] = {
+                    'video_codec': probe.get('video_codec'),
+                    'audio_codec': probe.get('audio_codec'),
+                    'optimized_s3_key': optimized_key,
+                    'optimized_file_size': os.path.getsize(optimized_path),
+                    'poster_s3_key': None,
+                }
+                if duration:
+                    fields['duration'] = int(round(duration))
+
+                # 첫 장면이 검은 화면인 경우가 많아 1초 지점 (짧은 영상은 가운데)
+                poster_at = min(1.0, duration / 2) if duration else 0.0
+                if VideoOptimizer.extract_poster(optimized_path, poster_path, poster_at):
+                    self.s3_client.upload_file(poster_path, self.bucket_name, poster_key,
+                                               ExtraArgs={'ContentType': 'image/jpeg', 'Metadata': metadata})
+                    fields['poster_s3_key'] = poster_key
+
+            if supabase is not None:
+                self._save_processed_fields(supabase, media_id, fields)
+            logger.info(f"🎞️ [MEDIA_SERVICE] 업로드 후처리 완료: {s3_key} - {probe}")
+            return {'status': 'processed', **fields}
+
+        except Exception as e:
+            logger.error(f"❌ [MEDIA_SERVICE] 업로드 후처리 실패: {s3_key} - {e}")
+            return {'status': 'failed', 'error': str(e)}
+
+    def _existing_processed_fields(self, optimized_key: str, poster_key: str,
+                                   source_etag: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 원본(ETag)으로 만든 파생 객체가 있으면 그 메타데이터로 만든 DB 필드, 없으면 None
+
+        코덱 / 재생 시간 메타데이터가 없는 예전 파생 객체는 해당 필드를 빼고 반환합니다 (DB 값 유지).
+        """
+        try:
+            existing = self.s3_client.head_object(Bucket=self.bucket_name, Key=optimized_key)
+        except Exception:
+            return None  # 파생 객체 없음
+        metadata = existing.get('Metadata', {})
+        if metadata.get('source-etag') != source_etag:
+            return None
+
+        fields: Dict[str, Any] = {
+            'optimized_s3_key': optimized_key,
+            'optimized_file_size': existing.get('ContentLength'),
+            'poster_s3_key': None,
+        }
+        for name, field_name in (('video-codec', 'video_codec'), ('audio-codec', 'audio_codec')):
+            if metadata.get(name):
+                fields[field_name] = metadata[name]
+        if metadata.get('duration', '').isdigit():
+            fields['duration'] = int(metadata['duration'])
+        try:
+            poster = self.s3_client.head_object(Bucket=self.bucket_name, Key=poster_key)
+            if poster.get('Metadata', {}).get('source-etag') == source_etag:
+                fields['poster_s3_key'] = poster_key
+        except Exception:
+            pass  # 포스터 없음
+        return fields
+
+    def _save_processed_fields(self, supabase, media_id: str, fields: Dict[str, Any]) -> None:
+        """후처리 결과 저장 (후처리 컬럼이 없는 DB는 재생 시간만 저장)"""
+        try:
+            supabase.table('media_files').update(fields).eq('media_id', media_id).execute()
+        except Exception as e:
+            from .supabase_client import is_missing_column_error
+            if not is_missing_column_error(e):
+                raise
+            logger.warning(f"⚠️ [MEDIA_SERVICE] 후처리 컬럼 저장 실패, 재생 시간만 저장: {e}")
+            basic = {k: v for k, v in fields.items() if k not in PROCESSED_FIELDS}
+            if basic:
+                supabase.table('media_files').update(basic).eq('media_id', media_id).execute()
+
 
 # 전역 서비스 인스턴스
 media_service = MediaService()
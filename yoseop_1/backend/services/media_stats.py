@@ -0,0 +1,141 @@
+"""
+사용자별 미디어 통계 (media_user_stats)
+
+/media/stats는 요청마다 사용자의 모든 media_files 행을 내려받아 Python에서 개수 / 크기를 집계했습니다.
+이제 media_files 트리거가 같은 트랜잭션 안에서 사용자별 통계 1행을 증감하므로 조회는 1행 select입니다
+(스키마 / 트리거 / 정합성 함수: scripts/database/media_user_stats.sql).
+
+- 업로드 시작: upload_status='pending'으로 삽입 (insert_media_record)
+- 업로드 완료: upload_status='completed'로 변경 (mark_upload_completed)
+- 삭제: 행 삭제만 하면 트리거가 차감
+- 어긋난 통계: reconcile_media_stats (scripts/reconcile_media_stats.py)
+
+통계 테이블이 아직 없으면 필요한 컬럼만 내려받아 이전처럼 집계합니다.
+"""
+
+import os
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MEDIA_USER_STATS_ENABLED = os.getenv('MEDIA_USER_STATS_ENABLED', 'true').lower() == 'true'
+
+STATS_TABLE = 'media_user_stats'
+RECONCILE_RPC = 'reconcile_media_user_stats'
+STATS_COLUMNS = ('total_files, video_count, audio_count, pending_count, completed_count, '
+                 'total_bytes, sized_files, latest_upload')
+# 통계 테이블이 없을 때 집계에 필요한 컬럼만 조회
+FALLBACK_COLUMNS = 'file_type, file_size, created_at, upload_status'
+
+EMPTY_STATS = {
+    'total_files': 0, 'video_count': 0, 'audio_count': 0, 'pending_count': 0, 'completed_count': 0,
+    'total_bytes': 0, 'sized_files': 0, 'latest_upload': None,
+}
+
+
+def aggregate_rows(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """media_files 행 목록 → 통계 행 (트리거와 같은 규칙, upload_status가 없으면 completed)"""
+    stats = dict(EMPTY_STATS)
+    for row in rows:
+        stats['total_files'] += 1
+        if row.get('file_type') == 'video':
+            stats['video_count'] += 1
+        elif row.get('file_type') == 'audio':
+            stats['audio_count'] += 1
+        status = row.get('upload_status', 'completed')
+        if status == 'pending':
+            stats['pending_count'] += 1
+        elif status == 'completed':
+            stats['completed_count'] += 1
+        if row.get('file_size') is not None:
+            stats['total_bytes'] += row['file_size']
+            stats['sized_files'] += 1
+        created_at = row.get('created_at')
+        if created_at and (stats['latest_upload'] is None or created_at > stats['latest_upload']):
+            stats['latest_upload'] = created_at
+    return stats
+
+
+def to_stats_response_fields(row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """통계 행 → MediaStatsResponse 필드"""
+    row = row or EMPTY_STATS
+    total_bytes = row.get('total_bytes') or 0
+    sized_files = row.get('sized_files') or 0
+    total_size_mb = total_bytes / (1024 * 1024)
+    return {
+        'total_files': row.get('total_files') or 0,
+        'total_size_mb': round(total_size_mb, 2),
+        'video_count': row.get('video_count') or 0,
+        'audio_count': row.get('audio_count') or 0,
+        'avg_file_size_mb': round(total_size_mb / sized_files, 2) if sized_files else 0.0,
+        'latest_upload': row.get('latest_upload'),
+        'pending_count': row.get('pending_count') or 0,
+        'completed_count': row.get('completed_count') or 0,
+        'total_bytes': total_bytes,
+    }
+
+
+def reconcile_media_stats(client, user_id: Any = None) -> List[Dict[str, Any]]:
+    """
+    실제 media_files 집계와 다른 통계 행을 바로잡음 (서비스 키 클라이언트 필요)
+
+    Args:
+        user_id: 지정하면 해당 사용자만, None이면 전체
+
+    Returns:
+        바로잡은(또는 새로 만든) 통계 행 목록
+    """
+    result = client.rpc(RECONCILE_RPC, {'p_user_id': user_id}).execute()
+    return result.data or []
+
+
+def _aggregate_from_media_files(client, user_id: Any) -> Dict[str, Any]:
+    """통계 테이블 없이 집계 (upload_status 컬럼이 없으면 제외하고 다시 조회)"""
+    try:
+        rows = client.table('media_files').select(FALLBACK_COLUMNS).eq('user_id', user_id).execute().data
+    except Exception:
+        rows = client.table('media_files').select('file_type, file_size, created_at').eq('user_id', user_id).execute().data
+    return aggregate_rows(rows or [])
+
+
+def get_user_media_stats(client, user_id: Any) -> Dict[str, Any]:
+    """
+    사용자 통계 1행 조회
+
+    행이 없으면 파일이 없는 사용자로 보고 빈 통계를 반환합니다 (트리거 도입 전 데이터는
+    scripts/reconcile_media_stats.py로 채움, 요청 경로에서는 정합성 함수를 호출하지 않음).
+    통계 테이블이 없으면 media_files에서 직접 집계합니다.
+    """
+    if MEDIA_USER_STATS_ENABLED:
+        try:
+            result = client.table(STATS_TABLE).select(STATS_COLUMNS).eq('user_id', user_id).limit(1).execute()
+            return result.data[0] if result.data else dict(EMPTY_STATS)
+        except Exception as e:
+            logger.warning(f"⚠️ [MEDIA_STATS] 통계 테이블 조회 실패, media_files 직접 집계로 대체: {e}")
+    return _aggregate_from_media_files(client, user_id)
+
+
+def insert_media_record(client, record: Dict[str, Any]):
+    """
+    Presigned 업로드 시작 시 media_files 레코드 삽입 (upload_status='pending')
+
+    upload_status 컬럼이 아직 없는 DB에서만 컬럼을 빼고 다시 삽입합니다 (다른 오류는 이미 삽입되었을 수 있어 그대로 전달).
+    """
+    try:
+        return client.table('media_files').insert({**record, 'upload_status': 'pending'}).execute()
+    except Exception as e:
+        from .supabase_client import is_missing_column_error
+        if not is_missing_column_error(e):
+            raise
+        logger.warning(f"⚠️ [MEDIA_STATS] upload_status 포함 삽입 실패, 컬럼 없이 재시도: {e}")
+        return client.table('media_files').insert(record).execute()
+
+
+def mark_upload_completed(client, media_id: str, user_id: Any) -> None:
+    """업로드 완료 상태로 변경 (실패해도 업로드 완료 처리는 계속)"""
+    try:
+        client.table('media_files').update({'upload_status': 'completed'}) \
+            .eq('media_id', media_id).eq('user_id', user_id).neq('upload_status', 'completed').execute()
+    except Exception as e:
+        logger.warning(f"⚠️ [MEDIA_STATS] 업로드 상태 변경 실패 (media_id={media_id}): {e}")
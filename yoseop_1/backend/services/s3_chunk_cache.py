@@ -0,0 +1,269 @@
+"""
+S3 객체 Range 청크 캐시 (프록시 스트리밍용)
+
+영상을 API가 중계(proxy)해야 할 때 Range 요청마다 S3에 다시 요청하게 되는데,
+플레이어는 탐색 / 다시 보기 때마다 같은 구간을 반복해서 요청합니다.
+이 모듈은 S3 객체를 고정 크기로 정렬된 청크 단위로 로컬 디스크에 저장하고, Range 응답을 캐시된 청크로 조립합니다.
+
+- 청크 키 = (S3 키, ETag, 청크 번호). 청크 i는 [i * chunk_size, (i + 1) * chunk_size) 구간
+  같은 키에 파일을 다시 올리면 ETag가 바뀌어 이전 청크는 쓰이지 않고 LRU로 밀려남
+- S3 읽기는 Range + IfMatch(ETag)로 청크 1개씩. 조회와 읽기 사이에 객체가 바뀌면 412로 실패하고 메타데이터를 다시 조회
+- LRU: 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 청크부터 삭제 (시작 시 폴더를 훑어 수정 시각 순으로 복원)
+- 같은 청크를 동시에 요청하면 S3 요청은 1번만 하고 나머지는 결과를 기다림
+- head_object 결과는 meta_ttl_sec 동안 메모리에 보관 (플레이어의 연속 Range 요청마다 HEAD를 보내지 않음)
+- 크기 제한과 LRU 순서는 프로세스 단위입니다 (여러 uvicorn 워커가 같은 폴더를 쓰면 워커 수만큼 커질 수 있음)
+
+s3_client는 boto3 클라이언트 또는 LocalS3Client (get_object / head_object)면 됩니다.
+
+환경변수:
+- S3_CHUNK_CACHE_ENABLED: 프록시 스트리밍 청크 캐시 사용 여부 (기본 true)
+- S3_CHUNK_CACHE_DIR: 캐시 폴더 (기본 backend/uploads/s3_chunk_cache)
+- S3_CHUNK_CACHE_CHUNK_KB: 청크 크기 (기본 1024KB)
+- S3_CHUNK_CACHE_MAX_MB: 전체 크기 제한 (기본 2048MB)
+"""
+
+import os
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock, get_ident
+from typing import Dict, Iterator, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+S3_CHUNK_CACHE_ENABLED = os.getenv('S3_CHUNK_CACHE_ENABLED', 'true').lower() == 'true'
+S3_CHUNK_CACHE_DIR = os.getenv('S3_CHUNK_CACHE_DIR', 'backend/uploads/s3_chunk_cache')
+S3_CHUNK_CACHE_CHUNK_KB = int(os.getenv('S3_CHUNK_CACHE_CHUNK_KB', '1024'))
+S3_CHUNK_CACHE_MAX_MB = int(os.getenv('S3_CHUNK_CACHE_MAX_MB', '2048'))
+
+ChunkId = Tuple[str, str, int]   # (키 해시, ETag, 청크 번호)
+
+
+@dataclass(frozen=True)
+class ObjectMeta:
+    """청크 캐시가 사용하는 객체 메타데이터"""
+    key: str
+    etag: str
+    size: int
+    content_type: str
+
+
+class S3ChunkCache:
+    """S3 객체의 정렬된 청크를 디스크에 보관하는 LRU 캐시"""
+
+    def __init__(self, s3_client, bucket: str, directory: str = S3_CHUNK_CACHE_DIR,
+                 chunk_size: int = S3_CHUNK_CACHE_CHUNK_KB * 1024,
+                 max_bytes: int = S3_CHUNK_CACHE_MAX_MB * 1024 * 1024,
+                 meta_ttl_sec: float = 30.0):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.meta_ttl_sec = meta_ttl_sec
+
+        self._lock = Lock()
+        self._index: 'OrderedDict[ChunkId, int]' = OrderedDict()   # 청크 → 크기 (앞쪽이 오래 쓰지 않은 청크)
+        self._total_bytes = 0
+        self._inflight: Dict[ChunkId, Future] = {}
+        self._meta: Dict[str, Tuple[float, ObjectMeta]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    # === 파일 배치 ===
+
+    @staticmethod
+    def _key_hash(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _path(self, chunk_id: ChunkId) -> str:
+        key_hash, etag, index = chunk_id
+        return os.path.join(self.directory, key_hash[:2], f"{key_hash}-{etag}-{index}.chunk")
+
+    def _load_index(self) -> None:
+        """기존 청크 파일을 수정 시각 순으로 LRU 목록에 복원"""
+        entries = []
+        for sub in os.listdir(self.directory):
+            sub_dir = os.path.join(self.directory, sub)
+            if not os.path.isdir(sub_dir):
+                continue
+            for name in os.listdir(sub_dir):
+                path = os.path.join(sub_dir, name)
+                if not name.endswith('.chunk'):
+                    if name.endswith('.tmp'):
+                        os.remove(path)   # 중단된 쓰기
+                    continue
+                # 멀티파트 ETag에는 '-'가 들어가므로 앞(키 해시)과 뒤(청크 번호)에서 나눔
+                key_hash, rest = name[:-len('.chunk')].split('-', 1)
+                etag, index = rest.rsplit('-', 1)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, (key_hash, etag, int(index)), stat.st_size))
+        for _, chunk_id, size in sorted(entries):
+            self._index[chunk_id] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        """크기 제한을 넘으면 오래 쓰지 않은 청크부터 삭제 (_lock 안에서 호출)"""
+        while self._total_bytes > self.max_bytes and self._index:
+            chunk_id, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(chunk_id))
+            except OSError:
+                pass
+
+    # === 메타데이터 ===
+
+    def head(self, key: str) -> ObjectMeta:
+        """객체 크기 / ETag / Content-Type (meta_ttl_sec 동안 메모리에 보관)"""
+        now = time.time()
+        cached = self._meta.get(key)
+        if cached and now - cached[0] < self.meta_ttl_sec:
+            return cached[1]
+        response = self.s3_client.head_object(Bucket=self.bucket, Key=key)
+        meta = ObjectMeta(
+            key=key,
+            etag=response['ETag'].strip('"'),
+            size=int(response['ContentLength']),
+            content_type=response.get('ContentType') or 'video/webm',
+        )
+        self._meta[key] = (now, meta)
+        return meta
+
+    def invalidate(self, key: str) -> None:
+        """메타데이터 캐시 삭제 (객체를 다시 올렸을 때)"""
+        self._meta.pop(key, None)
+
+    # === 청크 ===
+
+    def _fetch(self, meta: ObjectMeta, index: int) -> bytes:
+        start = index * self.chunk_size
+        end = min(start + self.chunk_size, meta.size) - 1
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=meta.key,
+                                                 Range=f"bytes={start}-{end}", IfMatch=f'"{meta.etag}"')
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('PreconditionFailed', '412'):
+                self.invalidate(meta.key)
+            raise
+        body = response['Body']
+        try:
+            data = body.read()
+        finally:
+            body.close()
+        if len(data) != end - start + 1:
+            raise IOError(f"청크 길이 불일치: {meta.key}#{index} {len(data)} != {end - start + 1}")
+        return data
+
+    def _store(self, chunk_id: ChunkId, data: bytes) -> None:
+        path = self._path(chunk_id)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # 디스크 저장 실패는 응답에 영향 없음 (다음 요청에서 다시 S3 읽기)
+            logger.warning(f"⚠️ [CHUNK_CACHE] 청크 저장 실패: {path} - {e}")
+            return
+        with self._lock:
+            if chunk_id not in self._index:
+                self._index[chunk_id] = len(data)
+                self._total_bytes += len(data)
+                self._evict()
+
+    def get_chunk(self, meta: ObjectMeta, index: int) -> bytes:
+        """청크 index의 바이트 (캐시 → 진행 중인 읽기 대기 → S3 읽기 순)"""
+        chunk_id = (self._key_hash(meta.key), meta.etag, index)
+        with self._lock:
+            cached = chunk_id in self._index
+            if cached:
+                self._index.move_to_end(chunk_id)
+            else:
+                future = self._inflight.get(chunk_id)
+                owner = future is None
+                if owner:
+                    future = self._inflight[chunk_id] = Future()
+                else:
+                    self.coalesced += 1
+
+        if cached:
+            try:
+                with open(self._path(chunk_id), 'rb') as f:
+                    data = f.read()
+                with self._lock:
+                    self.hits += 1
+                return data
+            except OSError:
+                # 다른 스레드가 방금 내보낸 청크: 목록에서 지우고 다시 읽기
+                with self._lock:
+                    size = self._index.pop(chunk_id, None)
+                    if size is not None:
+                        self._total_bytes -= size
+                return self.get_chunk(meta, index)
+
+        if not owner:
+            return future.result()
+
+        with self._lock:
+            self.misses += 1
+        try:
+            data = self._fetch(meta, index)
+            self._store(chunk_id, data)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(chunk_id, None)
+
+    def iter_range(self, meta: ObjectMeta, start: int, end: int) -> Iterator[bytes]:
+        """[start, end] 구간 (양 끝 포함)을 청크 단위로 잘라서 돌려줌"""
+        end = min(end, meta.size - 1)
+        for index in range(start // self.chunk_size, end // self.chunk_size + 1):
+            chunk_start = index * self.chunk_size
+            data = self.get_chunk(meta, index)
+            yield data[max(start - chunk_start, 0):end - chunk_start + 1]
+
+    def read_range(self, key: str, start: int, end: int) -> bytes:
+        """[start, end] 구간 바이트 (검증 / 스크립트용)"""
+        return b''.join(self.iter_range(self.head(key), start, end))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced,
+                'evictions': self.evictions, 'chunks': len(self._index), 'bytes': self._total_bytes,
+            }
+
+
+_cache: Optional[S3ChunkCache] = None
+_cache_lock = Lock()
+
+
+def get_s3_chunk_cache() -> Optional[S3ChunkCache]:
+    """공용 S3 클라이언트 / 버킷을 쓰는 청크 캐시 (S3_CHUNK_CACHE_ENABLED=false이면 None)"""
+    global _cache
+    if not S3_CHUNK_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from .s3_client import get_s3_client, S3_BUCKET_NAME
+                _cache = S3ChunkCache(get_s3_client(), S3_BUCKET_NAME)
+    return _cache
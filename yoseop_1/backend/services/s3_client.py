@@ -0,0 +1,80 @@
+"""
+프로세스 공용 S3 클라이언트
+
+라우터가 요청마다 boto3.client('s3')를 새로 만들면 요청마다 자격 증명 로드와 TLS 핸드셰이크가 반복되어,
+영상 탐색(Range 요청)마다 지연이 생겼습니다. 이 모듈은 연결 풀을 조정한 클라이언트 1개를 프로세스에서 공유합니다.
+boto3 클라이언트는 스레드 안전하므로 라우터 / 서비스 / 스레드 풀에서 함께 사용할 수 있습니다.
+
+- get_s3_client(): 공용 클라이언트 (처음 호출할 때 생성)
+- generate_presigned_get_url(): 브라우저가 S3에서 직접 Range 요청으로 재생하도록 짧은 만료 시간의 GET URL 생성
+  (권한 확인은 URL을 발급하는 API에서 수행)
+
+환경 변수:
+- AWS_S3_BUCKET: 버킷 이름 (기본값: betago-s3)
+- S3_MAX_POOL_CONNECTIONS: 연결 풀 크기 (기본값: 50, boto3 기본값 10은 동시 스트리밍에 부족)
+- S3_PRESIGNED_URL_EXPIRES_SEC: Presigned URL 만료 시간 (기본값: 900초)
+"""
+
+import os
+import threading
+import logging
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+S3_BUCKET_NAME = os.getenv('AWS_S3_BUCKET', 'betago-s3')
+S3_MAX_POOL_CONNECTIONS = int(os.getenv('S3_MAX_POOL_CONNECTIONS', '50'))
+S3_PRESIGNED_URL_EXPIRES_SEC = int(os.getenv('S3_PRESIGNED_URL_EXPIRES_SEC', '900'))
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """프로세스 공용 S3 클라이언트"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    's3',
+                    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                    region_name=os.getenv('AWS_REGION', 'ap-northeast-2'),
+                    config=Config(
+                        signature_version='s3v4',
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                        tcp_keepalive=True,
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                    ),
+                )
+                logger.info(f"✅ [S3] 공용 S3 클라이언트 생성 (연결 풀 {S3_MAX_POOL_CONNECTIONS})")
+    return _client
+
+
+def generate_presigned_get_url(s3_key: str, expires_in: Optional[int] = None,
+                               content_type: Optional[str] = None,
+                               download_name: Optional[str] = None,
+                               bucket: str = S3_BUCKET_NAME) -> str:
+    """
+    객체 GET용 Presigned URL 생성 (S3 요청 없이 로컬에서 서명만 수행)
+
+    Args:
+        s3_key: 객체 키
+        expires_in: 만료 시간(초), 기본값 S3_PRESIGNED_URL_EXPIRES_SEC
+        content_type: 응답 Content-Type 지정 (저장된 값이 binary/octet-stream인 객체 재생용)
+        download_name: 지정하면 첨부 파일로 내려받도록 Content-Disposition 설정
+    """
+    params = {'Bucket': bucket, 'Key': s3_key}
+    if content_type:
+        params['ResponseContentType'] = content_type
+    if download_name:
+        params['ResponseContentDisposition'] = f'attachment; filename="{download_name}"'
+    return get_s3_client().generate_presigned_url(
+        'get_object',
+        Params=params,
+        ExpiresIn=expires_in or S3_PRESIGNED_URL_EXPIRES_SEC,
+    )
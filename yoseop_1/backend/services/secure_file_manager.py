@@ -264,6 +264,18 @@ class FileValidator:
     MAX_FILE_SIZE_MB = 100
     MIN_FILE_SIZE_KB = 100
     
+    # 형식 판별에 필요한 앞부분 바이트 수
+    HEADER_SIZE = 12
+    VIDEO_FORMATS = {'mp4', 'webm', 'avi'}
+    # 판별된 형식별로 허용하는 확장자 (webm은 오디오 녹음도 같은 EBML 컨테이너)
+    FORMAT_EXTENSIONS = {
+        'mp4': {'.mp4', '.mov', '.m4a'},
+        'webm': {'.webm'},
+        'avi': {'.avi'},
+        'wav': {'.wav'},
+        'mp3': {'.mp3'},
+    }
+    
     @classmethod
     def validate_video_file(cls, file_path: str) -> dict:
         """
@@ -333,24 +345,58 @@ class FileValidator:
         """
         try:
             with open(file_path, 'rb') as f:
-                header = f.read(12)
-                
-                # MP4 파일 체크
-                if b'ftyp' in header:
-                    return True
-                
-                # WebM 파일 체크 (EBML 헤더)
-                if header.startswith(b'\x1a\x45\xdf\xa3'):
-                    return True
-                
-                # AVI 파일 체크
-                if header.startswith(b'RIFF') and b'AVI' in header:
-                    return True
-                    
-            return False
+                header = f.read(FileValidator.HEADER_SIZE)
+            return FileValidator.detect_format(header) in FileValidator.VIDEO_FORMATS
             
         except Exception:
             return False
+    
+    @staticmethod
+    def detect_format(header: bytes) -> Optional[str]:
+        """
+        파일 앞부분 바이트로 컨테이너 형식 판별 (업로드 스트림 검증용)
+        
+        Returns:
+            'mp4' / 'webm' / 'avi' / 'wav' / 'mp3', 알 수 없으면 None
+        """
+        # MP4 / MOV 파일 체크
+        if b'ftyp' in header[:FileValidator.HEADER_SIZE]:
+            return 'mp4'
+        
+        # WebM 파일 체크 (EBML 헤더)
+        if header.startswith(b'\x1a\x45\xdf\xa3'):
+            return 'webm'
+        
+        # AVI / WAV 파일 체크 (RIFF 컨테이너)
+        if header.startswith(b'RIFF'):
+            if header[8:12] == b'WAVE':
+                return 'wav'
+            if b'AVI' in header[:FileValidator.HEADER_SIZE]:
+                return 'avi'
+        
+        # MP3 파일 체크 (ID3 태그 또는 프레임 동기화 비트)
+        if header.startswith(b'ID3') or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+            return 'mp3'
+        
+        return None
+    
+    @classmethod
+    def validate_header(cls, header: bytes, extension: Optional[str] = None) -> str:
+        """
+        앞부분 바이트 검증: 형식을 판별하고 확장자와 맞는지 확인
+        
+        Returns:
+            str: 판별된 형식
+            
+        Raises:
+            ValueError: 알 수 없는 형식이거나 확장자와 다른 경우
+        """
+        detected = cls.detect_format(header)
+        if detected is None:
+            raise ValueError('알 수 없는 파일 형식이거나 손상된 파일입니다')
+        if extension and extension.lower() not in cls.FORMAT_EXTENSIONS[detected]:
+            raise ValueError(f'파일 내용({detected})과 확장자({extension})가 일치하지 않습니다')
+        return detected
 
 
 # 유틸리티 함수들
@@ -0,0 +1,295 @@
+"""
+S3 직접 스트리밍 업로드 (멀티파트)
+
+업로드 요청 본문을 임시 파일이나 메모리 전체에 모으지 않고, 읽는 대로 S3 멀티파트 업로드 파트로 보냅니다.
+
+- 본문: request.stream()을 비동기로 읽고 multipart/form-data는 python-multipart 파서로 파일 필드만 꺼냄
+  (Starlette UploadFile은 1MB가 넘으면 임시 파일로 옮기므로 사용하지 않음)
+- 검증: 첫 바이트로 FileValidator가 형식을 판별하고 확장자와 비교, 통과해야 S3 호출 시작
+- 전송: STREAM_UPLOAD_PART_MB 크기 파트를 STREAM_UPLOAD_CONCURRENCY개까지 동시에 업로드
+  메모리는 (동시 업로드 수 + 1) x 파트 크기를 넘지 않음 (자리가 없으면 본문 읽기를 멈춤)
+- 체크섬: 파트마다 Content-MD5를 보내 S3가 전송 중 손상을 거부하고, 전체 SHA-256은 순서대로 누적해 결과로 반환
+  해시 / S3 호출은 스레드에서 실행하므로 이벤트 루프를 막지 않음
+- 파트 하나보다 작은 파일은 단일 PUT, 실패 / 취소 시 멀티파트 업로드는 abort
+
+사용 예:
+    stream = MultipartFileStream(request)
+    await stream.open()
+    result = await StreamingS3Uploader().upload(stream, key, stream.content_type, extension='.webm')
+"""
+
+import os
+import base64
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from backend.services.s3_client import get_s3_client, S3_BUCKET_NAME
+from backend.services.secure_file_manager import FileValidator
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:
+    try:
+        from multipart.multipart import MultipartParser, parse_options_header
+    except ImportError as e:
+        print(f"[WARNING] python-multipart import 실패 (스트리밍 form 업로드 사용 불가): {e}")
+        MultipartParser = None
+        parse_options_header = None
+
+logger = logging.getLogger(__name__)
+
+# S3 멀티파트 최소 파트 크기는 5MB (마지막 파트 제외)
+STREAM_UPLOAD_PART_MB = max(int(os.getenv('STREAM_UPLOAD_PART_MB', '8')), 5)
+STREAM_UPLOAD_CONCURRENCY = max(int(os.getenv('STREAM_UPLOAD_CONCURRENCY', '4')), 1)
+STREAM_UPLOAD_MAX_MB = int(os.getenv('STREAM_UPLOAD_MAX_MB', '2048'))
+
+
+class StreamUploadError(Exception):
+    """업로드 내용이 잘못된 경우 (형식 / 요청 본문)"""
+    status_code = 400
+
+
+class UploadTooLargeError(StreamUploadError):
+    """허용 크기 초과"""
+    status_code = 413
+
+
+@dataclass
+class StreamUploadResult:
+    """스트리밍 업로드 결과"""
+    key: str
+    size: int
+    sha256: str
+    etag: str
+    parts: int
+    detected_format: str
+
+
+class MultipartFileStream:
+    """
+    multipart/form-data 요청 본문에서 파일 필드 하나만 청크 단위로 꺼내는 비동기 이터레이터
+
+    open()은 파일 필드 헤더까지만 읽어 filename / content_type을 채우고,
+    이후 순회하면 본문을 읽는 만큼 파일 데이터를 내보냅니다. 파일 필드가 끝나면 나머지 본문은 읽지 않습니다.
+    """
+
+    def __init__(self, request, field_name: str = 'file'):
+        if MultipartParser is None:
+            raise RuntimeError("python-multipart가 설치되어 있지 않습니다")
+        content_type, params = parse_options_header(request.headers.get('content-type', ''))
+        if content_type != b'multipart/form-data' or not params.get(b'boundary'):
+            raise StreamUploadError("multipart/form-data 요청이 아닙니다")
+        self.field_name = field_name.encode()
+        self.filename: Optional[str] = None
+        self.content_type: str = 'application/octet-stream'
+        self._body = request.stream().__aiter__()
+        self._body_done = False
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = b''
+        self._header_value = b''
+        self._in_file = False
+        self._file_seen = False
+        self._file_done = False
+        self._chunks: List[bytes] = []
+        self._parser = MultipartParser(params[b'boundary'], {
+            'on_part_begin': self._on_part_begin,
+            'on_header_field': self._on_header_field,
+            'on_header_value': self._on_header_value,
+            'on_header_end': self._on_header_end,
+            'on_headers_finished': self._on_headers_finished,
+            'on_part_data': self._on_part_data,
+            'on_part_end': self._on_part_end,
+        })
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field, self._header_value = b'', b''
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b'content-disposition', b''))
+        if options.get(b'name') == self.field_name and not self._file_seen:
+            self._in_file = self._file_seen = True
+            self.filename = options.get(b'filename', b'').decode('utf-8', errors='replace') or None
+            self.content_type = self._headers.get(b'content-type', b'application/octet-stream').decode('latin-1')
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._chunks.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._file_done = True
+
+    async def _feed(self) -> None:
+        """요청 본문 청크 하나를 파서에 넣음"""
+        try:
+            chunk = await self._body.__anext__()
+        except StopAsyncIteration:
+            self._body_done = True
+            self._parser.finalize()
+            return
+        if chunk:
+            self._parser.write(chunk)
+
+    async def open(self) -> 'MultipartFileStream':
+        """파일 필드 헤더까지 읽음 (없으면 StreamUploadError)"""
+        while not self._file_seen and not self._body_done:
+            await self._feed()
+        if not self._file_seen:
+            raise StreamUploadError(f"'{self.field_name.decode()}' 파일 필드가 없습니다")
+        return self
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            if self._chunks:
+                data = b''.join(self._chunks)
+                self._chunks.clear()
+                yield data
+            if self._file_done:
+                return
+            if self._body_done:
+                raise StreamUploadError("파일 데이터가 끝나기 전에 요청 본문이 끝났습니다")
+            await self._feed()
+
+
+class StreamingS3Uploader:
+    """비동기 청크 스트림 → S3 멀티파트 업로드"""
+
+    def __init__(self, s3_client=None, bucket: str = S3_BUCKET_NAME,
+                 part_size: int = STREAM_UPLOAD_PART_MB * 1024 * 1024,
+                 concurrency: int = STREAM_UPLOAD_CONCURRENCY,
+                 max_bytes: int = STREAM_UPLOAD_MAX_MB * 1024 * 1024):
+        self.s3_client = s3_client or get_s3_client()
+        self.bucket = bucket
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _validate(header: bytes, extension: Optional[str]) -> str:
+        if not header:
+            raise StreamUploadError("빈 파일입니다")
+        try:
+            return FileValidator.validate_header(header, extension)
+        except ValueError as e:
+            raise StreamUploadError(str(e))
+
+    def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> Dict[str, Any]:
+        """파트 업로드 (워커 스레드, Content-MD5로 S3가 전송 중 손상 검출)"""
+        content_md5 = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        response = self.s3_client.upload_part(Bucket=self.bucket, Key=key, UploadId=upload_id,
+                                              PartNumber=part_number, Body=data, ContentMD5=content_md5)
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    def _put_object(self, key: str, data: bytes, content_type: str) -> str:
+        content_md5 = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        response = self.s3_client.put_object(Bucket=self.bucket, Key=key, Body=data,
+                                             ContentType=content_type, ContentMD5=content_md5)
+        return response['ETag']
+
+    async def upload(self, chunks: AsyncIterator[bytes], key: str,
+                     content_type: str = 'application/octet-stream',
+                     extension: Optional[str] = None) -> StreamUploadResult:
+        """
+        청크 스트림을 key로 업로드
+
+        Args:
+            chunks: 파일 데이터 비동기 이터레이터 (청크 크기 무관)
+            extension: 지정하면 판별된 형식과 확장자가 맞는지 확인
+
+        Raises:
+            StreamUploadError: 형식 검증 실패 / UploadTooLargeError: max_bytes 초과
+        """
+        sha256 = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
+        detected: Optional[str] = None
+        upload_id: Optional[str] = None
+        part_tasks: List[asyncio.Task] = []
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def send_part(part_number: int, data: bytes) -> Dict[str, Any]:
+            try:
+                return await asyncio.to_thread(self._upload_part, key, upload_id, part_number, data)
+            finally:
+                slots.release()
+
+        async def submit(data: bytes) -> None:
+            nonlocal upload_id
+            # 빈 자리가 생길 때까지 본문 읽기를 멈춤 (메모리 상한)
+            await slots.acquire()
+            for task in part_tasks:
+                if task.done() and task.exception():
+                    slots.release()
+                    raise task.exception()
+            # 전체 해시는 파트 순서대로 (hashlib은 큰 버퍼에서 GIL을 놓으므로 스레드에서 실행)
+            await asyncio.to_thread(sha256.update, data)
+            if upload_id is None:
+                response = await asyncio.to_thread(self.s3_client.create_multipart_upload,
+                                                   Bucket=self.bucket, Key=key, ContentType=content_type)
+                upload_id = response['UploadId']
+            part_tasks.append(asyncio.create_task(send_part(len(part_tasks) + 1, data)))
+
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise UploadTooLargeError(f"파일이 너무 큽니다: {self.max_bytes // (1024 * 1024)}MB 이하만 업로드 가능합니다")
+                buffer += chunk
+                if detected is None and len(buffer) >= FileValidator.HEADER_SIZE:
+                    detected = self._validate(bytes(buffer[:FileValidator.HEADER_SIZE]), extension)
+                while len(buffer) >= self.part_size:
+                    data = bytes(buffer[:self.part_size])
+                    del buffer[:self.part_size]
+                    await submit(data)
+
+            if detected is None:
+                detected = self._validate(bytes(buffer), extension)
+
+            if upload_id is None:
+                data = bytes(buffer)
+                await asyncio.to_thread(sha256.update, data)
+                etag = await asyncio.to_thread(self._put_object, key, data, content_type)
+                parts = 1
+            else:
+                if buffer:
+                    await submit(bytes(buffer))
+                buffer = bytearray()
+                completed = await asyncio.gather(*part_tasks)
+                response = await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload, Bucket=self.bucket, Key=key,
+                    UploadId=upload_id, MultipartUpload={'Parts': completed}
+                )
+                etag = response['ETag']
+                parts = len(completed)
+        except BaseException:
+            for task in part_tasks:
+                task.cancel()
+            await asyncio.gather(*part_tasks, return_exceptions=True)
+            if upload_id is not None:
+                try:
+                    await asyncio.shield(asyncio.to_thread(self.s3_client.abort_multipart_upload,
+                                                           Bucket=self.bucket, Key=key, UploadId=upload_id))
+                except Exception as e:
+                    logger.warning(f"⚠️ [STREAM_UPLOAD] 멀티파트 업로드 취소 실패 ({key}): {e}")
+            raise
+
+        result = StreamUploadResult(key=key, size=size, sha256=sha256.hexdigest(), etag=etag,
+                                    parts=parts, detected_format=detected)
+        logger.info(f"📤 [STREAM_UPLOAD] 업로드 완료: {key} ({size} bytes, 파트 {parts}개, sha256 {result.sha256[:12]}...)")
+        return result
@@ -105,4 +105,19 @@ def get_supabase_client() -> Client:
 
 def get_user_supabase_client(user_token: str) -> Client:
     """사용자 JWT 토큰을 사용하는 Supabase 클라이언트"""
-    return supabase_client.get_user_client(user_token)
\ No newline at end of file
+    return supabase_client.get_user_client(user_token)
+
+# 없는 컬럼에 쓰려다 난 오류 코드 (PostgREST 스키마 캐시 / Postgres undefined_column)
+MISSING_COLUMN_ERROR_CODES = ('PGRST204', '42703')
+
+def is_missing_column_error(error: Exception) -> bool:
+    """
+    테이블에 없는 컬럼을 넣으려다 실패한 오류인지 확인
+
+    새 컬럼을 빼고 다시 저장하는 호환 경로는 이 경우에만 사용해야 합니다.
+    시간 초과 등 다른 오류 뒤에 다시 삽입하면 첫 요청이 실제로는 반영되었을 때 행이 중복됩니다.
+    """
+    code = getattr(error, 'code', None)
+    if code in MISSING_COLUMN_ERROR_CODES:
+        return True
+    return any(code in str(error) for code in MISSING_COLUMN_ERROR_CODES)
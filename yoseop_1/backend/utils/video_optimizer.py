@@ -94,12 +94,15 @@ class VideoOptimizer:
                 ]
             else:
                 # WebM의 경우 키프레임 간격 최적화
+                # MediaRecorder로 녹화한 WebM에는 재생 시간과 탐색 색인(Cues)이 없으므로
+                # 다시 묶으면서 Cues를 파일 앞쪽에 기록 (cues_to_front를 지원하지 않는 FFmpeg는 아래에서 재시도)
                 cmd = [
                     'ffmpeg',
                     '-i', input_path,
                     '-c:v', 'copy',  # 비디오 코덱 복사
                     '-c:a', 'copy',  # 오디오 코덱 복사
                     '-avoid_negative_ts', 'make_zero',
+                    '-cues_to_front', '1',
                     '-y',  # 출력 파일 덮어쓰기
                     output_path
                 ]
@@ -113,6 +116,10 @@ class VideoOptimizer:
                 text=True,
                 timeout=300  # 5분 타임아웃
             )
+            if result.returncode != 0 and '-cues_to_front' in cmd:
+                logger.warning("cues_to_front 미지원 FFmpeg, Cues 위치 지정 없이 재시도")
+                cmd = [arg for arg in cmd if arg not in ('-cues_to_front', '1')]
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
             
             if result.returncode == 0:
                 logger.info(f"비디오 최적화 완료: {output_path}")
@@ -160,4 +167,60 @@ class VideoOptimizer:
                 
         except Exception as e:
             logger.error(f"비디오 정보 조회 중 오류: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def probe_media(file_path: str) -> Optional[dict]:
+        """
+        재생 시간 / 코덱 / 해상도 요약 (ffprobe)
+
+        Returns:
+            dict: {'duration', 'format', 'video_codec', 'audio_codec', 'width', 'height'} 또는 None
+        """
+        info = VideoOptimizer.get_video_info(file_path)
+        if not info:
+            return None
+
+        video = next((s for s in info.get('streams', []) if s.get('codec_type') == 'video'), {})
+        audio = next((s for s in info.get('streams', []) if s.get('codec_type') == 'audio'), {})
+        duration = info.get('format', {}).get('duration') or video.get('duration')
+        try:
+            duration = float(duration) if duration is not None else None
+        except ValueError:
+            duration = None  # MediaRecorder WebM은 'N/A'
+        return {
+            'duration': duration,
+            'format': info.get('format', {}).get('format_name'),
+            'video_codec': video.get('codec_name'),
+            'audio_codec': audio.get('codec_name'),
+            'width': video.get('width'),
+            'height': video.get('height'),
+        }
+
+    @staticmethod
+    def extract_poster(input_path: str, output_path: str, at_sec: float = 1.0, width: int = 640) -> bool:
+        """
+        포스터 썸네일 (at_sec 지점 프레임 1장을 JPEG로 저장)
+
+        Returns:
+            bool: 성공 여부
+        """
+        cmd = [
+            'ffmpeg',
+            '-ss', f'{max(at_sec, 0):.2f}',
+            '-i', input_path,
+            '-frames:v', '1',
+            '-vf', f'scale={width}:-2',
+            '-q:v', '3',
+            '-y',
+            output_path
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                return True
+            logger.error(f"포스터 생성 실패: {result.stderr}")
+            return False
+        except Exception as e:
+            logger.error(f"포스터 생성 중 오류: {e}")
+            return False
@@ -131,7 +131,7 @@ export interface VideoAnalysisResponse {
 
 export interface AnalysisStatusResponse {
   task_id: string;
-  status: 'processing' | 'completed' | 'failed';
+  status: 'queued' | 'processing' | 'completed' | 'failed' | 'cancelled';
   progress?: number;
   result?: GazeAnalysisResult;
   error?: string;
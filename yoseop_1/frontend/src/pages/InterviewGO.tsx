@@ -9,6 +9,7 @@ import SpeechIndicator from '../components/voice/SpeechIndicator';
 import GazeVideoUploader from '../components/gaze/GazeVideoUploader';
 import { getInterviewState, markApiCallCompleted, debugInterviewState, setApiCallInProgress, isApiCallInProgress } from '../utils/interviewStateManager';
 import { GazeAnalysisResult, VideoAnalysisResponse, AnalysisStatusResponse } from '../components/test/types';
+import { LiveGazeStream, LIVE_GAZE_ENABLED } from '../utils/liveGazeStream';
 
 // API Base URL 설정
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
@@ -270,6 +271,7 @@ const InterviewGO: React.FC = () => {
   const gazeVideoRef = useRef<HTMLVideoElement>(null);
   const gazeMediaRecorderRef = useRef<MediaRecorder | null>(null);
   const gazeChunksRef = useRef<Blob[]>([]);
+  const liveGazeRef = useRef<LiveGazeStream | null>(null);
 
   // 👁️ 시선 분석 폴링 관련 상태 (Context로 이전됨)
   const [pollingError, setPollingError] = useState<string | null>(null);
@@ -1624,6 +1626,14 @@ const InterviewGO: React.FC = () => {
         console.log("🏁 면접 종료 신호 수신! 지금부터 영상 처리를 시작합니다.");
         const finalGazeBlob = await stopGazeRecording();
 
+        if (liveGazeRef.current) {
+          const liveResult = await liveGazeRef.current.stop();
+          liveGazeRef.current = null;
+          console.log('👁️ 라이브 시선 추적 결과:', liveResult
+            ? `커버리지 ${Math.round(liveResult.coverage * 100)}%, ${liveResult.covered ? '사후 분석 생략' : '사후 분석 진행'}`
+            : '결과 없음 - 사후 분석 진행');
+        }
+
         if (finalGazeBlob && finalGazeBlob.size > 0) {
           console.log(`UPLOAD_CALL: 이제 uploadGazeVideoS3 함수를 호출합니다. sessionId: ${sessionId}`);
           const taskId = await uploadGazeVideoS3(sessionId, finalGazeBlob);
@@ -1888,11 +1898,21 @@ const InterviewGO: React.FC = () => {
       setIsGazeRecording(true);
       console.log('👁️ 시선 추적 녹화 시작');
 
+      // 👁️ 라이브 시선 추적: 녹화와 함께 축소 프레임을 서버로 전송 (충분히 추적되면 면접 후 분석 생략)
+      const calibrationResult = state.gazeTracking?.calibrationResultData;
+      if (LIVE_GAZE_ENABLED && state.sessionId && calibrationResult?.calibration_points && gazeVideoRef.current) {
+        liveGazeRef.current = new LiveGazeStream(state.sessionId, {
+          calibration_points: calibrationResult.calibration_points,
+          initial_face_size: calibrationResult.initial_face_size
+        });
+        liveGazeRef.current.start(gazeVideoRef.current);
+      }
+
     } catch (error) {
       console.error('❌ 시선 추적 녹화 시작 실패:', error);
       setGazeError('시선 추적을 시작할 수 없습니다.');
     }
-  }, [currentPhase, gazeBlob, isGazeRecording, state.gazeTracking?.calibrationSessionId]);
+  }, [currentPhase, gazeBlob, isGazeRecording, state.gazeTracking?.calibrationSessionId, state.gazeTracking?.calibrationResultData, state.sessionId]);
 
   // 👁️ 시선 추적 녹화 중지
   const stopGazeRecording = (): Promise<Blob | null> => {
@@ -2179,8 +2199,8 @@ const InterviewGO: React.FC = () => {
           stopPolling(); // 모든 타이머 정리
           
 
-        } else if (statusData.status === 'failed') {
-          // 분석 실패
+        } else if (statusData.status === 'failed' || statusData.status === 'cancelled') {
+          // 분석 실패 (취소 포함)
           console.error('❌ 시선 분석 실패:', statusData.error);
           setGazeError('시선 분석에 실패했습니다.');
           dispatch({ type: 'SET_GAZE_ANALYSIS_STATUS', payload: 'failed' });
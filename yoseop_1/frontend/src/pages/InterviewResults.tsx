@@ -106,6 +106,10 @@ const InterviewResults: React.FC = () => {
   const [videoError, setVideoError] = useState<string | null>(null);
   const [videoMetadata, setVideoMetadata] = useState<any>(null);
   const hasFetched = useRef(false);
+  // S3 Presigned URL 재생: 만료/오류 시 재발급 1회 후 API 프록시 스트리밍으로 전환
+  const proxyVideoUrlRef = useRef<string | null>(null);
+  const presignedRetryRef = useRef(false);
+  const resumeTimeRef = useRef(0);
 
   // 메모 저장 함수
   const saveMemo = async (questionIndex: number, type: 'user' | 'ai', memo: string) => {
@@ -317,7 +321,18 @@ const InterviewResults: React.FC = () => {
         console.log('🎬 영상 파일 발견, 스트리밍 URL 설정:', absoluteVideoUrl);
         console.log('🔧 최적화 다운로드 URL 설정:', absoluteDownloadOptimizedUrl);
         
-        setVideoUrl(absoluteVideoUrl);
+        proxyVideoUrlRef.current = absoluteVideoUrl;
+        presignedRetryRef.current = false;
+        let playbackUrl = absoluteVideoUrl;
+        if (response.video_playback_mode === 'presigned') {
+          try {
+            playbackUrl = (await interviewApi.getVideoPlaybackUrl(interviewId!)).url;
+          } catch (error) {
+            console.warn('⚠️ 재생 URL 발급 실패, API 스트리밍으로 재생:', error);
+          }
+        }
+
+        setVideoUrl(playbackUrl);
         setDownloadOptimizedUrl(absoluteDownloadOptimizedUrl);
         setVideoMetadata(response.video_metadata || null);
         setVideoError(null); // 이전 에러가 있었다면 초기화
@@ -731,6 +746,7 @@ const InterviewResults: React.FC = () => {
                     className="w-full h-full bg-black rounded-lg"
                     controls
                     preload="metadata"
+                    poster={videoMetadata?.poster_url || undefined}
                     aria-label="면접 영상"
                     onLoadStart={() => {
                       console.log('🎬 비디오 로딩 시작');
@@ -742,14 +758,35 @@ const InterviewResults: React.FC = () => {
                     }}
                     onCanPlay={() => {
                       console.log('🎬 비디오 재생 준비 완료');
+                      presignedRetryRef.current = false;
                       setVideoLoading(false);
                     }}
-                    onLoadedMetadata={() => {
+                    onLoadedMetadata={(e) => {
                       console.log('🎬 비디오 메타데이터 로딩 완료');
+                      if (resumeTimeRef.current > 0) {
+                        e.currentTarget.currentTime = resumeTimeRef.current;
+                        resumeTimeRef.current = 0;
+                      }
                     }}
-                    onError={(e) => {
+                    onError={async (e) => {
                       console.error('🎬 비디오 로딩 에러:', e);
                       console.error('🎬 에러 상세:', e.target);
+                      const proxyUrl = proxyVideoUrlRef.current;
+                      if (proxyUrl && videoUrl !== proxyUrl) {
+                        // Presigned URL 만료 등: 재생 위치를 유지한 채 재발급, 다시 실패하면 API 스트리밍으로 전환
+                        resumeTimeRef.current = (e.target as HTMLVideoElement).currentTime || 0;
+                        if (!presignedRetryRef.current) {
+                          presignedRetryRef.current = true;
+                          try {
+                            setVideoUrl((await interviewApi.getVideoPlaybackUrl(interviewId!)).url);
+                            return;
+                          } catch (error) {
+                            console.warn('⚠️ 재생 URL 재발급 실패:', error);
+                          }
+                        }
+                        setVideoUrl(proxyUrl);
+                        return;
+                      }
                       setVideoLoading(false);
                       setVideoError('영상을 재생할 수 없습니다. 서버 연결을 확인해주세요.');
                     }}
@@ -153,7 +153,7 @@ export interface InterviewResponse {
 // 🆕 시선 분석 상태 응답 타입
 export interface AnalysisStatusResponse {
   task_id: string;
-  status: 'processing' | 'completed' | 'failed';
+  status: 'queued' | 'processing' | 'completed' | 'failed' | 'cancelled';
   progress?: number;
   result?: {
     gaze_score: number;
@@ -552,6 +552,12 @@ export const interviewApi = {
     return response.data;
   },
 
+  // 면접 영상 재생 URL 발급 (S3 Presigned URL, 브라우저가 S3에서 직접 재생)
+  async getVideoPlaybackUrl(interviewId: string): Promise<{ url: string; expires_in: number; content_type: string; file_size: number | null }> {
+    const response = await apiClient.get(`/interview/video/${interviewId}/stream`, { params: { mode: 'url' } });
+    return response.data;
+  },
+
   // 비언어적 피드백 (시선 분석) 조회
   async getGazeAnalysis(interviewId: string): Promise<GazeAnalysisResponse | null> {
     try {
@@ -0,0 +1,137 @@
+// Live Gaze Stream Utility
+// 면접 중 웹캠 프레임을 축소해 WebSocket(/gaze/live/{sessionId})으로 전송하는 라이브 시선 추적 클라이언트
+// 서버가 녹화 구간을 충분히 추적했다고 응답하면(covered) 면접 후 S3 시선 분석이 생략됨
+
+import { API_BASE_URL } from '../services/api';
+
+export const LIVE_GAZE_ENABLED = process.env.REACT_APP_LIVE_GAZE === 'true';
+
+// 전송 대기 바이트가 이보다 많으면 네트워크가 밀린 것으로 보고 프레임을 건너뜀
+const MAX_BUFFERED_BYTES = 256 * 1024;
+const JPEG_QUALITY = 0.7;
+
+export interface LiveGazeCalibration {
+  calibration_points: [number, number][];
+  initial_face_size?: number | null;
+}
+
+export interface LiveGazeResult {
+  type: 'result';
+  covered: boolean;
+  coverage: number;
+  analyzed_frames: number;
+  gaze_score: number | null;
+  error: string | null;
+}
+
+const toWebSocketUrl = (path: string): string =>
+  `${API_BASE_URL.replace(/^http/, 'ws')}${path}`;
+
+export class LiveGazeStream {
+  private socket: WebSocket | null = null;
+  private timer: number | null = null;
+  private canvas = document.createElement('canvas');
+  private startedAt = 0;
+  private sending = false;
+  private resultPromise: Promise<LiveGazeResult | null> | null = null;
+
+  constructor(
+    private sessionId: string,
+    private calibration: LiveGazeCalibration
+  ) {}
+
+  /**
+   * WebSocket 연결 후 video 요소의 프레임을 서버가 안내한 빈도/크기로 전송 시작
+   */
+  start(video: HTMLVideoElement): void {
+    const token = localStorage.getItem('auth_token');
+    if (!token || this.socket) return;
+
+    const socket = new WebSocket(
+      toWebSocketUrl(`/gaze/live/${encodeURIComponent(this.sessionId)}?token=${encodeURIComponent(token)}`)
+    );
+    socket.binaryType = 'arraybuffer';
+    this.socket = socket;
+    this.startedAt = performance.now();
+
+    this.resultPromise = new Promise((resolve) => {
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        if (message.type === 'ready') {
+          const [width, height] = message.frame_size;
+          this.canvas.width = width;
+          this.canvas.height = height;
+          const interval = Math.max(100, Math.round(1000 / message.fps));
+          this.timer = window.setInterval(() => this.sendFrame(video), interval);
+          console.log(`👁️ 라이브 시선 추적 시작 (${message.fps}fps, ${width}x${height})`);
+        } else if (message.type === 'result') {
+          resolve(message as LiveGazeResult);
+        } else if (message.type === 'error') {
+          console.warn('⚠️ 라이브 시선 추적 프레임 오류:', message.message);
+        }
+      };
+      socket.onclose = () => {
+        this.clearTimer();
+        resolve(null);
+      };
+      socket.onerror = () => console.warn('⚠️ 라이브 시선 추적 연결 오류 - 면접 후 분석으로 대체됩니다.');
+    });
+
+    socket.onopen = () => {
+      socket.send(JSON.stringify({ type: 'start', calibration_data: this.calibration }));
+    };
+  }
+
+  private sendFrame(video: HTMLVideoElement): void {
+    const socket = this.socket;
+    if (!socket || socket.readyState !== WebSocket.OPEN || this.sending) return;
+    if (video.readyState < 2 || socket.bufferedAmount > MAX_BUFFERED_BYTES) return;
+
+    const ctx = this.canvas.getContext('2d');
+    if (!ctx) return;
+    ctx.drawImage(video, 0, 0, this.canvas.width, this.canvas.height);
+    const elapsedMs = Math.round(performance.now() - this.startedAt);
+
+    this.sending = true;
+    this.canvas.toBlob(async (blob) => {
+      try {
+        if (!blob || socket.readyState !== WebSocket.OPEN) return;
+        const image = new Uint8Array(await blob.arrayBuffer());
+        const message = new Uint8Array(4 + image.length);
+        new DataView(message.buffer).setUint32(0, elapsedMs); // big-endian 경과 ms
+        message.set(image, 4);
+        socket.send(message);
+      } finally {
+        this.sending = false;
+      }
+    }, 'image/jpeg', JPEG_QUALITY);
+  }
+
+  private clearTimer(): void {
+    if (this.timer !== null) {
+      window.clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /**
+   * 전송을 멈추고 서버에 녹화 길이를 알린 뒤 라이브 결과를 기다림 (연결 실패 시 null)
+   */
+  async stop(timeoutMs: number = 10000): Promise<LiveGazeResult | null> {
+    this.clearTimer();
+    const socket = this.socket;
+    if (!socket || !this.resultPromise) return null;
+
+    if (socket.readyState === WebSocket.OPEN) {
+      const durationMs = Math.round(performance.now() - this.startedAt);
+      socket.send(JSON.stringify({ type: 'stop', duration_ms: durationMs }));
+    } else {
+      socket.close();
+    }
+
+    const timeout = new Promise<null>((resolve) => window.setTimeout(() => resolve(null), timeoutMs));
+    const result = await Promise.race([this.resultPromise, timeout]);
+    this.socket = null;
+    return result;
+  }
+}
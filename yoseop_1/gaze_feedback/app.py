@@ -205,241 +205,357 @@ def calculate_gaze_compliance_score(interview_gaze_data):
 
     return final_score
 
-def generate_frames():
-    """카메라 프레임 생성 - 환경 설정 및 면접 진행 모드 지원"""
-    global camera, gaze_data, is_setting, setting_phase, setting_start_time
+def annotate_frame(frame):
+    """카메라 프레임 1장 분석 및 오버레이 - 환경 설정 및 면접 진행 모드 지원 (분석 스레드에서만 호출)"""
+    global gaze_data, is_setting, setting_phase, setting_start_time
     global left_gaze_data, right_gaze_data, final_jitter_score, calibration_completed
     global is_interview, interview_start_time, interview_gaze_data, interview_jitter_score
     
-    if camera is None:
-        camera = cv2.VideoCapture(0)
-        camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    # 카메라 좌우반전 (수평 뒤집기)
+    frame = cv2.flip(frame, 1)
     
-    while True:
-        success, frame = camera.read()
-        if not success:
-            break
-        
-        # 카메라 좌우반전 (수평 뒤집기)
-        frame = cv2.flip(frame, 1)
-        
-        h, w, _ = frame.shape
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # 화면 중앙에 점선 원형 프레임 그리기 (가로 길이의 1/5 반지름)
-        center_x = w // 2
-        center_y = h // 2
-        radius = w // 5
-        
-        # 점선 원 그리기
-        for i in range(0, 360, 10):
-            if i % 20 == 0:  # 점선 효과
-                x1 = int(center_x + radius * np.cos(np.radians(i)))
-                y1 = int(center_y + radius * np.sin(np.radians(i)))
-                x2 = int(center_x + radius * np.cos(np.radians(i + 8)))
-                y2 = int(center_y + radius * np.sin(np.radians(i + 8)))
-                cv2.line(frame, (x1, y1), (x2, y2), (255, 255, 255), 2)
-        
-        # MediaPipe 얼굴 처리
-        results = face_mesh.process(rgb_frame)
-        
-        if results.multi_face_landmarks:
-            for face_landmarks in results.multi_face_landmarks:
-                # 개별 동공 포인트 계산
-                left_center, right_center, left_gaze_2d, right_gaze_2d = get_gaze_point_3d(face_landmarks.landmark, w, h)
-                
-                if is_setting:
-                    # 4포인트 환경 설정 단계에 따라 데이터 수집
-                    current_time = time.time()
-                    elapsed = current_time - setting_start_time
-                    
-                    if setting_phase == 'top_left':
-                        if elapsed >= 3:  # 3초 후부터 데이터 수집
-                            # 양쪽 동공의 평균 위치를 데이터로 사용
-                            avg_gaze = ((left_center + right_center) / 2)
-                            top_left_gaze_data.append(avg_gaze)
-                            # 시선 위치 표시 (좌상단 - 초록색)
-                            # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (0, 255, 0), -1)
-                    elif setting_phase == 'bottom_left':
-                        if elapsed >= 3:  # 3초 후부터 데이터 수집
-                            avg_gaze = ((left_center + right_center) / 2)
-                            bottom_left_gaze_data.append(avg_gaze)
-                            # 시선 위치 표시 (좌하단 - 파란색)
-                            # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (255, 0, 0), -1)
-                    elif setting_phase == 'top_right':
-                        if elapsed >= 3:  # 3초 후부터 데이터 수집
-                            avg_gaze = ((left_center + right_center) / 2)
-                            top_right_gaze_data.append(avg_gaze)
-                            # 시선 위치 표시 (우상단 - 빨간색)
-                            # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (0, 0, 255), -1)
-                    elif setting_phase == 'bottom_right':
-                        if elapsed >= 3:  # 3초 후부터 데이터 수집
-                            avg_gaze = ((left_center + right_center) / 2)
-                            bottom_right_gaze_data.append(avg_gaze)
-                            # 시선 위치 표시 (우하단 - 노란색)
-                            # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (0, 255, 255), -1)
+    h, w, _ = frame.shape
+    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    
+    # 화면 중앙에 점선 원형 프레임 그리기 (가로 길이의 1/5 반지름)
+    center_x = w // 2
+    center_y = h // 2
+    radius = w // 5
+    
+    # 점선 원 그리기
+    for i in range(0, 360, 10):
+        if i % 20 == 0:  # 점선 효과
+            x1 = int(center_x + radius * np.cos(np.radians(i)))
+            y1 = int(center_y + radius * np.sin(np.radians(i)))
+            x2 = int(center_x + radius * np.cos(np.radians(i + 8)))
+            y2 = int(center_y + radius * np.sin(np.radians(i + 8)))
+            cv2.line(frame, (x1, y1), (x2, y2), (255, 255, 255), 2)
+    
+    # MediaPipe 얼굴 처리
+    results = face_mesh.process(rgb_frame)
+    
+    if results.multi_face_landmarks:
+        for face_landmarks in results.multi_face_landmarks:
+            # 개별 동공 포인트 계산
+            left_center, right_center, left_gaze_2d, right_gaze_2d = get_gaze_point_3d(face_landmarks.landmark, w, h)
+            
+            if is_setting:
+                # 4포인트 환경 설정 단계에 따라 데이터 수집
+                current_time = time.time()
+                elapsed = current_time - setting_start_time
                 
-                # 면접 진행 중 데이터 수집
-                elif is_interview:
-                    current_time = time.time()
-                    elapsed = current_time - interview_start_time
-
-                    if elapsed < interview_duration:
-                        # 면접 중 동공 움직임 데이터 수집
+                if setting_phase == 'top_left':
+                    if elapsed >= 3:  # 3초 후부터 데이터 수집
+                        # 양쪽 동공의 평균 위치를 데이터로 사용
                         avg_gaze = ((left_center + right_center) / 2)
-
-                        # ★ 동공 인식 정상일 때만 데이터 저장 (깜빡임 등은 제외)
-                        if (
-                            not np.any(np.isnan(avg_gaze)) and
-                            not np.any(np.isinf(avg_gaze)) and
-                            not np.allclose(avg_gaze, 0)
-                        ):
-                            interview_gaze_data.append(avg_gaze)
-
-                            # 시선 범위 준수 확인 및 시각적 피드백
-                            if all(allowed_gaze_range.values()):
-                                x, y = avg_gaze[0], avg_gaze[1]
-                                x_in_range = allowed_gaze_range['left_bound'] <= x <= allowed_gaze_range['right_bound']
-                                y_in_range = allowed_gaze_range['top_bound'] <= y <= allowed_gaze_range['bottom_bound']
-
-                                if x_in_range and y_in_range:
-                                    # 범위 내: 초록색 테두리
-                                    cv2.rectangle(frame, (10, 10), (w-10, h-10), (0, 255, 0), 3)
-                                    status_text = "Good! Gaze within range"
-                                    text_color = (0, 255, 0)
-                                else:
-                                    # 범위 밖: 빨간색 테두리 및 경고
-                                    cv2.rectangle(frame, (10, 10), (w-10, h-10), (0, 0, 255), 3)
-                                    status_text = "Warning! Gaze out of range!"
-                                    text_color = (0, 0, 255)
-
-                                    # 경고 메시지 깜빡임 효과
-                                    if int(elapsed * 2) % 2:  # 0.5초마다 깜빡임
-                                        cv2.putText(frame, status_text, (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.8, text_color, 2)
-                        # else: 인식 실패(깜빡임 등) 프레임은 아무것도 저장하지 않음
-
-                        # 남은 시간 표시
-                        remaining = interview_duration - elapsed
-                        cv2.putText(frame, f"면접 진행 중... 남은 시간: {int(remaining)}초", 
-                                    (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-                        # 진행률 바 표시
-                        progress = elapsed / interview_duration
-                        bar_width = int(w * 0.6)
-                        bar_x = (w - bar_width) // 2
-                        bar_y = h - 50
-                        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + 20), (100, 100, 100), -1)
-                        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + int(bar_width * progress), bar_y + 20), (0, 255, 0), -1)
-                    else:
-                        # 면접 완료
-                        is_interview = False
-
-                        # 새로운 점수 계산 방식: 시선 범위 준수 기반
-                        interview_jitter_score = calculate_gaze_compliance_score(interview_gaze_data)
-
-                        print(f"면접 완료! 수집된 데이터: {len(interview_gaze_data)}개")
-                        print(f"면접 중 시선 범위 준수 점수: {interview_jitter_score}")
-
-        # 4포인트 설정 단계별 메시지 표시
-        if is_setting:
-            current_time = time.time()
-            elapsed = current_time - setting_start_time
+                        top_left_gaze_data.append(avg_gaze)
+                        # 시선 위치 표시 (좌상단 - 초록색)
+                        # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (0, 255, 0), -1)
+                elif setting_phase == 'bottom_left':
+                    if elapsed >= 3:  # 3초 후부터 데이터 수집
+                        avg_gaze = ((left_center + right_center) / 2)
+                        bottom_left_gaze_data.append(avg_gaze)
+                        # 시선 위치 표시 (좌하단 - 파란색)
+                        # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (255, 0, 0), -1)
+                elif setting_phase == 'top_right':
+                    if elapsed >= 3:  # 3초 후부터 데이터 수집
+                        avg_gaze = ((left_center + right_center) / 2)
+                        top_right_gaze_data.append(avg_gaze)
+                        # 시선 위치 표시 (우상단 - 빨간색)
+                        # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (0, 0, 255), -1)
+                elif setting_phase == 'bottom_right':
+                    if elapsed >= 3:  # 3초 후부터 데이터 수집
+                        avg_gaze = ((left_center + right_center) / 2)
+                        bottom_right_gaze_data.append(avg_gaze)
+                        # 시선 위치 표시 (우하단 - 노란색)
+                        # cv2.circle(frame, (int(avg_gaze[0]), int(avg_gaze[1])), 5, (0, 255, 255), -1)
             
-            if setting_phase == 'top_left':
-                if elapsed < 3:
-                    message = "Look at TOP LEFT corner of screen"
-                    countdown = 3 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                    cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                elif elapsed < 6:
-                    message = "Keep looking at TOP LEFT!"
-                    countdown = 6 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                    # 원형 진행바
-                    progress = (elapsed - 3) / 3
-                    cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (0, 255, 0), 3)
-                    cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                else:
-                    # 좌하단 단계로 전환
-                    setting_phase = 'bottom_left'
-                    setting_start_time = current_time
-                    
-            elif setting_phase == 'bottom_left':
-                if elapsed < 3:
-                    message = "Look at BOTTOM LEFT corner of screen"
-                    countdown = 3 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                    cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                elif elapsed < 6:
-                    message = "Keep looking at BOTTOM LEFT!"
-                    countdown = 6 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
-                    # 원형 진행바
-                    progress = (elapsed - 3) / 3
-                    cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (255, 0, 0), 3)
-                    cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-                else:
-                    # 우상단 단계로 전환
-                    setting_phase = 'top_right'
-                    setting_start_time = current_time
-                    
-            elif setting_phase == 'top_right':
-                if elapsed < 3:
-                    message = "Look at TOP RIGHT corner of screen"
-                    countdown = 3 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                    cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                elif elapsed < 6:
-                    message = "Keep looking at TOP RIGHT!"
-                    countdown = 6 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                    # 원형 진행바
-                    progress = (elapsed - 3) / 3
-                    cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (0, 0, 255), 3)
-                    cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+            # 면접 진행 중 데이터 수집
+            elif is_interview:
+                current_time = time.time()
+                elapsed = current_time - interview_start_time
+
+                if elapsed < interview_duration:
+                    # 면접 중 동공 움직임 데이터 수집
+                    avg_gaze = ((left_center + right_center) / 2)
+
+                    # ★ 동공 인식 정상일 때만 데이터 저장 (깜빡임 등은 제외)
+                    if (
+                        not np.any(np.isnan(avg_gaze)) and
+                        not np.any(np.isinf(avg_gaze)) and
+                        not np.allclose(avg_gaze, 0)
+                    ):
+                        interview_gaze_data.append(avg_gaze)
+
+                        # 시선 범위 준수 확인 및 시각적 피드백
+                        if all(allowed_gaze_range.values()):
+                            x, y = avg_gaze[0], avg_gaze[1]
+                            x_in_range = allowed_gaze_range['left_bound'] <= x <= allowed_gaze_range['right_bound']
+                            y_in_range = allowed_gaze_range['top_bound'] <= y <= allowed_gaze_range['bottom_bound']
+
+                            if x_in_range and y_in_range:
+                                # 범위 내: 초록색 테두리
+                                cv2.rectangle(frame, (10, 10), (w-10, h-10), (0, 255, 0), 3)
+                                status_text = "Good! Gaze within range"
+                                text_color = (0, 255, 0)
+                            else:
+                                # 범위 밖: 빨간색 테두리 및 경고
+                                cv2.rectangle(frame, (10, 10), (w-10, h-10), (0, 0, 255), 3)
+                                status_text = "Warning! Gaze out of range!"
+                                text_color = (0, 0, 255)
+
+                                # 경고 메시지 깜빡임 효과
+                                if int(elapsed * 2) % 2:  # 0.5초마다 깜빡임
+                                    cv2.putText(frame, status_text, (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.8, text_color, 2)
+                    # else: 인식 실패(깜빡임 등) 프레임은 아무것도 저장하지 않음
+
+                    # 남은 시간 표시
+                    remaining = interview_duration - elapsed
+                    cv2.putText(frame, f"면접 진행 중... 남은 시간: {int(remaining)}초", 
+                                (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+
+                    # 진행률 바 표시
+                    progress = elapsed / interview_duration
+                    bar_width = int(w * 0.6)
+                    bar_x = (w - bar_width) // 2
+                    bar_y = h - 50
+                    cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + 20), (100, 100, 100), -1)
+                    cv2.rectangle(frame, (bar_x, bar_y), (bar_x + int(bar_width * progress), bar_y + 20), (0, 255, 0), -1)
                 else:
-                    # 우하단 단계로 전환
-                    setting_phase = 'bottom_right'
-                    setting_start_time = current_time
-                    
-            elif setting_phase == 'bottom_right':
-                if elapsed < 3:
-                    message = "Look at BOTTOM RIGHT corner of screen"
-                    countdown = 3 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                    cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                elif elapsed < 6:
-                    message = "Keep looking at BOTTOM RIGHT!"
-                    countdown = 6 - int(elapsed)
-                    cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                    # 원형 진행바
-                    progress = (elapsed - 3) / 3
-                    cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (0, 255, 255), 3)
-                    cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                else:
-                    # 4포인트 설정 완료
-                    setting_phase = 'completed'
-                    is_setting = False
-                    calibration_completed = True
-                    
-                    # 4포인트 기반 허용 시선 범위 계산
-                    calculate_allowed_gaze_range()
-                    
-                    # Jitter 점수 계산 (모든 4포인트 데이터 사용)
-                    all_gaze_data = top_left_gaze_data + bottom_left_gaze_data + top_right_gaze_data + bottom_right_gaze_data
-                    final_jitter_score = calculate_jitter_score(all_gaze_data)
-                    print(f"4포인트 환경 설정 완료!")
-                    print(f"  좌상단: {len(top_left_gaze_data)}개, 좌하단: {len(bottom_left_gaze_data)}개")
-                    print(f"  우상단: {len(top_right_gaze_data)}개, 우하단: {len(bottom_right_gaze_data)}개")
-                    print(f"환경 설정 Jitter 점수: {final_jitter_score}")
+                    # 면접 완료
+                    is_interview = False
+
+                    # 새로운 점수 계산 방식: 시선 범위 준수 기반
+                    interview_jitter_score = calculate_gaze_compliance_score(interview_gaze_data)
+
+                    print(f"면접 완료! 수집된 데이터: {len(interview_gaze_data)}개")
+                    print(f"면접 중 시선 범위 준수 점수: {interview_jitter_score}")
+
+    # 4포인트 설정 단계별 메시지 표시
+    if is_setting:
+        current_time = time.time()
+        elapsed = current_time - setting_start_time
         
-        # JPEG 인코딩
+        if setting_phase == 'top_left':
+            if elapsed < 3:
+                message = "Look at TOP LEFT corner of screen"
+                countdown = 3 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+            elif elapsed < 6:
+                message = "Keep looking at TOP LEFT!"
+                countdown = 6 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                # 원형 진행바
+                progress = (elapsed - 3) / 3
+                cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (0, 255, 0), 3)
+                cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            else:
+                # 좌하단 단계로 전환
+                setting_phase = 'bottom_left'
+                setting_start_time = current_time
+                
+        elif setting_phase == 'bottom_left':
+            if elapsed < 3:
+                message = "Look at BOTTOM LEFT corner of screen"
+                countdown = 3 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+            elif elapsed < 6:
+                message = "Keep looking at BOTTOM LEFT!"
+                countdown = 6 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
+                # 원형 진행바
+                progress = (elapsed - 3) / 3
+                cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (255, 0, 0), 3)
+                cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+            else:
+                # 우상단 단계로 전환
+                setting_phase = 'top_right'
+                setting_start_time = current_time
+                
+        elif setting_phase == 'top_right':
+            if elapsed < 3:
+                message = "Look at TOP RIGHT corner of screen"
+                countdown = 3 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+            elif elapsed < 6:
+                message = "Keep looking at TOP RIGHT!"
+                countdown = 6 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                # 원형 진행바
+                progress = (elapsed - 3) / 3
+                cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (0, 0, 255), 3)
+                cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+            else:
+                # 우하단 단계로 전환
+                setting_phase = 'bottom_right'
+                setting_start_time = current_time
+                
+        elif setting_phase == 'bottom_right':
+            if elapsed < 3:
+                message = "Look at BOTTOM RIGHT corner of screen"
+                countdown = 3 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                cv2.putText(frame, f"Ready: {countdown}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+            elif elapsed < 6:
+                message = "Keep looking at BOTTOM RIGHT!"
+                countdown = 6 - int(elapsed)
+                cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+                # 원형 진행바
+                progress = (elapsed - 3) / 3
+                cv2.ellipse(frame, (w-100, 100), (30, 30), 0, 0, int(360 * progress), (0, 255, 255), 3)
+                cv2.putText(frame, f"{countdown}", (w-110, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+            else:
+                # 4포인트 설정 완료
+                setting_phase = 'completed'
+                is_setting = False
+                calibration_completed = True
+                
+                # 4포인트 기반 허용 시선 범위 계산
+                calculate_allowed_gaze_range()
+                
+                # Jitter 점수 계산 (모든 4포인트 데이터 사용)
+                all_gaze_data = top_left_gaze_data + bottom_left_gaze_data + top_right_gaze_data + bottom_right_gaze_data
+                final_jitter_score = calculate_jitter_score(all_gaze_data)
+                print(f"4포인트 환경 설정 완료!")
+                print(f"  좌상단: {len(top_left_gaze_data)}개, 좌하단: {len(bottom_left_gaze_data)}개")
+                print(f"  우상단: {len(top_right_gaze_data)}개, 우하단: {len(bottom_right_gaze_data)}개")
+                print(f"환경 설정 Jitter 점수: {final_jitter_score}")
+    
+    return frame
+
+# === 다중 시청자 스트리밍 파이프라인 ===
+# 카메라 캡처 → 분석(추론 + 오버레이) → JPEG 인코딩을 각각 전용 스레드 1개가 처리하고,
+# 단계 사이에는 "가장 최근 프레임 1장"만 둡니다. 각 단계와 시청자는 항상 최신 프레임만 가져가므로
+# 느린 단계나 느린 시청자는 중간 프레임을 건너뛸 뿐 앞 단계나 다른 시청자를 막지 않습니다.
+# (이전에는 시청자마다 generate_frames가 같은 카메라를 읽고 추론해, 시청자가 늘면 프레임을 나눠 갖고
+#  시선 데이터도 중복 수집되었습니다.)
+# 카메라를 읽지 못하면 STREAM_CLOSED를 단계마다 넘겨 스레드와 시청자 스트림을 모두 끝내고,
+# 다음 시청자가 접속할 때 파이프라인을 다시 시작합니다.
+
+class LatestFrame:
+    """가장 최근 값 1개만 보관하는 슬롯 (쓰는 쪽은 덮어쓰고, 읽는 쪽은 새 값이 올 때까지 대기)"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.value = None
+        self.seq = 0
+
+    def publish(self, value):
+        with self.condition:
+            self.value = value
+            self.seq += 1
+            self.condition.notify_all()
+
+    def wait_newer(self, last_seq, timeout=1.0):
+        """last_seq 이후의 최신 값 (seq, value). 시간 안에 새 값이 없으면 (last_seq, None)"""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.seq != last_seq, timeout):
+                return last_seq, None
+            return self.seq, self.value
+
+
+STREAM_CLOSED = object()          # 캡처 종료 표시 (각 단계가 다음 단계로 전달한 뒤 종료)
+
+raw_frames = LatestFrame()        # 캡처 스레드 → 분석 스레드
+annotated_frames = LatestFrame()  # 분석 스레드 → 인코딩 스레드
+jpeg_frames = LatestFrame()       # 인코딩 스레드 → 시청자별 generate_frames
+
+pipeline_lock = threading.Lock()
+pipeline_started = False
+stream_stats = {'captured': 0, 'analyzed': 0, 'encoded': 0, 'viewers': 0}
+
+def capture_loop():
+    """카메라를 읽는 유일한 스레드 (읽기에 실패하면 카메라를 해제하고 종료 표시를 전달)"""
+    global camera
+    camera = cv2.VideoCapture(0)
+    camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    
+    try:
+        while True:
+            success, frame = camera.read()
+            if not success:
+                print("카메라 프레임을 읽을 수 없습니다. 캡처를 종료합니다.")
+                break
+            raw_frames.publish(frame)
+            stream_stats['captured'] += 1
+    finally:
+        camera.release()
+        camera = None
+        raw_frames.publish(STREAM_CLOSED)
+
+def analysis_loop():
+    """최신 카메라 프레임만 추론 (분석이 느리면 그 사이 프레임은 버림)"""
+    seq = raw_frames.seq  # 이전 파이프라인이 남긴 값(종료 표시 포함)은 건너뜀
+    while True:
+        seq, frame = raw_frames.wait_newer(seq)
+        if frame is None:
+            continue
+        if frame is STREAM_CLOSED:
+            annotated_frames.publish(STREAM_CLOSED)
+            return
+        annotated_frames.publish(annotate_frame(frame))
+        stream_stats['analyzed'] += 1
+
+def encode_loop():
+    """분석된 최신 프레임을 한 번만 JPEG 인코딩해 모든 시청자가 공유"""
+    global pipeline_started
+    seq = annotated_frames.seq
+    while True:
+        seq, frame = annotated_frames.wait_newer(seq)
+        if frame is None:
+            continue
+        if frame is STREAM_CLOSED:
+            # 마지막 단계: 시청자 스트림을 끝내고 다음 시청자가 파이프라인을 다시 시작할 수 있게 함
+            with pipeline_lock:
+                jpeg_frames.publish(STREAM_CLOSED)
+                pipeline_started = False
+            return
         ret, buffer = cv2.imencode('.jpg', frame)
-        frame = buffer.tobytes()
-        
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+        if ret:
+            jpeg_frames.publish(buffer.tobytes())
+            stream_stats['encoded'] += 1
+
+def start_pipeline():
+    """
+    첫 시청자가 접속할 때 캡처/분석/인코딩 스레드 시작 (실행 중이면 무시)
+
+    Returns:
+        시청자가 기다리기 시작할 jpeg_frames 순번 (이전 파이프라인의 종료 표시를 받지 않도록 잠금 안에서 읽음)
+    """
+    global pipeline_started
+    with pipeline_lock:
+        if not pipeline_started:
+            for target in (capture_loop, analysis_loop, encode_loop):
+                threading.Thread(target=target, name=target.__name__, daemon=True).start()
+            pipeline_started = True
+        stream_stats['viewers'] += 1
+        return jpeg_frames.seq
+
+def generate_frames():
+    """
+    시청자별 MJPEG 스트림 - 항상 가장 최근 JPEG만 전송 (전송이 느린 동안 나온 프레임은 건너뜀)
+
+    카메라 캡처가 끝나면(종료 표시) 스트림도 끝납니다.
+    """
+    seq = start_pipeline()
+    try:
+        while True:
+            seq, frame = jpeg_frames.wait_newer(seq)
+            if frame is None:
+                continue
+            if frame is STREAM_CLOSED:
+                return
+            yield (b'--frame\r\n'
+                   b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+    finally:
+        # 브라우저가 연결을 끊으면 generator가 닫히며 여기로 옴
+        with pipeline_lock:
+            stream_stats['viewers'] -= 1
+
 
 @app.route('/')
 def index():
@@ -511,6 +627,11 @@ def video_feed():
     return Response(generate_frames(),
                     mimetype='multipart/x-mixed-replace; boundary=frame')
 
+@app.route('/stream_status', methods=['GET'])
+def stream_status():
+    """스트리밍 파이프라인 상태 (단계별 처리 프레임 수, 현재 시청자 수)"""
+    return jsonify(dict(stream_stats, running=pipeline_started))
+
 @app.route('/start_setting', methods=['POST'])
 def start_setting():
     """4포인트 환경 설정 시작"""
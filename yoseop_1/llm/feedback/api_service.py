@@ -71,8 +71,13 @@ class InterviewEvaluationService:
                 print(f"WARNING: 면접 세션 생성 실패: {str(e)}")
         return None
     
-    def _evaluate_single_question(self, qa_pair, company_info, question_index, position_info=None, posting_info=None, resume_info=None, who='user'):
-        """단일 질문 평가 (공유 모델 사용)"""
+    def _evaluate_single_question(self, qa_pair, company_info, question_index, position_info=None, posting_info=None, resume_info=None, who='user', raise_on_error=False):
+        """
+        단일 질문 평가 (공유 모델 사용)
+        
+        실패하면 오류 자리표시 결과(ml_score 0.0)를 반환합니다.
+        raise_on_error=True면 예외를 그대로 올립니다 (증분 평가: 결과를 저장하지 않고 최종 평가에서 다시 평가).
+        """
         try:
             print(f"\n--- Q{question_index} 평가 중 ---")
             
@@ -116,6 +121,8 @@ class InterviewEvaluationService:
             }
         except Exception as e:
             print(f"ERROR: Q{question_index} 평가 실패: {str(e)}")
+            if raise_on_error:
+                raise
             return {
                 "question_index": question_index,
                 "question": qa_pair.question,
@@ -172,10 +179,59 @@ class InterviewEvaluationService:
         except Exception as e:
             print(f"ERROR: 개별 질문 저장 실패 ({who}): {str(e)}")
 
+    def get_evaluation_context(self, company_id=None, position_id=None, posting_id=None, resume_id=None, who='user') -> dict:
+        """개별 질문 평가에 필요한 컨텍스트 정보 조회 (회사/직군/공고/이력서)"""
+        if who == 'user':
+            resume_info = self.db_manager.get_user_resume_info(resume_id) if resume_id else {}
+        else:
+            resume_info = self.db_manager.get_ai_resume_info(resume_id) if resume_id else {}
+        return {
+            "company_info": self.db_manager.get_company_info(company_id) if company_id else {},
+            "position_info": self.db_manager.get_position_info(position_id) if position_id else {},
+            "posting_info": self.db_manager.get_posting_info(posting_id) if posting_id else {},
+            "resume_info": resume_info
+        }
+
+    def evaluate_single_question_incremental(self, qa_pair, context: dict, question_index: int, who='user') -> dict:
+        """
+        면접 진행 중 개별 질문 하나를 미리 평가 (ML 점수 + LLM 평가 + 개별 최종 평가)
+        
+        면접 종료 후 evaluate_combined_interview에 precomputed 결과로 전달하면
+        종합 평가와 계획 생성만 남게 됩니다.
+        평가에 실패하면 예외를 내므로 오류 결과가 재사용되지 않고 최종 평가에서 다시 평가됩니다.
+        """
+        from .final_eval import finalize_single_result
+        
+        result = self._evaluate_single_question(
+            qa_pair, context["company_info"], question_index,
+            context["position_info"], context["posting_info"], context["resume_info"], who=who,
+            raise_on_error=True
+        )
+        result["final"] = finalize_single_result(
+            result, context["company_info"], context["position_info"],
+            context["posting_info"], context["resume_info"]
+        )
+        return result
+
+    def _reuse_or_evaluate(self, qa, precomputed, idx, company_info, position_info, posting_info, resume_info, who):
+        """증분 평가 결과가 같은 질문/답변에 대해 존재하면 재사용, 없으면 새로 평가"""
+        cached = precomputed[idx] if precomputed and idx < len(precomputed) else None
+        if cached and cached.get("question") == qa.question and cached.get("answer") == qa.answer:
+            return cached
+        return self._evaluate_single_question(
+            qa, company_info, idx+1, position_info, posting_info, resume_info, who=who
+        )
+
     def evaluate_combined_interview(self, user_id: int, user_qas: list, ai_qas: list,
                                   ai_resume_id=None, user_resume_id=None, posting_id=None, 
-                                  company_id=None, position_id=None, existing_interview_id=None):
-        """통합 면접 평가: 사용자와 AI 지원자 답변을 하나의 면접 레코드에 저장"""
+                                  company_id=None, position_id=None, existing_interview_id=None,
+                                  precomputed_user_results=None, precomputed_ai_results=None):
+        """
+        통합 면접 평가: 사용자와 AI 지원자 답변을 하나의 면접 레코드에 저장
+        
+        precomputed_*_results가 주어지면 (IncrementalEvaluator가 면접 중 계산한 결과)
+        질문/답변이 일치하는 항목의 개별 평가를 재사용합니다.
+        """
         try:
             print(f"🔄 통합 면접 평가 시작: user_qas={len(user_qas)}개, ai_qas={len(ai_qas)}개")
             
@@ -199,28 +255,33 @@ class InterviewEvaluationService:
             user_resume_info = self.db_manager.get_user_resume_info(user_resume_id) if user_resume_id else {}
             ai_resume_info = self.db_manager.get_ai_resume_info(ai_resume_id) if ai_resume_id else {}
             
-            # 3. 사용자 답변 평가
+            # 3. 사용자 답변 평가 (증분 평가 결과가 있으면 재사용)
             user_results = []
             for idx, qa in enumerate(user_qas):
-                result = self._evaluate_single_question(
-                    qa, company_info, idx+1, position_info, posting_info, user_resume_info, who='user'
+                result = self._reuse_or_evaluate(
+                    qa, precomputed_user_results, idx, company_info, position_info, posting_info, user_resume_info, 'user'
                 )
                 user_results.append(result)
             
             # 4. AI 답변 평가  
             ai_results = []
             for idx, qa in enumerate(ai_qas):
-                result = self._evaluate_single_question(
-                    qa, company_info, idx+1, position_info, posting_info, ai_resume_info, who='ai_interviewer'
+                result = self._reuse_or_evaluate(
+                    qa, precomputed_ai_results, idx, company_info, position_info, posting_info, ai_resume_info, 'ai_interviewer'
                 )
                 ai_results.append(result)
             
+            reused = sum(1 for r in user_results + ai_results if r.get("final"))
+            if reused:
+                print(f"⚡ 증분 평가 결과 재사용: {reused}/{len(user_results) + len(ai_results)}개 질문")
+            
             # 5. 사용자 상세 평가 실행 (기존 상세 형식 유지)
             user_detailed_eval = None
             if user_results:
                 print("🔄 사용자 상세 평가 실행...")
                 user_detailed_eval = self.run_final_evaluation_from_memory(
-                    interview_id, user_results, company_info, position_info, posting_info, user_resume_info, 'user', save_to_db=False
+                    interview_id, user_results, company_info, position_info, posting_info, user_resume_info, 'user', save_to_db=False,
+                    precomputed_per_question=[r.get("final") for r in user_results]
                 )
             
             # 6. AI 지원자 상세 평가 실행 (기존 상세 형식 유지)
@@ -228,7 +289,8 @@ class InterviewEvaluationService:
             if ai_results:
                 print("🔄 AI 지원자 상세 평가 실행...")
                 ai_detailed_eval = self.run_final_evaluation_from_memory(
-                    interview_id, ai_results, company_info, position_info, posting_info, ai_resume_info, 'ai_interviewer', save_to_db=False
+                    interview_id, ai_results, company_info, position_info, posting_info, ai_resume_info, 'ai_interviewer', save_to_db=False,
+                    precomputed_per_question=[r.get("final") for r in ai_results]
                 )
             
             # 7. 통합 상세 피드백 구조 생성 (기존 형식 유지하면서 user/ai로 분리)
@@ -597,7 +659,7 @@ class InterviewEvaluationService:
             }
     
 
-    def run_final_evaluation_from_memory(self, interview_id: int, per_question_results: list, company_info: dict, position_info=None, posting_info=None, resume_info=None, who='user', save_to_db=True) -> dict:
+    def run_final_evaluation_from_memory(self, interview_id: int, per_question_results: list, company_info: dict, position_info=None, posting_info=None, resume_info=None, who='user', save_to_db=True, precomputed_per_question=None) -> dict:
         """
         메모리 데이터를 기반으로 최종 평가 실행 후 DB에 저장
         
@@ -608,6 +670,7 @@ class InterviewEvaluationService:
             position_info: 직군 정보
             posting_info: 공고 정보
             resume_info: 이력서 정보
+            precomputed_per_question: 증분 평가로 미리 계산된 개별 최종 결과 (인덱스 정렬)
             
         Returns:
             dict: 최종 평가 결과
@@ -641,7 +704,8 @@ class InterviewEvaluationService:
                     position_info=position_info,
                     posting_info=posting_info,
                     resume_info=resume_info,
-                    output_file=None  # 파일 저장 하지 않음
+                    output_file=None,  # 파일 저장 하지 않음
+                    precomputed_per_question=precomputed_per_question
                 )
             except Exception as e:
                 import traceback
@@ -287,7 +287,7 @@ def parse_overall_llm_result(llm_result):
     return score, feedback, summary
 
 
-def process_realtime_results(realtime_data, company_info, position_info=None, posting_info=None, resume_info=None):
+def process_realtime_results(realtime_data, company_info, position_info=None, posting_info=None, resume_info=None, precomputed=None):
     """
     실시간 평가 결과를 최종 평가 형태로 변환
     
@@ -297,6 +297,7 @@ def process_realtime_results(realtime_data, company_info, position_info=None, po
         position_info (dict): 직군 정보
         posting_info (dict): 공고 정보
         resume_info (dict): 이력서 정보
+        precomputed (list): 증분 평가에서 미리 계산된 개별 최종 결과 (인덱스 정렬, 없으면 None)
         
     Returns:
         list: 최종 평가 형태로 변환된 결과 리스트
@@ -304,34 +305,51 @@ def process_realtime_results(realtime_data, company_info, position_info=None, po
     
     final_results = []
     
-    # 각 질문에 대해 최종 통합 평가 수행
-    for item in realtime_data:
-        question = item["question"]
-        answer = item["answer"]
-        intent = item.get("intent", "")
-        ml_score = item.get("ml_score", 0)  # num_eval.py에서 생성된 점수
-        llm_evaluation = item.get("llm_evaluation", "")  # text_eval.py에서 생성된 평가
-        
-        # ML 점수와 LLM 평가를 결합한 최종 통합 평가 (앙상블 적용)
-        final_prompt = build_final_prompt(question, answer, ml_score, llm_evaluation, intent, company_info, position_info, posting_info, resume_info)
-        ensemble_result = call_llm_with_ensemble(final_prompt)
-        
-        # 결과에서 구조화된 정보 추출
-        final_score, evaluation, improvement = parse_llm_result(ensemble_result["result"])
-        
-        # 최종 결과 형태로 구성
-        final_results.append({
-            "question": question,
-            "answer": answer,
-            "intent": intent,  # text_eval.py에서 이미 추출된 의도 사용
-            "final_score": final_score,
-            "evaluation": evaluation,
-            "improvement": improvement
-        })
+    # 각 질문에 대해 최종 통합 평가 수행 (증분 평가로 이미 계산된 항목은 재사용)
+    for idx, item in enumerate(realtime_data):
+        cached = precomputed[idx] if precomputed and idx < len(precomputed) else None
+        if cached and cached.get("question") == item["question"] and cached.get("answer") == item["answer"]:
+            final_results.append(cached)
+            continue
+        final_results.append(finalize_single_result(item, company_info, position_info, posting_info, resume_info))
     
     return final_results
 
-def run_final_evaluation_from_realtime(realtime_data=None, company_info=None, position_info=None, posting_info=None, resume_info=None, realtime_file="realtime_result.json", output_file="final_evaluation_results.json"):
+def finalize_single_result(item, company_info, position_info=None, posting_info=None, resume_info=None):
+    """
+    개별 질문 하나에 대한 최종 통합 평가 (ML점수 + LLM평가 → 통합점수)
+    
+    Args:
+        item (dict): question, answer, intent, ml_score, llm_evaluation을 담은 실시간 결과
+        company_info (dict): DB에서 가져온 회사 정보
+        
+    Returns:
+        dict: 최종 평가 형태의 개별 질문 결과
+    """
+    question = item["question"]
+    answer = item["answer"]
+    intent = item.get("intent", "")
+    ml_score = item.get("ml_score", 0)  # num_eval.py에서 생성된 점수
+    llm_evaluation = item.get("llm_evaluation", "")  # text_eval.py에서 생성된 평가
+    
+    # ML 점수와 LLM 평가를 결합한 최종 통합 평가 (앙상블 적용)
+    final_prompt = build_final_prompt(question, answer, ml_score, llm_evaluation, intent, company_info, position_info, posting_info, resume_info)
+    ensemble_result = call_llm_with_ensemble(final_prompt)
+    
+    # 결과에서 구조화된 정보 추출
+    final_score, evaluation, improvement = parse_llm_result(ensemble_result["result"])
+    
+    # 최종 결과 형태로 구성
+    return {
+        "question": question,
+        "answer": answer,
+        "intent": intent,  # text_eval.py에서 이미 추출된 의도 사용
+        "final_score": final_score,
+        "evaluation": evaluation,
+        "improvement": improvement
+    }
+
+def run_final_evaluation_from_realtime(realtime_data=None, company_info=None, position_info=None, posting_info=None, resume_info=None, realtime_file="realtime_result.json", output_file="final_evaluation_results.json", precomputed_per_question=None):
     """
     실시간 결과를 바탕으로 최종 평가 실행
     
@@ -343,6 +361,7 @@ def run_final_evaluation_from_realtime(realtime_data=None, company_info=None, po
         resume_info (dict): 이력서 정보
         realtime_file (str): 실시간 결과 파일 경로 (폴백)
         output_file (str): 최종 결과 저장 파일 경로
+        precomputed_per_question (list): 증분 평가로 미리 계산된 개별 최종 결과
         
     Returns:
         dict: 최종 평가 결과 (개별+전체)
@@ -358,7 +377,7 @@ def run_final_evaluation_from_realtime(realtime_data=None, company_info=None, po
     
     # 2. 실시간 결과를 최종 평가 형태로 변환
     #    (ML점수 + LLM평가 → 통합점수 + 상세평가)
-    per_question = process_realtime_results(realtime_data, company_info, position_info, posting_info, resume_info)
+    per_question = process_realtime_results(realtime_data, company_info, position_info, posting_info, resume_info, precomputed_per_question)
     
     # 3. 전체 면접에 대한 종합 평가 수행 (앙상블 적용)
     overall_prompt = build_overall_prompt(per_question)
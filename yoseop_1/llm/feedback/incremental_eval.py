@@ -0,0 +1,170 @@
+"""
+증분 면접 평가 모듈
+
+면접이 끝난 뒤 모든 질문을 한꺼번에 평가하는 대신, 질문-답변이 확정될 때마다
+(사용자 답변 제출 직후 / AI 답변 생성 직후) 백그라운드 스레드에서 미리 평가합니다.
+
+- ML 점수(num_eval) + LLM 평가(text_eval) + 개별 최종 평가(final_eval)를 질문 단위로 수행
+- 낮은 우선순위의 전용 워커 스레드에서 실행되어 면접 진행(질문 생성/AI 답변)을 방해하지 않음
+- 결과는 session_state['incremental_eval']에 누적 저장
+- 면접 종료 시 collect()로 결과를 모아 evaluate_combined_interview에 전달하면
+  종합 평가와 개선 계획 생성만 남게 됩니다.
+"""
+
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from .api_models import QuestionAnswerPair
+
+# 낮은 우선순위 (nice 값) - 면접 진행 스레드보다 CPU를 양보
+INCREMENTAL_EVAL_NICE = int(os.getenv("INCREMENTAL_EVAL_NICE", "10"))
+
+
+def _lower_thread_priority():
+    """워커 스레드의 스케줄링 우선순위를 낮춤 (Linux에서는 스레드 단위로 적용됨)"""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), INCREMENTAL_EVAL_NICE)
+    except (AttributeError, OSError):
+        # 지원하지 않는 플랫폼에서는 우선순위 조정 없이 진행
+        pass
+
+
+def is_incremental_evaluation_enabled(settings: Dict[str, Any]) -> bool:
+    """면접 설정 또는 환경변수로 증분 평가 사용 여부 결정 (기본: 비활성화)"""
+    if settings.get('incremental_evaluation'):
+        return True
+    return os.getenv("INCREMENTAL_EVALUATION_ENABLED", "False").lower() == "true"
+
+
+class IncrementalEvaluator:
+    """질문-답변 단위 백그라운드 평가기"""
+
+    STATE_KEY = 'incremental_eval'
+
+    def __init__(self, max_workers: int = 1, service_factory: Optional[Callable[[], Any]] = None):
+        """
+        Args:
+            service_factory: 평가 서비스를 돌려주는 함수. 면접 종료 후 최종 평가와 같은
+                InterviewEvaluationService 인스턴스를 쓰도록 넘김 (없으면 전용 인스턴스 생성)
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="incremental-eval",
+            initializer=_lower_thread_priority
+        )
+        self._service = None
+        self._service_factory = service_factory
+        self._service_lock = threading.Lock()
+        self._context_lock = threading.Lock()
+
+    def _get_service(self):
+        """평가 서비스 지연 로드 (모델 로드는 워커 스레드에서 최초 1회만 수행)"""
+        with self._service_lock:
+            if self._service is None:
+                if self._service_factory is not None:
+                    self._service = self._service_factory()
+                else:
+                    from .api_service import InterviewEvaluationService
+                    self._service = InterviewEvaluationService()
+            return self._service
+
+    @staticmethod
+    def to_qa_pair(qa: Dict[str, Any]) -> QuestionAnswerPair:
+        """qa_history 항목을 평가용 QuestionAnswerPair로 변환"""
+        return QuestionAnswerPair(
+            question=qa.get('question', ''),
+            answer=qa.get('answer', ''),
+            duration=qa.get('duration') or 120,
+            question_level=qa.get('question_level') or 1,
+        )
+
+    def _get_context(self, eval_state: Dict[str, Any], ids: Dict[str, Any], who: str) -> Dict[str, Any]:
+        """세션별 평가 컨텍스트를 한 번만 조회하여 캐시"""
+        with self._context_lock:
+            contexts = eval_state['contexts']
+            if who not in contexts:
+                resume_id = ids['user_resume_id'] if who == 'user' else ids['ai_resume_id']
+                contexts[who] = self._get_service().get_evaluation_context(
+                    company_id=ids['company_id'],
+                    position_id=ids['position_id'],
+                    posting_id=ids['posting_id'],
+                    resume_id=resume_id,
+                    who=who
+                )
+            return contexts[who]
+
+    def _evaluate(self, eval_state: Dict[str, Any], ids: Dict[str, Any], qa_pair: QuestionAnswerPair,
+                  index: int, who: str) -> Dict[str, Any]:
+        service = self._get_service()
+        context = self._get_context(eval_state, ids, who)
+        return service.evaluate_single_question_incremental(qa_pair, context, index + 1, who=who)
+
+    def submit(self, session_state: Dict[str, Any], qa_entry: Dict[str, Any]) -> None:
+        """
+        qa_history에 새 항목이 추가된 직후 호출 (이벤트 루프 내에서)
+
+        평가 작업을 워커 스레드에 큐잉하고 즉시 반환합니다.
+        """
+        answerer = qa_entry.get('answerer')
+        if answerer not in ('user', 'ai'):
+            return
+        who = 'user' if answerer == 'user' else 'ai_interviewer'
+
+        eval_state = session_state.setdefault(self.STATE_KEY, {
+            'user': [],
+            'ai_interviewer': [],
+            'contexts': {},
+            'pending': [],
+        })
+
+        # 평가 시 사용하는 인덱스는 answerer별 qa_history 순서와 동일해야 함
+        index = sum(1 for qa in session_state.get('qa_history', []) if qa.get('answerer') == answerer) - 1
+        if index < 0:
+            return
+
+        ids = {
+            'company_id': session_state.get('company_numeric_id') or session_state.get('company_id'),
+            'position_id': session_state.get('position_id'),
+            'posting_id': session_state.get('posting_id'),
+            'user_resume_id': session_state.get('user_resume_id'),
+            'ai_resume_id': session_state.get('ai_resume_id'),
+        }
+
+        results: List[Optional[Dict[str, Any]]] = eval_state[who]
+        while len(results) <= index:
+            results.append(None)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._executor, self._evaluate, eval_state, ids, self.to_qa_pair(qa_entry), index, who
+        )
+
+        def _store(done: asyncio.Future) -> None:
+            eval_state['pending'].remove(done)
+            if done.cancelled() or done.exception() is not None:
+                return
+            results[index] = done.result()
+
+        eval_state['pending'].append(future)
+        future.add_done_callback(_store)
+
+    async def collect(self, session_state: Dict[str, Any]) -> Tuple[List[Optional[Dict[str, Any]]], List[Optional[Dict[str, Any]]]]:
+        """
+        대기 중인 평가가 끝날 때까지 기다린 뒤 (사용자 결과, AI 결과)를 반환
+
+        평가 중 예외가 난 항목은 None으로 남으며 (evaluate_single_question_incremental은 실패 시
+        오류 자리표시 결과를 만들지 않고 예외를 냄), 최종 평가 시 해당 질문만 다시 평가됩니다.
+        """
+        eval_state = session_state.get(self.STATE_KEY)
+        if not eval_state:
+            return [], []
+        pending = list(eval_state['pending'])
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return list(eval_state['user']), list(eval_state['ai_interviewer'])
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,239 @@
+"""
+답변 품질 ML 모델 경량화 모듈
+
+AutoGluon TabularPredictor(다중 모델 앙상블)를 단일 LightGBM 모델로 증류(distillation)하여
+네이티브 텍스트 포맷으로 저장하고, num_eval에서 그대로 쓸 수 있는 경량 스코어러를 제공합니다.
+
+- export_native_model(): 교사 모델(AutoGluon) 예측값으로 LightGBM 학생 모델 학습 + 저장
+- build_parity_report(): 홀드아웃 세트에서 교사/학생 점수 일치도 및 지연시간 비교
+- NativeScorer: TabularPredictor.predict와 동일한 인터페이스의 단일 모델 스코어러
+
+사용법:
+    python -m llm.feedback.native_model --data interview_data.json
+
+작성자: AI Assistant
+"""
+
+import os
+import json
+import time
+import argparse
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+
+NATIVE_MODEL_DIR = os.path.join(os.path.dirname(__file__), "native_model")
+NATIVE_MODEL_PATH = os.path.join(NATIVE_MODEL_DIR, "num_eval_lgbm.txt")
+PARITY_REPORT_PATH = os.path.join(NATIVE_MODEL_DIR, "parity_report.json")
+
+# 학생 모델 기본 하이퍼파라미터 (점수 회귀용 단일 GBM)
+DEFAULT_LGBM_PARAMS = {
+    "objective": "regression",
+    "learning_rate": 0.05,
+    "num_leaves": 31,
+    "min_data_in_leaf": 10,
+    "feature_fraction": 0.5,
+    "bagging_fraction": 0.8,
+    "bagging_freq": 1,
+    "lambda_l2": 1.0,
+    "verbosity": -1,
+}
+
+
+class NativeScorer:
+    """
+    LightGBM 네이티브 모델 기반 스코어러
+
+    TabularPredictor.predict(df)와 같은 방식으로 호출할 수 있으며,
+    numpy 배열을 직접 전달하면 DataFrame 변환 없이 바로 점수를 계산합니다.
+    """
+
+    def __init__(self, model_file: str = NATIVE_MODEL_PATH):
+        import lightgbm as lgb
+        self.model_file = model_file
+        self.booster = lgb.Booster(model_file=model_file)
+        self.feature_names: List[str] = self.booster.feature_name()
+
+    def predict(self, data) -> np.ndarray:
+        if hasattr(data, "columns"):
+            data = data[self.feature_names].to_numpy(dtype=np.float64)
+        vector = np.asarray(data, dtype=np.float64)
+        if vector.ndim == 1:
+            vector = vector.reshape(1, -1)
+        # 단일 행 예측에서는 스레드 생성 비용이 더 크므로 1스레드로 고정
+        return self.booster.predict(vector, num_threads=1)
+
+
+def _load_teacher_training_features(predictor) -> "pd.DataFrame":
+    """교사 모델 학습에 사용된 원본 특성 (f0..fN) 복원"""
+    X = predictor.load_data_internal(data='train', return_y=False)
+    # 피처 생성 단계에서 제거된(상수 등) 원본 컬럼은 0으로 채워 원본 스키마 유지
+    return X.reindex(columns=predictor.original_features, fill_value=0.0)
+
+
+def _embed_qa_file(json_path: str, encoder_name: str) -> "pd.DataFrame":
+    """num_eval 포맷 JSON(question/answer 목록)을 임베딩 특성으로 변환"""
+    import pandas as pd
+    from .num_eval import load_encoder, load_interview_data, embed_qa_pair
+
+    encoder = load_encoder(encoder_name)
+    rows = [embed_qa_pair(item.get("question", ""), item.get("answer", ""), encoder)[0]
+            for item in load_interview_data(json_path)]
+    matrix = np.vstack(rows)
+    return pd.DataFrame(matrix, columns=[f'f{i}' for i in range(matrix.shape[1])])
+
+
+def _mixup(X: np.ndarray, copies: int, seed: int) -> np.ndarray:
+    """행 쌍 사이를 보간한 합성 샘플 생성 (증류 데이터 확장용)"""
+    if copies <= 0 or len(X) < 2:
+        return np.empty((0, X.shape[1]))
+    rng = np.random.default_rng(seed)
+    n = len(X) * copies
+    left = rng.integers(0, len(X), n)
+    right = rng.integers(0, len(X), n)
+    lam = rng.uniform(0.0, 1.0, (n, 1))
+    return lam * X[left] + (1.0 - lam) * X[right]
+
+
+def build_parity_report(predictor, scorer: NativeScorer, X_holdout, sample_rows: int = 200) -> Dict[str, Any]:
+    """홀드아웃 세트에서 교사(AutoGluon)와 학생(LightGBM) 점수 일치도 및 단건 지연시간 비교"""
+    teacher = np.asarray(predictor.predict(X_holdout), dtype=np.float64)
+    student = scorer.predict(X_holdout.to_numpy(dtype=np.float64))
+    diff = student - teacher
+
+    ss_res = float(np.sum(diff ** 2))
+    ss_tot = float(np.sum((teacher - teacher.mean()) ** 2))
+    corr = float(np.corrcoef(teacher, student)[0, 1]) if len(teacher) > 1 else 1.0
+
+    # 단건 예측 지연시간 (num_eval 실제 사용 패턴과 동일하게 1행씩)
+    n = min(sample_rows, len(X_holdout))
+    teacher_rows = [X_holdout.iloc[[i]] for i in range(n)]
+    student_rows = [X_holdout.iloc[i].to_numpy(dtype=np.float64) for i in range(n)]
+
+    start = time.perf_counter()
+    for row in teacher_rows:
+        predictor.predict(row)
+    teacher_latency = (time.perf_counter() - start) / max(n, 1)
+
+    start = time.perf_counter()
+    for row in student_rows:
+        scorer.predict(row)
+    student_latency = (time.perf_counter() - start) / max(n, 1)
+
+    return {
+        "holdout_rows": int(len(teacher)),
+        "mae": float(np.mean(np.abs(diff))),
+        "max_abs_error": float(np.max(np.abs(diff))),
+        "rmse": float(np.sqrt(np.mean(diff ** 2))),
+        "r2": 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0,
+        "pearson": corr,
+        "teacher_latency_us": teacher_latency * 1e6,
+        "student_latency_us": student_latency * 1e6,
+        "speedup": teacher_latency / student_latency if student_latency > 0 else None,
+        "model_file_bytes": os.path.getsize(scorer.model_file),
+    }
+
+
+def export_native_model(model_path: Optional[str] = None, data_path: Optional[str] = None,
+                        output_path: str = NATIVE_MODEL_PATH, report_path: str = PARITY_REPORT_PATH,
+                        holdout_ratio: float = 0.2, valid_ratio: float = 0.1, mixup_copies: int = 3,
+                        num_boost_round: int = 600, seed: int = 42) -> Dict[str, Any]:
+    """
+    AutoGluon 예측기를 단일 LightGBM 모델로 증류하여 저장
+
+    Args:
+        model_path: AutoGluon 모델 경로 (기본: num_eval.MODEL_PATH)
+        data_path: 추가 증류 데이터 (num_eval 포맷 JSON). 없으면 교사 모델 학습 데이터만 사용
+        output_path: LightGBM 네이티브 모델 저장 경로
+        report_path: 패리티 리포트(JSON) 저장 경로
+        holdout_ratio: 패리티 측정용 홀드아웃 비율 (학습과 조기 종료에 쓰지 않음)
+        valid_ratio: 조기 종료 검증용 비율 (홀드아웃을 뺀 나머지 행에서 분리)
+        mixup_copies: 원본 1행당 생성할 보간 샘플 수
+        num_boost_round: 최대 부스팅 라운드 (검증 세트 기준 조기 종료)
+
+    Returns:
+        dict: 패리티 리포트
+    """
+    import pandas as pd
+    import lightgbm as lgb
+    from .num_eval import load_autogluon_model, MODEL_PATH, ENCODER_NAME
+
+    predictor = load_autogluon_model(model_path or MODEL_PATH)
+    if predictor.problem_type != 'regression':
+        raise ValueError(f"회귀 모델만 증류할 수 있습니다. (problem_type={predictor.problem_type})")
+
+    frames = [_load_teacher_training_features(predictor)]
+    if data_path:
+        frames.append(_embed_qa_file(data_path, ENCODER_NAME))
+    X = pd.concat(frames, ignore_index=True)
+    print(f"증류 데이터: {len(X)}행, {X.shape[1]}개 특성")
+
+    # 홀드아웃 / 조기 종료 검증 세트 분리 (증강 이전의 실제 데이터에서만)
+    # 홀드아웃은 패리티 측정에만 쓰므로 조기 종료 검증에 다시 쓰지 않음
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(X))
+    n_holdout = max(1, int(len(X) * holdout_ratio))
+    n_valid = max(1, int(len(X) * valid_ratio))
+    X_holdout = X.iloc[order[:n_holdout]].reset_index(drop=True)
+    X_valid = X.iloc[order[n_holdout:n_holdout + n_valid]].reset_index(drop=True)
+    X_train = X.iloc[order[n_holdout + n_valid:]].reset_index(drop=True)
+    if X_train.empty:
+        raise ValueError(f"학습에 쓸 행이 없습니다. (전체 {len(X)}행, 홀드아웃 {n_holdout}행, 검증 {len(X_valid)}행)")
+
+    train_matrix = X_train.to_numpy(dtype=np.float64)
+    train_matrix = np.vstack([train_matrix, _mixup(train_matrix, mixup_copies, seed)])
+    train_frame = pd.DataFrame(train_matrix, columns=X.columns)
+
+    # 교사 모델의 예측값이 학생 모델의 학습 타깃
+    print("교사 모델 예측 계산 중...")
+    y_train = np.asarray(predictor.predict(train_frame), dtype=np.float64)
+    y_valid = np.asarray(predictor.predict(X_valid), dtype=np.float64)
+
+    params = dict(DEFAULT_LGBM_PARAMS, seed=seed)
+    train_set = lgb.Dataset(train_matrix, label=y_train, feature_name=list(X.columns))
+    valid_set = lgb.Dataset(X_valid.to_numpy(dtype=np.float64), label=y_valid, reference=train_set)
+    booster = lgb.train(
+        params, train_set, num_boost_round=num_boost_round, valid_sets=[valid_set],
+        callbacks=[lgb.early_stopping(50, verbose=False)]
+    )
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    booster.save_model(output_path, num_iteration=booster.best_iteration)
+    print(f"네이티브 모델 저장 완료: {output_path} (트리 {booster.best_iteration}개)")
+
+    report = build_parity_report(predictor, NativeScorer(output_path), X_holdout)
+    report.update({
+        "teacher_model_path": model_path or MODEL_PATH,
+        "student_model_path": output_path,
+        "distill_rows": int(len(train_matrix)),
+        "valid_rows": int(len(X_valid)),
+        "num_trees": int(booster.best_iteration),
+    })
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"패리티 리포트 저장 완료: {report_path}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AutoGluon 답변 품질 모델 경량화(LightGBM 증류) 도구')
+    parser.add_argument('--model-path', default=None, help='AutoGluon 모델 경로 (기본: llm/feedback/automl)')
+    parser.add_argument('--data', default=None, help='추가 증류 데이터 (question/answer JSON)')
+    parser.add_argument('--output', default=NATIVE_MODEL_PATH, help='네이티브 모델 저장 경로')
+    parser.add_argument('--report', default=PARITY_REPORT_PATH, help='패리티 리포트 저장 경로')
+    parser.add_argument('--holdout-ratio', type=float, default=0.2, help='홀드아웃 비율')
+    parser.add_argument('--valid-ratio', type=float, default=0.1, help='조기 종료 검증 비율')
+    parser.add_argument('--mixup-copies', type=int, default=3, help='원본 1행당 보간 샘플 수')
+    parser.add_argument('--rounds', type=int, default=600, help='최대 부스팅 라운드')
+    args = parser.parse_args()
+
+    report = export_native_model(
+        model_path=args.model_path, data_path=args.data, output_path=args.output,
+        report_path=args.report, holdout_ratio=args.holdout_ratio, valid_ratio=args.valid_ratio,
+        mixup_copies=args.mixup_copies, num_boost_round=args.rounds
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
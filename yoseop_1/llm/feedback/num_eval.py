@@ -1,19 +1,43 @@
 import json
 import numpy as np
 import pandas as pd
-from autogluon.tabular import TabularPredictor
 from sentence_transformers import SentenceTransformer
 
 # 모델 및 인코더 이름  
 import os
+from .native_model import NativeScorer, NATIVE_MODEL_PATH
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "automl")
 ENCODER_NAME = "BM-K/KoSimCSE-roberta"
 DATA_PATH = "interview_data.json"
 OUTPUT_PATH = "scored_results.json"
 
-def load_model(model_path: str):
+# 점수 모델 백엔드: auto(경량 모델이 있으면 사용) | native | autogluon
+NUM_EVAL_BACKEND = os.getenv("NUM_EVAL_BACKEND", "auto").lower()
+
+def load_autogluon_model(model_path: str):
+    # AutoGluon은 의존성이 매우 크므로 실제로 필요할 때만 import
+    from autogluon.tabular import TabularPredictor
     return TabularPredictor.load(model_path, require_version_match=False)
 
+def load_model(model_path: str):
+    """
+    점수 모델 로드 - native_model.py로 내보낸 경량 LightGBM 모델이 있으면 우선 사용
+    (NUM_EVAL_BACKEND=autogluon 이면 항상 원본 AutoGluon 예측기 사용)
+    """
+    if NUM_EVAL_BACKEND != "autogluon" and os.path.exists(NATIVE_MODEL_PATH):
+        return NativeScorer(NATIVE_MODEL_PATH)
+    if NUM_EVAL_BACKEND == "native":
+        raise FileNotFoundError(f"경량 모델 파일이 없습니다: {NATIVE_MODEL_PATH} (python -m llm.feedback.native_model 로 생성)")
+    return load_autogluon_model(model_path)
+
+def predict_score(model, vector: np.ndarray) -> float:
+    """임베딩 벡터 1행에 대한 점수 예측 (경량 모델은 DataFrame 변환 생략)"""
+    if isinstance(model, NativeScorer):
+        return float(model.predict(vector)[0])
+    columns = [f'f{i}' for i in range(vector.shape[1])]
+    df = pd.DataFrame(vector, columns=columns)
+    return float(model.predict(df)[0])
+
 def load_encoder(model_name: str):
     return SentenceTransformer(model_name)
 
@@ -32,10 +56,8 @@ def score_interview_data(data: list, model, encoder: SentenceTransformer) -> lis
         question = item.get("question", "")
         answer = item.get("answer", "")
         vector = embed_qa_pair(question, answer, encoder)
-        columns = [f'f{i}' for i in range(vector.shape[1])]
-        df = pd.DataFrame(vector, columns=columns)
-        score = model.predict(df)[0]
-        results.append({"question": question, "answer": answer, "score": float(score)})
+        score = predict_score(model, vector)
+        results.append({"question": question, "answer": answer, "score": score})
     return results
 
 def save_results(results: list, output_path: str):
@@ -50,10 +72,7 @@ def evaluate_single_qa(question: str, answer: str, model=None, encoder=None) ->
         encoder = load_encoder(ENCODER_NAME)
     
     vector = embed_qa_pair(question, answer, encoder)
-    columns = [f'f{i}' for i in range(vector.shape[1])]
-    df = pd.DataFrame(vector, columns=columns)
-    score = model.predict(df)[0]
-    return float(score)
+    return predict_score(model, vector)
 
 # 이 모듈은 다른 파일에서 import하여 사용됩니다.
 # 직접 실행이 필요한 경우 main.py를 사용하세요.
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+캘리브레이션 동시 처리 벤치마크
+
+세션 수를 늘려가며 각 세션이 별도 스레드에서 process_frame을 연속 호출할 때
+세션당 처리 FPS를 측정합니다. FaceMesh 풀 크기 1은 기존 전역 잠금(모든 세션 직렬 처리)과 같은 조건입니다.
+
+측정 중에는 단계가 넘어가지 않도록 준비 시간을 길게 설정하여 매 프레임 추론이 일어나게 합니다.
+
+사용법:
+    python scripts/benchmarks/calibration_concurrency_benchmark.py --sessions 1 2 4 8 --seconds 5
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.calibration_service import GazeCalibrationManager
+from backend.services.gaze_core import GazeConfig, FaceMeshPool
+
+
+def make_frame(width: int, height: int, seed: int) -> np.ndarray:
+    """얼굴 모양 도형이 있는 합성 웹캠 프레임 (세션마다 조금씩 다름)"""
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+    cx, cy = width // 2 + seed % 20, height // 2
+    cv2.ellipse(frame, (cx, cy), (width // 6, height // 4), 0, 0, 360, (180, 200, 220), -1)
+    cv2.circle(frame, (cx - width // 16, cy - height // 16), 8, (20, 20, 20), -1)
+    cv2.circle(frame, (cx + width // 16, cy - height // 16), 8, (20, 20, 20), -1)
+    _, encoded = cv2.imencode('.jpg', frame)  # 실제 요청처럼 JPEG 왕복
+    return cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+
+
+def run_sessions(manager: GazeCalibrationManager, sessions: int, seconds: float,
+                 width: int, height: int) -> list:
+    """세션별 스레드에서 seconds 동안 프레임 처리, 세션별 FPS 반환"""
+    session_ids = []
+    for _ in range(sessions):
+        session_id = manager.create_session()
+        manager.start_calibration(session_id)
+        session_ids.append(session_id)
+
+    counts = [0] * sessions
+    start_barrier = threading.Barrier(sessions + 1)
+    deadline = [0.0]
+
+    def worker(index: int, session_id: str):
+        frame = make_frame(width, height, index)
+        start_barrier.wait()
+        while time.perf_counter() < deadline[0]:
+            manager.process_frame(session_id, frame)
+            counts[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i, sid)) for i, sid in enumerate(session_ids)]
+    for thread in threads:
+        thread.start()
+    deadline[0] = time.perf_counter() + seconds
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    return [count / seconds for count in counts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캘리브레이션 동시 처리 벤치마크')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8], help='동시 세션 수 목록')
+    parser.add_argument('--seconds', type=float, default=5.0, help='세션 수별 측정 시간 (초)')
+    parser.add_argument('--size', default='640x480', help='프레임 해상도')
+    parser.add_argument('--pool-size', type=int, default=GazeConfig.FACE_MESH_POOL_SIZE,
+                        help='FaceMesh 풀 크기 (1 = 기존 전역 잠금과 동일한 직렬 처리)')
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+
+    print(f"프레임 {width}x{height}, 측정 {args.seconds:.0f}초, CPU {os.cpu_count()}개")
+    print(f"{'pool':>6}{'sessions':>10}{'fps/session':>14}{'min':>8}{'total fps':>12}")
+
+    for pool_size in sorted({1, args.pool_size}):
+        for sessions in args.sessions:
+            manager = GazeCalibrationManager()
+            manager.face_mesh_pool = FaceMeshPool(max_size=pool_size, initial=manager.face_mesh)
+            manager.preparation_time = 1e9  # 측정 중 단계 진행 방지
+
+            # 풀 인스턴스 생성(모델 로딩)이 측정에 섞이지 않도록 짧게 예열
+            run_sessions(manager, sessions, 1.0, width, height)
+            fps = run_sessions(manager, sessions, args.seconds, width, height)
+            print(f"{pool_size:>6}{sessions:>10}{np.mean(fps):>14.1f}{min(fps):>8.1f}{sum(fps):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
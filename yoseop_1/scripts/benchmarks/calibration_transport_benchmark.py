@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+캘리브레이션 프레임 전송 형식 벤치마크
+
+기존 /gaze/calibration/frame 경로(data URL 문자열 → base64 디코딩 → imdecode)와
+WebSocket 바이너리 경로(decode_frame_message: 4바이트 헤더 + 이미지 바이트를 바로 imdecode)의
+서버 측 프레임당 디코딩 비용과 전송 크기를 비교합니다.
+HTTP 요청/폼 파싱 오버헤드와 MediaPipe 추론은 포함하지 않으므로 실제 차이는 이보다 큽니다.
+
+사용법:
+    python scripts/benchmarks/calibration_transport_benchmark.py --frames 500 --size 640x480
+"""
+
+import os
+import sys
+import time
+import base64
+import argparse
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import FRAME_HEADER, decode_frame_message
+
+
+def make_frame(width: int, height: int) -> np.ndarray:
+    """얼굴 모양 도형이 있는 웹캠 프레임 흉내 (결정적)"""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+    cv2.ellipse(frame, (width // 2, height // 2), (width // 8, height // 5), 0, 0, 360, (180, 200, 220), -1)
+    return frame
+
+
+def decode_legacy(frame_data: str) -> np.ndarray:
+    """기존 HTTP 경로와 같은 디코딩"""
+    if ',' in frame_data:
+        frame_data = frame_data.split(',')[1]
+    image_bytes = base64.b64decode(frame_data)
+    return cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+
+
+def timed(fn, payloads):
+    start = time.perf_counter()
+    for payload in payloads:
+        fn(payload)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캘리브레이션 프레임 전송 형식 벤치마크')
+    parser.add_argument('--frames', type=int, default=500, help='디코딩 반복 수')
+    parser.add_argument('--size', default='640x480', help='프레임 해상도')
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    frame = make_frame(width, height)
+
+    print(f"{'format':<8}{'quality':>8}{'legacy(us)':>12}{'binary(us)':>12}{'speedup':>10}"
+          f"{'legacy KB':>11}{'binary KB':>11}{'match':>8}")
+    for ext, flag in (('.jpg', cv2.IMWRITE_JPEG_QUALITY), ('.webp', cv2.IMWRITE_WEBP_QUALITY)):
+        for quality in (60, 80):
+            ok, encoded = cv2.imencode(ext, frame, [flag, quality])
+            if not ok:
+                continue
+            image = encoded.tobytes()
+            mime = 'jpeg' if ext == '.jpg' else 'webp'
+            legacy_payload = f"data:image/{mime};base64," + base64.b64encode(image).decode()
+            binary_payload = FRAME_HEADER.pack(1234) + image
+
+            t_legacy = timed(decode_legacy, [legacy_payload] * args.frames)
+            t_binary = timed(decode_frame_message, [binary_payload] * args.frames)
+            match = bool(np.array_equal(decode_legacy(legacy_payload), decode_frame_message(binary_payload)[1]))
+            print(f"{ext[1:]:<8}{quality:>8}{t_legacy / args.frames * 1e6:>12.1f}"
+                  f"{t_binary / args.frames * 1e6:>12.1f}{t_legacy / t_binary:>10.2f}"
+                  f"{len(legacy_payload) / 1024:>11.1f}{len(binary_payload) / 1024:>11.1f}{str(match):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+얼굴 ROI 추적 벤치마크
+
+실제 얼굴이 나오는 동영상을 원본 해상도로 디코딩해, FaceMesh에 전체 프레임을 넣는 방식과
+FaceRoiTracker로 직전 얼굴 주변만 잘라 넣는 방식의 프레임당 추론 시간(RGB 변환 포함)과
+시선 포인트 / 얼굴 크기 차이를 비교합니다. MediaPipe가 필요하며, 합성 영상에서는 얼굴이 검출되지 않습니다.
+
+ROI 방식의 시간에는 크롭 전용 FaceMesh 생성, 영역이 바뀔 때의 재추적 추론, 크롭에서 놓친 프레임의
+전체 프레임 재검출이 모두 포함됩니다.
+
+사용법:
+    python scripts/benchmarks/face_roi_benchmark.py --video interview_720p.webm --frame-skip 3
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import GazeCoreProcessor, FaceRoiTracker, iter_sampled_frames
+
+
+def run(processor: GazeCoreProcessor, frames, use_roi: bool):
+    """프레임별 (시선 포인트, 얼굴 크기)와 총 추론 시간. 방식마다 새 FaceMesh로 같은 조건에서 측정"""
+    face_mesh = processor.create_face_mesh()
+    samples = []
+    start = time.perf_counter()
+    tracker = FaceRoiTracker(face_mesh_factory=processor.create_face_mesh) if use_roi else None
+    for frame in frames:
+        points = processor.locate_face(face_mesh, frame, tracker)
+        if points is None:
+            samples.append(None)
+        else:
+            samples.append((processor.gaze_point_from_array(points), processor.face_size_from_array(points)))
+    if tracker is not None:
+        tracker.close()
+    elapsed = time.perf_counter() - start
+    face_mesh.close()
+    return samples, elapsed, tracker
+
+
+def main():
+    parser = argparse.ArgumentParser(description='얼굴 ROI 추적 벤치마크')
+    parser.add_argument('--video', required=True, help='얼굴이 나오는 동영상 경로 (HD 권장)')
+    parser.add_argument('--frame-skip', type=int, default=3, help='프레임 스킵 간격')
+    parser.add_argument('--max-frames', type=int, default=600, help='분석할 최대 샘플 프레임 수')
+    args = parser.parse_args()
+
+    cap = cv2.VideoCapture(args.video)
+    if not cap.isOpened():
+        raise SystemExit(f"동영상을 열 수 없습니다: {args.video}")
+    frames = []
+    for _, frame in iter_sampled_frames(cap, args.frame_skip):
+        frames.append(frame)
+        if len(frames) >= args.max_frames:
+            break
+    cap.release()
+    if not frames:
+        raise SystemExit("샘플 프레임이 없습니다.")
+
+    processor = GazeCoreProcessor()
+    full, t_full, _ = run(processor, frames, use_roi=False)
+    roi, t_roi, tracker = run(processor, frames, use_roi=True)
+
+    both = [(a, b) for a, b in zip(full, roi) if a and b and a[0] and b[0]]
+    gaze_err = np.array([np.hypot(a[0][0] - b[0][0], a[0][1] - b[0][1]) for a, b in both])
+    size_err = np.array([abs(a[1] - b[1]) / a[1] for a, b in both])
+
+    h, w = frames[0].shape[:2]
+    print(f"동영상: {w}x{h}, 샘플 {len(frames)}프레임 (frame_skip={args.frame_skip})")
+    print(f"{'mode':<6}{'ms/frame':>10}{'detected':>10}")
+    print(f"{'full':<6}{t_full / len(frames) * 1e3:>10.2f}{sum(1 for s in full if s):>10}")
+    print(f"{'roi':<6}{t_roi / len(frames) * 1e3:>10.2f}{sum(1 for s in roi if s):>10}")
+    print(f"speedup: {t_full / t_roi:.2f}x / 크롭 {tracker.cropped}회, 전체 {tracker.full}회, 재검출 {tracker.lost}회, "
+          f"영역 변경 재추적 {tracker.reprimes}회 (시간에 포함)")
+    if both:
+        print(f"시선 포인트 차이: 평균 {gaze_err.mean():.2f}px, 최대 {gaze_err.max():.2f}px / "
+              f"얼굴 크기 차이: 평균 {size_err.mean() * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+시선 분석 벤치마크 스위트
+
+결정적인 합성 얼굴 동영상(해상도 / 길이 / 코덱 조합)을 만들어 동영상 분석 경로(GazeAnalyzer.analyze_video_from_s3)와
+캘리브레이션 경로(decode_frame_message + GazeCalibrationManager.process_frame)를 실행하고,
+처리 속도(fps), 최대 메모리(peak RSS), 점수 안정성을 JSON으로 기록합니다. 네트워크와 GPU 없이 실행됩니다.
+
+- 동영상: 고정 시드 궤적(응시 / 눈동자 이동 / 머리 이동 / 시선 이탈 / 얼굴 없음 구간)을 OpenCV VideoWriter로 인코딩
+  (프레임 내용은 시드로 결정되고, 인코딩 바이트는 OpenCV 빌드의 인코더에 따라 달라질 수 있음)
+- S3: 로컬 폴더를 S3 클라이언트처럼 제공하는 LocalObjectStore로 대체 (다운로드 / 스트리밍 경로 그대로 실행)
+- FaceMesh:
+    synthetic (기본) 합성 얼굴의 피부/동공 색을 찾아 FaceMesh 형식의 랜드마크를 돌려주는 대용 모델.
+                     디코딩, 샘플링, ROI, 통계, 점수 계산 등 FaceMesh를 뺀 파이프라인 전체를 측정하고
+                     정답 궤적으로 계산한 기준 점수와 비교할 수 있음
+    mediapipe        실제 FaceMesh (합성 얼굴은 검출되지 않으므로 --video로 실제 녹화 영상을 추가해 사용)
+- 케이스마다 별도 프로세스에서 실행하므로 peak RSS는 케이스별 값입니다 (FFmpeg는 자식 프로세스 최대값으로 별도 기록).
+- 구간 병렬 분석은 코어 수에 따라 결과가 달라지므로 기본값은 --parallel-workers 1입니다.
+
+사용법:
+    python scripts/benchmarks/gaze_benchmark_suite.py --output gaze_bench.json
+    python scripts/benchmarks/gaze_benchmark_suite.py --quick --baseline gaze_bench.json --fail-on-regression
+    python scripts/benchmarks/gaze_benchmark_suite.py --facemesh mediapipe --video interview.webm
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import platform
+import tempfile
+import subprocess
+from types import SimpleNamespace
+
+# 결과 캐시가 측정에 끼어들지 않도록 비활성화 (서비스 모듈 import 전에 설정)
+os.environ.setdefault('GAZE_RESULT_CACHE_ENABLED', 'false')
+
+import cv2
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+from backend.services.gaze_core import GazeCoreProcessor, GazeConfig, FRAME_HEADER, decode_frame_message
+
+SUITE_VERSION = 1
+DECODE_W, DECODE_H = GazeConfig.STREAM_DECODE_SIZE
+VIDEO_FPS = 30
+
+# 합성 얼굴 (480p 기준 픽셀, 해상도에 비례해 확대)
+FACE_RX, FACE_RY = 80, 100
+BACKGROUND = (110, 110, 110)
+SKIN = (150, 180, 210)       # BGR
+SCLERA = (235, 235, 235)
+PUPIL = (20, 20, 20)
+CALIBRATION_EYE = 0.8        # 캘리브레이션 4점 = 눈동자 오프셋 (±0.8, ±0.8)
+
+# (이름, 너비, 높이, 길이 초, fourcc, 확장자)
+VIDEO_MATRIX = [
+    ('vga-30s-vp8', 640, 480, 30, 'VP80', '.webm'),
+    ('hd-30s-vp8', 1280, 720, 30, 'VP80', '.webm'),
+    ('hd-30s-mp4v', 1280, 720, 30, 'mp4v', '.mp4'),
+    ('hd-120s-vp8', 1280, 720, 120, 'VP80', '.webm'),
+]
+QUICK_CASES = ('vga-30s-vp8', 'hd-30s-vp8')
+CALIBRATION_SIZES = [(640, 480), (1280, 720)]
+
+
+# === 합성 동영상 ===
+
+def make_trajectory(seed: int, seconds: int):
+    """
+    프레임별 (머리 중심(정규화), 눈동자 오프셋(-1~1), 얼굴 유무)
+
+    구간 종류: 응시 / 눈동자 이동 / 머리 이동 / 시선 이탈(머리를 크게 돌림) / 얼굴 없음
+    """
+    rng = np.random.default_rng(seed)
+    total = seconds * VIDEO_FPS
+    head = np.zeros((total, 2))
+    eye = np.zeros((total, 2))
+    present = np.ones(total, bool)
+    center = np.array([0.5, 0.45])
+    head_pos, eye_pos = center.copy(), np.zeros(2)
+
+    i = 0
+    while i < total:
+        kind = rng.choice(['fixation', 'eye', 'head', 'away', 'absent'], p=[0.55, 0.2, 0.12, 0.1, 0.03])
+        length = int(rng.uniform(*{'fixation': (2, 6), 'eye': (0.3, 1.0), 'head': (0.5, 1.5),
+                                   'away': (1, 3), 'absent': (0.5, 1.5)}[kind]) * VIDEO_FPS)
+        length = max(1, min(length, total - i))
+        head_target, eye_target = head_pos, eye_pos
+        if kind == 'fixation':
+            eye_target = np.clip(eye_pos + rng.normal(0, 0.05, 2), -1, 1)
+        elif kind == 'eye':
+            eye_target = rng.uniform(-1, 1, 2)
+        elif kind == 'head':
+            head_target = center + rng.normal(0, 0.02, 2)
+        elif kind == 'away':
+            head_target = center + np.array([rng.choice([-1, 1]) * rng.uniform(0.15, 0.25), 0])
+
+        # 이동은 구간 처음 1/4 동안, 이후 유지 (시선 이탈과 얼굴 없음 구간 뒤에는 원래 자세로 복귀)
+        move = max(1, length // 4)
+        t = np.clip(np.arange(1, length + 1) / move, 0, 1)[:, None]
+        head[i:i + length] = head_pos + (head_target - head_pos) * t
+        eye[i:i + length] = eye_pos + (eye_target - eye_pos) * t
+        if kind == 'absent':
+            present[i:i + length] = False
+        if kind not in ('away', 'absent'):
+            head_pos, eye_pos = head_target, eye_target
+        i += length
+    return head, eye, present
+
+
+def face_geometry(head, width: int, height: int):
+    """머리 중심(정규화) → (중심 x, 중심 y, 반지름 x, 반지름 y) 픽셀"""
+    scale = height / 480
+    return head[0] * width, head[1] * height, FACE_RX * scale, FACE_RY * scale
+
+
+def pupil_centers(head, eye, width: int, height: int):
+    hx, hy, rx, ry = face_geometry(head, width, height)
+    return [(hx + side * 0.45 * rx + eye[0] * 0.12 * rx, hy - 0.2 * ry + eye[1] * 0.06 * ry) for side in (-1, 1)]
+
+
+def gaze_truth(head, eye, width: int, height: int):
+    """양쪽 동공 중심 평균을 분석 해상도(STREAM_DECODE_SIZE) 좌표로"""
+    (lx, ly), (rx_, ry_) = pupil_centers(head, eye, width, height)
+    return ((lx + rx_) / 2 * DECODE_W / width, (ly + ry_) / 2 * DECODE_H / height)
+
+
+def render_frame(width: int, height: int, head, eye, present: bool) -> np.ndarray:
+    frame = np.full((height, width, 3), BACKGROUND, np.uint8)
+    if not present:
+        return frame
+    shift = 4  # 1/16 픽셀 정밀도로 그려 느린 이동도 프레임마다 반영되게 함
+    fx = lambda v: int(round(v * (1 << shift)))
+    hx, hy, rx, ry = face_geometry(head, width, height)
+    cv2.ellipse(frame, (fx(hx), fx(hy)), (fx(rx), fx(ry)), 0, 0, 360, SKIN, -1, cv2.LINE_AA, shift)
+    for side, (px, py) in zip((-1, 1), pupil_centers(head, eye, width, height)):
+        ex, ey = hx + side * 0.45 * rx, hy - 0.2 * ry
+        cv2.ellipse(frame, (fx(ex), fx(ey)), (fx(0.22 * rx), fx(0.12 * ry)), 0, 0, 360, SCLERA, -1,
+                    cv2.LINE_AA, shift)
+        cv2.circle(frame, (fx(px), fx(py)), fx(max(2.0, 0.07 * rx)), PUPIL, -1, cv2.LINE_AA, shift)
+    return frame
+
+
+def ensure_video(workdir: str, name: str, width: int, height: int, seconds: int, fourcc: str, ext: str,
+                 seed: int):
+    """합성 동영상 생성 (같은 설정의 파일이 있으면 재사용). Returns: 경로 또는 None (인코더 없음)"""
+    path = os.path.join(workdir, f"{name}-s{seed}-v{SUITE_VERSION}{ext}")
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        return path
+    writer = cv2.VideoWriter(path + '.tmp' + ext, cv2.VideoWriter_fourcc(*fourcc), VIDEO_FPS, (width, height))
+    if not writer.isOpened():
+        return None
+    head, eye, present = make_trajectory(seed, seconds)
+    for i in range(len(head)):
+        writer.write(render_frame(width, height, head[i], eye[i], present[i]))
+    writer.release()
+    os.replace(path + '.tmp' + ext, path)
+    return path
+
+
+def synthetic_calibration():
+    """캘리브레이션 4점(top_left, top_right, bottom_left, bottom_right)과 초기 얼굴 크기 (분석 해상도 좌표)"""
+    center = np.array([0.5, 0.45])
+    points = [gaze_truth(center, np.array([sx, sy]) * CALIBRATION_EYE, DECODE_W, DECODE_H)
+              for sy in (-1, 1) for sx in (-1, 1)]
+    return points, 2.0 * FACE_RY
+
+
+# === FaceMesh 대용 / S3 대용 ===
+
+class SyntheticFaceMesh:
+    """
+    합성 얼굴 전용 FaceMesh 대용
+
+    피부색 영역의 외곽으로 얼굴 경계 랜드마크(10, 152, 234, 454)를, 얼굴 안 어두운 영역(동공)의 좌우 무게중심으로
+    아이리스 랜드마크(468~477)를 만들어 MediaPipe와 같은 형식(정규화 좌표)으로 돌려줍니다. 입력은 RGB입니다.
+    """
+
+    def __init__(self):
+        self._zero = SimpleNamespace(x=0.0, y=0.0, z=0.0)
+
+    def process(self, image: np.ndarray):
+        h, w = image.shape[:2]
+        small = image[::2, ::2].astype(np.int16)
+        skin = (small[:, :, 0] - small[:, :, 2]) > 30
+        ys, xs = np.nonzero(skin)
+        if len(xs) < 20:
+            return SimpleNamespace(multi_face_landmarks=None)
+        x0, x1, y0, y1 = xs.min() * 2, xs.max() * 2 + 1, ys.min() * 2, ys.max() * 2 + 1
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+
+        region = image[y0:y1 + 1, x0:x1 + 1]
+        dark_y, dark_x = np.nonzero(region.max(axis=2) < 70)
+        dark_x = dark_x + x0
+        dark_y = dark_y + y0
+        pupils = []
+        for mask in (dark_x < cx, dark_x >= cx):
+            if mask.sum() < 3:
+                return SimpleNamespace(multi_face_landmarks=None)
+            pupils.append((dark_x[mask].mean(), dark_y[mask].mean()))
+
+        landmarks = [self._zero] * 478
+        point = lambda x, y: SimpleNamespace(x=x / w, y=y / h, z=0.0)
+        for base, (px, py) in zip((468, 473), pupils):
+            for k in range(5):
+                landmarks[base + k] = point(px, py)
+        for index, (x, y) in zip((10, 152, 234, 454), ((cx, y0), (cx, y1), (x0, cy), (x1, cy))):
+            landmarks[index] = point(x, y)
+        return SimpleNamespace(multi_face_landmarks=[SimpleNamespace(landmark=landmarks)])
+
+    def close(self):
+        pass
+
+
+class CountingFaceMesh:
+    """FaceMesh.process 호출 수 집계"""
+
+    def __init__(self, face_mesh):
+        self.face_mesh = face_mesh
+        self.calls = 0
+
+    def process(self, image):
+        self.calls += 1
+        return self.face_mesh.process(image)
+
+    def close(self):
+        self.face_mesh.close()
+
+
+class LocalObjectStore:
+    """로컬 폴더를 S3 클라이언트처럼 제공 (download_file / get_object / head_object)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def download_file(self, bucket: str, key: str, local_path: str) -> None:
+        shutil.copyfile(self._path(key), local_path)
+
+    def get_object(self, Bucket: str, Key: str):
+        path = self._path(Key)
+        return {'Body': open(path, 'rb'), 'ContentLength': os.path.getsize(path)}
+
+    def head_object(self, Bucket: str, Key: str):
+        with open(self._path(Key), 'rb') as f:
+            return {'ETag': f'"{hashlib.md5(f.read()).hexdigest()}"'}
+
+
+# === 케이스 실행 (자식 프로세스) ===
+
+def peak_rss_mb():
+    """(이 프로세스 최대 RSS, 자식 프로세스 최대 RSS) MB. resource가 없으면 None"""
+    if resource is None:
+        return None, None
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024  # macOS는 바이트, Linux는 KB
+    return (round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1),
+            round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / divisor, 1))
+
+
+def configure(case: dict) -> None:
+    GazeConfig.PARALLEL_MAX_WORKERS = case['parallel_workers']
+    GazeConfig.STREAM_DECODE_ENABLED = case['decoder'] == 'pipe'
+    if case['facemesh'] == 'synthetic':
+        GazeCoreProcessor.create_face_mesh = staticmethod(SyntheticFaceMesh)
+
+
+def reference_score(analyzer, case: dict, calibration_points, initial_face_size):
+    """정답 궤적을 기준 fps 전체 프레임으로 누적한 점수 (합성 영상만)"""
+    from backend.services.gaze_stats import GazeStatsAccumulator
+    head, eye, present = make_trajectory(case['seed'], case['seconds'])
+    stats = GazeStatsAccumulator(analyzer.calculate_allowed_gaze_range(calibration_points), initial_face_size)
+    step = VIDEO_FPS // GazeConfig.STREAM_BASE_FPS
+    for i in range(step - 1, len(head), step):
+        if present[i]:
+            stats.update(gaze_truth(head[i], eye[i], case['width'], case['height']), 2.0 * FACE_RY)
+    total = len(head) // step
+    return analyzer.score_gaze_stats(stats, total, calibration_points, time.time(), lambda *_: None).gaze_score
+
+
+def run_analysis_case(case: dict) -> dict:
+    from backend.services.gaze_service import GazeAnalyzer
+
+    analyzer = GazeAnalyzer()
+    analyzer.s3_client = LocalObjectStore(os.path.dirname(case['video']))
+    analyzer.face_mesh = CountingFaceMesh(analyzer.face_mesh)
+    calibration_points, initial_face_size = synthetic_calibration()
+
+    runs = []
+    for _ in range(case['repeats']):
+        start = time.perf_counter()
+        calls_before = analyzer.face_mesh.calls
+        try:
+            result = analyzer.analyze_video_from_s3(
+                'local', os.path.basename(case['video']), calibration_points, initial_face_size,
+                frame_skip=case['frame_skip']
+            )
+            score, analyzed, error = result.gaze_score, result.analyzed_frames, None
+        except Exception as e:
+            score, analyzed, error = None, None, str(e)
+        elapsed = time.perf_counter() - start
+        runs.append({'seconds': round(elapsed, 3), 'score': score, 'analyzed_frames': analyzed,
+                     'facemesh_calls': analyzer.face_mesh.calls - calls_before, 'error': error})
+
+    best = min(run['seconds'] for run in runs)
+    scores = [run['score'] for run in runs if run['score'] is not None]
+    source_frames = case['seconds'] * VIDEO_FPS
+    report = {
+        'seconds_best': best,
+        'source_fps': round(source_frames / best, 1),
+        'realtime_factor': round(case['seconds'] / best, 2),
+        'facemesh_calls': runs[0]['facemesh_calls'],
+        'scores': [run['score'] for run in runs],
+        'score_spread': (max(scores) - min(scores)) if scores else None,
+        'errors': sorted({run['error'] for run in runs if run['error']}),
+        'runs': runs,
+    }
+    if case.get('synthetic'):
+        report['score_reference'] = reference_score(analyzer, case, calibration_points, initial_face_size)
+        report['score_error'] = abs(scores[0] - report['score_reference']) if scores else None
+    return report
+
+
+def run_calibration_case(case: dict) -> dict:
+    from backend.services.calibration_service import GazeCalibrationManager
+
+    width, height = case['width'], case['height']
+    manager = GazeCalibrationManager()
+    session_id = manager.create_session('benchmark')
+    manager.start_calibration(session_id)
+
+    # 4개 모서리를 번갈아 응시하는 웹캠 프레임 (브라우저와 같이 JPEG + 4바이트 헤더)
+    center = np.array([0.5, 0.45])
+    corners = [np.array([sx, sy]) * CALIBRATION_EYE for sy in (-1, 1) for sx in (-1, 1)]
+    messages = []
+    for i in range(case['frames']):
+        frame = render_frame(width, height, center, corners[(i // 30) % 4], True)
+        ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        messages.append(FRAME_HEADER.pack(i) + encoded.tobytes())
+
+    latencies = []
+    detected = 0
+    start = time.perf_counter()
+    for message in messages:
+        t0 = time.perf_counter()
+        _, frame = decode_frame_message(message)
+        result = manager.process_frame(session_id, frame)
+        latencies.append(time.perf_counter() - t0)
+        detected += bool(result and result.get('eye_detected'))
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1e3
+    return {
+        'seconds': round(elapsed, 3),
+        'fps': round(len(messages) / elapsed, 1),
+        'latency_p50_ms': round(float(np.percentile(latencies_ms, 50)), 2),
+        'latency_p95_ms': round(float(np.percentile(latencies_ms, 95)), 2),
+        'eye_detected_ratio': round(detected / len(messages), 3),
+        'message_kb': round(sum(len(m) for m in messages) / len(messages) / 1024, 1),
+    }
+
+
+def run_case_in_process(case: dict) -> None:
+    configure(case)
+    rss_before, _ = peak_rss_mb()
+    report = run_analysis_case(case) if case['kind'] == 'analysis' else run_calibration_case(case)
+    rss_peak, rss_children = peak_rss_mb()
+    report.update({'peak_rss_mb_before': rss_before, 'peak_rss_mb': rss_peak, 'children_peak_rss_mb': rss_children})
+    with open(case['result_path'], 'w', encoding='utf-8') as f:
+        json.dump(report, f)
+
+
+# === 스위트 (부모 프로세스) ===
+
+def run_case(case: dict) -> dict:
+    """케이스를 새 프로세스에서 실행 (peak RSS를 케이스별로 분리)"""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        result_path = f.name
+    try:
+        case = dict(case, result_path=result_path)
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-case', json.dumps(case)],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            return {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else
+                    f'exit code {completed.returncode}'}
+        with open(result_path, encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(result_path)
+
+
+def environment_info() -> dict:
+    def command_output(command):
+        try:
+            return subprocess.run(command, capture_output=True, text=True, cwd=PROJECT_ROOT).stdout.strip() or None
+        except OSError:
+            return None
+
+    try:
+        import mediapipe
+        mediapipe_version = mediapipe.__version__
+    except ImportError:
+        mediapipe_version = None
+    ffmpeg = command_output(['ffmpeg', '-version'])
+    return {
+        'suite_version': SUITE_VERSION,
+        'git_commit': command_output(['git', 'rev-parse', 'HEAD']),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'opencv': cv2.__version__,
+        'mediapipe': mediapipe_version,
+        'ffmpeg': ffmpeg.splitlines()[0] if ffmpeg else None,
+    }
+
+
+def build_cases(args, workdir: str) -> list:
+    common = {'facemesh': args.facemesh, 'parallel_workers': args.parallel_workers, 'seed': args.seed}
+    cases = []
+    matrix = [row for row in VIDEO_MATRIX if not args.quick or row[0] in QUICK_CASES]
+    for name, width, height, seconds, fourcc, ext in matrix:
+        path = ensure_video(workdir, name, width, height, seconds, fourcc, ext, args.seed)
+        for decoder in args.decoders:
+            case_id = f"analysis/{name}/{decoder}"
+            if path is None:
+                cases.append({'id': case_id, 'skipped': f"인코더 없음: {fourcc}"})
+                continue
+            cases.append(dict(common, id=case_id, kind='analysis', video=path, synthetic=True, decoder=decoder,
+                              width=width, height=height, seconds=seconds, frame_skip=args.frame_skip,
+                              repeats=args.repeats))
+    for video in args.video or []:
+        cap = cv2.VideoCapture(video)
+        fps, frames = cap.get(cv2.CAP_PROP_FPS) or VIDEO_FPS, cap.get(cv2.CAP_PROP_FRAME_COUNT)
+        width, height = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        cap.release()
+        for decoder in args.decoders:
+            cases.append(dict(common, id=f"analysis/{os.path.basename(video)}/{decoder}", kind='analysis',
+                              video=os.path.abspath(video), synthetic=False, decoder=decoder, width=width,
+                              height=height, seconds=max(int(frames / fps), 1), frame_skip=args.frame_skip,
+                              repeats=args.repeats))
+    if not args.skip_calibration:
+        for width, height in CALIBRATION_SIZES[:1] if args.quick else CALIBRATION_SIZES:
+            cases.append(dict(common, id=f"calibration/{width}x{height}", kind='calibration', decoder='pipe',
+                              width=width, height=height, frames=args.calibration_frames))
+    return cases
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """기준 결과 대비 회귀 목록 (처리 속도가 tolerance 이상 느려졌거나 점수가 바뀐 케이스)"""
+    base_cases = {case['id']: case for case in baseline.get('cases', [])}
+    regressions = []
+    print(f"\n{'case':<36}{'speed':>12}{'rss(MB)':>14}{'score':>14}")
+    for case in results['cases']:
+        base = base_cases.get(case['id'])
+        if base is None or 'error' in case or 'skipped' in case or 'error' in base or 'skipped' in base:
+            continue
+        speed_key = 'source_fps' if 'source_fps' in case else 'fps'
+        speed = case[speed_key] / base[speed_key] if base.get(speed_key) else float('nan')
+        rss = (case.get('peak_rss_mb') or 0) - (base.get('peak_rss_mb') or 0)
+        score_changed = case.get('scores') != base.get('scores')
+        print(f"{case['id']:<36}{speed:>11.2f}x{rss:>+14.1f}"
+              f"{(str(base.get('scores')) + '→' + str(case.get('scores'))) if score_changed else 'same':>14}")
+        if speed < 1 - tolerance:
+            regressions.append(f"{case['id']}: {speed_key} {base[speed_key]} → {case[speed_key]}")
+        if score_changed:
+            regressions.append(f"{case['id']}: 점수 {base.get('scores')} → {case.get('scores')}")
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    print(f"\n{'case':<36}{'fps':>9}{'x real':>8}{'calls':>7}{'score':>7}{'ref':>5}{'rss(MB)':>9}{'ffmpeg':>8}")
+    for case in results['cases']:
+        if 'skipped' in case or 'error' in case:
+            print(f"{case['id']:<36}  {case.get('skipped') or case.get('error')}")
+        elif 'source_fps' in case:
+            score = case['scores'][0] if case['scores'] else '-'
+            print(f"{case['id']:<36}{case['source_fps']:>9.1f}{case['realtime_factor']:>8.1f}"
+                  f"{case['facemesh_calls']:>7}{str(score):>7}{str(case.get('score_reference', '-')):>5}"
+                  f"{case['peak_rss_mb'] or 0:>9.1f}{case['children_peak_rss_mb'] or 0:>8.1f}"
+                  f"{'  ' + '; '.join(case['errors']) if case['errors'] else ''}")
+        else:
+            print(f"{case['id']:<36}{case['fps']:>9.1f}{'':>8}{'':>7}{'':>7}{'':>5}{case['peak_rss_mb'] or 0:>9.1f}"
+                  f"  p50 {case['latency_p50_ms']}ms / p95 {case['latency_p95_ms']}ms, "
+                  f"검출 {case['eye_detected_ratio']:.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시선 분석 벤치마크 스위트')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='처리 속도 회귀 허용 비율 (기본 10%%)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+    parser.add_argument('--quick', action='store_true', help='짧은 케이스만 실행')
+    parser.add_argument('--facemesh', choices=['synthetic', 'mediapipe'], default='synthetic')
+    parser.add_argument('--decoders', default='pipe', type=lambda v: v.split(','),
+                        help='분석 디코딩 경로 (pipe,opencv)')
+    parser.add_argument('--video', action='append', help='추가로 분석할 실제 동영상 (여러 번 지정 가능)')
+    parser.add_argument('--frame-skip', type=int, default=10, help='분석 frame_skip (서비스 기본값 10)')
+    parser.add_argument('--repeats', type=int, default=2, help='케이스별 반복 횟수 (최고 기록 사용)')
+    parser.add_argument('--parallel-workers', type=int, default=1, help='구간 병렬 분석 워커 수')
+    parser.add_argument('--calibration-frames', type=int, default=300, help='캘리브레이션 경로 프레임 수')
+    parser.add_argument('--skip-calibration', action='store_true')
+    parser.add_argument('--seed', type=int, default=7, help='합성 궤적 시드')
+    parser.add_argument('--workdir', default=os.path.join(tempfile.gettempdir(), 'gaze_benchmark_videos'),
+                        help='합성 동영상 보관 폴더 (재사용)')
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        run_case_in_process(json.loads(args.run_case))
+        return
+
+    os.makedirs(args.workdir, exist_ok=True)
+    print(f"합성 동영상 준비 중... ({args.workdir})")
+    cases = build_cases(args, args.workdir)
+
+    results = {'environment': environment_info(), 'settings': {
+        key: value for key, value in vars(args).items() if key not in ('run_case', 'output', 'baseline')
+    }, 'cases': []}
+    for case in cases:
+        print(f"▶ {case['id']}")
+        if 'skipped' in case:
+            results['cases'].append(case)
+            continue
+        report = run_case(case)
+        results['cases'].append(dict({'id': case['id'], 'kind': case['kind']}, **report))
+
+    print_table(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"⚠️ 회귀: {regression}")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
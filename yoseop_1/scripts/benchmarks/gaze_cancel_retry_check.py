@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+시선 분석 취소 후 재요청 검증
+
+작업 ID는 입력에서 만들어지므로(derive_task_id) 사용자가 분석을 취소한 뒤 다시 요청하면
+같은 작업 ID와 같은 분석 키(task:{작업 ID})로 워커 풀에 다시 제출됩니다.
+취소된 분석이 아직 중단되기 전이어도 재요청이 새 분석으로 실행되어 완료되는지 확인합니다.
+
+- 대기 중 취소: 워커가 다른 분석을 실행하는 동안 대기열의 작업을 취소하고 바로 재요청
+- 실행 중 취소: 분석이 시작된 뒤 취소하고 바로 재요청 (중단 중인 분석과 겹침)
+- 라우터와 같은 순서로 작업 저장소(GazeTaskRegistry, 메모리 DB) 상태를 갱신해 최종 상태가 completed인지 확인
+
+분석은 cancel_event를 확인하며 잠시 기다리는 대용 분석기로 실행하므로 S3와 MediaPipe 없이 동작합니다.
+실패한 회차가 있으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/benchmarks/gaze_cancel_retry_check.py --rounds 50
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
+
+# 결과 캐시가 검증에 끼어들지 않도록 비활성화 (서비스 모듈 import 전에 설정)
+os.environ.setdefault('GAZE_RESULT_CACHE_ENABLED', 'false')
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import GazeAnalysisCancelled
+from backend.services.gaze_task_registry import GazeTaskRegistry, derive_task_id
+from backend.services.gaze_worker_pool import GazeAnalysisWorkerPool
+
+
+class FakeAnalyzer:
+    """analyze_video_from_s3와 같은 시그니처로 duration초 동안 cancel_event를 확인하는 대용 분석기"""
+
+    def __init__(self, duration: float):
+        self.duration = duration
+        self.runs = 0
+        self._lock = threading.Lock()
+
+    def analyze_video_from_s3(self, progress_callback=None, cancel_event=None, **kwargs):
+        with self._lock:
+            self.runs += 1
+        deadline = time.perf_counter() + self.duration
+        while time.perf_counter() < deadline:
+            if cancel_event is not None and cancel_event.is_set():
+                raise GazeAnalysisCancelled("시선 분석이 취소되었습니다.")
+            if progress_callback:
+                progress_callback(0.5, "분석 중...")
+            time.sleep(0.005)
+        return {'key': kwargs['key']}
+
+
+class FakeAnalyzerPool(GazeAnalysisWorkerPool):
+    """워커 스레드별 GazeAnalyzer 대신 대용 분석기를 쓰는 워커 풀"""
+
+    def __init__(self, analyzer: FakeAnalyzer, max_workers: int):
+        super().__init__(max_workers=max_workers, max_queue=4)
+        self.analyzer = analyzer
+
+    def _get_analyzer(self):
+        return self.analyzer
+
+
+def submit_like_router(pool: GazeAnalysisWorkerPool, registry: GazeTaskRegistry, task_id: str, s3_key: str):
+    """라우터(/gaze/analyze)와 같은 순서: 작업 생성 → 워커 풀 제출"""
+    registry.create(task_id, {'status': 'queued', 'progress': 0.0, 'message': '분석 작업을 대기열에 추가했습니다.'})
+    return pool.submit(task_id, 'bucket', s3_key, [], progress_callback=None)
+
+
+def run_round(mode: str, duration: float, rng: random.Random) -> str:
+    """한 회차 실행. 통과하면 빈 문자열, 실패하면 사유"""
+    analyzer = FakeAnalyzer(duration)
+    pool = FakeAnalyzerPool(analyzer, max_workers=1)
+    registry = GazeTaskRegistry(':memory:')
+    s3_key = f"gaze/{mode}/{rng.randrange(1 << 30)}.webm"
+    task_id = derive_task_id('analyze', 1, s3_key, [], None, 3)
+    try:
+        blocker = None
+        if mode == 'queued':
+            # 워커를 다른 분석으로 점유해 대상 작업이 대기열에 머물게 함
+            blocker = pool.submit('blocker', 'bucket', 'gaze/blocker.webm', [])
+        first = submit_like_router(pool, registry, task_id, s3_key)
+        time.sleep(rng.uniform(0.0, duration / 2) if mode == 'running' else 0.0)
+
+        # 취소 → 같은 입력으로 재요청 (같은 작업 ID)
+        if not pool.cancel(task_id):
+            return "취소 대상 작업을 찾지 못함"
+        registry.update(task_id, {'status': 'cancelled'})
+        retry_id = derive_task_id('analyze', 1, s3_key, [], None, 3)
+        if retry_id != task_id or registry.get(retry_id)['status'] != 'cancelled':
+            return "재요청 작업 ID 또는 취소 상태가 다름"
+        second = submit_like_router(pool, registry, retry_id, s3_key)
+        if second is first:
+            return "취소된 작업 Future가 재사용됨"
+
+        try:
+            result = second.result(timeout=duration * 10 + 5)
+        except (CancelledError, GazeAnalysisCancelled):
+            return "재요청 작업이 취소된 분석 결과를 받음"
+        except FutureTimeoutError:
+            return "재요청 작업이 끝나지 않음"
+        registry.update(retry_id, {'status': 'completed', 'progress': 1.0})
+
+        if result != {'key': s3_key}:
+            return f"결과가 다름: {result}"
+        if not first.cancelled():
+            return "취소한 작업 Future가 취소 상태가 아님"
+        if blocker is not None:
+            blocker.result(timeout=duration * 10 + 5)
+
+        # 취소된 분석의 완료 콜백이 재요청 상태를 지우지 않았는지 확인
+        deadline = time.perf_counter() + 2.0
+        while (pool._jobs or pool._analyses) and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        if pool._jobs or pool._analyses:
+            return f"풀에 남은 작업: jobs={list(pool._jobs)}, analyses={list(pool._analyses)}"
+        if registry.get(retry_id)['status'] != 'completed':
+            return f"최종 상태: {registry.get(retry_id)['status']}"
+        if mode == 'running' and analyzer.runs != 2:
+            return f"분석 실행 횟수 {analyzer.runs} (기대값 2)"
+        return ""
+    finally:
+        pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시선 분석 취소 후 재요청 검증')
+    parser.add_argument('--rounds', type=int, default=50, help='모드별 반복 횟수 (취소 시점은 무작위)')
+    parser.add_argument('--duration', type=float, default=0.2, help='대용 분석 1회 소요 시간 (초)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    failed = 0
+    print(f"{'mode':>10}{'rounds':>8}{'passed':>8}  first failure")
+    for mode in ('queued', 'running'):
+        failures = [reason for reason in (run_round(mode, args.duration, rng) for _ in range(args.rounds)) if reason]
+        failed += len(failures)
+        print(f"{mode:>10}{args.rounds:>8}{args.rounds - len(failures):>8}  {failures[0] if failures else '-'}")
+
+    print("✅ 취소 후 재요청이 모두 완료되었습니다." if not failed else f"❌ 실패 {failed}회")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+시선 분석 프레임 디코딩 벤치마크
+
+합성 동영상을 만들어 기존 방식(cap.read()로 모든 프레임 디코딩 후 스킵)과
+iter_sampled_frames(grab()으로 스킵, 샘플 프레임만 retrieve())의 디코딩 시간을 비교합니다.
+FFmpeg가 있으면 기존 트랜스코딩 경로(webm→mp4 변환 후 OpenCV 디코딩)와
+FFmpegFrameReader(rawvideo 파이프) 경로의 시간과 디스크 쓰기량도 비교합니다.
+MediaPipe 추론은 포함하지 않고 순수 디코딩 비용만 측정합니다.
+
+사용법:
+    python scripts/benchmarks/gaze_decode_benchmark.py --seconds 60 --size 1280x720
+"""
+
+import os
+import sys
+import time
+import argparse
+import shutil
+import tempfile
+import hashlib
+import subprocess
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import GazeConfig, FFmpegFrameReader, iter_sampled_frames
+
+
+def create_synthetic_video(path: str, width: int, height: int, fps: int, seconds: int) -> int:
+    """움직이는 얼굴 모양 도형이 있는 합성 동영상 생성 (결정적)"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+    total = fps * seconds
+    for i in range(total):
+        frame = background.copy()
+        cx = int(width / 2 + width * 0.1 * np.sin(i / fps))
+        cy = int(height / 2 + height * 0.05 * np.cos(i / fps))
+        cv2.ellipse(frame, (cx, cy), (width // 8, height // 5), 0, 0, 360, (180, 200, 220), -1)
+        cv2.circle(frame, (cx - width // 20, cy - height // 20), 6, (20, 20, 20), -1)
+        cv2.circle(frame, (cx + width // 20, cy - height // 20), 6, (20, 20, 20), -1)
+        writer.write(frame)
+    writer.release()
+    return total
+
+
+def decode_read_all(path: str, frame_skip: int):
+    """기존 방식: 모든 프레임을 read()한 뒤 스킵"""
+    cap = cv2.VideoCapture(path)
+    digests = []
+    frame_count = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame_count += 1
+        if frame_count % frame_skip != 0:
+            continue
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        digests.append(hashlib.md5(rgb.tobytes()).hexdigest())
+    cap.release()
+    return digests
+
+
+def decode_sparse(path: str, frame_skip: int, seek_threshold: int):
+    """개선 방식: grab()으로 스킵하고 샘플 프레임만 retrieve()"""
+    cap = cv2.VideoCapture(path)
+    digests = []
+    for _, frame in iter_sampled_frames(cap, frame_skip, seek_threshold=seek_threshold):
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        digests.append(hashlib.md5(rgb.tobytes()).hexdigest())
+    cap.release()
+    return digests
+
+
+def decode_transcode_then_opencv(path: str, frame_skip: int, tmp_dir: str):
+    """기존 경로: 640x480/15fps mp4로 트랜스코딩한 뒤 OpenCV로 샘플 프레임 디코딩. (프레임 수, 중간 파일 바이트)"""
+    mp4_path = os.path.join(tmp_dir, 'transcoded.mp4')
+    width, height = GazeConfig.STREAM_DECODE_SIZE
+    subprocess.run(
+        ['ffmpeg', '-y', '-v', 'error', '-i', path, '-c:v', 'libx264', '-preset', 'faster', '-crf', '28',
+         '-s', f'{width}x{height}', '-r', str(GazeConfig.STREAM_BASE_FPS), '-an', mp4_path],
+        check=True
+    )
+    cap = cv2.VideoCapture(mp4_path)
+    frames = sum(1 for _ in iter_sampled_frames(cap, frame_skip, seek_threshold=0))
+    cap.release()
+    written = os.path.getsize(mp4_path)
+    os.remove(mp4_path)
+    return frames, written
+
+
+def decode_ffmpeg_pipe(path: str, frame_skip: int):
+    """개선 경로: FFmpeg rawvideo 파이프로 샘플 프레임만 축소 디코딩. (프레임 수, 중간 파일 바이트 = 0)"""
+    reader = FFmpegFrameReader(path, GazeConfig.STREAM_BASE_FPS / frame_skip)
+    frames = sum(1 for _ in reader)
+    return frames, 0
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시선 분석 프레임 디코딩 벤치마크')
+    parser.add_argument('--seconds', type=int, default=30, help='합성 동영상 길이 (초)')
+    parser.add_argument('--size', default='1280x720', help='해상도 (예: 640x480)')
+    parser.add_argument('--fps', type=int, default=30, help='프레임레이트')
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        video_path = os.path.join(tmp_dir, 'synthetic.mp4')
+        total = create_synthetic_video(video_path, width, height, args.fps, args.seconds)
+        print(f"합성 동영상: {width}x{height}, {args.fps}fps, {args.seconds}초 ({total}프레임)")
+        print(f"{'mode':<18}{'skip':>6}{'read_all(s)':>14}{'sparse(s)':>12}{'speedup':>10}{'frames':>8}{'match':>8}")
+
+        for mode, frame_skip in GazeConfig.FRAME_SKIP_CONFIGS.items():
+            baseline, t_base = timed(decode_read_all, video_path, frame_skip)
+            # 프레임 정확도 비교를 위해 grab/retrieve 경로만 측정 (seek은 별도 행)
+            sparse, t_sparse = timed(decode_sparse, video_path, frame_skip, 0)
+            print(f"{mode:<18}{frame_skip:>6}{t_base:>14.3f}{t_sparse:>12.3f}"
+                  f"{t_base / t_sparse:>10.2f}{len(sparse):>8}{str(baseline == sparse):>8}")
+
+        # 긴 스킵에서 seek 경로 비교 (키프레임 간격보다 긴 스킵)
+        long_skip = max(GazeConfig.SEEK_FRAME_SKIP_THRESHOLD, 60)
+        baseline, t_base = timed(decode_read_all, video_path, long_skip)
+        seeked, t_seek = timed(decode_sparse, video_path, long_skip, long_skip)
+        print(f"{'seek':<18}{long_skip:>6}{t_base:>14.3f}{t_seek:>12.3f}"
+              f"{t_base / t_seek:>10.2f}{len(seeked):>8}{str(baseline == seeked):>8}")
+
+        if shutil.which('ffmpeg') is None:
+            print("\nFFmpeg가 없어 파이프 디코딩 비교를 건너뜁니다.")
+            return
+
+        # 실제 업로드와 같은 webm(VP8) 입력으로 변환
+        webm_path = os.path.join(tmp_dir, 'synthetic.webm')
+        subprocess.run(['ffmpeg', '-y', '-v', 'error', '-i', video_path, '-c:v', 'libvpx', '-b:v', '2M', webm_path],
+                       check=True)
+        print(f"\n{'mode':<18}{'skip':>6}{'transcode(s)':>14}{'pipe(s)':>10}{'speedup':>10}"
+              f"{'frames':>14}{'disk MB':>14}")
+        for mode, frame_skip in GazeConfig.FRAME_SKIP_CONFIGS.items():
+            (base_frames, written), t_base = timed(decode_transcode_then_opencv, webm_path, frame_skip, tmp_dir)
+            (pipe_frames, _), t_pipe = timed(decode_ffmpeg_pipe, webm_path, frame_skip)
+            print(f"{mode:<18}{frame_skip:>6}{t_base:>14.3f}{t_pipe:>10.3f}{t_base / t_pipe:>10.2f}"
+                  f"{f'{base_frames}/{pipe_frames}':>14}{f'{written / 1e6:.1f}/0.0':>14}")
+
+
+if __name__ == "__main__":
+    main()
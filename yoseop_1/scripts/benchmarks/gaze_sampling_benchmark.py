@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+움직임 적응형 샘플링 벤치마크
+
+합성 면접 영상(고정 응시 구간 + 머리 이동 + 눈동자만 움직이는 구간 + 시선 이탈)을 만들고,
+기준 fps(15fps) 모든 프레임을 분석한 점수를 기준값으로 삼아
+고정 간격 샘플링(frame_skip)과 MotionAdaptiveSampler의 점수 오차와 FaceMesh 호출 수를 비교합니다.
+
+FaceMesh 대신 정답 시선 포인트에 측정 잡음을 더해 돌려주는 오라클을 사용하므로
+MediaPipe 없이 샘플링 전략만 비교합니다. 적응형 샘플러는 실제로 렌더링한 프레임에서 움직임을 측정합니다.
+추적 루프는 GazeCoreProcessor.track_frames와 같은 규칙(건너뛴 프레임은 누적하지 않음)을 따릅니다.
+
+사용법:
+    python scripts/benchmarks/gaze_sampling_benchmark.py --seconds 300 --seeds 5
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import GazeConfig, MotionAdaptiveSampler
+from backend.services.gaze_service import GazeAnalyzer
+from backend.services.gaze_stats import GazeStatsAccumulator
+
+FRAME_W, FRAME_H = GazeConfig.STREAM_DECODE_SIZE
+BASE_FPS = GazeConfig.STREAM_BASE_FPS
+FACE_SIZE = 200.0
+
+
+def make_trajectory(rng: np.random.Generator, seconds: int):
+    """프레임별 (머리 중심, 눈동자 오프셋) 궤적. 구간 종류: 응시 / 머리 이동 / 눈동자 이동 / 시선 이탈"""
+    total = seconds * BASE_FPS
+    head = np.zeros((total, 2))
+    eye = np.zeros((total, 2))
+    center = np.array([FRAME_W / 2, FRAME_H / 2])
+    head_pos, eye_pos = center.copy(), np.zeros(2)
+
+    i = 0
+    while i < total:
+        kind = rng.choice(['fixation', 'head', 'eye', 'away'], p=[0.55, 0.2, 0.15, 0.1])
+        if kind == 'fixation':
+            length = int(rng.uniform(2, 8) * BASE_FPS)
+            head_target, eye_target = head_pos, eye_pos
+        elif kind == 'head':
+            length = int(rng.uniform(0.3, 1.5) * BASE_FPS)
+            head_target = center + rng.normal(0, 25, 2)
+            eye_target = eye_pos
+        elif kind == 'eye':
+            length = int(rng.uniform(0.2, 0.6) * BASE_FPS)
+            head_target, eye_target = head_pos, rng.uniform(-6, 6, 2)
+        else:
+            length = int(rng.uniform(1, 3) * BASE_FPS)
+            head_target = center + rng.choice([-1, 1]) * np.array([rng.uniform(90, 140), 0])
+            eye_target = eye_pos
+        length = max(1, min(length, total - i))
+
+        # 이동 구간은 처음 1/3 동안 목표로 이동한 뒤 유지 (시선 이탈은 구간 끝에 원위치)
+        move = max(1, length // 3)
+        t = np.clip(np.arange(1, length + 1) / move, 0, 1)[:, None]
+        head[i:i + length] = head_pos + (head_target - head_pos) * t
+        eye[i:i + length] = eye_pos + (eye_target - eye_pos) * t
+        i += length
+        if kind == 'away':
+            head_pos = center + rng.normal(0, 10, 2)
+        else:
+            head_pos, eye_pos = head_target, eye_target
+    return head, eye
+
+
+def gaze_truth(head: np.ndarray, eye: np.ndarray) -> np.ndarray:
+    """FaceMesh가 측정하는 값 = 양쪽 눈동자 중심의 평균 (픽셀)"""
+    return head + np.array([0, -FACE_SIZE * 0.1]) + eye
+
+
+def render_frame(head_xy, eye_xy, noise: np.ndarray) -> np.ndarray:
+    """머리(타원) + 눈 + 눈동자를 그린 BGR 프레임 (센서 잡음 포함)"""
+    frame = np.full((FRAME_H, FRAME_W, 3), 40, np.uint8)
+    hx, hy = head_xy
+    cv2.ellipse(frame, (int(hx), int(hy)), (int(FACE_SIZE * 0.4), int(FACE_SIZE * 0.5)),
+                0, 0, 360, (150, 180, 210), -1, cv2.LINE_AA)
+    for side in (-1, 1):
+        ex, ey = hx + side * FACE_SIZE * 0.18, hy - FACE_SIZE * 0.1
+        cv2.ellipse(frame, (int(ex), int(ey)), (14, 8), 0, 0, 360, (235, 235, 235), -1, cv2.LINE_AA)
+        cv2.circle(frame, (int(round(ex + eye_xy[0])), int(round(ey + eye_xy[1]))), 5, (30, 20, 20), -1,
+                   cv2.LINE_AA)
+    return np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+class OracleFaceMesh:
+    """정답 시선 포인트 + 측정 잡음을 돌려주는 FaceMesh 대용 (호출 수 집계)"""
+
+    def __init__(self, truth: np.ndarray, rng: np.random.Generator, noise_px: float = 0.8):
+        self.truth = truth
+        self.rng = rng
+        self.noise_px = noise_px
+        self.calls = 0
+
+    def measure(self, index: int):
+        self.calls += 1
+        x, y = self.truth[index] + self.rng.normal(0, self.noise_px, 2)
+        return (float(x), float(y)), FACE_SIZE
+
+
+def track(indices, oracle: OracleFaceMesh, stats: GazeStatsAccumulator, sampler=None, frame_at=None):
+    """GazeCoreProcessor.track_frames와 같은 규칙의 추적 루프"""
+    for index in indices:
+        if sampler is not None and not sampler.should_analyze(frame_at(index)):
+            continue
+        sample = oracle.measure(index)
+        stats.update(*sample)
+        if sampler is not None:
+            sampler.set_focus(*sample)
+    return stats
+
+
+def scores(analyzer: GazeAnalyzer, stats: GazeStatsAccumulator):
+    jitter = analyzer.jitter_to_score((stats.x.std + stats.y.std) / 2)
+    compliance = int(stats.in_range_ratio * 100)
+    weights = GazeConfig.SCORE_WEIGHTS
+    final = int(jitter * weights['jitter'] + compliance * weights['compliance'])
+    return np.array([final, jitter, compliance])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='움직임 적응형 샘플링 벤치마크')
+    parser.add_argument('--seconds', type=int, default=300, help='합성 영상 길이 (초)')
+    parser.add_argument('--seeds', type=int, default=5, help='반복할 합성 영상 수')
+    parser.add_argument('--frame-skip', type=int, default=10, help='비교할 고정 샘플링 간격 (기준 15fps)')
+    parser.add_argument('--budget', type=float, default=None, help='분당 FaceMesh 호출 예산 (기본: 설정값)')
+    args = parser.parse_args()
+
+    analyzer = GazeAnalyzer()
+    candidate_fps, budget = GazeConfig.adaptive_sampling_plan(args.frame_skip)
+    budget = args.budget or budget
+    center = np.array([FRAME_W / 2, FRAME_H / 2 - FACE_SIZE * 0.1])
+    calibration_points = [tuple(center + offset) for offset in ((-60, -30), (60, -30), (-60, 30), (60, 30))]
+    allowed_range = analyzer.calculate_allowed_gaze_range(calibration_points)
+
+    print(f"합성 영상 {args.seconds}초 x {args.seeds}개, 기준 {BASE_FPS}fps 전체 분석 대비 점수 오차")
+    print(f"고정: frame_skip={args.frame_skip} ({BASE_FPS / args.frame_skip:.2f}fps) / "
+          f"적응형: 후보 {candidate_fps:.2f}fps, 분당 최대 {budget:.0f}회")
+    print(f"{'seed':>5}{'dense':>12}{'fixed':>18}{'adaptive':>18}{'calls(d/f/a)':>20}{'probe(us)':>11}")
+
+    errors = {'fixed': [], 'adaptive': []}
+    calls = {'fixed': 0, 'adaptive': 0}
+    for seed in range(args.seeds):
+        rng = np.random.default_rng(seed)
+        head, eye = make_trajectory(rng, args.seconds)
+        truth = gaze_truth(head, eye)
+        total = len(truth)
+        noise_bank = [rng.normal(0, 2, (FRAME_H, FRAME_W, 3)).clip(-6, 6).astype(np.int16) for _ in range(8)]
+
+        def frame_at(index: int) -> np.ndarray:
+            return render_frame(head[index], eye[index], noise_bank[index % len(noise_bank)])
+
+        dense = track(range(total), OracleFaceMesh(truth, np.random.default_rng(100 + seed)),
+                      GazeStatsAccumulator(allowed_range, FACE_SIZE))
+        reference = scores(analyzer, dense)
+
+        fixed_oracle = OracleFaceMesh(truth, np.random.default_rng(100 + seed))
+        fixed = track(range(args.frame_skip - 1, total, args.frame_skip), fixed_oracle,
+                      GazeStatsAccumulator(allowed_range, FACE_SIZE))
+
+        # FFmpeg fps 필터처럼 후보 fps 간격으로 기준 프레임을 고름
+        candidates = np.unique((np.arange(int(total * candidate_fps / BASE_FPS)) * BASE_FPS / candidate_fps)
+                               .astype(int))
+        adaptive_oracle = OracleFaceMesh(truth, np.random.default_rng(100 + seed))
+        sampler = MotionAdaptiveSampler(candidate_fps, budget)
+        start = time.perf_counter()
+        adaptive = track(candidates, adaptive_oracle, GazeStatsAccumulator(allowed_range, FACE_SIZE),
+                         sampler=sampler, frame_at=frame_at)
+        probe_us = (time.perf_counter() - start) / len(candidates) * 1e6
+
+        fixed_scores, adaptive_scores = scores(analyzer, fixed), scores(analyzer, adaptive)
+        errors['fixed'].append(np.abs(fixed_scores - reference))
+        errors['adaptive'].append(np.abs(adaptive_scores - reference))
+        calls['fixed'] += fixed_oracle.calls
+        calls['adaptive'] += adaptive_oracle.calls
+        print(f"{seed:>5}{str(reference.tolist()):>12}{str(fixed_scores.tolist()):>18}"
+              f"{str(adaptive_scores.tolist()):>18}"
+              f"{f'{total}/{fixed_oracle.calls}/{adaptive_oracle.calls}':>20}{probe_us:>11.0f}")
+
+    minutes = args.seconds * args.seeds / 60
+    print(f"\n{'strategy':<10}{'calls/min':>10}{'MAE final':>11}{'MAE jitter':>12}{'MAE compliance':>16}")
+    for name in ('fixed', 'adaptive'):
+        mae = np.mean(errors[name], axis=0)
+        print(f"{name:<10}{calls[name] / minutes:>10.1f}{mae[0]:>11.2f}{mae[1]:>12.2f}{mae[2]:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+시선 랜드마크 추출 / 점수 계산 마이크로벤치마크
+
+1) 프레임당 비용: 기존 방식(get_gaze_point_3d + _estimate_face_size가 각각 랜드마크 객체에서
+   작은 배열/리스트를 만듦)과 measure_landmarks(14개 랜드마크를 배열 하나로 추출 후 numpy 연산)를 비교합니다.
+2) 최종 점수 계산: 10k 포인트 궤적에서 기존 파이썬 루프(포인트별 범위 비교, 샘플마다 동적 스케일링)와
+   배열 기반 점수 계산(gaze_in_range_mask, 마지막 얼굴 크기로 1회 스케일링)을 비교합니다.
+3) 온라인 누적: GazeStatsAccumulator(프레임 단위 갱신)의 결과가 같은 궤적의 배치 계산
+   (np.std, 마지막 얼굴 크기로 스케일링한 범위 마스크)과 같은지, 구간별 누적 후 merge한 결과도 같은지 확인합니다.
+
+각 항목마다 결과가 기준 계산과 같은지 함께 출력합니다. MediaPipe 추론은 포함하지 않습니다.
+
+사용법:
+    python scripts/benchmarks/gaze_scoring_benchmark.py --frames 20000 --points 10000
+"""
+
+import os
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import gaze_in_range_mask
+from backend.services.gaze_service import GazeAnalyzer
+from backend.services.gaze_stats import GazeStatsAccumulator
+
+FRAME_W, FRAME_H = 640, 480
+
+
+def make_landmarks(rng: np.random.Generator) -> list:
+    """MediaPipe NormalizedLandmark처럼 x, y, z 속성을 가진 478개 랜드마크"""
+    coords = rng.uniform(0.2, 0.8, (478, 3))
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in coords]
+
+
+def legacy_measure(processor: GazeAnalyzer, landmarks, w: int, h: int):
+    """기존 프레임 처리: 눈별 np.array 생성 + 얼굴 경계 파이썬 리스트"""
+    left = np.mean(np.array([(landmarks[i].x * w, landmarks[i].y * h, landmarks[i].z)
+                             for i in processor.left_iris_indices]), axis=0)
+    right = np.mean(np.array([(landmarks[i].x * w, landmarks[i].y * h, landmarks[i].z)
+                              for i in processor.right_iris_indices]), axis=0)
+    avg_gaze = (left + right) / 2
+    if np.any(np.isnan(avg_gaze)) or np.any(np.isinf(avg_gaze)) or np.allclose(avg_gaze, 0):
+        gaze_point = None
+    else:
+        gaze_point = (float(avg_gaze[0]), float(avg_gaze[1]))
+
+    face_points = [(landmarks[i].x * w, landmarks[i].y * h) for i in processor.face_boundary_indices]
+    x_coords = [p[0] for p in face_points]
+    y_coords = [p[1] for p in face_points]
+    face_size = max(max(x_coords) - min(x_coords), max(y_coords) - min(y_coords))
+    return gaze_point, face_size
+
+
+def legacy_score(analyzer: GazeAnalyzer, samples, original_range: dict, initial_face_size: float):
+    """기존 점수 계산: 샘플마다 동적 스케일링 + 포인트별 범위 비교 루프"""
+    gaze_points = []
+    current_range = original_range
+    for gaze_point, face_size in samples:
+        gaze_points.append(gaze_point)
+        current_range = analyzer.apply_dynamic_scaling(original_range, initial_face_size, face_size)
+
+    arr = np.array(gaze_points)
+    jitter = (np.std(arr[:, 0]) + np.std(arr[:, 1])) / 2
+
+    in_range = 0
+    for x, y in gaze_points:
+        if (current_range['left_bound'] <= x <= current_range['right_bound'] and
+                current_range['top_bound'] <= y <= current_range['bottom_bound']):
+            in_range += 1
+    compliance = int(in_range / len(gaze_points) * 100)
+    in_range_count = sum(1 for x, y in gaze_points
+                         if (current_range['left_bound'] <= x <= current_range['right_bound'] and
+                             current_range['top_bound'] <= y <= current_range['bottom_bound']))
+    return float(jitter), compliance, in_range_count
+
+
+def vectorized_score(analyzer: GazeAnalyzer, samples, original_range: dict, initial_face_size: float):
+    """개선 점수 계산: (N, 2) 배열 + gaze_in_range_mask"""
+    gaze_array = np.array([gaze_point for gaze_point, _ in samples], dtype=np.float64).reshape(-1, 2)
+    current_range = analyzer.apply_dynamic_scaling(original_range, initial_face_size, samples[-1][1])
+
+    jitter = (np.std(gaze_array[:, 0]) + np.std(gaze_array[:, 1])) / 2
+    compliance = analyzer.calculate_gaze_compliance_score(gaze_array, current_range)
+    in_range_count = int(np.count_nonzero(gaze_in_range_mask(gaze_array, current_range)))
+    return float(jitter), compliance, in_range_count
+
+
+def batch_stats(samples, allowed_range: dict, initial_face_size: float):
+    """배치 기준값: 전체 배열로 표준편차와 마지막 얼굴 크기로 스케일링한 범위 내 포인트 수 계산"""
+    points = np.array([gaze_point for gaze_point, _ in samples])
+    scale = samples[-1][1] / initial_face_size
+    center_x = (allowed_range['left_bound'] + allowed_range['right_bound']) / 2
+    center_y = (allowed_range['top_bound'] + allowed_range['bottom_bound']) / 2
+    new_width = (allowed_range['right_bound'] - allowed_range['left_bound']) * scale
+    new_height = (allowed_range['bottom_bound'] - allowed_range['top_bound']) * scale
+    in_range = ((center_x - new_width / 2 <= points[:, 0]) & (points[:, 0] <= center_x + new_width / 2) &
+                (center_y - new_height / 2 <= points[:, 1]) & (points[:, 1] <= center_y + new_height / 2))
+    return float(np.std(points[:, 0])), float(np.std(points[:, 1])), int(np.count_nonzero(in_range))
+
+
+def stream_stats(samples, allowed_range: dict, initial_face_size: float, segments: int = 1):
+    """온라인 누적 (segments > 1이면 구간 병렬 분석처럼 구간별로 누적 후 시간 순서대로 merge)"""
+    stats = GazeStatsAccumulator(allowed_range, initial_face_size)
+    bounds = np.linspace(0, len(samples), segments + 1).astype(int)
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        part = stats.spawn()
+        for gaze_point, face_size in samples[start:end]:
+            part.update(gaze_point, face_size)
+        stats.merge(part)
+    return stats
+
+
+def timed(fn, *args, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시선 랜드마크 추출 / 점수 계산 마이크로벤치마크')
+    parser.add_argument('--frames', type=int, default=20000, help='프레임당 비용 측정 반복 수')
+    parser.add_argument('--points', type=int, default=10000, help='점수 계산용 궤적 길이')
+    parser.add_argument('--repeat', type=int, default=5, help='점수 계산 반복 횟수')
+    args = parser.parse_args()
+
+    analyzer = GazeAnalyzer()
+    rng = np.random.default_rng(0)
+
+    # === 1) 프레임당 랜드마크 처리 비용 ===
+    frames = [make_landmarks(rng) for _ in range(64)]
+    batch = [frames[i % len(frames)] for i in range(args.frames)]
+
+    legacy, t_legacy = timed(lambda: [legacy_measure(analyzer, lm, FRAME_W, FRAME_H) for lm in batch])
+    vector, t_vector = timed(lambda: [analyzer.measure_landmarks(lm, FRAME_W, FRAME_H) for lm in batch])
+    print(f"프레임당 랜드마크 처리 ({args.frames}프레임)")
+    print(f"{'legacy(us)':>12}{'vectorized(us)':>16}{'speedup':>10}{'match':>8}")
+    print(f"{t_legacy / args.frames * 1e6:>12.2f}{t_vector / args.frames * 1e6:>16.2f}"
+          f"{t_legacy / t_vector:>10.2f}{str(legacy == vector):>8}")
+
+    # === 2) 10k 포인트 궤적 최종 점수 계산 ===
+    center = np.array([FRAME_W / 2, FRAME_H / 2])
+    trace = center + np.cumsum(rng.normal(0, 2.0, (args.points, 2)), axis=0) * 0.1
+    face_sizes = 150 + rng.normal(0, 5, args.points)
+    samples = [((float(x), float(y)), float(size)) for (x, y), size in zip(trace, face_sizes)]
+    calibration_points = [(center[0] - 40, center[1] - 30), (center[0] + 40, center[1] - 30),
+                          (center[0] - 40, center[1] + 30), (center[0] + 40, center[1] + 30)]
+    allowed_range = analyzer.calculate_allowed_gaze_range(calibration_points)
+
+    legacy, t_legacy = timed(legacy_score, analyzer, samples, allowed_range, 150.0, repeat=args.repeat)
+    vector, t_vector = timed(vectorized_score, analyzer, samples, allowed_range, 150.0, repeat=args.repeat)
+    print(f"\n최종 점수 계산 ({args.points}포인트, {args.repeat}회 평균)")
+    print(f"{'legacy(ms)':>12}{'vectorized(ms)':>16}{'speedup':>10}{'match':>8}")
+    print(f"{t_legacy * 1e3:>12.2f}{t_vector * 1e3:>16.2f}{t_legacy / t_vector:>10.2f}{str(legacy == vector):>8}")
+
+    # === 3) 온라인 누적 vs 배치 계산 ===
+    (std_x, std_y, in_range), t_batch = timed(batch_stats, samples, allowed_range, 150.0, repeat=args.repeat)
+    print(f"\n온라인 누적 vs 배치 ({args.points}포인트)")
+    print(f"{'segments':>10}{'update(us)':>12}{'batch(ms)':>11}{'std err':>10}{'in_range':>10}{'match':>8}{'sampled':>9}")
+    for segments in (1, 4):
+        stats, t_stream = timed(stream_stats, samples, allowed_range, 150.0, segments, repeat=args.repeat)
+        std_err = max(abs(stats.x.std - std_x), abs(stats.y.std - std_y))
+        print(f"{segments:>10}{t_stream / args.points * 1e6:>12.2f}{t_batch * 1e3:>11.2f}{std_err:>10.1e}"
+              f"{stats.in_range_count:>10}{str(stats.in_range_count == in_range and std_err < 1e-9):>8}"
+              f"{len(stats.sampled_points()):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+구간 병렬 분석 / 순차 분석 일치 검증 (VP8 webm / mp4)
+
+합성 영상을 만들어, 구간 병렬 분석(split_frame_segments로 나눈 구간마다 track_video_segment 후 merge)과
+전체 순차 분석의 결과가 같은지 확인합니다. 기본은 브라우저 녹화와 같은 VP8 webm(구간 시작까지 디코딩)이고,
+--fourcc mp4v로 탐색 경로(구간 시작 직전 키프레임으로 탐색)를 검증합니다.
+
+1) 샘플 프레임: 구간마다 iter_sampled_frames(start_frame=구간 시작)가 내는 프레임 번호와 픽셀이
+   순차 분석의 같은 번호 프레임과 같은지 비교합니다. 비교를 위해 CAP_PROP_POS_FRAMES 탐색으로
+   구간 시작에 도착한 프레임이 맞는지와 iter_sampled_frames가 탐색을 쓰는지도 함께 출력합니다.
+2) 시선 통계: 합성 얼굴용 FaceMesh 대용(gaze_benchmark_suite.SyntheticFaceMesh)으로 순차 분석과
+   구간 분석 + merge의 분석 프레임 수, x/y 표준편차, 범위 내 프레임 수, 전체 궤적을 비교합니다.
+
+구간은 프로세스 풀 대신 같은 프로세스에서 차례로 분석합니다 (결과는 워커 수와 무관).
+불일치가 있으면 종료 코드 1, 인코더가 없으면 종료 코드 2를 반환합니다.
+
+사용법:
+    python scripts/benchmarks/gaze_segment_parity_check.py --seconds 60 --workers 4
+    python scripts/benchmarks/gaze_segment_parity_check.py --fourcc mp4v
+"""
+
+import os
+import sys
+import hashlib
+import argparse
+import tempfile
+
+import cv2
+
+# 결과 캐시가 검증에 끼어들지 않도록 비활성화 (서비스 모듈 import 전에 설정)
+os.environ.setdefault('GAZE_RESULT_CACHE_ENABLED', 'false')
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gaze_core import (
+    GazeCoreProcessor, iter_sampled_frames, seek_is_frame_accurate, split_frame_segments
+)
+from backend.services.gaze_service import GazeAnalyzer
+from backend.services.gaze_stats import GazeStatsAccumulator
+from gaze_benchmark_suite import VIDEO_FPS, SyntheticFaceMesh, ensure_video, synthetic_calibration
+
+# 합성 영상 코덱 → 확장자
+CONTAINERS = {'VP80': '.webm', 'mp4v': '.mp4'}
+
+
+def frame_digest(frame) -> str:
+    return hashlib.md5(frame.tobytes()).hexdigest()
+
+
+def sampled_digests(video_path: str, frame_skip: int, start_frame: int = 0, end_frame=None) -> dict:
+    """구간 샘플 프레임의 (1부터 센 프레임 번호 → 픽셀 해시)"""
+    cap = cv2.VideoCapture(video_path)
+    try:
+        digests = {}
+        for frame_number, frame in iter_sampled_frames(cap, frame_skip, start_frame=start_frame):
+            if end_frame is not None and frame_number > end_frame:
+                break
+            digests[frame_number] = frame_digest(frame)
+        return digests
+    finally:
+        cap.release()
+
+
+def seek_lands_on(video_path: str, start_frame: int, expected: str) -> bool:
+    """CAP_PROP_POS_FRAMES 탐색 후 읽은 프레임이 순차 디코딩의 start_frame + 1번째 프레임과 같은지"""
+    cap = cv2.VideoCapture(video_path)
+    try:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        ret, frame = cap.read()
+        return bool(ret) and frame_digest(frame) == expected
+    finally:
+        cap.release()
+
+
+def nth_frame_digest(video_path: str, frame_number: int) -> str:
+    cap = cv2.VideoCapture(video_path)
+    try:
+        for _ in range(frame_number - 1):
+            cap.grab()
+        ret, frame = cap.read()
+        return frame_digest(frame) if ret else ''
+    finally:
+        cap.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구간 병렬 분석 / 순차 분석 일치 검증 (VP8 webm / mp4)')
+    parser.add_argument('--fourcc', default='VP80', choices=sorted(CONTAINERS), help='합성 영상 코덱')
+    parser.add_argument('--seconds', type=int, default=60, help='합성 영상 길이 (초)')
+    parser.add_argument('--frame-skip', type=int, default=10, help='샘플링 간격')
+    parser.add_argument('--workers', type=int, default=4, help='나눌 구간 수 (최대)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workdir', default=None, help='합성 영상 보관 폴더 (기본: 임시 폴더)')
+    args = parser.parse_args()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='gaze_parity_')
+    ext = CONTAINERS[args.fourcc]
+    video = ensure_video(workdir, f'parity-vga-{args.fourcc.lower()}', 640, 480, args.seconds, args.fourcc, ext,
+                         args.seed)
+    if video is None:
+        print(f"❌ OpenCV 빌드에 {args.fourcc} 인코더가 없어 {ext} 영상을 만들 수 없습니다.")
+        sys.exit(2)
+
+    cap = cv2.VideoCapture(video)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or VIDEO_FPS
+    seeks = total_frames > 0 and seek_is_frame_accurate(cap)
+    cap.release()
+    if total_frames <= 0:
+        total_frames = args.seconds * VIDEO_FPS
+    segments = split_frame_segments(total_frames, fps, args.frame_skip, args.workers)
+    print(f"합성 영상: {video} ({total_frames}프레임, {fps:.1f}fps), 구간 {len(segments)}개, "
+          f"frame_skip={args.frame_skip}, 구간 시작 {'탐색' if seeks else '디코딩'}")
+
+    failures = 0
+
+    # === 1) 샘플 프레임 비교 ===
+    sequential = sampled_digests(video, args.frame_skip)
+    print(f"\n{'segment':>14}{'frames':>8}{'numbers':>9}{'pixels':>8}{'seek start':>12}")
+    merged = {}
+    for start, end in segments:
+        part = sampled_digests(video, args.frame_skip, start, end)
+        merged.update(part)
+        expected = {n: d for n, d in sequential.items() if n > start and (end is None or n <= end)}
+        numbers_ok = list(part) == list(expected)
+        pixels_ok = numbers_ok and all(part[n] == expected[n] for n in part)
+        seek_ok = start == 0 or seek_lands_on(video, start, nth_frame_digest(video, start + 1))
+        failures += (not numbers_ok) + (not pixels_ok)
+        label = f"{start}-{end if end is not None else 'end'}"
+        print(f"{label:>14}{len(part):>8}{str(numbers_ok):>9}"
+              f"{str(pixels_ok):>8}{str(seek_ok):>12}")
+    if merged != sequential:
+        failures += 1
+        print(f"❌ 구간 샘플 합계 {len(merged)}개 / 순차 {len(sequential)}개가 다름")
+
+    # === 2) 시선 통계 비교 ===
+    GazeCoreProcessor.create_face_mesh = staticmethod(SyntheticFaceMesh)
+    processor = GazeAnalyzer()
+    calibration_points, initial_face_size = synthetic_calibration()
+    allowed_range = processor.calculate_allowed_gaze_range(calibration_points)
+
+    seq_stats = processor.track_video_segment(
+        video, args.frame_skip, accumulator=GazeStatsAccumulator(allowed_range, initial_face_size))
+    seg_stats = GazeStatsAccumulator(allowed_range, initial_face_size)
+    for start, end in segments:
+        seg_stats.merge(processor.track_video_segment(video, args.frame_skip, start, end,
+                                                      accumulator=seg_stats.spawn()))
+
+    std_err = max(abs(seq_stats.x.std - seg_stats.x.std), abs(seq_stats.y.std - seg_stats.y.std))
+    rows = [
+        ('analyzed', seq_stats.count, seg_stats.count, seq_stats.count == seg_stats.count),
+        ('in_range', seq_stats.in_range_count, seg_stats.in_range_count,
+         seq_stats.in_range_count == seg_stats.in_range_count),
+        ('std x', f"{seq_stats.x.std:.4f}", f"{seg_stats.x.std:.4f}", std_err < 1e-6),
+        ('std y', f"{seq_stats.y.std:.4f}", f"{seg_stats.y.std:.4f}", std_err < 1e-6),
+        ('trace', len(seq_stats.trace_points()), len(seg_stats.trace_points()),
+         seq_stats.trace_points() == seg_stats.trace_points()),
+    ]
+    print(f"\n{'stat':>10}{'sequential':>12}{'segments':>12}{'match':>8}")
+    for name, seq_value, seg_value, ok in rows:
+        failures += not ok
+        print(f"{name:>10}{str(seq_value):>12}{str(seg_value):>12}{str(ok):>8}")
+
+    print("\n✅ 구간 분석이 순차 분석과 일치합니다." if not failures else f"\n❌ 불일치 {failures}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
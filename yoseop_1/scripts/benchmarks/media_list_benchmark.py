@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+미디어 목록 조회 벤치마크 (/media/list)
+
+SQLite로 만든 Supabase(PostgREST) 쿼리 빌더 대용(LocalSupabase)에 사용자 1명당 --rows개(기본 1만 개)의
+media_files 행을 넣고, 기존 방식과 새 방식의 페이지별 조회 시간을 비교합니다.
+
+- legacy: 전체 행 조회 후 len()으로 개수 + offset/limit 페이지 (이전 /media/list)
+- keyset: count='exact', head=True 개수 조회 + (created_at, media_id) 키셋 커서 페이지 (services/media_pagination.py)
+
+응답은 PostgREST처럼 JSON 직렬화/역직렬화를 거치므로 행 수에 비례하는 전송 비용이 반영됩니다 (네트워크 지연은 제외).
+측정 전에 커서로 전체 목록을 끝까지 넘겨 보며 순서 / 중복 / 누락 / 개수를 검증합니다 (created_at이 같은 행 포함).
+
+사용법:
+    python scripts/benchmarks/media_list_benchmark.py
+    python scripts/benchmarks/media_list_benchmark.py --rows 10000 --page-size 20 --pages 1 50 250 500 --repeat 20
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import statistics
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.media_pagination import count_media, list_media_page
+
+OPERATORS = {'eq': '=', 'lt': '<', 'gt': '>', 'lte': '<=', 'gte': '>='}
+
+
+def _split_top_level(text: str) -> list:
+    """PostgREST 논리 필터를 괄호 / 따옴표 밖의 쉼표로 분리"""
+    parts, depth, quoted, current = [], 0, False, ''
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        if char == ',' and depth == 0 and not quoted:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return parts
+
+
+def _logic_to_sql(text: str, joiner: str, params: list) -> str:
+    """'a.lt."x",and(a.eq."x",b.lt."y")' → SQL 조건 (or / and, eq/lt/gt/lte/gte만 지원)"""
+    clauses = []
+    for part in _split_top_level(text):
+        match = re.fullmatch(r'(and|or)\((.*)\)', part)
+        if match:
+            clauses.append(_logic_to_sql(match.group(2), ' AND ' if match.group(1) == 'and' else ' OR ', params))
+            continue
+        column, op, value = part.split('.', 2)
+        params.append(value[1:-1] if value.startswith('"') else value)
+        clauses.append(f"{column} {OPERATORS[op]} ?")
+    return '(' + joiner.join(clauses) + ')'
+
+
+class LocalQuery:
+    """supabase-py 쿼리 빌더 중 이 프로젝트에서 쓰는 부분 (select/eq/or_/order/limit/range/execute)"""
+
+    def __init__(self, db: sqlite3.Connection, table: str):
+        self.db = db
+        self.table = table
+        self.columns = '*'
+        self.count = None
+        self.head = False
+        self.where = []
+        self.params = []
+        self.orders = []
+        self.limit_value = None
+        self.offset_value = 0
+
+    def select(self, columns: str = '*', count=None, head=False):
+        self.columns, self.count, self.head = columns, count, head
+        return self
+
+    def eq(self, column: str, value):
+        self.where.append(f"{column} = ?")
+        self.params.append(value)
+        return self
+
+    def or_(self, filters: str):
+        self.where.append(_logic_to_sql(filters, ' OR ', self.params))
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.orders.append(f"{column} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self, size: int):
+        self.limit_value = size
+        return self
+
+    def range(self, start: int, end: int):
+        self.offset_value, self.limit_value = start, end - start + 1
+        return self
+
+    def execute(self):
+        where = f" WHERE {' AND '.join(self.where)}" if self.where else ''
+        count = None
+        if self.count == 'exact':
+            count = self.db.execute(f"SELECT COUNT(*) FROM {self.table}{where}", self.params).fetchone()[0]
+        data = []
+        if not self.head:
+            sql = f"SELECT {self.columns} FROM {self.table}{where}"
+            if self.orders:
+                sql += f" ORDER BY {', '.join(self.orders)}"
+            if self.limit_value is not None:
+                sql += f" LIMIT {self.limit_value} OFFSET {self.offset_value}"
+            cursor = self.db.execute(sql, self.params)
+            names = [d[0] for d in cursor.description]
+            # PostgREST 응답처럼 JSON 왕복 (행 수에 비례하는 전송 / 파싱 비용)
+            data = json.loads(json.dumps([dict(zip(names, row)) for row in cursor.fetchall()]))
+        return SimpleNamespace(data=data, count=count)
+
+
+class LocalSupabase:
+    """SQLite 기반 Supabase 클라이언트 대용"""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def table(self, name: str) -> LocalQuery:
+        return LocalQuery(self.db, name)
+
+
+def build_database(rows: int, users: int, seed: int) -> sqlite3.Connection:
+    db = sqlite3.connect(':memory:', check_same_thread=False)
+    db.execute("""
+        CREATE TABLE media_files (
+            media_id TEXT PRIMARY KEY, user_id INTEGER, interview_id INTEGER, file_name TEXT, file_type TEXT,
+            s3_url TEXT, s3_key TEXT, file_size INTEGER, duration INTEGER, created_at TEXT, updated_at TEXT
+        )""")
+    db.execute("CREATE INDEX media_files_user_created ON media_files (user_id, created_at DESC, media_id DESC)")
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for user_id in range(1, users + 1):
+        for i in range(rows):
+            # 같은 초에 여러 파일이 만들어지는 경우(동일 created_at)를 섞음
+            created = base + timedelta(seconds=(i // 3) * 60 + rng.randrange(2))
+            media_id = f"{rng.getrandbits(128):032x}"
+            file_type = 'video' if i % 4 else 'audio'
+            key = f"interviews/{user_id}/{media_id}.webm"
+            records.append((media_id, user_id, i, f"recording-{i}.webm", file_type,
+                            f"https://betago-s3.s3.ap-northeast-2.amazonaws.com/{key}", key,
+                            rng.randrange(1, 100) * 1024 * 1024, rng.randrange(60, 1800),
+                            created.isoformat(), created.isoformat()))
+    db.executemany("INSERT INTO media_files VALUES (?,?,?,?,?,?,?,?,?,?,?)", records)
+    db.commit()
+    return db
+
+
+def legacy_page(client, user_id: int, page: int, page_size: int, file_type=None):
+    """이전 /media/list 조회 방식"""
+    query = client.table('media_files').select('*').eq('user_id', user_id)
+    if file_type:
+        query = query.eq('file_type', file_type)
+    total_count = len(query.execute().data)
+    offset = (page - 1) * page_size
+    query = client.table('media_files').select('*').eq('user_id', user_id)
+    if file_type:
+        query = query.eq('file_type', file_type)
+    rows = query.order('created_at', desc=True).range(offset, offset + page_size - 1).execute().data
+    return total_count, rows
+
+
+def verify(client, db, user_id: int, page_size: int, file_type=None) -> int:
+    """커서로 끝까지 넘기면서 순서 / 중복 / 누락 / 개수 검증, 페이지 수 반환"""
+    where, params = "user_id = ?", [user_id]
+    if file_type:
+        where, params = where + " AND file_type = ?", params + [file_type]
+    expected = [row[0] for row in db.execute(
+        f"SELECT media_id FROM media_files WHERE {where} ORDER BY created_at DESC, media_id DESC", params)]
+    assert count_media(client, user_id, file_type) == len(expected)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = list_media_page(client, user_id, page_size, file_type, cursor)
+        seen.extend(row['media_id'] for row in rows)
+        pages += 1
+        if cursor is None:
+            break
+    assert seen == expected, "키셋 순회 결과가 정렬 순서와 다름"
+
+    # offset으로 바로 이동한 페이지도 같은 순서
+    rows, _ = list_media_page(client, user_id, page_size, file_type, offset=page_size * 3)
+    assert [row['media_id'] for row in rows] == expected[page_size * 3:page_size * 4]
+    return pages
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미디어 목록 조회 벤치마크')
+    parser.add_argument('--rows', type=int, default=10000, help='사용자당 행 수')
+    parser.add_argument('--users', type=int, default=3, help='사용자 수 (측정은 1번 사용자)')
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 50, 250, 500])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    db = build_database(args.rows, args.users, args.seed)
+    client = LocalSupabase(db)
+    user_id = 1
+
+    for file_type in (None, 'video'):
+        pages = verify(client, db, user_id, args.page_size, file_type)
+        print(f"✅ 검증 통과 (file_type={file_type}): 커서 {pages}페이지, 순서/중복/누락/개수 일치")
+
+    # 목표 페이지 직전 커서 준비 (측정 대상은 해당 페이지 요청 1회)
+    cursors, cursor = {1: None}, None
+    for page in range(1, max(args.pages)):
+        _, cursor = list_media_page(client, user_id, args.page_size, None, cursor)
+        cursors[page + 1] = cursor
+
+    print(f"\n사용자당 {args.rows}행 x {args.users}명, page_size {args.page_size}, 중앙값 {args.repeat}회 (ms)")
+    print(f"{'page':>6}{'legacy':>12}{'count':>10}{'keyset':>10}{'new total':>12}{'speedup':>10}")
+    for page in args.pages:
+        legacy_ms = timed(lambda: legacy_page(client, user_id, page, args.page_size), args.repeat)
+        count_ms = timed(lambda: count_media(client, user_id), args.repeat)
+        keyset_ms = timed(lambda: list_media_page(client, user_id, args.page_size, None, cursors.get(page)),
+                          args.repeat)
+        total_ms = count_ms + keyset_ms
+        print(f"{page:>6}{legacy_ms:>12.2f}{count_ms:>10.2f}{keyset_ms:>10.2f}{total_ms:>12.2f}{legacy_ms / total_ms:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
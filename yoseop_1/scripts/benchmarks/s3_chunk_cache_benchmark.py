@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+S3 Range 청크 캐시 벤치마크
+
+로컬 폴더를 S3처럼 제공하는 LocalS3Client에 요청당 지연(--latency-ms)을 넣고,
+플레이어처럼 앞에서부터 재생하다가 탐색 / 다시 보기를 섞은 Range 요청을 보내
+직접 S3 읽기와 S3ChunkCache의 S3 요청 수, S3 읽기 바이트, 응답 시간을 비교합니다.
+모든 응답은 원본 파일의 같은 구간과 바이트 단위로 비교합니다.
+
+추가로 확인하는 항목:
+- 동시 요청 합치기: 여러 스레드가 같은 청크를 동시에 요청하면 S3 요청은 1번
+- LRU: 크기 제한을 작게 잡았을 때 캐시 폴더 크기가 제한을 넘지 않음
+
+사용법:
+    python scripts/benchmarks/s3_chunk_cache_benchmark.py
+    python scripts/benchmarks/s3_chunk_cache_benchmark.py --size-mb 50 --requests 500 --latency-ms 30 --chunk-kb 512
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.local_s3 import LocalS3Client
+from backend.services.s3_chunk_cache import S3ChunkCache
+
+KEY = 'interviews/benchmark/video.webm'
+
+
+class CountingS3Client(LocalS3Client):
+    """요청 수 / 읽은 바이트를 세고 요청마다 지연을 넣는 LocalS3Client"""
+
+    def __init__(self, root: str, latency_sec: float):
+        super().__init__(root)
+        self.latency_sec = latency_sec
+        self.gets = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def get_object(self, Bucket, Key, Range=None, **kwargs):
+        time.sleep(self.latency_sec)
+        response = super().get_object(Bucket, Key, Range=Range, **kwargs)
+        with self._lock:
+            self.gets += 1
+            self.bytes += response['ContentLength']
+        return response
+
+
+def player_requests(size: int, count: int, seed: int) -> list:
+    """재생(앞에서부터 2MB씩) + 탐색 + 다시 보기 Range 요청 목록"""
+    rng = random.Random(seed)
+    requests, position, visited = [], 0, []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.15 and visited:
+            position = rng.choice(visited)          # 다시 보기
+        elif roll < 0.3:
+            position = rng.randrange(size)          # 탐색
+        visited.append(position)
+        end = min(position + 2 * 1024 * 1024, size) - 1
+        requests.append((position, end))
+        position = end + 1 if end + 1 < size else 0
+    return requests
+
+
+def run_direct(client: CountingS3Client, requests: list, data: bytes) -> float:
+    start = time.perf_counter()
+    for first, last in requests:
+        body = client.get_object(Bucket='bench', Key=KEY, Range=f'bytes={first}-{last}')['Body']
+        assert body.read() == data[first:last + 1]
+    return time.perf_counter() - start
+
+
+def run_cached(cache: S3ChunkCache, requests: list, data: bytes) -> float:
+    start = time.perf_counter()
+    for first, last in requests:
+        assert cache.read_range(KEY, first, last) == data[first:last + 1]
+    return time.perf_counter() - start
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='S3 Range 청크 캐시 벤치마크')
+    parser.add_argument('--size-mb', type=int, default=20, help='테스트 파일 크기')
+    parser.add_argument('--requests', type=int, default=300, help='Range 요청 수')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='S3 요청당 지연')
+    parser.add_argument('--chunk-kb', type=int, default=1024)
+    parser.add_argument('--threads', type=int, default=16, help='동시 요청 합치기 확인용 스레드 수')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='chunk_cache_bench_')
+    try:
+        data = random.Random(args.seed).randbytes(args.size_mb * 1024 * 1024)
+        path = os.path.join(work_dir, 's3', KEY)
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(data)
+        requests = player_requests(len(data), args.requests, args.seed)
+        latency = args.latency_ms / 1000
+        chunk_size = args.chunk_kb * 1024
+
+        direct_client = CountingS3Client(os.path.join(work_dir, 's3'), latency)
+        direct_sec = run_direct(direct_client, requests, data)
+
+        cached_client = CountingS3Client(os.path.join(work_dir, 's3'), latency)
+        cache = S3ChunkCache(cached_client, 'bench', directory=os.path.join(work_dir, 'cache'),
+                             chunk_size=chunk_size, max_bytes=len(data) * 2)
+        cached_sec = run_cached(cache, requests, data)
+
+        print(f"파일 {args.size_mb}MB, Range 요청 {args.requests}개, S3 지연 {args.latency_ms:.0f}ms, 청크 {args.chunk_kb}KB")
+        print(f"{'mode':>8}{'S3 GET':>10}{'S3 MB':>10}{'sec':>10}")
+        print(f"{'direct':>8}{direct_client.gets:>10}{direct_client.bytes / 1024 / 1024:>10.1f}{direct_sec:>10.2f}")
+        print(f"{'cached':>8}{cached_client.gets:>10}{cached_client.bytes / 1024 / 1024:>10.1f}{cached_sec:>10.2f}")
+        print(f"캐시 통계: {cache.stats()}")
+
+        # 동시 요청 합치기: 새 캐시에서 같은 청크를 threads개 스레드가 동시에 요청
+        coalesce_client = CountingS3Client(os.path.join(work_dir, 's3'), latency)
+        coalesce_cache = S3ChunkCache(coalesce_client, 'bench', directory=os.path.join(work_dir, 'cache_coalesce'),
+                                      chunk_size=chunk_size)
+        meta = coalesce_cache.head(KEY)
+        barrier = threading.Barrier(args.threads)
+        results = [None] * args.threads
+
+        def fetch(index: int):
+            barrier.wait()
+            results[index] = coalesce_cache.get_chunk(meta, 1)
+
+        threads = [threading.Thread(target=fetch, args=(i,)) for i in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(result == data[chunk_size:2 * chunk_size] for result in results)
+        print(f"동시 요청 {args.threads}개 → S3 GET {coalesce_client.gets}회 (합쳐진 요청 {coalesce_cache.stats()['coalesced']}개)")
+
+        # LRU: 파일 크기의 1/4 제한
+        budget = len(data) // 4
+        lru_dir = os.path.join(work_dir, 'cache_lru')
+        lru_cache = S3ChunkCache(CountingS3Client(os.path.join(work_dir, 's3'), 0), 'bench',
+                                 directory=lru_dir, chunk_size=chunk_size, max_bytes=budget)
+        run_cached(lru_cache, requests, data)
+        used = directory_size(lru_dir)
+        assert used <= budget, f"캐시 크기 초과: {used} > {budget}"
+        print(f"LRU 제한 {budget / 1024 / 1024:.1f}MB → 폴더 {used / 1024 / 1024:.1f}MB, 삭제 {lru_cache.stats()['evictions']}개")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+S3 스트리밍 멀티파트 업로드 벤치마크
+
+요청 본문처럼 64KB 청크로 들어오는 동영상을 로컬 폴더 기반 LocalS3Client(요청당 --latency-ms 지연)에 올리며
+기존 방식과 StreamingS3Uploader를 비교합니다.
+
+- legacy: 이벤트 루프에서 임시 파일에 동기로 복사(shutil.copyfileobj와 같음) 후 upload_file (이전 /gaze/upload/temporary)
+- stream: 청크를 읽는 대로 파트로 나눠 동시 업로드 (services/streaming_upload.py)
+
+본문은 --client-mbps 속도로 도착하므로 stream은 수신과 S3 전송이 겹치고, legacy는 수신이 끝난 뒤 전송을 시작합니다.
+측정 항목: 전체 시간, 이벤트 루프 최대 지연(10ms 주기 타이머 기준), 로컬 디스크 쓰기,
+파이썬 메모리 최대 사용량(tracemalloc, 시간 측정과 별도 실행)
+업로드된 객체는 원본과 바이트 단위로, SHA-256은 hashlib 결과와 비교합니다.
+
+추가로 확인하는 항목:
+- 형식 검증: 동영상이 아닌 첫 바이트 / 확장자 불일치는 S3 호출 없이 거부
+- 실패 처리: 파트 업로드 중 오류가 나면 멀티파트 업로드를 abort (남은 파트 없음)
+- multipart/form-data 파싱: python-multipart가 설치되어 있으면 MultipartFileStream으로 같은 파일을 꺼내 비교
+
+사용법:
+    python scripts/benchmarks/streaming_upload_benchmark.py
+    python scripts/benchmarks/streaming_upload_benchmark.py --size-mb 200 --client-mbps 100 --latency-ms 50 --part-mb 8 --concurrency 4
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import asyncio
+import hashlib
+import argparse
+import tempfile
+import tracemalloc
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.local_s3 import LocalS3Client
+from backend.services import streaming_upload
+from backend.services.streaming_upload import MultipartFileStream, StreamingS3Uploader, StreamUploadError
+
+CHUNK_SIZE = 64 * 1024
+WEBM_HEADER = b'\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\xf7\x81'
+
+
+class SlowS3Client(LocalS3Client):
+    """S3 호출마다 지연을 넣고 호출 수를 세는 LocalS3Client (fail_part: 해당 번호 파트에서 오류)"""
+
+    def __init__(self, root: str, latency_sec: float, fail_part: int = 0):
+        super().__init__(root)
+        self.latency_sec = latency_sec
+        self.fail_part = fail_part
+        self.calls = 0
+
+    def _delay(self):
+        self.calls += 1
+        time.sleep(self.latency_sec)
+
+    def upload_file(self, Filename, Bucket, Key, **kwargs):
+        self._delay()
+        # 실제 S3처럼 본문 크기에 비례하는 전송 시간 (8MB당 1회 지연)
+        time.sleep(self.latency_sec * (os.path.getsize(Filename) // (8 * 1024 * 1024)))
+        return super().upload_file(Filename, Bucket, Key, **kwargs)
+
+    def put_object(self, Bucket, Key, Body=b'', **kwargs):
+        self._delay()
+        return super().put_object(Bucket, Key, Body=Body, **kwargs)
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self._delay()
+        return super().create_multipart_upload(Bucket, Key, **kwargs)
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, **kwargs):
+        self._delay()
+        time.sleep(self.latency_sec * (len(Body) // (8 * 1024 * 1024)))
+        if PartNumber == self.fail_part:
+            raise RuntimeError(f"파트 {PartNumber} 업로드 실패 (테스트)")
+        return super().upload_part(Bucket, Key, UploadId, PartNumber, Body, **kwargs)
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, **kwargs):
+        self._delay()
+        return super().complete_multipart_upload(Bucket, Key, UploadId, MultipartUpload, **kwargs)
+
+
+# 본문 도착 속도 (MB/s, 0이면 제한 없음)
+CLIENT_MBPS = 0.0
+
+
+async def body_chunks(data: bytes):
+    """요청 본문 스트림 대용 (CLIENT_MBPS 속도로 도착, 청크 사이에 이벤트 루프 양보)"""
+    start = time.perf_counter()
+    for offset in range(0, len(data), CHUNK_SIZE):
+        yield data[offset:offset + CHUNK_SIZE]
+        due = start + (offset + CHUNK_SIZE) / (CLIENT_MBPS * 1024 * 1024) if CLIENT_MBPS else 0
+        await asyncio.sleep(max(due - time.perf_counter(), 0))
+
+
+async def peak_memory(coro_factory) -> float:
+    """파이썬 메모리 최대 사용량 MB (tracemalloc은 느리므로 시간 측정과 따로 실행)"""
+    tracemalloc.start()
+    try:
+        await coro_factory()
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def measure(coro_factory):
+    """(결과, 걸린 시간, 이벤트 루프 최대 지연 ms)"""
+    max_lag = 0.0
+    stop = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_lag
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    try:
+        result = await coro_factory()
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await tick
+    return result, elapsed, max_lag * 1000
+
+
+async def legacy_upload(client: SlowS3Client, data: bytes, key: str, temp_dir: str) -> int:
+    """이전 방식: 이벤트 루프에서 임시 파일에 동기 복사 후 업로드"""
+    path = os.path.join(temp_dir, 'upload.webm')
+    with open(path, 'wb') as f:
+        async for chunk in body_chunks(data):
+            f.write(chunk)
+    written = os.path.getsize(path)
+    client.upload_file(path, 'bench', key)
+    os.remove(path)
+    return written
+
+
+class FakeRequest:
+    """Starlette Request 대용 (headers / stream())"""
+
+    def __init__(self, body: bytes, boundary: str):
+        self.headers = {'content-type': f'multipart/form-data; boundary={boundary}'}
+        self._body = body
+
+    async def stream(self):
+        async for chunk in body_chunks(self._body):
+            yield chunk
+
+
+def multipart_body(data: bytes, boundary: str) -> bytes:
+    return (f'--{boundary}\r\nContent-Disposition: form-data; name="note"\r\n\r\nhello\r\n'
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="session.webm"\r\n'
+            f'Content-Type: video/webm\r\n\r\n').encode() + data + f'\r\n--{boundary}--\r\n'.encode()
+
+
+async def run(args):
+    global CLIENT_MBPS
+    CLIENT_MBPS = args.client_mbps
+    work_dir = tempfile.mkdtemp(prefix='stream_upload_bench_')
+    try:
+        rng = random.Random(args.seed)
+        data = WEBM_HEADER + rng.randbytes(args.size_mb * 1024 * 1024 - len(WEBM_HEADER))
+        expected_sha = hashlib.sha256(data).hexdigest()
+        latency = args.latency_ms / 1000
+        part_size = args.part_mb * 1024 * 1024
+        s3_root = os.path.join(work_dir, 's3')
+        os.makedirs(s3_root)
+
+        legacy_client = SlowS3Client(s3_root, latency)
+        legacy = lambda: legacy_upload(legacy_client, data, 'legacy/video.webm', work_dir)
+        written, legacy_sec, legacy_lag = await measure(legacy)
+        legacy_calls = legacy_client.calls
+        legacy_mem = await peak_memory(legacy)
+
+        stream_client = SlowS3Client(s3_root, latency)
+        uploader = StreamingS3Uploader(stream_client, 'bench', part_size=part_size, concurrency=args.concurrency)
+        stream = lambda: uploader.upload(body_chunks(data), 'stream/video.webm', 'video/webm', extension='.webm')
+        result, stream_sec, stream_lag = await measure(stream)
+        stream_calls = stream_client.calls
+        stream_mem = await peak_memory(stream)
+
+        with open(os.path.join(s3_root, 'stream/video.webm'), 'rb') as f:
+            assert f.read() == data, "업로드된 객체가 원본과 다름"
+        assert result.sha256 == expected_sha and result.size == len(data)
+        assert not os.listdir(os.path.join(s3_root, '.multipart')), "남은 멀티파트 파트가 있음"
+
+        print(f"파일 {args.size_mb}MB, 청크 {CHUNK_SIZE // 1024}KB, 본문 {args.client_mbps:.0f}MB/s, S3 지연 {args.latency_ms:.0f}ms, "
+              f"파트 {args.part_mb}MB x 동시 {args.concurrency}")
+        print(f"{'mode':>8}{'sec':>8}{'loop lag ms':>13}{'peak MB':>10}{'disk MB':>10}{'S3 calls':>10}")
+        print(f"{'legacy':>8}{legacy_sec:>8.2f}{legacy_lag:>13.1f}{legacy_mem:>10.1f}"
+              f"{written / 1024 / 1024:>10.1f}{legacy_calls:>10}")
+        print(f"{'stream':>8}{stream_sec:>8.2f}{stream_lag:>13.1f}{stream_mem:>10.1f}"
+              f"{0:>10.1f}{stream_calls:>10}")
+        print(f"✅ 내용 / SHA-256 일치 (파트 {result.parts}개, ETag {result.etag})")
+
+        # 형식 검증: S3 호출 없이 거부
+        for header, extension in ((b'<html><body>' * 2, '.webm'), (WEBM_HEADER, '.mp4')):
+            check_client = SlowS3Client(s3_root, 0)
+            try:
+                await StreamingS3Uploader(check_client, 'bench', part_size=part_size).upload(
+                    body_chunks(header + data[:1024]), 'rejected/video' + extension, extension=extension)
+                raise AssertionError("검증 실패가 나야 함")
+            except StreamUploadError as e:
+                assert check_client.calls == 0
+                print(f"✅ 형식 검증 거부 ({extension}): {e}")
+
+        # 실패 처리: 2번 파트 오류 → abort, 객체 / 파트 없음
+        fail_client = SlowS3Client(s3_root, latency, fail_part=2)
+        try:
+            await StreamingS3Uploader(fail_client, 'bench', part_size=part_size, concurrency=args.concurrency).upload(
+                body_chunks(data), 'failed/video.webm', extension='.webm')
+            raise AssertionError("업로드 오류가 나야 함")
+        except RuntimeError:
+            assert not os.path.exists(os.path.join(s3_root, 'failed/video.webm'))
+            assert not os.listdir(os.path.join(s3_root, '.multipart'))
+            print("✅ 파트 오류 시 멀티파트 업로드 abort (남은 파트 없음)")
+
+        # multipart/form-data 스트림 파싱
+        if streaming_upload.MultipartParser is None:
+            print("⏭️ python-multipart 미설치: MultipartFileStream 확인 생략")
+        else:
+            boundary = '----bench' + os.urandom(8).hex()
+            stream = await MultipartFileStream(FakeRequest(multipart_body(data, boundary), boundary)).open()
+            assert (stream.filename, stream.content_type) == ('session.webm', 'video/webm')
+            form_result = await StreamingS3Uploader(SlowS3Client(s3_root, 0), 'bench', part_size=part_size).upload(
+                stream, 'form/video.webm', stream.content_type, extension='.webm')
+            assert form_result.sha256 == expected_sha
+            print("✅ multipart/form-data 파일 필드 스트리밍 일치")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='S3 스트리밍 멀티파트 업로드 벤치마크')
+    parser.add_argument('--size-mb', type=int, default=100, help='테스트 파일 크기')
+    parser.add_argument('--client-mbps', type=float, default=100.0, help='요청 본문 도착 속도 (0=제한 없음)')
+    parser.add_argument('--latency-ms', type=float, default=30.0, help='S3 요청 지연 (8MB 전송당 같은 지연 추가)')
+    parser.add_argument('--part-mb', type=int, default=8)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
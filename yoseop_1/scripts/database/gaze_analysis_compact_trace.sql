@@ -0,0 +1,14 @@
+-- gaze_analysis 압축 궤적 / 히트맵 컬럼
+--
+-- 시선 분석 결과의 전체 해상도 궤적 압축본(services/gaze_trace.encode_trace)과
+-- 저해상도 히트맵(build_heatmap)을 저장합니다. 기존 gaze_points(다운샘플링 포인트)는 그대로 유지합니다.
+-- 컬럼이 없는 DB에서는 저장 시 압축 필드를 빼고 다시 저장하므로(PGRST204 / 42703 오류일 때만) 적용 전에도 동작합니다.
+-- 기존 레코드는 scripts/gaze_backfill.py로 재분석해 채울 수 있습니다.
+--
+-- 적용: Supabase SQL Editor에서 이 파일 전체를 실행
+
+alter table gaze_analysis add column if not exists gaze_trace jsonb;
+alter table gaze_analysis add column if not exists gaze_heatmap jsonb;
+
+-- PostgREST 스키마 캐시 갱신 (새 컬럼을 바로 insert / select에 사용)
+notify pgrst, 'reload schema';
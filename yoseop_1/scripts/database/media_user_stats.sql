@@ -0,0 +1,144 @@
+-- 사용자별 미디어 통계 (media_user_stats)
+--
+-- /media/stats가 요청마다 사용자의 모든 media_files 행을 내려받아 집계하던 것을 1행 조회로 바꾸기 위한 스키마입니다.
+-- media_files에 행이 추가 / 변경 / 삭제되면 트리거가 같은 트랜잭션 안에서 통계 행을 증감하므로
+-- 업로드(insert), 완료(upload_status 변경), 삭제(delete)와 통계가 어긋나지 않습니다.
+-- 트리거 도입 전 데이터나 트리거를 우회한 변경으로 생긴 차이는 reconcile_media_user_stats()로 바로잡습니다
+-- (scripts/reconcile_media_stats.py, 하루 1회 실행 권장).
+--
+-- 적용: Supabase SQL Editor에서 이 파일 전체를 실행한 뒤 select * from reconcile_media_user_stats(); 로 초기값 채우기
+
+-- 업로드 상태 (기존 행과 업로드가 끝난 뒤 삽입되는 행은 completed, Presigned 업로드 시작 시 pending으로 삽입)
+alter table media_files add column if not exists upload_status text not null default 'completed';
+
+create table if not exists media_user_stats (
+    user_id bigint primary key,
+    total_files integer not null default 0,
+    video_count integer not null default 0,
+    audio_count integer not null default 0,
+    pending_count integer not null default 0,
+    completed_count integer not null default 0,
+    total_bytes bigint not null default 0,
+    sized_files integer not null default 0,          -- file_size가 있는 파일 수 (평균 크기 계산용)
+    latest_upload timestamptz,
+    updated_at timestamptz not null default now()
+);
+-- API는 서비스 키로 조회하고 권한은 API에서 확인 (정책 없이 RLS만 켜서 anon 키 직접 접근 차단)
+alter table media_user_stats enable row level security;
+
+-- 통계 행 증감 (p_sign: +1 추가 / -1 제거)
+create or replace function media_user_stats_apply(
+    p_user_id bigint, p_sign integer, p_file_type text, p_status text, p_file_size bigint, p_created_at timestamptz
+) returns void language sql as $$
+    insert into media_user_stats as s (
+        user_id, total_files, video_count, audio_count, pending_count, completed_count,
+        total_bytes, sized_files, latest_upload
+    ) values (
+        p_user_id,
+        p_sign,
+        case when p_file_type = 'video' then p_sign else 0 end,
+        case when p_file_type = 'audio' then p_sign else 0 end,
+        case when p_status = 'pending' then p_sign else 0 end,
+        case when p_status = 'completed' then p_sign else 0 end,
+        p_sign * coalesce(p_file_size, 0),
+        case when p_file_size is not null then p_sign else 0 end,
+        case when p_sign > 0 then p_created_at end
+    )
+    on conflict (user_id) do update set
+        total_files = s.total_files + excluded.total_files,
+        video_count = s.video_count + excluded.video_count,
+        audio_count = s.audio_count + excluded.audio_count,
+        pending_count = s.pending_count + excluded.pending_count,
+        completed_count = s.completed_count + excluded.completed_count,
+        total_bytes = s.total_bytes + excluded.total_bytes,
+        sized_files = s.sized_files + excluded.sized_files,
+        latest_upload = greatest(s.latest_upload, excluded.latest_upload),
+        updated_at = now();
+$$;
+
+create or replace function media_user_stats_trigger() returns trigger
+language plpgsql security definer set search_path = public as $$
+begin
+    if tg_op in ('UPDATE', 'DELETE') then
+        perform media_user_stats_apply(old.user_id, -1, old.file_type, old.upload_status, old.file_size, old.created_at);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') then
+        perform media_user_stats_apply(new.user_id, 1, new.file_type, new.upload_status, new.file_size, new.created_at);
+    end if;
+    -- 가장 최근 파일을 지웠으면 최근 업로드 시간을 다시 계산 (user_id, created_at 인덱스 사용)
+    if tg_op in ('UPDATE', 'DELETE') then
+        update media_user_stats
+           set latest_upload = (select max(created_at) from media_files where user_id = old.user_id)
+         where user_id = old.user_id and latest_upload <= old.created_at;
+    end if;
+    return null;
+end;
+$$;
+
+drop trigger if exists media_user_stats_sync on media_files;
+create trigger media_user_stats_sync
+    after insert or delete or update of user_id, file_type, upload_status, file_size, created_at on media_files
+    for each row execute function media_user_stats_trigger();
+
+-- 실제 media_files 집계와 다른 통계 행을 바로잡고, 바로잡은(또는 새로 만든) 행을 반환
+-- 집계 중 변경이 끼어들어 다시 어긋나지 않도록 media_files 쓰기를 잠시 막음 (읽기는 가능)
+create or replace function reconcile_media_user_stats(p_user_id bigint default null)
+returns setof media_user_stats language plpgsql security definer set search_path = public as $$
+begin
+    lock table media_files in share mode;
+    return query
+    with actual as (
+        select m.user_id,
+               count(*)::integer as total_files,
+               (count(*) filter (where m.file_type = 'video'))::integer as video_count,
+               (count(*) filter (where m.file_type = 'audio'))::integer as audio_count,
+               (count(*) filter (where m.upload_status = 'pending'))::integer as pending_count,
+               (count(*) filter (where m.upload_status = 'completed'))::integer as completed_count,
+               coalesce(sum(m.file_size), 0)::bigint as total_bytes,
+               count(m.file_size)::integer as sized_files,
+               max(m.created_at) as latest_upload
+          from media_files m
+         where p_user_id is null or m.user_id = p_user_id
+         group by m.user_id
+        union all
+        -- 파일이 모두 지워진 사용자
+        select s.user_id, 0, 0, 0, 0, 0, 0, 0, null
+          from media_user_stats s
+         where (p_user_id is null or s.user_id = p_user_id)
+           and not exists (select 1 from media_files m where m.user_id = s.user_id)
+    ),
+    upserted as (
+    insert into media_user_stats as s (
+        user_id, total_files, video_count, audio_count, pending_count, completed_count,
+        total_bytes, sized_files, latest_upload
+    )
+    select * from actual
+    on conflict (user_id) do update set
+        total_files = excluded.total_files,
+        video_count = excluded.video_count,
+        audio_count = excluded.audio_count,
+        pending_count = excluded.pending_count,
+        completed_count = excluded.completed_count,
+        total_bytes = excluded.total_bytes,
+        sized_files = excluded.sized_files,
+        latest_upload = excluded.latest_upload,
+        updated_at = now()
+    where (s.total_files, s.video_count, s.audio_count, s.pending_count, s.completed_count,
+           s.total_bytes, s.sized_files, s.latest_upload)
+          is distinct from
+          (excluded.total_files, excluded.video_count, excluded.audio_count, excluded.pending_count,
+           excluded.completed_count, excluded.total_bytes, excluded.sized_files, excluded.latest_upload)
+    returning s.*
+    )
+    select * from upserted;
+end;
+$$;
+
+-- 두 함수 모두 호출자와 관계없이 통계 행을 바꾸므로 API 역할(anon / authenticated)에서는 호출할 수 없게 막음
+-- (트리거는 소유자 권한으로 실행되고, 정합성 함수는 서비스 키로만 호출: scripts/reconcile_media_stats.py)
+revoke execute on function media_user_stats_apply(bigint, integer, text, text, bigint, timestamptz)
+    from public, anon, authenticated;
+revoke execute on function reconcile_media_user_stats(bigint) from public, anon, authenticated;
+grant execute on function reconcile_media_user_stats(bigint) to service_role;
+
+create index if not exists media_files_user_created on media_files (user_id, created_at desc, media_id desc);
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+시선 분석 일괄 재분석 (백필) CLI
+
+점수 계산 방식이 바뀐 뒤 과거 녹화 영상을 현재 분석기로 다시 채점해 gaze_analysis에 반영합니다.
+구현은 backend/services/gaze_backfill.py를 참고하세요.
+
+- 대상 조건: 생성 일시 범위(--since / --until), 사용자(--user-id), 면접(--interview-id)
+- 중단 후 같은 --checkpoint로 다시 실행하면 완료된 영상은 건너뛰고 실패한 영상만 재시도합니다.
+- --local-dir: 로컬 폴더를 S3 대신 사용 (키 = 폴더 기준 상대 경로). --manifest, --output과 함께 쓰면 네트워크 없이 실행됩니다.
+
+사용법:
+    python scripts/gaze_backfill.py --since 2025-07-01 --until 2025-08-01 --workers 4 --dry-run
+    python scripts/gaze_backfill.py --since 2025-07-01 --workers 4 --max-mbps 50 --checkpoint backfill_0701.jsonl
+    python scripts/gaze_backfill.py --local-dir ./videos --manifest jobs.jsonl --output results.jsonl
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+from itertools import islice
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.services.gaze_backfill import (
+    BackfillCheckpoint, JsonlResultSink, ManifestRecordingSource, SupabaseRecordingSource,
+    SupabaseResultSink, run_backfill,
+)
+
+DEFAULT_BUCKET = 'betago-s3'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='시선 분석 일괄 재분석')
+    parser.add_argument('--since', help='생성 일시 시작 (포함, ISO 형식)')
+    parser.add_argument('--until', help='생성 일시 끝 (미포함, ISO 형식)')
+    parser.add_argument('--user-id', type=int, action='append', help='대상 사용자 (여러 번 지정 가능)')
+    parser.add_argument('--interview-id', type=int, action='append', help='대상 면접 (여러 번 지정 가능)')
+    parser.add_argument('--limit', type=int, help='최대 대상 영상 수')
+    parser.add_argument('--bucket', default=DEFAULT_BUCKET)
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1), help='분석 프로세스 수')
+    parser.add_argument('--frame-skip', type=int, help='분석 프레임 간격 (기본: GazeConfig.FRAME_SKIP)')
+    parser.add_argument('--max-requests-per-sec', type=float, default=0.0, help='S3 다운로드 시작 속도 제한 (0=제한 없음)')
+    parser.add_argument('--max-mbps', type=float, default=0.0, help='S3 읽기 MB/s 제한 (0=제한 없음)')
+    parser.add_argument('--batch-size', type=int, default=50, help='결과 일괄 저장 단위')
+    parser.add_argument('--checkpoint', default='gaze_backfill_checkpoint.jsonl')
+    parser.add_argument('--report-interval', type=float, default=30.0, help='진행 상황 출력 간격(초)')
+    parser.add_argument('--local-dir', help='S3 대신 사용할 로컬 폴더')
+    parser.add_argument('--manifest', help='대상 목록 JSONL (지정하면 DB를 조회하지 않음)')
+    parser.add_argument('--output', help='결과 JSONL (지정하면 DB에 저장하지 않음)')
+    parser.add_argument('--dry-run', action='store_true', help='대상 목록만 출력')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    client = None
+    if not args.manifest or not args.output:
+        from backend.services.supabase_client import get_supabase_client
+        client = get_supabase_client()
+
+    source = ManifestRecordingSource(args.manifest) if args.manifest else SupabaseRecordingSource(client)
+    jobs = source.iter_jobs(args.since, args.until, args.user_id, args.interview_id)
+    if args.limit:
+        jobs = islice(jobs, args.limit)
+
+    if args.dry_run:
+        count = 0
+        for job in jobs:
+            count += 1
+            calibrated = 'O' if len(job.calibration_points) == 4 else 'X'
+            print(f"{job.created_at}  media={job.media_id}  user={job.user_id}  "
+                  f"interview={job.interview_id}  calibration={calibrated}  {job.s3_key}")
+        print(f"📋 [BACKFILL] 대상 영상 {count}개")
+        return
+
+    if args.output:
+        sink = JsonlResultSink(args.output, batch_size=args.batch_size)
+    else:
+        sink = SupabaseResultSink(client, batch_size=args.batch_size)
+
+    checkpoint = BackfillCheckpoint(args.checkpoint)
+    print(f"🚀 [BACKFILL] 시작: workers={args.workers}, 완료 기록 {len(checkpoint.done)}개는 건너뜀")
+    try:
+        stats = run_backfill(
+            jobs, sink, checkpoint, args.bucket,
+            workers=args.workers,
+            frame_skip=args.frame_skip,
+            local_root=args.local_dir,
+            max_requests_per_sec=args.max_requests_per_sec,
+            max_bytes_per_sec=args.max_mbps * 1024 * 1024,
+            report_interval=args.report_interval,
+        )
+    finally:
+        checkpoint.close()
+
+    print(json.dumps(stats.summary(), ensure_ascii=False, indent=2))
+    if stats.failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
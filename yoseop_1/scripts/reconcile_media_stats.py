@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+사용자별 미디어 통계 정합성 작업
+
+media_user_stats 행을 실제 media_files 집계와 비교해 다른 행만 바로잡고, 바로잡은 행을 출력합니다.
+트리거 도입 전 데이터를 채우거나, 트리거를 우회한 변경으로 생긴 차이를 없애는 용도입니다 (하루 1회 실행 권장).
+스키마는 scripts/database/media_user_stats.sql을 참고하세요.
+
+사용법:
+    python scripts/reconcile_media_stats.py
+    python scripts/reconcile_media_stats.py --user-id 42
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.services.media_stats import reconcile_media_stats
+from backend.services.supabase_client import get_supabase_client
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사용자별 미디어 통계 정합성 작업')
+    parser.add_argument('--user-id', type=int, help='대상 사용자 (없으면 전체)')
+    args = parser.parse_args()
+
+    rows = reconcile_media_stats(get_supabase_client(), args.user_id)
+    for row in rows:
+        print(f"🔧 user_id={row['user_id']}: 파일 {row['total_files']}개 (video {row['video_count']}, "
+              f"audio {row['audio_count']}, pending {row['pending_count']}), {row['total_bytes']} bytes")
+    print(f"✅ 바로잡은 통계 행: {len(rows)}개")
+
+
+if __name__ == '__main__':
+    main()